@@ -0,0 +1,77 @@
+# -*- mode: python ; coding: utf-8 -*-
+#
+# Startup-tuned build: onedir (nothing is unpacked to a temp dir on launch),
+# bytecode compiled with -OO, no UPX (decompressing DLLs on load costs more
+# than it saves) and only the modules the app imports. Output is the
+# self-contained folder dist/BabbittQuoteGenerator/. Build with
+# build_onedir.py, which also reports size and launch time.
+# (BabbittQuoteGenerator.spec is the one-file build used by build_installer.py.)
+
+# Runtime resources only; Python packages are found by import analysis
+datas = [
+    ('database/quotes.db', 'database'),
+    ('database/customers.db', 'database'),
+    # Schema CustomerDatabaseManager runs when customers.db is missing; the other
+    # .sql files are export/backup dumps and rebuild-script inputs
+    ('database/create_customer_db.sql', 'database'),
+    ('data/*.json', 'data'),
+    ('export/templates/*.docx', 'export/templates'),
+    ('export/unified_templates/master_template.docx', 'export/unified_templates'),
+    ('export/unified_templates/configs', 'export/unified_templates/configs'),
+]
+
+excludes = [
+    # Tests, benchmarks and developer scripts
+    'tests', 'benchmarks', 'pytest', 'unittest', 'doctest', 'pydoc', 'pdb',
+    # Unused export paths: the RTF processor, its example and old processor copies
+    'export.word_exporter', 'export.integration_example',
+    'export.unified_templates.unified_template_processor_backup',
+    'export.unified_templates.unified_template_processor_fixed',
+    # Optional accelerators the app runs without
+    'numpy',
+    # Never used by the app
+    'pydantic', 'colorama', 'setuptools', 'pkg_resources', 'distutils',
+    'lib2to3', 'tkinter.test', 'test', 'xmlrpc', 'pywin32_ctypes',
+]
+
+a = Analysis(
+    ['main.py'],
+    pathex=[],
+    binaries=[],
+    datas=datas,
+    hiddenimports=[],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=excludes,
+    noarchive=False,
+    optimize=2,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='BabbittQuoteGenerator',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    name='BabbittQuoteGenerator',
+)
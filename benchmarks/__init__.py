@@ -0,0 +1 @@
+# Benchmarks for Babbitt Quote Generator
@@ -0,0 +1,174 @@
+"""
+Export Benchmarks for Babbitt Quote Generator
+Times master quote export through python-docx and through the streaming writer at growing item counts
+
+Usage:
+    python -m benchmarks.export_benchmarks [--sizes 10 100 1000] [--rounds 3] [--output export.json]
+    python -m benchmarks.export_benchmarks --backend streaming --baseline old.json [--threshold 0.15]
+
+Quote items are the parsed sample part numbers, repeated up to each size.
+Every stage records the median export time, the file size and the peak
+Python heap from one extra run (tracing slows the export). lxml's tree
+memory is not traced, so the heap figure understates the document backend.
+The two backends' documents are also checked for identical package parts.
+Results use the pricing benchmark layout, so compare() applies unchanged.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import tracemalloc
+import zipfile
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from benchmarks.pricing_benchmarks import (
+    DEFAULT_FIXTURES, DEFAULT_THRESHOLD, compare, format_comparison, load_fixtures, time_stage
+)
+
+DEFAULT_SIZES = (10, 100, 1000)
+DEFAULT_ROUNDS = 3
+BACKENDS = ('document', 'streaming')
+RESULTS_VERSION = 1
+
+
+def quote_items(count: int, fixtures_path: str = DEFAULT_FIXTURES) -> List[Dict[str, Any]]:
+    """Main quote items for the valid fixture part numbers, cycled up to count"""
+    from core.part_parser import PartNumberParser
+
+    parser = PartNumberParser()
+    items = []
+    for part_number, _ in load_fixtures(fixtures_path):
+        parsed = parser.parse_part_number(part_number)
+        if not parsed.get('errors'):
+            items.append({'type': 'main', 'part_number': part_number, 'quantity': 1 + len(items) % 3,
+                          'data': parser.get_quote_data(parsed)})
+    return [items[i % len(items)] for i in range(count)]
+
+
+class ExportRun:
+    """Exports one quote to a fixed path with one backend"""
+
+    def __init__(self, items: List[Dict[str, Any]], output_path: str, streaming: bool):
+        from export.master_quote_generator import MasterQuoteGenerator
+
+        self.generator = MasterQuoteGenerator()
+        self.items = items
+        self.output_path = output_path
+        self.streaming = streaming
+
+    def __call__(self, _ctx=None) -> int:
+        if not self.generator.generate_master_quote(
+                self.items, 'Benchmark Co', 'Bench Tester', 'Benchmark ZF010126A', self.output_path,
+                employee_info={'name': 'Bench', 'phone': '', 'email': ''}, streaming=self.streaming):
+            raise RuntimeError(f"generate_master_quote failed for {self.output_path}")
+        return len(self.items)
+
+    def peak_memory(self) -> int:
+        """Peak traced allocation of one export, in bytes"""
+        tracemalloc.start()
+        try:
+            self()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+
+def same_package(first: str, second: str) -> bool:
+    """True if two .docx files hold the same parts with the same bytes"""
+    with zipfile.ZipFile(first) as a, zipfile.ZipFile(second) as b:
+        return a.namelist() == b.namelist() and all(a.read(name) == b.read(name) for name in a.namelist())
+
+
+def run_suite(sizes: Sequence[int] = DEFAULT_SIZES, backends: Sequence[str] = BACKENDS,
+              rounds: int = DEFAULT_ROUNDS, warmup: int = 1,
+              fixtures_path: str = DEFAULT_FIXTURES) -> Dict[str, Any]:
+    """
+    Time each backend at each size.
+
+    Returns:
+        JSON-ready results with a '<backend>_<size>' stage per combination
+    """
+    unknown = [backend for backend in backends if backend not in BACKENDS]
+    if unknown:
+        raise ValueError(f"Unknown backend(s): {', '.join(unknown)}; expected {', '.join(BACKENDS)}")
+
+    output_dir = tempfile.mkdtemp(prefix='export_bench_')
+    try:
+        items = quote_items(max(sizes), fixtures_path)
+        results = {
+            'version': RESULTS_VERSION,
+            'meta': {
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'identical': {},
+            },
+            'stages': {},
+        }
+        for size in sizes:
+            outputs = {}
+            for backend in backends:
+                outputs[backend] = os.path.join(output_dir, f"{backend}_{size}.docx")
+                run = ExportRun(items[:size], outputs[backend], streaming=backend == 'streaming')
+                stage = time_stage(run, None, rounds, warmup)
+                stage.update(description=f"generate_master_quote, {size} items, {backend} backend",
+                             bytes=os.path.getsize(outputs[backend]), peak_kib=run.peak_memory() // 1024)
+                results['stages'][f"{backend}_{size}"] = stage
+            if len(outputs) == len(BACKENDS):
+                results['meta']['identical'][str(size)] = same_package(*outputs.values())
+        return results
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def format_results(results: Dict[str, Any]) -> str:
+    lines = [f"{'stage':<16}{'median ms':>11}{'per item ms':>13}{'KiB out':>9}{'peak KiB':>10}"]
+    for name, stage in results['stages'].items():
+        lines.append(f"{name:<16}{stage['median_s'] * 1000:>11.0f}{stage['per_op_ms']:>13.2f}"
+                     f"{stage['bytes'] // 1024:>9}{stage['peak_kib']:>10}")
+    for size, identical in results['meta']['identical'].items():
+        if not identical:
+            lines.append(f"{size} items: backends produced different documents")
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.export_benchmarks', description=__doc__.split('\n')[2])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help="quote item counts")
+    parser.add_argument('--backend', action='append', choices=BACKENDS, help="backend to run (repeatable; default both)")
+    parser.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES)
+    parser.add_argument('--output', help="write results JSON here")
+    parser.add_argument('--baseline', help="compare against this results JSON")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.sizes, args.backend or BACKENDS, args.rounds, args.warmup, args.fixtures)
+    print(format_results(results))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    status = 0 if all(results['meta']['identical'].values()) else 1
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            rows = compare(json.load(f), results, args.threshold)
+        print(format_comparison(rows, args.threshold))
+        if any(row['regressed'] for row in rows):
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""
+Launch Benchmarks for Babbitt Quote Generator
+Times app launches to an interactive window and measures build output size
+
+Usage:
+    python -m benchmarks.launch_benchmarks [--runs 5] [--output launch.json] [--baseline old.json]
+    python -m benchmarks.launch_benchmarks --command dist/BabbittQuoteGenerator/BabbittQuoteGenerator.exe
+    python -m benchmarks.launch_benchmarks --size dist/BabbittQuoteGenerator
+
+Each run starts the app with BABBITT_STARTUP_PROBE pointing at a temp file.
+The main window writes its start-to-interactive time there and exits, so a
+run measures both the wall time of the process and the time the app itself
+reports. Results use the pricing benchmark layout, so compare() and its
+regression threshold apply unchanged.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from benchmarks.pricing_benchmarks import DEFAULT_THRESHOLD, compare, format_comparison
+
+try:
+    from config.settings import STARTUP_PROBE_ENV
+except ImportError:
+    STARTUP_PROBE_ENV = "BABBITT_STARTUP_PROBE"
+
+DEFAULT_COMMAND = (sys.executable, os.path.join(ROOT_DIR, 'main.py'))
+DEFAULT_RUNS = 5
+DEFAULT_TIMEOUT = 120.0  # seconds per launch
+RESULTS_VERSION = 1
+
+
+def launch_once(command: Sequence[str], timeout: float = DEFAULT_TIMEOUT) -> Dict[str, float]:
+    """
+    Launch the app once and wait for it to report startup and exit.
+
+    Returns:
+        wall_s (process start to exit) and interactive_s (as reported by the app)
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        probe_path = os.path.join(temp_dir, 'startup.json')
+        env = dict(os.environ, **{STARTUP_PROBE_ENV: probe_path})
+        start = time.perf_counter()
+        subprocess.run(list(command), env=env, cwd=ROOT_DIR, timeout=timeout,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        wall = time.perf_counter() - start
+        try:
+            with open(probe_path, encoding='utf-8') as f:
+                startup_ms = json.load(f)['startup_ms']
+        except (OSError, ValueError, KeyError):
+            raise RuntimeError(f"{command[-1]} exited without reporting its startup time")
+    return {'wall_s': wall, 'interactive_s': startup_ms / 1000.0}
+
+
+def _stage(samples: List[float], description: str) -> Dict[str, Any]:
+    return {
+        'description': description,
+        'ops': 1,
+        'rounds': len(samples),
+        'median_s': statistics.median(samples),
+        'min_s': min(samples),
+        'max_s': max(samples),
+        'samples_s': samples,
+    }
+
+
+def measure_launch(command: Sequence[str] = DEFAULT_COMMAND, runs: int = DEFAULT_RUNS, warmup: int = 1,
+                   timeout: float = DEFAULT_TIMEOUT) -> Dict[str, Any]:
+    """
+    Launch the app warmup + runs times; warmup launches fill the OS file cache and are not recorded.
+
+    Returns:
+        JSON-serializable results with 'launch_wall' and 'launch_interactive' stages
+    """
+    for _ in range(warmup):
+        launch_once(command, timeout)
+    samples = [launch_once(command, timeout) for _ in range(runs)]
+    return {
+        'version': RESULTS_VERSION,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'command': list(command),
+        'stages': {
+            'launch_wall': _stage([s['wall_s'] for s in samples], "process start to exit after first idle"),
+            'launch_interactive': _stage([s['interactive_s'] for s in samples], "app-reported start to interactive"),
+        },
+    }
+
+
+def bundle_size(path: str, largest: int = 10) -> Dict[str, Any]:
+    """
+    Size of a build output (a onedir folder or a single executable).
+
+    Returns:
+        total bytes, file count and the largest top-level entries
+    """
+    if os.path.isfile(path):
+        return {'path': path, 'bytes': os.path.getsize(path), 'files': 1, 'largest': []}
+    entries: Dict[str, int] = {}
+    total = files = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            file_path = os.path.join(dirpath, filename)
+            size = os.path.getsize(file_path)
+            total += size
+            files += 1
+            parts = os.path.relpath(file_path, path).split(os.sep)
+            # Group by the first level below the contents directory (_internal/<entry>)
+            top = os.path.join(*parts[:2]) if parts[0] == '_internal' and len(parts) > 1 else parts[0]
+            entries[top] = entries.get(top, 0) + size
+    ranked = sorted(entries.items(), key=lambda item: item[1], reverse=True)[:largest]
+    return {'path': path, 'bytes': total, 'files': files, 'largest': [list(item) for item in ranked]}
+
+
+def format_results(results: Dict[str, Any]) -> str:
+    lines = [f"{'stage':<20}{'median ms':>12}{'min ms':>10}{'max ms':>10}  description"]
+    for name, stage in results.get('stages', {}).items():
+        lines.append(f"{name:<20}{stage['median_s'] * 1000:>12.0f}{stage['min_s'] * 1000:>10.0f}"
+                     f"{stage['max_s'] * 1000:>10.0f}  {stage['description']}")
+    size = results.get('size')
+    if size:
+        lines.append(f"size: {size['bytes'] / (1024 * 1024):.1f} MB in {size['files']} files ({size['path']})")
+        for entry, entry_bytes in size['largest']:
+            lines.append(f"  {entry_bytes / (1024 * 1024):>8.1f} MB  {entry}")
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.launch_benchmarks', description=__doc__.split('\n')[2])
+    parser.add_argument('--command', nargs='+', help="launch command (default: this Python running main.py)")
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT)
+    parser.add_argument('--size', help="also report the size of this build output")
+    parser.add_argument('--no-launch', action='store_true', help="only report --size")
+    parser.add_argument('--output', help="write results JSON here")
+    parser.add_argument('--baseline', help="compare against this results JSON")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    if args.no_launch:
+        results = {'version': RESULTS_VERSION, 'created_at': datetime.now().isoformat(timespec='seconds'), 'stages': {}}
+    else:
+        results = measure_launch(args.command or DEFAULT_COMMAND, args.runs, args.warmup, args.timeout)
+    if args.size:
+        results['size'] = bundle_size(args.size)
+    print(format_results(results))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding='utf-8') as f:
+        rows = compare(json.load(f), results, args.threshold)
+    print(format_comparison(rows, args.threshold))
+    return 1 if any(row['regressed'] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
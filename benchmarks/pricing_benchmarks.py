@@ -0,0 +1,352 @@
+"""
+Pricing Benchmarks for Babbitt Quote Generator
+Times each stage of quoting over the sample part numbers, with JSON results and regression gates
+
+Usage:
+    python -m benchmarks.pricing_benchmarks run [--rounds 5] [--stage parse_cold ...] [--output results.json]
+    python -m benchmarks.pricing_benchmarks run --baseline baseline.json [--threshold 0.15]
+    python -m benchmarks.pricing_benchmarks compare baseline.json results.json [--threshold 0.15]
+
+Every stage runs once per round over all fixtures from
+tests/test_data/sample_part_numbers.txt; the median round time is compared
+between runs. compare (and run --baseline) exit with status 1 when any stage
+is slower than the baseline by more than the threshold.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+DEFAULT_FIXTURES = os.path.join(ROOT_DIR, 'tests', 'test_data', 'sample_part_numbers.txt')
+DEFAULT_ROUNDS = 5
+DEFAULT_THRESHOLD = 0.15  # 15% slower than baseline fails
+COMPARE_METRIC = 'median_s'
+RESULTS_VERSION = 1
+
+# Main items per generated document in the unified_quote stages
+QUOTE_ITEMS_PER_DOCUMENT = 5
+EXPORT_CACHE_BYTES = 256 * 1024 * 1024  # export cache used by unified_quote_cached
+
+# Part number sections probed by the autocomplete stage, by position
+AUTOCOMPLETE_SECTIONS = ((0, 'model'), (1, 'voltage'), (2, 'material'))
+
+
+def load_fixtures(path: str = DEFAULT_FIXTURES) -> List[Tuple[str, Optional[float]]]:
+    """(part number, expected price) pairs from a 'PART=PRICE' file; comments and blanks skipped"""
+    fixtures = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            part_number, _, price = line.rpartition('=')
+            if not part_number:
+                part_number, price = price, ''
+            fixtures.append((part_number.strip(), float(price) if price.strip() else None))
+    return fixtures
+
+
+def pricing_args(parsed: Dict[str, Any]) -> Dict[str, Any]:
+    """calculate_complete_pricing arguments for a parsed part, as the parser derives them"""
+    insulator = parsed.get('insulator')
+    connection = parsed.get('process_connection')
+    return {
+        'model_code': parsed.get('model', ''),
+        'voltage': parsed.get('voltage', ''),
+        'material_code': parsed.get('probe_material', 'S'),
+        'probe_length': parsed.get('probe_length', 10.0),
+        'option_codes': [option['code'] for option in parsed.get('options', [])],
+        'insulator_code': insulator['material'] if insulator else parsed.get('insulator_material', 'U'),
+        'insulator_length': insulator['length'] if insulator else parsed.get('insulator_length', 4.0),
+        'connection_info': {
+            'type': connection.get('type', 'NPT'),
+            'size': connection.get('size', '3/4"'),
+            'material': 'SS',
+            'rating': connection.get('rating'),
+        } if connection else None,
+    }
+
+
+def autocomplete_probes(part_numbers: Sequence[str]) -> List[Tuple[str, str]]:
+    """(section type, typed prefix) pairs as a user would type each fixture"""
+    probes = []
+    for part_number in part_numbers:
+        segments = part_number.split('-')
+        sections = [(section, segments[index]) for index, section in AUTOCOMPLETE_SECTIONS if index < len(segments)]
+        sections += [('option', segment) for segment in segments[4:]]
+        for section, text in sections:
+            for size in range(1, min(len(text), 3) + 1):
+                probes.append((section, text[:size]))
+    return probes
+
+
+class BenchmarkContext:
+    """Shared objects and precomputed inputs for the stages"""
+
+    def __init__(self, fixtures: List[Tuple[str, Optional[float]]], db_path: Optional[str] = None):
+        from core.part_parser import PartNumberParser
+        from core.pricing_engine import PricingEngine
+        from database.db_manager import DatabaseManager
+
+        self.fixtures = fixtures
+        self.part_numbers = [part_number for part_number, _ in fixtures]
+        self.db = DatabaseManager(db_path)
+        self.parser = PartNumberParser(self.db)
+        self.engine = PricingEngine(self.db)
+        self.parsed = [self.parser.parse_part_number(part_number) for part_number in self.part_numbers]
+        self.valid = [parsed for parsed in self.parsed if not parsed.get('errors')]
+        self.quote_data = [self.parser.get_quote_data(parsed) for parsed in self.valid]
+        self.probes = autocomplete_probes(self.part_numbers)
+        self.output_dir = tempfile.mkdtemp(prefix='quote_bench_')
+        self.export_cache = None  # filled by the first unified_quote_cached round
+
+    def price_mismatches(self) -> List[str]:
+        """Fixtures whose parsed total differs from the expected price"""
+        mismatches = []
+        for (part_number, expected), parsed in zip(self.fixtures, self.parsed):
+            actual = parsed.get('pricing', {}).get('total_price')
+            if expected is not None and (actual is None or abs(actual - expected) > 0.01):
+                mismatches.append(f"{part_number}: expected {expected:.2f}, got {actual}")
+        return mismatches
+
+    def close(self):
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+
+def _parse_cold(ctx: BenchmarkContext) -> int:
+    ctx.parser.clear_cache()
+    for part_number in ctx.part_numbers:
+        ctx.parser.parse_part_number(part_number)
+    return len(ctx.part_numbers)
+
+
+def _parse_warm(ctx: BenchmarkContext) -> int:
+    for part_number in ctx.part_numbers:
+        ctx.parser.parse_part_number(part_number)
+    return len(ctx.part_numbers)
+
+
+def _pricing(ctx: BenchmarkContext) -> int:
+    for parsed in ctx.valid:
+        ctx.engine.calculate_complete_pricing(**pricing_args(parsed))
+    return len(ctx.valid)
+
+
+def _quote_data(ctx: BenchmarkContext) -> int:
+    for parsed in ctx.valid:
+        ctx.parser.get_quote_data(parsed)
+    return len(ctx.valid)
+
+
+def _autocomplete(ctx: BenchmarkContext) -> int:
+    for section, text in ctx.probes:
+        ctx.db.get_autocomplete_suggestions(section, text)
+    return len(ctx.probes)
+
+
+def _generate_unified_quotes(ctx: BenchmarkContext) -> int:
+    from export.unified_templates.unified_template_processor import generate_unified_quote
+
+    pairs = list(zip(ctx.valid, ctx.quote_data))
+    documents = 0
+    for start in range(0, len(pairs), QUOTE_ITEMS_PER_DOCUMENT):
+        chunk = pairs[start:start + QUOTE_ITEMS_PER_DOCUMENT]
+        items = [{'type': 'main', 'part_number': parsed['original_part_number'], 'quantity': 1, 'data': data}
+                 for parsed, data in chunk]
+        output_path = os.path.join(ctx.output_dir, f"bench_{documents}.docx")
+        if not generate_unified_quote(items, 'Benchmark Co', 'Bench Tester', f"Benchmark ZF0101{documents:02d}A",
+                                      output_path, employee_info={'name': 'Bench', 'phone': '', 'email': ''}):
+            raise RuntimeError(f"generate_unified_quote failed for {output_path}")
+        documents += 1
+    return documents
+
+
+def _unified_quote(ctx: BenchmarkContext) -> int:
+    from export.export_cache import ExportCache, use_export_cache
+
+    # Export cache off, so every round renders
+    with use_export_cache(ExportCache(ctx.output_dir, max_bytes=0)):
+        return _generate_unified_quotes(ctx)
+
+
+def _unified_quote_cached(ctx: BenchmarkContext) -> int:
+    from export.export_cache import ExportCache, use_export_cache
+
+    if ctx.export_cache is None:
+        ctx.export_cache = ExportCache(os.path.join(ctx.output_dir, 'export_cache'), EXPORT_CACHE_BYTES)
+    with use_export_cache(ctx.export_cache):
+        return _generate_unified_quotes(ctx)
+
+
+# Stage name -> (function returning the number of operations, description)
+STAGES: Dict[str, Tuple[Callable[[BenchmarkContext], int], str]] = {
+    'parse_cold': (_parse_cold, "PartNumberParser.parse_part_number, empty parse cache"),
+    'parse_warm': (_parse_warm, "PartNumberParser.parse_part_number, cached"),
+    'pricing': (_pricing, "PricingEngine.calculate_complete_pricing"),
+    'quote_data': (_quote_data, "PartNumberParser.get_quote_data"),
+    'autocomplete': (_autocomplete, "DatabaseManager.get_autocomplete_suggestions per typed prefix"),
+    'unified_quote': (_unified_quote, "generate_unified_quote, one DOCX per 5 items, export cache off"),
+    'unified_quote_cached': (_unified_quote_cached,
+                             "generate_unified_quote, same documents served by the export cache (warm-up fills it)"),
+}
+
+
+def time_stage(func: Callable[[BenchmarkContext], int], ctx: BenchmarkContext,
+               rounds: int = DEFAULT_ROUNDS, warmup: int = 1) -> Dict[str, Any]:
+    """Run a stage warmup + rounds times and summarize the round times"""
+    for _ in range(warmup):
+        func(ctx)
+    times = []
+    ops = 0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        ops = func(ctx)
+        times.append(time.perf_counter() - start)
+    median = statistics.median(times)
+    return {
+        'ops': ops,
+        'rounds': rounds,
+        'min_s': min(times),
+        'median_s': median,
+        'mean_s': statistics.fmean(times),
+        'max_s': max(times),
+        'per_op_ms': median / ops * 1000.0 if ops else 0.0,
+    }
+
+
+def run_suite(stages: Optional[Sequence[str]] = None, rounds: int = DEFAULT_ROUNDS, warmup: int = 1,
+              fixtures_path: str = DEFAULT_FIXTURES, db_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Time the selected stages (default: all) over the fixture file,
+    against db_path (default: the application database).
+
+    Returns:
+        JSON-ready results: run metadata plus per-stage timings
+    """
+    names = list(stages or STAGES)
+    unknown = [name for name in names if name not in STAGES]
+    if unknown:
+        raise ValueError(f"Unknown stage(s): {', '.join(unknown)}; expected {', '.join(STAGES)}")
+
+    ctx = BenchmarkContext(load_fixtures(fixtures_path), db_path)
+    try:
+        results = {
+            'version': RESULTS_VERSION,
+            'meta': {
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'fixtures': os.path.relpath(fixtures_path, ROOT_DIR),
+                'fixture_count': len(ctx.fixtures),
+                'price_mismatches': ctx.price_mismatches(),
+            },
+            'stages': {},
+        }
+        for name in names:
+            func, description = STAGES[name]
+            results['stages'][name] = dict(time_stage(func, ctx, rounds, warmup), description=description)
+        return results
+    finally:
+        ctx.close()
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            threshold: float = DEFAULT_THRESHOLD, metric: str = COMPARE_METRIC) -> List[Dict[str, Any]]:
+    """
+    Per-stage comparison of two result sets (stages present in both).
+
+    Returns:
+        Rows with baseline and current values, relative change and whether
+        the change exceeds the threshold
+    """
+    rows = []
+    for name, stage in current.get('stages', {}).items():
+        before = baseline.get('stages', {}).get(name)
+        if not before:
+            continue
+        old, new = before[metric], stage[metric]
+        change = (new - old) / old if old else 0.0
+        rows.append({'stage': name, 'baseline': old, 'current': new,
+                     'change': change, 'regressed': change > threshold})
+    return rows
+
+
+def format_comparison(rows: List[Dict[str, Any]], threshold: float) -> str:
+    lines = [f"{'stage':<22}{'baseline ms':>13}{'current ms':>13}{'change':>9}"]
+    for row in rows:
+        flag = '  REGRESSION' if row['regressed'] else ''
+        lines.append(f"{row['stage']:<22}{row['baseline'] * 1000:>13.2f}{row['current'] * 1000:>13.2f}"
+                     f"{row['change']:>+9.1%}{flag}")
+    regressions = sum(row['regressed'] for row in rows)
+    lines.append(f"{regressions} regression(s) beyond {threshold:.0%}")
+    return '\n'.join(lines)
+
+
+def format_results(results: Dict[str, Any]) -> str:
+    lines = [f"{'stage':<22}{'ops':>6}{'median ms':>12}{'per op ms':>12}  description"]
+    for name, stage in results['stages'].items():
+        lines.append(f"{name:<22}{stage['ops']:>6}{stage['median_s'] * 1000:>12.2f}"
+                     f"{stage['per_op_ms']:>12.3f}  {stage['description']}")
+    mismatches = results['meta']['price_mismatches']
+    if mismatches:
+        lines.append(f"{len(mismatches)} fixture price mismatch(es), e.g. {mismatches[0]}")
+    return '\n'.join(lines)
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.pricing_benchmarks', description=__doc__.split('\n')[2])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help="time the stages")
+    run.add_argument('--stage', action='append', choices=list(STAGES), help="stage to run (repeatable; default all)")
+    run.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS)
+    run.add_argument('--warmup', type=int, default=1)
+    run.add_argument('--fixtures', default=DEFAULT_FIXTURES)
+    run.add_argument('--db', help="database to run against (default: the application database)")
+    run.add_argument('--output', help="write results JSON here")
+    run.add_argument('--baseline', help="compare against this results JSON")
+    run.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+
+    comp = commands.add_parser('compare', help="compare two results files")
+    comp.add_argument('baseline')
+    comp.add_argument('current')
+    comp.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+    if args.command == 'run':
+        current = run_suite(args.stage, args.rounds, args.warmup, args.fixtures, args.db)
+        print(format_results(current))
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(current, f, indent=2)
+            print(f"Results written to {args.output}")
+        if not args.baseline:
+            return 0
+        baseline = _load(args.baseline)
+    else:
+        baseline, current = _load(args.baseline), _load(args.current)
+
+    rows = compare(baseline, current, args.threshold)
+    print(format_comparison(rows, args.threshold))
+    return 1 if any(row['regressed'] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Onedir Build Script for Babbitt Quote Generator
+Builds dist/BabbittQuoteGenerator/ from BabbittQuoteGenerator_onedir.spec and reports size and launch time
+
+Usage:
+    python build_onedir.py [--runs 5] [--no-launch] [--baseline build_report.json]
+
+The build is reproducible: PYTHONHASHSEED is fixed and SOURCE_DATE_EPOCH is
+the last commit time, so rebuilding the same commit with the same toolchain
+gives the same bytecode. The report (size, largest entries, launch timings)
+is written to dist/BabbittQuoteGenerator_build_report.json; pass an older
+report as --baseline to fail the build on a startup regression.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.launch_benchmarks import bundle_size, format_results, measure_launch
+from benchmarks.pricing_benchmarks import DEFAULT_THRESHOLD, compare, format_comparison
+
+PROJECT_ROOT = Path(__file__).parent
+APP_NAME = "BabbittQuoteGenerator"
+SPEC_FILE = PROJECT_ROOT / f"{APP_NAME}_onedir.spec"
+BUILD_DIR = PROJECT_ROOT / "build" / APP_NAME
+OUTPUT_DIR = PROJECT_ROOT / "dist" / APP_NAME
+REPORT_FILE = PROJECT_ROOT / "dist" / f"{APP_NAME}_build_report.json"
+
+
+def build_environment() -> dict:
+    """Environment for a reproducible PyInstaller run"""
+    env = dict(os.environ, PYTHONHASHSEED="0")
+    try:
+        commit_time = subprocess.run(["git", "log", "-1", "--format=%ct"], cwd=PROJECT_ROOT,
+                                     capture_output=True, text=True, check=True).stdout.strip()
+        if commit_time:
+            env["SOURCE_DATE_EPOCH"] = commit_time
+    except (OSError, subprocess.CalledProcessError):
+        pass  # not a git checkout; timestamps will vary
+    return env
+
+
+def build() -> bool:
+    """Run PyInstaller on the onedir spec; True if the app folder was produced"""
+    print("🧹 Cleaning previous onedir build...")
+    for path in (BUILD_DIR, OUTPUT_DIR):
+        if path.exists():
+            shutil.rmtree(path)
+
+    print("🔨 Building with PyInstaller (onedir, optimized bytecode)...")
+    cmd = [sys.executable, "-m", "PyInstaller", "--noconfirm", "--clean", str(SPEC_FILE)]
+    result = subprocess.run(cmd, cwd=PROJECT_ROOT, env=build_environment(), capture_output=True, text=True)
+    if result.returncode != 0:
+        print("❌ Build failed!")
+        print("STDOUT:", result.stdout)
+        print("STDERR:", result.stderr)
+        return False
+    if not OUTPUT_DIR.exists():
+        print(f"❌ Build output not found: {OUTPUT_DIR}")
+        return False
+    print(f"✅ Build successful: {OUTPUT_DIR}")
+    return True
+
+
+def executable_path() -> Path:
+    suffix = ".exe" if sys.platform == "win32" else ""
+    return OUTPUT_DIR / f"{APP_NAME}{suffix}"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Build the onedir app and report size and launch time")
+    parser.add_argument("--runs", type=int, default=5, help="timed launches of the built app")
+    parser.add_argument("--no-launch", action="store_true", help="skip the launch benchmark (e.g. headless CI)")
+    parser.add_argument("--skip-build", action="store_true", help="report on the existing build only")
+    parser.add_argument("--baseline", help="earlier build report; exit 1 if launch time regressed")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    print("🚀 Building Babbitt Quote Generator (onedir)")
+    print("=" * 50)
+    if not args.skip_build and not build():
+        return 1
+
+    report = {'stages': {}}
+    if not args.no_launch:
+        print(f"⏱️  Launching {args.runs} times...")
+        report = measure_launch([str(executable_path())], runs=args.runs)
+    report['size'] = bundle_size(str(OUTPUT_DIR))
+    print(format_results(report))
+
+    REPORT_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(REPORT_FILE, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"📄 Build report: {REPORT_FILE}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            rows = compare(json.load(f), report, args.threshold)
+        print(format_comparison(rows, args.threshold))
+        if any(row['regressed'] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -90,12 +90,31 @@ DATABASE_SCHEMA = {
     }
 }
 
-# Connection pool settings (for future expansion)
+# Connection pool settings (see database/connection_pool.py)
 POOL_SETTINGS = {
     'max_connections': 10,
     'min_connections': 1,
     'connection_timeout': 30,
-    'idle_timeout': 300
+    'idle_timeout': 300,
+    'cached_statements': 256
+}
+
+# PRAGMAs applied to every pooled connection.
+# WAL lets exports read while a save is writing.
+PRAGMA_SETTINGS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -8000,       # KiB (negative = size, not pages)
+    'mmap_size': 67108864,     # 64 MiB
+    'temp_store': 'MEMORY'
+}
+
+# Overrides for databases on a network share (UNC path, mapped or network
+# mount). WAL and mmap rely on memory shared by processes on one host, so
+# workstations sharing a file over SMB/NFS must use rollback journaling.
+NETWORK_PRAGMA_OVERRIDES = {
+    'journal_mode': 'DELETE',
+    'mmap_size': 0
 }
 
 # Database backup settings
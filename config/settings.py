@@ -22,12 +22,22 @@ LOGS_DIR = BASE_DIR / "logs"
 # Database Settings
 DATABASE_NAME = "quotes.db"
 DATABASE_PATH = DATABASE_DIR / DATABASE_NAME
+CATALOG_REFRESH_INTERVAL = 2.0  # seconds between reference catalog change checks
 
 # Export Settings
 DEFAULT_EXPORT_FORMAT = "docx"
 
 QUOTE_TEMPLATE_NAME = "quote_template.docx"
 QUOTE_TEMPLATE_PATH = TEMPLATES_DIR / QUOTE_TEMPLATE_NAME
+COMPOSED_SECTION_WORKERS = 0      # processes rendering composed quote item sections (0 = CPU count)
+COMPOSED_PARALLEL_MIN_ITEMS = 16  # main items before a composed quote renders sections in parallel
+STREAMING_EXPORT_MIN_ITEMS = 50   # quote items before the master quote is streamed to disk item by item
+
+# Export Cache (rendered quotes reused when nothing that goes into them changed)
+APP_DATA_DIR = Path(os.environ.get("LOCALAPPDATA") or Path.home() / ".cache") / APP_NAME
+EXPORT_CACHE_DIR = APP_DATA_DIR / "export_cache"
+EXPORT_CACHE_MAX_MB = 200         # size cap before least recently used quotes are evicted (0 = disabled)
+EXPORT_CACHE_LINK = False         # hard-link cached quotes into place instead of copying them
 
 # GUI Settings
 WINDOW_TITLE = f"{APP_NAME} v{APP_VERSION}"
@@ -35,6 +45,18 @@ WINDOW_WIDTH = 1200
 WINDOW_HEIGHT = 800
 WINDOW_MIN_WIDTH = 800
 WINDOW_MIN_HEIGHT = 600
+AUTOCOMPLETE_DEBOUNCE_MS = 120  # pause in typing before suggestions refresh
+AUTOCOMPLETE_CACHE_SIZE = 1024  # cached (section, prefix) suggestion lists
+
+# Part Number Parse Cache
+PARSE_CACHE_SIZE = 512          # parsed part numbers kept in memory
+PARSE_CACHE_TTL = 3600.0        # seconds before a cached parse is recomputed
+
+# Quote Numbers
+QUOTE_RESERVATION_TTL = 8 * 3600.0  # seconds an unsaved quote number stays reserved
+
+# Startup
+STARTUP_PROBE_ENV = "BABBITT_STARTUP_PROBE"  # file to write the startup time to before exiting (launch benchmark)
 
 # Default Values
 DEFAULT_CUSTOMER = "New Customer"
@@ -61,7 +83,9 @@ QUOTE_NUMBER_PREFIX = "BBT"
 QUOTE_VALIDITY_DAYS = 30
 
 # Logging Settings
-LOG_LEVEL = "INFO"
+LOG_LEVEL = "INFO"  # TRACE adds per-export and per-price detail
+LOG_LEVEL_ENV = "BABBITT_LOG_LEVEL"  # environment override for LOG_LEVEL
+LOG_TRACE_ENV = "BABBITT_TRACE"  # comma-separated logger names to trace, e.g. "export,core.pricing_engine"
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
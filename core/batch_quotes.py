@@ -0,0 +1,365 @@
+"""
+Headless Batch Quoting for Babbitt Quote Generator
+Parses, prices and exports many quotes from a CSV or JSONL file
+
+Usage:
+    python -m core.batch_quotes requests.csv --initials ZF --output-dir exports/batch
+    python -m core.batch_quotes requests.jsonl --initials ZF --workers 4 --save
+
+CSV input has one row per line item with the columns
+    customer, contact, part_number, quantity[, quote_number, lead_time, quote_id]
+Rows are grouped into one quote per quote_id (or per customer + contact).
+
+JSONL input has one quote per line:
+    {"customer": "...", "contact": "...", "items": [{"part_number": "...", "quantity": 2}]}
+Flat JSON lines with the CSV columns are grouped the same way as CSV rows.
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Any
+
+from database.quote_numbers import letters_to_seq, seq_to_letters
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Letters after the date code of a quote number (ACME ZF071925AB -> AB)
+_LETTER_SUFFIX = re.compile(r'(?<=\d)[A-Z]+$')
+
+# Per-process parser; each worker builds its own catalog snapshot once
+_worker_parser = None
+
+
+def _init_worker():
+    """Process pool initializer: build the parser (and its catalog) once per worker"""
+    global _worker_parser
+    from core.part_parser import PartNumberParser
+    _worker_parser = PartNumberParser()
+    _worker_parser.db.get_model_plan('')  # load the catalog snapshot up front
+
+
+def _get_parser():
+    if _worker_parser is None:
+        _init_worker()
+    return _worker_parser
+
+
+def read_quote_requests(path: str) -> List[Dict[str, Any]]:
+    """
+    Read quote requests from a .csv or .jsonl file
+
+    Returns:
+        List of quotes: {'customer', 'contact', 'quote_number', 'lead_time', 'items': [...]}
+    """
+    rows = []
+    quotes = []
+
+    if path.lower().endswith('.csv'):
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            rows = [{k.strip().lower(): (v or '').strip() for k, v in row.items() if k} for row in csv.DictReader(f)]
+    else:
+        with open(path, encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{path}:{line_number}: invalid JSON: {e}")
+                if 'items' in record:
+                    quotes.append(_normalize_quote(record))
+                else:
+                    rows.append(record)
+
+    # Group flat line-item rows into quotes, keeping first-seen order
+    grouped: Dict[Any, Dict[str, Any]] = {}
+    for row in rows:
+        key = row.get('quote_id') or (row.get('customer', ''), row.get('contact', ''))
+        if key not in grouped:
+            grouped[key] = _normalize_quote({k: v for k, v in row.items()
+                                             if k not in ('part_number', 'quantity')})
+            quotes.append(grouped[key])
+        if row.get('part_number'):
+            grouped[key]['items'].append(_normalize_item(row))
+
+    return quotes
+
+
+def _normalize_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        quantity = int(item.get('quantity') or 1)
+    except (TypeError, ValueError):
+        quantity = 1
+    return {'part_number': str(item.get('part_number', '')).strip(), 'quantity': max(quantity, 1)}
+
+
+def _normalize_quote(record: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'customer': str(record.get('customer') or record.get('customer_name') or '').strip(),
+        'contact': str(record.get('contact') or record.get('attention_name') or '').strip(),
+        'quote_number': str(record.get('quote_number') or '').strip() or None,
+        'lead_time': str(record.get('lead_time') or '').strip() or None,
+        'items': [_normalize_item(item) for item in record.get('items', [])],
+    }
+
+
+def _bump_letter(quote_number: str) -> str:
+    """ACME ZF071925A -> ACME ZF071925B, ...Z -> ...AA (the allocator's letter sequence)"""
+    match = _LETTER_SUFFIX.search(quote_number)
+    if match is None:
+        return quote_number + 'A'
+    return quote_number[:match.start()] + seq_to_letters(letters_to_seq(match.group()) + 1)
+
+
+def assign_quote_numbers(quotes: List[Dict[str, Any]], user_initials: str, db=None) -> List[str]:
+    """
+    Give every quote without a number the next free one for its customer
+
+    Returns:
+        The numbers reserved from the database; hand them to
+        release_quote_numbers() once the run is over
+    """
+    if db is None:
+        from database.db_manager import DatabaseManager
+        db = DatabaseManager()
+    used = {quote['quote_number'] for quote in quotes if quote['quote_number']}
+    reserved = []
+    for quote in quotes:
+        if quote['quote_number']:
+            continue
+        quote_number = db.generate_quote_number(user_initials, quote['customer'])
+        reserved.append(quote_number)
+        while quote_number in used:
+            quote_number = _bump_letter(quote_number)
+        quote['quote_number'] = quote_number
+        used.add(quote_number)
+    return reserved
+
+
+def release_quote_numbers(quote_numbers: List[str], db=None):
+    """Give back reserved numbers; those of saved quotes are already confirmed and stay taken"""
+    if not quote_numbers:
+        return
+    if db is None:
+        from database.db_manager import DatabaseManager
+        db = DatabaseManager()
+    for quote_number in quote_numbers:
+        db.release_quote_number(quote_number)
+
+
+def _safe_filename(name: str) -> str:
+    return re.sub(r'[\\/:*?"<>|]+', '_', name).strip() or 'quote'
+
+
+def process_quote(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Parse, price and export one quote (runs in a worker process)
+
+    Returns:
+        Manifest entry with status, totals, item results and timings (ms)
+    """
+    started = time.perf_counter()
+    quote = job['quote']
+    entry = {
+        'quote_number': quote['quote_number'],
+        'customer': quote['customer'],
+        'contact': quote['contact'],
+        'output_path': None,
+        'success': False,
+        'total_price': 0.0,
+        'items': [],
+        'errors': [],
+        'timings': {},
+    }
+
+    parser = _get_parser()
+    quote_items = []
+
+    parse_started = time.perf_counter()
+    for item in quote['items']:
+        item_entry = {'part_number': item['part_number'], 'quantity': item['quantity']}
+        parsed = parser.parse_part_number(item['part_number'])
+        if parsed.get('error'):
+            item_entry['error'] = parsed['error']
+            entry['errors'].append(f"{item['part_number']}: {parsed['error']}")
+        else:
+            quote_data = parser.get_quote_data(parsed)
+            quote_data['quantity'] = item['quantity']
+            unit_price = quote_data.get('total_price', 0.0)
+            item_entry.update({
+                'expanded_part_number': quote_data.get('part_number'),
+                'unit_price': unit_price,
+                'total_price': unit_price * item['quantity'],
+            })
+            entry['total_price'] += unit_price * item['quantity']
+            quote_items.append({
+                'type': 'main',
+                'part_number': quote_data.get('part_number', item['part_number']),
+                'customer_name': quote['customer'],
+                'quantity': item['quantity'],
+                'data': quote_data,
+                'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            })
+        entry['items'].append(item_entry)
+    entry['timings']['parse_ms'] = round((time.perf_counter() - parse_started) * 1000, 2)
+
+    if not quote_items:
+        entry['errors'].append("No valid items to export")
+    elif entry['errors'] and not job.get('allow_partial'):
+        entry['errors'].append("Skipped export because some items failed to parse")
+    else:
+        from export.unified_templates.unified_template_processor import generate_unified_quote
+
+        output_path = os.path.join(job['output_dir'], _safe_filename(quote['quote_number']) + '.docx')
+        export_started = time.perf_counter()
+        extra = {'lead_time': quote['lead_time']} if quote['lead_time'] else {}
+        success = generate_unified_quote(
+            quote_items=quote_items,
+            customer_name=quote['customer'] or "Customer Name",
+            attention_name=quote['contact'] or "Contact Person",
+            quote_number=quote['quote_number'],
+            output_path=output_path,
+            employee_info=job.get('employee_info'),
+            **extra
+        )
+        entry['timings']['export_ms'] = round((time.perf_counter() - export_started) * 1000, 2)
+        if success:
+            entry['success'] = True
+            entry['output_path'] = output_path
+        else:
+            entry['errors'].append("Document export failed")
+
+    entry['quote_items'] = quote_items if entry['success'] else []
+    entry['timings']['total_ms'] = round((time.perf_counter() - started) * 1000, 2)
+    entry['worker_pid'] = os.getpid()
+    return entry
+
+
+def run_batch(quotes: List[Dict[str, Any]], output_dir: str, workers: int = 1,
+              employee_info: Optional[Dict[str, str]] = None, allow_partial: bool = False,
+              save: bool = False, user_initials: str = "") -> Dict[str, Any]:
+    """
+    Export every quote and return the run manifest
+
+    Args:
+        quotes: Quotes from read_quote_requests() with quote numbers assigned
+        output_dir: Directory for the .docx files
+        workers: Number of worker processes (1 runs in this process)
+        employee_info: {'name', 'phone', 'email'} for the template
+        allow_partial: Export quotes even if some of their items failed to parse
+        save: Record successful quotes in the quotes database
+        user_initials: Initials stored with saved quotes
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = [{'quote': quote, 'output_dir': output_dir, 'employee_info': employee_info,
+             'allow_partial': allow_partial} for quote in quotes]
+
+    started_at = datetime.now()
+    started = time.perf_counter()
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            entries = list(pool.map(process_quote, jobs))
+    else:
+        entries = [process_quote(job) for job in jobs]
+    elapsed = time.perf_counter() - started
+
+    if save:
+        # Saves happen here, one writer, after the parallel work is done
+        from database.db_manager import DatabaseManager
+        db = DatabaseManager()
+        for entry in entries:
+            if entry['success']:
+                entry['saved'] = db.save_quote(
+                    quote_number=entry['quote_number'],
+                    customer_name=entry['customer'],
+                    customer_email=entry['contact'],
+                    quote_items=entry['quote_items'],
+                    total_price=entry['total_price'],
+                    user_initials=user_initials
+                )
+        db.disconnect()
+
+    for entry in entries:
+        del entry['quote_items']
+
+    succeeded = sum(1 for entry in entries if entry['success'])
+    return {
+        'started_at': started_at.isoformat(timespec='seconds'),
+        'elapsed_seconds': round(elapsed, 3),
+        'workers': workers,
+        'quotes': len(entries),
+        'succeeded': succeeded,
+        'failed': len(entries) - succeeded,
+        'quotes_per_second': round(len(entries) / elapsed, 2) if elapsed > 0 else None,
+        'results': entries,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m core.batch_quotes',
+        description='Parse, price and export quotes in bulk without the GUI.'
+    )
+    parser.add_argument('input', help='CSV or JSONL file of quote requests')
+    parser.add_argument('--initials', default='', help='User initials for generated quote numbers')
+    parser.add_argument('--output-dir', default=os.path.join('exports', 'batch'),
+                        help='Directory for the generated .docx files (default: exports/batch)')
+    parser.add_argument('--manifest', help='Manifest path (default: <output-dir>/manifest.json)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes (default: CPU count; 1 = no pool)')
+    parser.add_argument('--employee-name', default=None)
+    parser.add_argument('--employee-phone', default=None)
+    parser.add_argument('--employee-email', default=None)
+    parser.add_argument('--allow-partial', action='store_true',
+                        help='Export quotes even when some of their part numbers fail to parse')
+    parser.add_argument('--save', action='store_true', help='Save exported quotes to the database')
+    args = parser.parse_args(argv)
+
+    try:
+        quotes = read_quote_requests(args.input)
+    except (OSError, ValueError) as e:
+        print(f"Error reading {args.input}: {e}", file=sys.stderr)
+        return 2
+
+    if any(not quote['quote_number'] for quote in quotes) and not args.initials:
+        print("--initials is required when the input does not give quote numbers", file=sys.stderr)
+        return 2
+
+    employee_info = None
+    if args.employee_name or args.employee_phone or args.employee_email:
+        employee_info = {key: value for key, value in (('name', args.employee_name),
+                                                       ('phone', args.employee_phone),
+                                                       ('email', args.employee_email)) if value}
+
+    reserved = []
+    try:
+        if any(not quote['quote_number'] for quote in quotes):
+            reserved = assign_quote_numbers(quotes, args.initials.upper())
+        manifest = run_batch(quotes, args.output_dir, workers=max(args.workers, 1),
+                             employee_info=employee_info, allow_partial=args.allow_partial,
+                             save=args.save, user_initials=args.initials.upper())
+
+        manifest_path = args.manifest or os.path.join(args.output_dir, 'manifest.json')
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+    finally:
+        # Numbers of quotes that were not saved (no --save, or the quote failed) can be reissued
+        release_quote_numbers(reserved)
+
+    print(f"Exported {manifest['succeeded']}/{manifest['quotes']} quotes in "
+          f"{manifest['elapsed_seconds']:.1f}s with {manifest['workers']} worker(s)")
+    print(f"Manifest: {manifest_path}")
+    return 0 if manifest['failed'] == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
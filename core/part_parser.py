@@ -4,54 +4,62 @@ Parses complex part numbers like: LS2000-115VAC-S-10"-XSP-VR-8"TEFINS
 """
 
 import re
+import pickle
 from typing import Dict, List, Optional, Any
 from database.db_manager import DatabaseManager
+from utils.cache import LRUCache
+
+try:
+    from config.settings import PARSE_CACHE_SIZE, PARSE_CACHE_TTL
+except ImportError:
+    PARSE_CACHE_SIZE = 512
+    PARSE_CACHE_TTL = 3600.0
+
+# Code tables used when the database is unavailable
+FALLBACK_MATERIAL_CODES = {
+    'S': '316 Stainless Steel',
+    'H': 'Halar Coated',
+    'TS': 'Teflon Sleeve', 
+    'U': 'UHMWPE Blind End',
+    'T': 'Teflon Blind End',
+    'C': 'Ceramic',
+    'CPVC': 'CPVC Blind End'
+}
+
+FALLBACK_OPTION_CODES = {
+    'XSP': 'Extra Static Protection',
+    'VR': 'Vibration Resistance',
+    # 'BP': 'Bent Probe',  # Now handled as degree format (e.g., 90DEG)
+    'CP': 'Cable Probe',
+    'SSTAG': 'Stainless Steel Tag',
+    # 'TEF': 'Teflon Insulator',  # Now handled as insulator via XINS format
+    # 'PEEK': 'PEEK Insulator',   # Now handled as insulator via XINS format
+    'SSHOUSING': 'Stainless Steel Housing',
+    'VRHOUSING': 'Epoxy Housing',
+    '3/4"OD': '3/4" Diameter Probe'
+}
+
+FALLBACK_INSULATOR_CODES = {
+    'TEF': 'Teflon',
+    'UHMWPE': 'UHMWPE',
+    'DEL': 'Delrin',
+    'PEEK': 'PEEK',
+    'CER': 'Ceramic',
+    'U': 'UHMWPE'
+}
 
 class PartNumberParser:
-    def __init__(self):
-        """Initialize parser with database connection"""
-        self.db = DatabaseManager()
-        
-        # Load current data from database
-        self.material_codes = self.db.get_material_codes()
-        self.option_codes = self.db.get_option_codes()
-        self.insulator_codes = self.db.get_insulator_codes()
-        
-        # Fallback hardcoded values if database unavailable
-        if not self.material_codes:
-            self.material_codes = {
-                'S': '316 Stainless Steel',
-                'H': 'Halar Coated',
-                'TS': 'Teflon Sleeve', 
-                'U': 'UHMWPE Blind End',
-                'T': 'Teflon Blind End',
-                'C': 'Ceramic',
-                'CPVC': 'CPVC Blind End'
-            }
+    def __init__(self, db_manager: Optional[DatabaseManager] = None):
+        """Initialize parser with database connection (the default database unless one is given)"""
+        self.db = db_manager if db_manager else DatabaseManager()
         
-        if not self.option_codes:
-            self.option_codes = {
-                'XSP': 'Extra Static Protection',
-                'VR': 'Vibration Resistance',
-                # 'BP': 'Bent Probe',  # Now handled as degree format (e.g., 90DEG)
-                'CP': 'Cable Probe',
-                'SSTAG': 'Stainless Steel Tag',
-                # 'TEF': 'Teflon Insulator',  # Now handled as insulator via XINS format
-                # 'PEEK': 'PEEK Insulator',   # Now handled as insulator via XINS format
-                'SSHOUSING': 'Stainless Steel Housing',
-                'VRHOUSING': 'Epoxy Housing',
-                '3/4"OD': '3/4" Diameter Probe'
-            }
+        # Parsed results keyed by (normalized part number, catalog version)
+        self._parse_cache = LRUCache(maxsize=PARSE_CACHE_SIZE, ttl=PARSE_CACHE_TTL)
         
-        if not self.insulator_codes:
-            self.insulator_codes = {
-                'TEF': 'Teflon',
-                'UHMWPE': 'UHMWPE',
-                'DEL': 'Delrin',
-                'PEEK': 'PEEK',
-                'CER': 'Ceramic',
-                'U': 'UHMWPE'
-            }
+        # Code tables are loaded from the database on first use, not at startup
+        self._material_codes = None
+        self._option_codes = None
+        self._insulator_codes = None
         
         # Default values by model (enhanced with database info)
         self.model_defaults = {
@@ -109,11 +117,59 @@ class PartNumberParser:
             }
         }
     
+    @property
+    def material_codes(self) -> Dict[str, str]:
+        """Probe material code -> name"""
+        if self._material_codes is None:
+            self._material_codes = self.db.get_material_codes() or dict(FALLBACK_MATERIAL_CODES)
+        return self._material_codes
+    
+    @property
+    def option_codes(self) -> Dict[str, str]:
+        """Option code -> name"""
+        if self._option_codes is None:
+            self._option_codes = self.db.get_option_codes() or dict(FALLBACK_OPTION_CODES)
+        return self._option_codes
+    
+    @property
+    def insulator_codes(self) -> Dict[str, str]:
+        """Insulator code -> name"""
+        if self._insulator_codes is None:
+            self._insulator_codes = self.db.get_insulator_codes() or dict(FALLBACK_INSULATOR_CODES)
+        return self._insulator_codes
+    
     def parse_part_number(self, part_number: str) -> Dict[str, Any]:
         """
         Parse a complete part number into all components
         Example: LS2000-115VAC-S-10"-XSP-VR-8"TEFINS
+        
+        Results are cached per normalized part number and catalog version,
+        so a price, option or alias change in the database forces a re-parse.
+        Callers get their own copy and may modify it.
         """
+        if not isinstance(part_number, str):
+            return self._parse_part_number_uncached(part_number)
+        
+        key = (part_number.strip().upper(), self.db.catalog_version)
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            return pickle.loads(cached)
+        
+        result = self._parse_part_number_uncached(part_number)
+        # Stored pickled: a cheap way to hand out independent copies
+        self._parse_cache.put(key, pickle.dumps(result, pickle.HIGHEST_PROTOCOL))
+        return result
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Parse cache hit/miss counters"""
+        return self._parse_cache.stats()
+    
+    def clear_cache(self):
+        """Drop all cached parses"""
+        self._parse_cache.clear()
+    
+    def _parse_part_number_uncached(self, part_number: str) -> Dict[str, Any]:
+        """Parse a part number without consulting the cache"""
         try:
             # Clean up the part number
             part_number = part_number.strip().upper()
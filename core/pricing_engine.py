@@ -3,10 +3,16 @@ Pricing Engine for Babbitt Quote Generator
 Centralized pricing calculations and business rules
 """
 
+import math
 from typing import Dict, List, Optional, Any, Tuple
 from database.db_manager import DatabaseManager
 from core.spare_parts_manager import SparePartsManager
-from utils.logger import get_logger
+from core.pricing_plan import (
+    length_cost, insulator_length_adder, od_option_cost, bent_probe_option,
+    batch_length_costs, batch_od_foot_adders, OD_OPTION_CODE, OD_OPTION_BASE_COST, OD_OPTION_ADDER_PER_FOOT
+)
+from core.pricing_plan import insulator_cost as insulator_rule_cost
+from utils.logger import get_logger, trace
 
 logger = get_logger(__name__)
 
@@ -16,9 +22,9 @@ class PricingEngine:
     Handles all pricing logic and business rules
     """
     
-    def __init__(self):
-        """Initialize pricing engine with database connection"""
-        self.db = DatabaseManager()
+    def __init__(self, db_manager: Optional[DatabaseManager] = None):
+        """Initialize pricing engine with database connection (the default database unless one is given)"""
+        self.db = db_manager if db_manager else DatabaseManager()
         if not self.db.connect():
             logger.warning("Failed to connect to database in PricingEngine")
         self.spare_parts_manager = SparePartsManager(self.db)
@@ -49,14 +55,12 @@ class PricingEngine:
         Returns:
             Dict containing detailed pricing breakdown
         """
-        import math
-        
         try:
             # Round up any non-whole number lengths for pricing
             original_length = probe_length
             probe_length = math.ceil(probe_length)
             
-            logger.info(f"Calculating pricing for {model_code}-{voltage}-{material_code}-{probe_length}\"")
+            trace(logger, "Calculating pricing for %s-%s-%s-%s\"", model_code, voltage, material_code, probe_length)
             
             # Initialize result structure
             pricing_result = {
@@ -132,7 +136,7 @@ class PricingEngine:
                 pricing_result['calculation_notes'].append(f"Length adjustments for {probe_length}\" probe")
             
             # Log successful calculation
-            logger.info(f"Pricing calculated successfully: ${total_price:.2f}")
+            trace(logger, "Pricing calculated successfully: $%.2f", total_price)
             
             return pricing_result
             
@@ -181,12 +185,9 @@ class PricingEngine:
                     result['breakdown'].append(f"Material Adder ({material_code}): ${material_adder:.2f}")
             
             # Add voltage price adder (if any)
-            voltage_info = self.db.execute_query(
-                "SELECT * FROM voltages WHERE model_family = ? AND voltage = ?", 
-                (model_code, voltage)
-            )
+            voltage_info = self.db.get_voltage_info(model_code, voltage)
             if voltage_info:
-                voltage_adder = voltage_info[0].get('price_adder', 0.0)
+                voltage_adder = voltage_info.get('price_adder', 0.0)
                 if voltage_adder > 0:
                     result['total'] += voltage_adder
                     result['components']['voltage'] = voltage_adder
@@ -207,62 +208,36 @@ class PricingEngine:
         }
         
         try:
-            # Get model info to determine model base length
-            model_info = self.db.get_model_info(model_family)
-            if not model_info:
+            # Compiled model entry carries the base length and threshold tables
+            model = self.db.get_model_plan(model_family)
+            if not model:
                 return result
             
-            model_base_length = model_info['base_length']
-            
-            # Get material info for material base length and pricing
-            material_info = self.db.get_material_info(material_code)
-            if not material_info:
+            material = self.db.get_material_plan(material_code)
+            if not material:
                 return result
             
-            # Calculate length cost based on material type
-            if material_info['length_adder_per_foot'] > 0:
-                # Per-foot materials use stepped calculation
-                length_cost = self._calculate_stepped_foot_pricing(
-                    model_base_length, 
-                    probe_length, 
-                    material_info['length_adder_per_foot']
-                )
-                
-                if length_cost > 0:
-                    # Calculate how many foot adders were applied
-                    num_adders = self._count_foot_adders(model_base_length, probe_length)
-                    result['breakdown'].append(f"Length Cost ({num_adders} foot adders @ ${material_info['length_adder_per_foot']:.0f}/ft): ${length_cost:.2f}")
-                    
-            elif material_info['length_adder_per_inch'] > 0:
-                # Per-inch materials use continuous calculation from material base length
-                material_base_length = material_info['material_base_length']
-                extra_length = max(0, probe_length - material_base_length)
-                
-                if extra_length > 0:
-                    length_cost = extra_length * material_info['length_adder_per_inch']
-                    result['breakdown'].append(f"Length Cost ({extra_length:.1f}\" extra @ ${material_info['length_adder_per_inch']:.2f}/in): ${length_cost:.2f}")
-                else:
-                    length_cost = 0.0
-            else:
-                length_cost = 0.0
+            costs = length_cost(model, material, probe_length)
+            length_cost_value = costs['length_cost']
             
-            result['length_cost'] = length_cost
+            if length_cost_value > 0:
+                if material.adder_per_foot > 0:
+                    # Per-foot materials use stepped calculation
+                    result['breakdown'].append(f"Length Cost ({costs['num_foot_adders']} foot adders @ ${material.adder_per_foot:.0f}/ft): ${length_cost_value:.2f}")
+                else:
+                    # Per-inch materials use continuous calculation from material base length
+                    result['breakdown'].append(f"Length Cost ({costs['extra_inches']:.1f}\" extra @ ${material.adder_per_inch:.2f}/in): ${length_cost_value:.2f}")
             
-            # Calculate nonstandard length surcharge
-            surcharge = 0.0
+            result['length_cost'] = length_cost_value
             
-            # Special rule for H (Halar) material: $300 adder for non-standard lengths
-            if material_code == 'H':
-                standard_lengths = [10, 12, 18, 24, 36, 48, 60, 72, 84, 96]
-                if probe_length not in standard_lengths:
-                    surcharge = 300.0
+            # Nonstandard length surcharge
+            surcharge = costs['surcharge']
+            if surcharge > 0:
+                if material_code == 'H':
+                    # Special rule for H (Halar) material: $300 adder for non-standard lengths
                     result['breakdown'].append(f"Non-Standard Length Surcharge (H material, {probe_length}\" not in standard lengths): ${surcharge:.2f}")
-            
-            # Original nonstandard length surcharge for other materials
-            elif (material_info['nonstandard_length_surcharge'] > 0 and 
-                  probe_length > 96.0):  # Nonstandard threshold for most materials
-                surcharge = material_info['nonstandard_length_surcharge']
-                result['breakdown'].append(f"Nonstandard Length Surcharge (>96\"): ${surcharge:.2f}")
+                else:
+                    result['breakdown'].append(f"Nonstandard Length Surcharge (>96\"): ${surcharge:.2f}")
             
             result['surcharge'] = surcharge
             
@@ -272,106 +247,6 @@ class PricingEngine:
         
         return result
     
-    def _calculate_stepped_foot_pricing(self, model_base_length: float, probe_length: float, adder_per_foot: float) -> float:
-        """
-        Calculate stepped foot pricing based on foot thresholds.
-        For 10" base models: first adder at 11", then 24", 36", 48", etc.
-        For 6" base models: first adder at 7", then 18", 30", 42", etc. (every 12" from base)
-        """
-        if probe_length <= model_base_length:
-            return 0.0
-        
-        # Calculate foot thresholds based on model base length
-        if model_base_length == 10.0:
-            # For 10" base: thresholds at 11", 25", 37", 49", 61", 73", 85", 97", 109", 121"...
-            thresholds = [11.0]
-            next_threshold = 25.0
-            while next_threshold <= 121.0:  # Reasonable upper limit
-                thresholds.append(next_threshold)
-                next_threshold += 12.0
-        elif model_base_length == 6.0:
-            # For 6" base (FS10000): first adder at 7", then every 12" from base: 18", 30", 42", 54"...
-            thresholds = [7.0]  # First adder at base + 1"
-            next_threshold = model_base_length + 12.0  # Start at 18" (6" + 12")
-            while next_threshold <= 120.0:  # Reasonable upper limit
-                thresholds.append(next_threshold)
-                next_threshold += 12.0  # Continue every 12": 30", 42", 54", etc.
-        else:
-            # For other base lengths, use simple 12" increments from base + 1"
-            thresholds = [model_base_length + 1.0]
-            next_threshold = model_base_length + 12.0
-            while next_threshold <= model_base_length + 120.0:
-                thresholds.append(next_threshold)
-                next_threshold += 12.0
-        
-        # Count how many thresholds the probe length exceeds
-        num_adders = 0
-        for threshold in thresholds:
-            if probe_length >= threshold:
-                num_adders += 1
-            else:
-                break
-        
-        return num_adders * adder_per_foot
-    
-    def _count_foot_adders(self, model_base_length: float, probe_length: float) -> int:
-        """Count how many foot adders are applied for a given probe length"""
-        if probe_length <= model_base_length:
-            return 0
-        
-        # Use same logic as _calculate_stepped_foot_pricing but just count
-        if model_base_length == 10.0:
-            thresholds = [11.0, 25.0, 37.0, 49.0, 61.0, 73.0, 85.0, 97.0, 109.0, 121.0]
-        elif model_base_length == 6.0:
-            # For 6" base: first adder at 7", then every 12" from base: 18", 30", 42", 54"...
-            thresholds = [7.0, 18.0, 30.0, 42.0, 54.0, 66.0, 78.0, 90.0, 102.0, 114.0]
-        else:
-            thresholds = [model_base_length + 1.0]
-            next_threshold = model_base_length + 12.0
-            while next_threshold <= model_base_length + 120.0:
-                thresholds.append(next_threshold)
-                next_threshold += 12.0
-        
-        num_adders = 0
-        for threshold in thresholds:
-            if probe_length >= threshold:
-                num_adders += 1
-            else:
-                break
-        
-        return num_adders
-    
-    def _calculate_od_option_foot_pricing(self, model_base_length: float, probe_length: float, adder_per_foot: float) -> float:
-        """
-        Calculate 3/4"OD option stepped foot pricing with strict 12" increments.
-        For 3/4"OD: 11" = first adder, 22" = second adder, 34" = third adder, etc.
-        Every 12" from model base length + 1".
-        """
-        if probe_length <= model_base_length:
-            return 0.0
-        
-        # Calculate thresholds: base + 1", base + 12", base + 24", base + 36", etc.
-        thresholds = []
-        for i in range(10):  # Generate up to 10 thresholds (reasonable limit)
-            if i == 0:
-                threshold = model_base_length + 1.0  # First threshold at base + 1"
-            else:
-                threshold = model_base_length + (12.0 * i)  # Subsequent thresholds every 12"
-            
-            if threshold > 120.0:  # Stop at reasonable upper limit
-                break
-            thresholds.append(threshold)
-        
-        # Count how many thresholds the probe length exceeds
-        num_adders = 0
-        for threshold in thresholds:
-            if probe_length >= threshold:
-                num_adders += 1
-            else:
-                break
-        
-        return num_adders * adder_per_foot
-    
     def _calculate_option_pricing(self, option_codes: List[str], probe_length: float, model_code: Optional[str] = None) -> Dict[str, Any]:
         """Calculate pricing for all options"""
         result = {
@@ -385,45 +260,29 @@ class PricingEngine:
                 option_cost = 0.0
                 option_name = code
                 
-                # Check for bent probe degree format (e.g., 90DEG, 45DEG)
-                if code.endswith('DEG'):
-                    try:
-                        degree = int(code[:-3])
-                        if 0 <= degree <= 180:
-                            option_cost = 50.0  # Fixed price for bent probe
-                            option_name = f'Bent Probe ({degree}°)'
-                            result['options'].append({
-                                'code': code,
-                                'name': option_name,
-                                'price': option_cost,
-                                'price_type': 'fixed'
-                            })
-                    except ValueError:
-                        pass
+                bent = bent_probe_option(code)
+                if bent:
+                    if bent['valid']:
+                        option_cost = bent['price']
+                        option_name = bent['name']
+                        result['options'].append({k: v for k, v in bent.items() if k != 'valid'})
                 
-                elif code == '3/4"OD':
-                    # Special handling for 3/4" OD probe: $175 base + $175 per foot in strict 12" increments
-                    # 11" = 1st adder, 22" = 2nd adder, 34" = 3rd adder, etc.
-                    model_info = self.db.get_model_info(model_code) if model_code else None
-                    model_base_length = model_info['base_length'] if model_info else 10.0  # Default to 10" if not found
-                    
-                    base_cost = 175.0
-                    # Use OD-specific stepped foot pricing: strict 12" increments from base + 1"
-                    stepped_foot_cost = self._calculate_od_option_foot_pricing(model_base_length, probe_length, 175.0)
-                    option_cost = base_cost + stepped_foot_cost
+                elif code == OD_OPTION_CODE:
+                    # 3/4" OD probe: base cost plus strict 12" foot steps (11", 22", 34" ...)
+                    model = self.db.get_model_plan(model_code) if model_code else None
+                    model_base_length = model.base_length if model else 10.0  # Default to 10" if not found
+                    od = od_option_cost(model_base_length, probe_length)
+                    option_cost = od['price']
                     option_name = '3/4" Diameter Probe'
                     
-                    # Calculate how many foot adders were applied for breakdown
-                    num_adders = int(stepped_foot_cost / 175.0) if stepped_foot_cost > 0 else 0
-                    
                     result['options'].append({
                         'code': code,
                         'name': option_name,
                         'price': option_cost,
                         'price_type': 'base_plus_stepped_foot',
-                        'base_cost': base_cost,
-                        'stepped_foot_cost': stepped_foot_cost,
-                        'num_foot_adders': num_adders,
+                        'base_cost': od['base_cost'],
+                        'stepped_foot_cost': od['stepped_foot_cost'],
+                        'num_foot_adders': od['num_foot_adders'],
                         'model_base_length': model_base_length
                     })
                 
@@ -460,56 +319,26 @@ class PricingEngine:
         try:
             insulator_info = self.db.get_insulator_info(insulator_code)
             if insulator_info:
-                cost = insulator_info['price_adder']
-                base_cost = cost
-                # Special rule: If probe material is 'h', teflon insulation adder is not applied
-                if material_code.upper() == 'H' and insulator_code.upper() == 'TEF':
-                    base_cost = 0.0
+                model = self.db.get_model_plan(model_code) if model_code else None
+                costs = insulator_rule_cost(insulator_code, insulator_info['price_adder'], material_code,
+                                            model.default_insulator if model else None, insulator_length)
+                if costs['waived'] == 'material_h':
                     result['breakdown'].append(f"Insulator ({insulator_info['name']}): $0.00 (Not applied - Material H)")
-                # Special rule: If base insulator is Teflon, teflon insulation adder is not applied
-                elif model_code and insulator_code.upper() == 'TEF':
-                    model_info = self.db.get_model_info(model_code)
-                    if model_info and model_info.get('default_insulator', '').upper() == 'TEF':
-                        base_cost = 0.0
-                        result['breakdown'].append(f"Insulator ({insulator_info['name']}): $0.00 (Not applied - Base insulator is Teflon)")
-                if base_cost > 0:
-                    result['breakdown'].append(f"Insulator ({insulator_info['name']}): ${base_cost:.2f}")
-                # Always apply length adder if length > 4"
-                length_adder = 0.0
-                if insulator_length and insulator_length > 4.0:
-                    length_adder = self._calculate_insulator_length_adder(insulator_length)
-                    if length_adder > 0:
-                        result['breakdown'].append(f"Insulator Length Adder ({insulator_length}"): ${length_adder:.2f}")
-                result['cost'] = base_cost + length_adder
+                elif costs['waived'] == 'base_teflon':
+                    result['breakdown'].append(f"Insulator ({insulator_info['name']}): $0.00 (Not applied - Base insulator is Teflon)")
+                elif costs['base_cost'] > 0:
+                    result['breakdown'].append(f"Insulator ({insulator_info['name']}): ${costs['base_cost']:.2f}")
+                if costs['length_adder'] > 0:
+                    result['breakdown'].append(f"Insulator Length Adder ({insulator_length}\"): ${costs['length_adder']:.2f}")
+                result['cost'] = costs['cost']
         except Exception as e:
             result['breakdown'].append(f"Insulator pricing error: {str(e)}")
             logger.error(f"Insulator pricing calculation failed: {str(e)}")
         return result
     
     def _calculate_insulator_length_adder(self, insulator_length: float) -> float:
-        """
-        Calculate insulator length adder based on the new pricing rule:
-        - 5-6": $150 adder
-        - 7-8": $200 adder  
-        - 9-10": $250 adder
-        - 11-12": $300 adder
-        - 13-14": $350 adder
-        - 15-16": $400 adder
-        - 17-18": $450 adder
-        - 19-20": $500 adder
-        """
-        if insulator_length <= 4.0:
-            return 0.0
-        
-        # Calculate which bracket the length falls into
-        # Each bracket is 2 inches wide, starting at 5"
-        bracket = int((insulator_length - 5.0) / 2.0) + 1
-        
-        # Calculate adder: $150 base + $50 per additional bracket
-        adder = 150.0 + (bracket - 1) * 50.0
-        
-        # Cap at $500 for 20" and above
-        return min(adder, 500.0)
+        """Insulator length adder (see core.pricing_plan.INSULATOR_LENGTH_BRACKETS)"""
+        return insulator_length_adder(insulator_length)
     
     def _calculate_connection_pricing(self, connection_info: Dict[str, str]) -> Dict[str, Any]:
         """Calculate process connection pricing"""
@@ -536,6 +365,144 @@ class PricingEngine:
         
         return result
     
+    # Columns accepted by price_batch(), in calculate_complete_pricing() argument order
+    BATCH_INPUT_FIELDS = ('model_code', 'voltage', 'material_code', 'probe_length',
+                          'option_codes', 'insulator_code', 'insulator_length', 'connection_info')
+    BATCH_PRICE_FIELDS = ('base_price', 'length_cost', 'length_surcharge', 'option_cost',
+                          'insulator_cost', 'connection_cost', 'total_price')
+    
+    def price_batch(self, configurations: Any, include_breakdown: bool = False) -> Dict[str, List[Any]]:
+        """
+        Price many configurations at once
+        
+        Gives the same totals as calling calculate_complete_pricing() per row,
+        but base, option, insulator and connection prices are computed once per
+        distinct combination and the length math runs column-wise (vectorized
+        when NumPy is installed). Nothing is logged per row.
+        
+        Args:
+            configurations: Either an iterable of dicts, or a dict of equal-length
+                columns, keyed by BATCH_INPUT_FIELDS. Only model_code,
+                material_code and probe_length are required.
+            include_breakdown: Also return the per-row breakdown text (slow path)
+            
+        Returns:
+            Dict of columns: the input fields, 'pricing_length' (rounded up),
+            BATCH_PRICE_FIELDS, 'success' and 'error', plus 'breakdown' when
+            requested
+        """
+        if isinstance(configurations, dict):
+            size = len(configurations.get('model_code', ()))
+            rows = [{field: configurations[field][i] for field in self.BATCH_INPUT_FIELDS if field in configurations}
+                    for i in range(size)]
+        else:
+            rows = list(configurations)
+        
+        columns = {field: [] for field in self.BATCH_INPUT_FIELDS}
+        columns.update({'pricing_length': [], 'success': [], 'error': []})
+        for row in rows:
+            error = None
+            try:
+                length = math.ceil(row['probe_length'])
+            except (KeyError, TypeError, ValueError) as e:
+                length, error = 0, f"Invalid probe length: {e}"
+            for field in self.BATCH_INPUT_FIELDS:
+                columns[field].append(row.get(field))
+            columns['option_codes'][-1] = list(row.get('option_codes') or [])
+            columns['pricing_length'].append(length)
+            columns['success'].append(error is None)
+            columns['error'].append(error)
+        
+        models = columns['model_code']
+        materials = columns['material_code']
+        lengths = columns['pricing_length']
+        model_lookup = {code: self.db.get_model_plan(code) for code in set(models) if code}
+        material_lookup = {code: self.db.get_material_plan(code) for code in set(materials) if code}
+        model_plans = [model_lookup.get(code) for code in models]
+        material_plans = [material_lookup.get(code) for code in materials]
+        
+        # Length cost and surcharge, column-wise
+        length_columns = batch_length_costs(model_plans, material_plans, lengths)
+        
+        # 3/4"OD foot steps, column-wise (unknown models default to a 10" base)
+        od_rows = [i for i, codes in enumerate(columns['option_codes']) if OD_OPTION_CODE in codes]
+        od_costs = {}
+        if od_rows:
+            od_counts = batch_od_foot_adders(
+                [model_plans[i].base_length if model_plans[i] else 10.0 for i in od_rows],
+                [lengths[i] for i in od_rows]
+            )
+            od_costs = {i: OD_OPTION_BASE_COST + count * OD_OPTION_ADDER_PER_FOOT
+                        for i, count in zip(od_rows, od_counts)}
+        
+        # Everything else depends on a handful of distinct combinations
+        base_cache, option_cache, insulator_cache, connection_cache = {}, {}, {}, {}
+        for field in self.BATCH_PRICE_FIELDS:
+            columns[field] = []
+        
+        for i in range(len(rows)):
+            if not columns['success'][i]:
+                for field in self.BATCH_PRICE_FIELDS:
+                    columns[field].append(0.0)
+                continue
+            model_code, voltage, material_code = models[i], columns['voltage'][i], materials[i]
+            
+            key = (model_code, voltage, material_code)
+            if key not in base_cache:
+                base_cache[key] = self._calculate_base_price(model_code, voltage, material_code)['total']
+            base_price = base_cache[key]
+            
+            option_cost = 0.0
+            option_codes = columns['option_codes'][i]
+            if option_codes:
+                # Sum in option order so totals match calculate_complete_pricing exactly
+                for code in option_codes:
+                    if code == OD_OPTION_CODE:
+                        option_cost += od_costs[i]
+                    else:
+                        if code not in option_cache:
+                            option_cache[code] = self._calculate_option_pricing([code], 0, model_code)['total_cost']
+                        option_cost += option_cache[code]
+            
+            insulator_cost = 0.0
+            insulator_code = columns['insulator_code'][i]
+            if insulator_code:
+                key = (insulator_code, material_code, model_code, columns['insulator_length'][i])
+                if key not in insulator_cache:
+                    insulator_cache[key] = self._calculate_insulator_pricing(*key)['cost']
+                insulator_cost = insulator_cache[key]
+            
+            connection_cost = 0.0
+            connection_info = columns['connection_info'][i]
+            if connection_info:
+                key = tuple(sorted(connection_info.items()))
+                if key not in connection_cache:
+                    connection_cache[key] = self._calculate_connection_pricing(connection_info)['cost']
+                connection_cost = connection_cache[key]
+            
+            length_cost_value = length_columns['length_cost'][i]
+            surcharge = length_columns['surcharge'][i]
+            total_price = (base_price + length_cost_value + surcharge +
+                           option_cost + insulator_cost + connection_cost)
+            
+            for field, value in zip(self.BATCH_PRICE_FIELDS,
+                                    (base_price, length_cost_value, surcharge, option_cost,
+                                     insulator_cost, connection_cost, total_price)):
+                columns[field].append(value)
+        
+        if include_breakdown:
+            columns['breakdown'] = [
+                self.calculate_complete_pricing(
+                    models[i], columns['voltage'][i], materials[i], columns['probe_length'][i],
+                    columns['option_codes'][i], columns['insulator_code'][i],
+                    columns['insulator_length'][i], columns['connection_info'][i]
+                )['breakdown'] if columns['success'][i] else [f"ERROR: {columns['error'][i]}"]
+                for i in range(len(rows))
+            ]
+        
+        logger.debug("Batch priced %d configurations", len(rows))
+        return columns
+    
     def get_pricing_summary(self, pricing_result: Dict[str, Any]) -> str:
         """Generate a formatted pricing summary"""
         lines = [
@@ -582,7 +549,7 @@ class PricingEngine:
             
             # Check options
             for option_code in option_codes:
-                if not option_code.endswith('DEG') and option_code != '3/4"OD':
+                if not option_code.endswith('DEG') and option_code != OD_OPTION_CODE:
                     option_info = self.db.get_option_info(option_code)
                     if not option_info:
                         warnings.append(f"Option {option_code} not found in pricing database")
@@ -638,7 +605,7 @@ class PricingEngine:
             if result['subtotal'] > 0:
                 result['breakdown'].append(f"Spare Parts Subtotal: ${result['subtotal']:,.2f}")
             
-            logger.info(f"Spare parts pricing calculated: {result['total_parts']} parts, ${result['subtotal']:,.2f}")
+            logger.debug("Spare parts pricing calculated: %s parts, $%.2f", result['total_parts'], result['subtotal'])
             
             return result
             
@@ -681,7 +648,7 @@ class PricingEngine:
             Dict containing complete quote pricing breakdown
         """
         try:
-            logger.info(f"Calculating complete quote pricing for {model_code} with {len(spare_parts_list or [])} spare parts")
+            logger.debug("Calculating complete quote pricing for %s with %d spare parts", model_code, len(spare_parts_list or []))
             
             # Calculate main product pricing
             product_pricing = self.calculate_complete_pricing(
@@ -727,7 +694,7 @@ class PricingEngine:
             complete_result['warnings'].extend(product_pricing.get('warnings', []))
             complete_result['warnings'].extend(spare_parts_pricing.get('warnings', []))
             
-            logger.info(f"Complete quote pricing calculated: ${quote_total:,.2f}")
+            logger.debug("Complete quote pricing calculated: $%.2f", quote_total)
             
             return complete_result
             
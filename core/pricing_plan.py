@@ -0,0 +1,419 @@
+"""
+Compiled Pricing Plan for Babbitt Quote Generator
+Precomputes the stepped length threshold tables so pricing lookups are bisects
+
+Every length, option and insulator rule lives here once. DatabaseManager,
+PricingEngine and SparePartsParser evaluate the same rules, and per-foot
+rates for probe assemblies come from the length_pricing table (or
+data/length_pricing.json when the database has none).
+"""
+
+import json
+import os
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, NamedTuple, Any
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; batch pricing falls back to plain Python
+    np = None
+
+# Halar (H) probes are stocked in these lengths; anything else carries a surcharge
+HALAR_STANDARD_LENGTHS = frozenset([10, 12, 18, 24, 36, 48, 60, 72, 84, 96])
+HALAR_NONSTANDARD_SURCHARGE = 300.0
+
+# Other materials apply their nonstandard surcharge above this length
+NONSTANDARD_LENGTH_THRESHOLD = 96.0
+
+# 3/4"OD probe: $175 base plus $175 per foot step
+OD_OPTION_BASE_COST = 175.0
+OD_OPTION_ADDER_PER_FOOT = 175.0
+OD_OPTION_CODE = '3/4"OD'
+
+# Bent probe options (e.g. 90DEG) are a flat price for 0-180 degrees
+BENT_PROBE_PRICE = 50.0
+BENT_PROBE_MAX_DEGREES = 180
+
+# Insulator length adder: $150 for 5-6", +$50 per 2" bracket, capped at $500 (19"+)
+INSULATOR_LENGTH_FREE_MAX = 4.0
+INSULATOR_LENGTH_BASE_ADDER = 150.0
+INSULATOR_LENGTH_STEP_ADDER = 50.0
+INSULATOR_LENGTH_BRACKETS = (7.0, 9.0, 11.0, 13.0, 15.0, 17.0, 19.0)
+
+
+@lru_cache(maxsize=None)
+def stepped_foot_thresholds(model_base_length: float) -> Tuple[float, ...]:
+    """
+    Probe lengths at which each per-foot adder starts.
+    10" base: 11", 25", 37" ... 121"
+    6" base (FS10000): 7", 18", 30" ... 114"
+    Other bases: base + 1", then every 12" from base up to base + 120"
+    """
+    if model_base_length == 10.0:
+        thresholds = [11.0]
+        next_threshold, limit = 25.0, 121.0
+    elif model_base_length == 6.0:
+        thresholds = [7.0]
+        next_threshold, limit = model_base_length + 12.0, 120.0
+    else:
+        thresholds = [model_base_length + 1.0]
+        next_threshold, limit = model_base_length + 12.0, model_base_length + 120.0
+
+    while next_threshold <= limit:
+        thresholds.append(next_threshold)
+        next_threshold += 12.0
+    return tuple(thresholds)
+
+
+@lru_cache(maxsize=None)
+def od_option_thresholds(model_base_length: float) -> Tuple[float, ...]:
+    """
+    3/4"OD foot steps: base + 1", then base + 12", base + 24" ... (max 10 steps, none past 120")
+    """
+    thresholds = []
+    for i in range(10):
+        threshold = model_base_length + 1.0 if i == 0 else model_base_length + 12.0 * i
+        if threshold > 120.0:
+            break
+        thresholds.append(threshold)
+    return tuple(thresholds)
+
+
+def count_steps(thresholds: Tuple[float, ...], probe_length: float) -> int:
+    """Number of thresholds the probe length has reached"""
+    return bisect_right(thresholds, probe_length)
+
+
+def foot_adder_count(model_base_length: float, probe_length: float) -> int:
+    """Number of per-foot adders for a probe on a model with this base length"""
+    if probe_length <= model_base_length:
+        return 0
+    return count_steps(stepped_foot_thresholds(model_base_length), probe_length)
+
+
+def od_foot_adder_count(model_base_length: float, probe_length: float) -> int:
+    """Number of 3/4"OD foot adders for a probe on a model with this base length"""
+    if probe_length <= model_base_length:
+        return 0
+    return count_steps(od_option_thresholds(model_base_length), probe_length)
+
+
+def insulator_length_adder(insulator_length: float) -> float:
+    """Insulator length adder for lengths over 4" (see INSULATOR_LENGTH_BRACKETS)"""
+    if insulator_length <= INSULATOR_LENGTH_FREE_MAX:
+        return 0.0
+    steps = bisect_right(INSULATOR_LENGTH_BRACKETS, insulator_length)
+    return INSULATOR_LENGTH_BASE_ADDER + steps * INSULATOR_LENGTH_STEP_ADDER
+
+
+def prorated_length_adder(length: float, base_length: float, adder_per_foot: float = 0.0,
+                          adder_per_inch: float = 0.0) -> float:
+    """Continuous (non-stepped) adder for every inch past the base length, as spare probes are priced"""
+    extra_inches = length - base_length
+    if extra_inches <= 0:
+        return 0.0
+    return extra_inches * (adder_per_foot / 12.0 + adder_per_inch)
+
+
+def od_option_cost(model_base_length: float, probe_length: float) -> Dict[str, float]:
+    """3/4"OD option: base cost plus one adder per OD foot step"""
+    num_adders = od_foot_adder_count(model_base_length, probe_length)
+    stepped_foot_cost = num_adders * OD_OPTION_ADDER_PER_FOOT
+    return {
+        'price': OD_OPTION_BASE_COST + stepped_foot_cost,
+        'base_cost': OD_OPTION_BASE_COST,
+        'stepped_foot_cost': stepped_foot_cost,
+        'num_foot_adders': num_adders,
+    }
+
+
+def bent_probe_option(code: str) -> Optional[Dict[str, Any]]:
+    """
+    Option entry for a bent probe code ('90DEG'), None for any other code.
+    Out-of-range or malformed degree codes price to zero with valid=False.
+    """
+    if not code.endswith('DEG'):
+        return None
+    try:
+        degree = int(code[:-3])
+    except ValueError:
+        return {'code': code, 'name': 'Invalid Bent Probe Format', 'price': 0.0,
+                'price_type': 'fixed', 'valid': False}
+    if 0 <= degree <= BENT_PROBE_MAX_DEGREES:
+        return {'code': code, 'name': f'Bent Probe ({degree}°)', 'price': BENT_PROBE_PRICE,
+                'price_type': 'fixed', 'valid': True}
+    return {'code': code, 'name': f'Invalid Bent Probe ({degree}°)', 'price': 0.0,
+            'price_type': 'fixed', 'valid': False}
+
+
+def insulator_cost(insulator_code: str, price_adder: float, material_code: Optional[str] = None,
+                   default_insulator: Optional[str] = None,
+                   insulator_length: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Insulator adder with the Teflon waivers and the length adder.
+    Teflon is free on Halar (H) probes and on models whose standard insulator
+    is already Teflon; the length adder always applies over 4".
+
+    Returns:
+        base_cost, length_adder, cost and waived ('material_h', 'base_teflon' or None)
+    """
+    waived = None
+    if insulator_code.upper() == 'TEF':
+        if material_code and material_code.upper() == 'H':
+            waived = 'material_h'
+        elif default_insulator and default_insulator.upper() == 'TEF':
+            waived = 'base_teflon'
+    base_cost = 0.0 if waived else price_adder
+    length_adder = insulator_length_adder(insulator_length) if insulator_length else 0.0
+    return {
+        'base_cost': base_cost,
+        'length_adder': length_adder,
+        'cost': base_cost + length_adder,
+        'waived': waived,
+    }
+
+
+class ModelPlan(NamedTuple):
+    """Pricing-relevant fields of a product model with its threshold tables"""
+    model_number: str
+    base_length: float
+    default_insulator: str
+    foot_thresholds: Tuple[float, ...]
+    od_thresholds: Tuple[float, ...]
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> 'ModelPlan':
+        base_length = row['base_length']
+        return cls(
+            model_number=row['model_number'],
+            base_length=base_length,
+            default_insulator=(row.get('default_insulator') or '').upper(),
+            foot_thresholds=stepped_foot_thresholds(base_length),
+            od_thresholds=od_option_thresholds(base_length),
+        )
+
+    def foot_adders(self, probe_length: float) -> int:
+        if probe_length <= self.base_length:
+            return 0
+        return bisect_right(self.foot_thresholds, probe_length)
+
+    def od_foot_adders(self, probe_length: float) -> int:
+        if probe_length <= self.base_length:
+            return 0
+        return bisect_right(self.od_thresholds, probe_length)
+
+
+class MaterialPlan(NamedTuple):
+    """Pricing-relevant fields of a probe material"""
+    code: str
+    base_price_adder: float
+    adder_per_foot: float
+    adder_per_inch: float
+    material_base_length: float
+    nonstandard_surcharge: float
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> 'MaterialPlan':
+        return cls(
+            code=row['code'],
+            base_price_adder=row['base_price_adder'],
+            adder_per_foot=row['length_adder_per_foot'],
+            adder_per_inch=row['length_adder_per_inch'],
+            material_base_length=row.get('material_base_length', 4.0),
+            nonstandard_surcharge=row['nonstandard_length_surcharge'],
+        )
+
+
+class LengthRule(NamedTuple):
+    """One length_pricing row: how a material is priced by length on a model family"""
+    model_family: str
+    material_code: str
+    base_length: float
+    adder_per_foot: float
+    adder_per_inch: float
+    nonstandard_surcharge: float
+    nonstandard_threshold: float
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> 'LengthRule':
+        return cls(
+            model_family=row['model_family'],
+            material_code=row['material_code'],
+            base_length=row['base_length'],
+            adder_per_foot=row.get('adder_per_foot') or 0.0,
+            adder_per_inch=row.get('adder_per_inch') or 0.0,
+            nonstandard_surcharge=row.get('nonstandard_surcharge') or 0.0,
+            nonstandard_threshold=row.get('nonstandard_threshold') or 0.0,
+        )
+
+    def prorated_adder(self, length: float) -> float:
+        """Adder for a spare probe assembly of this length"""
+        return prorated_length_adder(length, self.base_length, self.adder_per_foot, self.adder_per_inch)
+
+
+LENGTH_PRICING_JSON = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                   'data', 'length_pricing.json')
+
+
+def compile_length_rules(rows) -> Dict[Tuple[str, str], LengthRule]:
+    """(model_family, material_code) -> LengthRule; the first row for a pair wins"""
+    rules: Dict[Tuple[str, str], LengthRule] = {}
+    for row in rows:
+        rule = LengthRule.from_row(row)
+        rules.setdefault((rule.model_family, rule.material_code), rule)
+    return rules
+
+
+@lru_cache(maxsize=None)
+def default_length_rules(path: str = LENGTH_PRICING_JSON) -> Dict[Tuple[str, str], LengthRule]:
+    """Rule table from the exported length_pricing data file (empty if it is missing)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return compile_length_rules(json.load(f))
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def length_cost(model: ModelPlan, material: MaterialPlan, probe_length: float) -> Dict[str, float]:
+    """
+    Length cost and nonstandard surcharge for a (whole-inch) probe length.
+    Per-foot materials use the model's stepped thresholds; per-inch materials
+    charge every inch past the material base length.
+    """
+    num_adders = 0
+    extra_inches = 0.0
+    cost = 0.0
+    if material.adder_per_foot > 0:
+        num_adders = model.foot_adders(probe_length)
+        cost = num_adders * material.adder_per_foot
+    elif material.adder_per_inch > 0:
+        extra_inches = max(0, probe_length - material.material_base_length)
+        cost = extra_inches * material.adder_per_inch
+
+    surcharge = 0.0
+    if material.code == 'H':
+        if probe_length not in HALAR_STANDARD_LENGTHS:
+            surcharge = HALAR_NONSTANDARD_SURCHARGE
+    elif material.nonstandard_surcharge > 0 and probe_length > NONSTANDARD_LENGTH_THRESHOLD:
+        surcharge = material.nonstandard_surcharge
+
+    return {
+        'length_cost': cost,
+        'surcharge': surcharge,
+        'num_foot_adders': num_adders,
+        'extra_inches': extra_inches,
+    }
+
+
+def batch_length_costs(models: Sequence[Optional[ModelPlan]],
+                       materials: Sequence[Optional[MaterialPlan]],
+                       lengths: Sequence[float]) -> Dict[str, List[float]]:
+    """
+    Column-wise length_cost() for many configurations.
+    Rows whose model or material is unknown price to zero, as in
+    PricingEngine. Uses NumPy when it is installed.
+    """
+    if np is None or not lengths:
+        columns = {'length_cost': [], 'surcharge': [], 'num_foot_adders': []}
+        for model, material, length in zip(models, materials, lengths):
+            if model is None or material is None:
+                costs = {'length_cost': 0.0, 'surcharge': 0.0, 'num_foot_adders': 0}
+            else:
+                costs = length_cost(model, material, length)
+            for key in columns:
+                columns[key].append(costs[key])
+        return columns
+
+    known = [model is not None and material is not None for model, material in zip(models, materials)]
+    lengths_arr = np.asarray(lengths, dtype=float)
+    known_arr = np.asarray(known, dtype=bool)
+
+    def material_column(field, default=0.0):
+        return np.array([getattr(m, field) if ok else default for m, ok in zip(materials, known)], dtype=float)
+
+    per_foot = material_column('adder_per_foot')
+    per_inch = material_column('adder_per_inch')
+    material_base = material_column('material_base_length')
+    nonstandard = material_column('nonstandard_surcharge')
+    is_halar = np.array([ok and m.code == 'H' for m, ok in zip(materials, known)], dtype=bool)
+    base_lengths = np.array([m.base_length if ok else 0.0 for m, ok in zip(models, known)], dtype=float)
+
+    # Foot adder counts: one searchsorted per distinct model base length
+    counts = np.zeros(len(lengths_arr), dtype=np.int64)
+    for base_length in np.unique(base_lengths[known_arr]):
+        rows = known_arr & (base_lengths == base_length)
+        thresholds = np.asarray(stepped_foot_thresholds(float(base_length)))
+        counts[rows] = np.searchsorted(thresholds, lengths_arr[rows], side='right')
+    counts[lengths_arr <= base_lengths] = 0
+
+    uses_foot = per_foot > 0
+    uses_inch = ~uses_foot & (per_inch > 0)
+    counts[~uses_foot] = 0
+    cost = np.where(uses_foot, counts * per_foot, 0.0)
+    cost = np.where(uses_inch, np.maximum(0, lengths_arr - material_base) * per_inch, cost)
+
+    standard = np.isin(lengths_arr, np.asarray(sorted(HALAR_STANDARD_LENGTHS), dtype=float))
+    surcharge = np.where(is_halar & ~standard, HALAR_NONSTANDARD_SURCHARGE, 0.0)
+    surcharge = np.where(~is_halar & known_arr & (nonstandard > 0) & (lengths_arr > NONSTANDARD_LENGTH_THRESHOLD),
+                         nonstandard, surcharge)
+
+    return {
+        'length_cost': cost.tolist(),
+        'surcharge': surcharge.tolist(),
+        'num_foot_adders': counts.tolist(),
+    }
+
+
+def batch_od_foot_adders(base_lengths: Sequence[float], lengths: Sequence[float]) -> List[int]:
+    """Column-wise od_foot_adder_count()"""
+    if np is None or not lengths:
+        return [od_foot_adder_count(base, length) for base, length in zip(base_lengths, lengths)]
+
+    base_arr = np.asarray(base_lengths, dtype=float)
+    lengths_arr = np.asarray(lengths, dtype=float)
+    counts = np.zeros(len(lengths_arr), dtype=np.int64)
+    for base_length in np.unique(base_arr):
+        rows = base_arr == base_length
+        thresholds = np.asarray(od_option_thresholds(float(base_length)))
+        counts[rows] = np.searchsorted(thresholds, lengths_arr[rows], side='right')
+    counts[lengths_arr <= base_arr] = 0
+    return counts.tolist()
+
+
+class PricingPlan:
+    """
+    Pricing plan compiled from one catalog snapshot: model and material
+    entries with their threshold tables, keyed by code, plus the length
+    rule table.
+    """
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.version = catalog.version
+        self.models = {row['model_number']: ModelPlan.from_row(row)
+                       for row in catalog.rows('product_models')}
+        self.materials = {row['code']: MaterialPlan.from_row(row)
+                          for row in catalog.rows('materials')}
+        if catalog.has_table('length_pricing'):
+            self.length_rules = compile_length_rules(catalog.rows('length_pricing'))
+        else:
+            self.length_rules = default_length_rules()
+
+    def model(self, model_code: str) -> Optional[ModelPlan]:
+        plan = self.models.get(model_code)
+        if plan is None and model_code:
+            # Same prefix fallback as DatabaseManager.get_model_info
+            row = self.catalog.get_model_info(model_code)
+            plan = self.models.get(row['model_number']) if row else None
+        return plan
+
+    def material(self, material_code: str) -> Optional[MaterialPlan]:
+        return self.materials.get(material_code)
+
+    def length_rule(self, model_code: str, material_code: str) -> Optional[LengthRule]:
+        rule = self.length_rules.get((model_code, material_code))
+        if rule is None and model_code:
+            model = self.model(model_code)
+            rule = self.length_rules.get((model.model_number, material_code)) if model else None
+        return rule
@@ -4,16 +4,22 @@ Creates Word documents from parsed quote data
 """
 
 import os
+import importlib.util
 from typing import Dict, Any, Optional
 from datetime import datetime
 
-try:
-    from docx import Document
-    from docx.shared import Inches
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
+# python-docx is imported when the first document is generated, not at app startup
+DOCX_AVAILABLE = importlib.util.find_spec('docx') is not None
+Document = None
+WD_ALIGN_PARAGRAPH = None
+
+
+def _load_docx():
+    """Import the python-docx names used below (once)"""
+    global Document, WD_ALIGN_PARAGRAPH
+    if Document is None:
+        from docx import Document
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
 
 class QuoteGenerator:
     def __init__(self):
@@ -38,6 +44,7 @@ class QuoteGenerator:
         
         try:
             # Create a new document
+            _load_docx()
             doc = Document()
             
             # Add header
@@ -68,7 +75,7 @@ class QuoteGenerator:
             print(f"❌ Error generating quote: {e}")
             return False
     
-    def _add_header(self, doc: Document, data: Dict[str, Any]):
+    def _add_header(self, doc: 'Document', data: Dict[str, Any]):
         """Add document header"""
         # Company header
         header = doc.add_heading('Babbitt International', 0)
@@ -87,7 +94,7 @@ class QuoteGenerator:
         
         doc.add_paragraph("=" * 60)
     
-    def _add_part_info(self, doc: Document, data: Dict[str, Any]):
+    def _add_part_info(self, doc: 'Document', data: Dict[str, Any]):
         """Add basic part information"""
         doc.add_heading('Product Information', 2)
         
@@ -117,7 +124,7 @@ class QuoteGenerator:
         
         doc.add_paragraph("")
     
-    def _add_specifications(self, doc: Document, data: Dict[str, Any]):
+    def _add_specifications(self, doc: 'Document', data: Dict[str, Any]):
         """Add detailed specifications"""
         doc.add_heading('Technical Specifications', 2)
         
@@ -192,7 +199,7 @@ class QuoteGenerator:
         limits_p.add_run(f"O-Ring Material: ").bold = True
         limits_p.add_run(f"{data.get('oring_material', 'N/A')}")
     
-    def _add_options(self, doc: Document, data: Dict[str, Any]):
+    def _add_options(self, doc: 'Document', data: Dict[str, Any]):
         """Add options section"""
         options = data.get('options', [])
         
@@ -204,7 +211,7 @@ class QuoteGenerator:
                 option_p.add_run(f"{option.get('code', 'N/A')}: ").bold = True
                 option_p.add_run(option.get('name', 'N/A'))
     
-    def _add_warnings_errors(self, doc: Document, data: Dict[str, Any]):
+    def _add_warnings_errors(self, doc: 'Document', data: Dict[str, Any]):
         """Add warnings and errors"""
         warnings = data.get('warnings', [])
         errors = data.get('errors', [])
@@ -223,7 +230,7 @@ class QuoteGenerator:
                 error_p.add_run("❌ ").bold = True
                 error_p.add_run(error)
     
-    def _add_footer(self, doc: Document):
+    def _add_footer(self, doc: 'Document'):
         """Add document footer"""
         doc.add_paragraph("")
         doc.add_paragraph("=" * 60)
@@ -4,8 +4,8 @@ Handles spare parts business logic, pricing, and validation
 """
 
 from typing import Dict, List, Optional, Any, Tuple
-import json
 from database.db_manager import DatabaseManager
+from database.spare_part_models import parse_compatible_models
 from .spare_parts_parser import SparePartsParser
 
 class SparePartsManager:
@@ -37,7 +37,7 @@ class SparePartsManager:
             'cable': 8
         }
 
-        self.spare_parts_parser = SparePartsParser()
+        self.spare_parts_parser = SparePartsParser(self.db_manager)
     
     def get_spare_parts_for_model(self, model_code: str, category: Optional[str] = None) -> Dict[str, Any]:
         """Get organized spare parts data for a specific model"""
@@ -108,10 +108,7 @@ class SparePartsManager:
             part['category_display'] = self.category_display.get(part['category'], part['category'])
             
             # Parse compatible models
-            try:
-                part['compatible_models_list'] = json.loads(part['compatible_models'])
-            except (json.JSONDecodeError, TypeError):
-                part['compatible_models_list'] = [part['compatible_models']] if part['compatible_models'] else []
+            part['compatible_models_list'] = parse_compatible_models(part['compatible_models'])
             
             # Add ordering requirements summary
             requirements = []
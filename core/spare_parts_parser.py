@@ -8,9 +8,9 @@ from typing import Dict, List, Optional, Any, Tuple
 from database.db_manager import DatabaseManager
 
 class SparePartsParser:
-    def __init__(self):
+    def __init__(self, db_manager: Optional[DatabaseManager] = None):
         """Initialize spare parts parser with pattern definitions"""
-        self.db = DatabaseManager()
+        self.db = db_manager if db_manager else DatabaseManager()
         
         # Define parsing patterns for different spare part types
         self.patterns = {
@@ -228,17 +228,11 @@ class SparePartsParser:
         # For probe assemblies, calculate length-based pricing
         if result['part_type'] == 'probe_assembly' and 'length' in variables:
             length = float(variables['length'])
-            material = variables['material']
             
-            # Add length surcharges based on material and length
-            if material == 'S' and length > 10:  # Stainless steel
-                additional_cost = (length - 10) * 45.0 / 12.0  # $45 per foot
-            elif material == 'H' and length > 10:  # Halar
-                additional_cost = (length - 10) * 110.0 / 12.0  # $110 per foot
-            else:
-                additional_cost = 0
-            
-            base_price += additional_cost
+            # Prorated per-foot/per-inch rate from the model's length pricing rule
+            rule = self.db.get_length_rule(variables['model'], variables['material'])
+            if rule:
+                base_price += rule.prorated_adder(length)
         
         result['pricing_info'] = {
             'base_price': result['database_match']['price'],
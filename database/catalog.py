@@ -0,0 +1,274 @@
+"""
+Reference Catalog Snapshot for Babbitt Quote Generator
+Loads the product reference tables once and serves lookups from memory
+"""
+
+import itertools
+import os
+import sqlite3
+import threading
+import time
+from types import MappingProxyType
+from typing import Callable, Dict, List, Optional, Tuple, Mapping, Any
+
+from utils.logger import get_logger
+
+try:
+    from config.settings import CATALOG_REFRESH_INTERVAL
+except ImportError:
+    CATALOG_REFRESH_INTERVAL = 2.0  # seconds
+
+logger = get_logger(__name__)
+
+# Reference tables mirrored in the snapshot (quotes, employees etc. are not)
+CATALOG_TABLES = (
+    'product_models',
+    'materials',
+    'options',
+    'insulators',
+    'voltages',
+    'process_connections',
+    'spare_parts',
+)
+
+# Loaded when present; older databases may not have them
+CATALOG_OPTIONAL_TABLES = (
+    'part_section_aliases',
+    'length_pricing',
+)
+
+_version_counter = itertools.count(1)
+_UNLOADED = object()
+
+
+class CatalogSnapshot:
+    """Immutable, versioned view of the reference tables with dict indexes.
+
+    Rows are stored read-only; lookups hand back plain ``dict`` copies so
+    callers can keep annotating results the way they did with query rows.
+    """
+
+    def __init__(self, tables: Dict[str, List[Mapping[str, Any]]], version: int):
+        self.version = version
+        self.loaded_at = time.time()
+        self._tables = {name: tuple(rows) for name, rows in tables.items()}
+
+        self._models = {}
+        for row in self._tables.get('product_models', ()):
+            self._models.setdefault(row['model_number'], row)
+
+        self._materials = self._index_by_code('materials')
+        self._options = self._index_by_code('options')
+        self._insulators = self._index_by_code('insulators')
+
+        self._voltages = {}
+        for row in self._tables.get('voltages', ()):
+            self._voltages.setdefault((row['model_family'], row['voltage']), row)
+
+        self._connections = {}
+        for row in self._tables.get('process_connections', ()):
+            key = (row['type'], row['size'], row['material'], row['rating'] or '')
+            self._connections.setdefault(key, row)
+
+        self._spare_parts = {}
+        for row in self._tables.get('spare_parts', ()):
+            self._spare_parts.setdefault(row['part_number'], row)
+
+        self._aliases = {}
+        for row in self._tables.get('part_section_aliases', ()):
+            self._aliases.setdefault((row['section_type'], row['alias']), row['standard_code'])
+
+        self._derived: Dict[str, Any] = {}
+        self._derived_lock = threading.Lock()
+
+    def _index_by_code(self, table: str) -> Dict[str, Mapping[str, Any]]:
+        index = {}
+        for row in self._tables.get(table, ()):
+            index.setdefault(row['code'], row)
+        return index
+
+    @classmethod
+    def load(cls, connection: sqlite3.Connection) -> 'CatalogSnapshot':
+        """Read every reference table from an open connection"""
+        cursor = connection.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        existing = {row[0] for row in cursor.fetchall()}
+        tables = {}
+        for table in CATALOG_TABLES + tuple(t for t in CATALOG_OPTIONAL_TABLES if t in existing):
+            cursor.execute(f"SELECT * FROM {table} ORDER BY rowid")
+            columns = [col[0] for col in cursor.description]
+            tables[table] = [MappingProxyType(dict(zip(columns, row))) for row in cursor.fetchall()]
+        return cls(tables, next(_version_counter))
+
+    # Lookups ---------------------------------------------------------------
+
+    @staticmethod
+    def _copy(row: Optional[Mapping[str, Any]]) -> Optional[Dict]:
+        return dict(row) if row is not None else None
+
+    def get_model_info(self, model_code: str) -> Optional[Dict]:
+        """Exact model match, falling back to a case-insensitive prefix match"""
+        if model_code is None:
+            return None
+        row = self._models.get(model_code)
+        if row is None:
+            prefix = str(model_code).lower()
+            for candidate in self._tables['product_models']:
+                if str(candidate['model_number']).lower().startswith(prefix):
+                    row = candidate
+                    break
+        return self._copy(row)
+
+    def get_material_info(self, material_code: str) -> Optional[Dict]:
+        return self._copy(self._materials.get(material_code))
+
+    def get_option_info(self, option_code: str) -> Optional[Dict]:
+        return self._copy(self._options.get(option_code))
+
+    def get_insulator_info(self, insulator_code: str) -> Optional[Dict]:
+        return self._copy(self._insulators.get(insulator_code))
+
+    def get_voltage_info(self, model_family: str, voltage: str) -> Optional[Dict]:
+        return self._copy(self._voltages.get((model_family, voltage)))
+
+    def get_voltage_options(self, model_family: Optional[str] = None) -> List[Dict]:
+        rows = [row for row in self._tables['voltages']
+                if not model_family or row['model_family'] == model_family]
+        rows.sort(key=lambda row: (row['model_family'], -(row['is_default'] or 0), row['voltage']))
+        return [dict(row) for row in rows]
+
+    def get_process_connection_info(self, conn_type: str, size: str, material: str = 'SS',
+                                    rating: Optional[str] = None) -> Optional[Dict]:
+        return self._copy(self._connections.get((conn_type, size, material, rating or '')))
+
+    def get_spare_part(self, part_number: str) -> Optional[Dict]:
+        return self._copy(self._spare_parts.get(part_number))
+
+    def has_table(self, table: str) -> bool:
+        return table in self._tables
+
+    def get_section_alias(self, section_type: str, alias: str) -> Optional[str]:
+        return self._aliases.get((section_type, alias))
+
+    def same_content(self, other: 'CatalogSnapshot') -> bool:
+        """True if both snapshots hold identical rows"""
+        return self._tables == other._tables
+
+    def get_code_map(self, table: str) -> Dict[str, str]:
+        """code -> name mapping for materials, options or insulators"""
+        return {row['code']: row['name'] for row in self._tables[table]}
+
+    def rows(self, table: str) -> Tuple[Mapping[str, Any], ...]:
+        """Read-only rows of a reference table in rowid order"""
+        return self._tables[table]
+
+    def derived(self, key: str, factory: Callable[['CatalogSnapshot'], Any]) -> Any:
+        """Build-once structure compiled from this snapshot (e.g. the pricing plan).
+
+        Derived data lives and dies with the snapshot, so a catalog refresh
+        recompiles it automatically.
+        """
+        value = self._derived.get(key)
+        if value is None:
+            with self._derived_lock:
+                value = self._derived.get(key)
+                if value is None:
+                    value = factory(self)
+                    self._derived[key] = value
+        return value
+
+
+class CatalogCache:
+    """Holds the current snapshot for one database file.
+
+    The snapshot is swapped in one assignment once a replacement has fully
+    loaded, so readers always see a complete catalog. Changes are detected
+    from the database file (and WAL) stat, checked at most once per
+    ``refresh_interval`` seconds.
+    """
+
+    def __init__(self, db_path: str, refresh_interval: float = CATALOG_REFRESH_INTERVAL):
+        self.db_path = db_path
+        self.refresh_interval = refresh_interval
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._fingerprint = _UNLOADED
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _stat_fingerprint(self):
+        fingerprint = []
+        for path in (self.db_path, self.db_path + '-wal'):
+            try:
+                st = os.stat(path)
+                fingerprint.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                fingerprint.append(None)
+        return tuple(fingerprint)
+
+    def get(self) -> Optional[CatalogSnapshot]:
+        """Return the current snapshot, reloading it if the database changed"""
+        snapshot = self._snapshot
+        now = time.monotonic()
+        if snapshot is not None and now - self._checked_at < self.refresh_interval:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is not None and now - self._checked_at < self.refresh_interval:
+                return self._snapshot
+            fingerprint = self._stat_fingerprint()
+            self._checked_at = now
+            if fingerprint == self._fingerprint:
+                return self._snapshot
+            return self._reload(fingerprint)
+
+    def _reload(self, fingerprint) -> Optional[CatalogSnapshot]:
+        # Remember the fingerprint even on failure so a missing or partial
+        # database is not re-read on every lookup
+        self._fingerprint = fingerprint
+        if not os.path.exists(self.db_path):
+            self._snapshot = None
+            return None
+        try:
+            connection = sqlite3.connect(self.db_path)
+            try:
+                # One read transaction so all tables come from the same commit
+                connection.execute("BEGIN")
+                snapshot = CatalogSnapshot.load(connection)
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            logger.warning("Catalog snapshot load failed, using direct queries: %s", e)
+            self._snapshot = None
+            return None
+
+        # Writes to other tables (quotes, employees...) also touch the file;
+        # keep the current version when the reference data did not change
+        if self._snapshot is not None and self._snapshot.same_content(snapshot):
+            return self._snapshot
+
+        self._snapshot = snapshot
+        logger.debug("Loaded catalog snapshot v%d from %s", snapshot.version, self.db_path)
+        return snapshot
+
+    def invalidate(self):
+        """Force the next lookup to re-check the database"""
+        with self._lock:
+            self._fingerprint = _UNLOADED
+            self._checked_at = 0.0
+
+
+_caches: Dict[str, CatalogCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_catalog_cache(db_path: str) -> CatalogCache:
+    """Shared catalog cache for a database file (one per absolute path)"""
+    key = os.path.abspath(db_path)
+    cache = _caches.get(key)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(key)
+            if cache is None:
+                cache = CatalogCache(key)
+                _caches[key] = cache
+    return cache
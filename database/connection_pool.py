@@ -0,0 +1,227 @@
+"""
+SQLite Connection Pool for Babbitt Quote Generator
+Keeps one tuned connection per thread per database file
+"""
+
+import atexit
+import os
+import sqlite3
+import threading
+from typing import Dict, Optional, Any, Tuple
+
+from utils.logger import get_logger
+
+try:
+    from config.database_config import POOL_SETTINGS, PRAGMA_SETTINGS, NETWORK_PRAGMA_OVERRIDES
+except ImportError:
+    POOL_SETTINGS = {
+        'max_connections': 10,
+        'connection_timeout': 30,
+        'cached_statements': 256,
+    }
+    PRAGMA_SETTINGS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -8000,
+        'mmap_size': 67108864,
+        'temp_store': 'MEMORY',
+    }
+    NETWORK_PRAGMA_OVERRIDES = {
+        'journal_mode': 'DELETE',
+        'mmap_size': 0,
+    }
+
+logger = get_logger(__name__)
+
+# Filesystem types (as listed in /proc/mounts) that are served over the network
+_NETWORK_FILESYSTEMS = {'cifs', 'smbfs', 'smb3', 'nfs', 'nfs4', 'afs', 'fuse.sshfs', '9p'}
+_DRIVE_REMOTE = 4  # GetDriveTypeW result for a mapped network drive
+
+
+def _mount_type(path: str) -> Optional[str]:
+    """Filesystem type of the mount containing path, or None if unknown"""
+    try:
+        with open('/proc/mounts', encoding='utf-8') as mounts:
+            entries = [line.split()[1:3] for line in mounts if len(line.split()) >= 3]
+    except OSError:
+        return None
+    best, fs_type = '', None
+    for mount_point, mount_type in entries:
+        mount_point = mount_point.replace('\\040', ' ')
+        prefix = mount_point.rstrip('/') + '/'
+        if (path == mount_point or path.startswith(prefix)) and len(mount_point) > len(best):
+            best, fs_type = mount_point, mount_type
+    return fs_type
+
+
+def is_network_path(path: str) -> bool:
+    """True if path is on a network share (UNC path, mapped drive or network mount)"""
+    if path.startswith(('\\\\', '//')):
+        return True
+    path = os.path.abspath(path)
+    if os.name == 'nt':
+        drive = os.path.splitdrive(path)[0]
+        if drive.startswith('\\\\'):
+            return True
+        try:
+            import ctypes
+            return ctypes.windll.kernel32.GetDriveTypeW(drive + '\\') == _DRIVE_REMOTE
+        except (AttributeError, OSError):
+            return False
+    return _mount_type(path) in _NETWORK_FILESYSTEMS
+
+
+class ConnectionPool:
+    """Thread-affine pool of SQLite connections for one database file.
+
+    sqlite3 connections must not be shared between threads, so each thread
+    gets its own connection which is kept open and reused until the pool is
+    closed. Connections belonging to threads that have exited are closed the
+    next time a new thread asks for one.
+
+    Several owners on one thread (e.g. nested DatabaseManagers) share its
+    connection; each registers with hold() and hands it back with release(),
+    and uncommitted work is only rolled back when the last of them does.
+
+    Databases on a network share keep rollback journaling and no mmap
+    (NETWORK_PRAGMA_OVERRIDES) unless pragmas are given explicitly.
+    """
+
+    def __init__(self, db_path: str, row_factory: Any = None,
+                 pragmas: Optional[Dict[str, Any]] = None,
+                 timeout: float = POOL_SETTINGS.get('connection_timeout', 30),
+                 cached_statements: int = POOL_SETTINGS.get('cached_statements', 256),
+                 max_connections: int = POOL_SETTINGS.get('max_connections', 10)):
+        self.db_path = db_path
+        self.row_factory = row_factory
+        if pragmas is None:
+            pragmas = dict(PRAGMA_SETTINGS)
+            if is_network_path(db_path):
+                pragmas.update(NETWORK_PRAGMA_OVERRIDES)
+                logger.info("%s is on a network share; using %s journaling", db_path,
+                            pragmas.get('journal_mode'))
+        self.pragmas = dict(pragmas)
+        self.timeout = timeout
+        self.cached_statements = cached_statements
+        self.max_connections = max_connections
+        self._connections: Dict[threading.Thread, sqlite3.Connection] = {}
+        self._holders: Dict[threading.Thread, int] = {}
+        self._lock = threading.Lock()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.timeout,
+            cached_statements=self.cached_statements,
+            check_same_thread=False,  # affinity is enforced by the pool; lets close_all() run anywhere
+        )
+        if self.row_factory is not None:
+            conn.row_factory = self.row_factory
+        for name, value in self.pragmas.items():
+            try:
+                conn.execute(f"PRAGMA {name} = {value}")
+            except sqlite3.Error as e:
+                # e.g. WAL is refused on some network filesystems; keep going with defaults
+                logger.warning("PRAGMA %s = %s failed on %s: %s", name, value, self.db_path, e)
+        return conn
+
+    def _prune_dead_threads(self):
+        dead = [thread for thread in self._connections if not thread.is_alive()]
+        for thread in dead:
+            self._holders.pop(thread, None)
+            self._close(self._connections.pop(thread))
+
+    @staticmethod
+    def _close(conn: sqlite3.Connection):
+        try:
+            conn.close()
+        except sqlite3.Error as e:
+            logger.warning("Error closing pooled connection: %s", e)
+
+    def acquire(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, opening it on first use"""
+        thread = threading.current_thread()
+        conn = self._connections.get(thread)
+        if conn is not None:
+            return conn
+
+        with self._lock:
+            self._prune_dead_threads()
+            if len(self._connections) >= self.max_connections:
+                logger.warning("Connection pool for %s exceeded %d threads",
+                               self.db_path, self.max_connections)
+            conn = self._open()
+            self._connections[thread] = conn
+            return conn
+
+    def hold(self) -> sqlite3.Connection:
+        """Get the calling thread's connection and count the caller as holding it until release()"""
+        conn = self.acquire()
+        thread = threading.current_thread()
+        with self._lock:
+            self._holders[thread] = self._holders.get(thread, 0) + 1
+        return conn
+
+    def release(self, conn: Optional[sqlite3.Connection]):
+        """Hand a connection back; uncommitted work is rolled back once no other holder remains"""
+        thread = threading.current_thread()
+        with self._lock:
+            holders = self._holders.get(thread, 0)
+            if holders > 1:
+                self._holders[thread] = holders - 1
+                return
+            self._holders.pop(thread, None)
+        if conn is not None and conn.in_transaction:
+            try:
+                conn.rollback()
+            except sqlite3.Error as e:
+                logger.warning("Rollback on release failed: %s", e)
+
+    def discard(self):
+        """Close and forget the calling thread's connection"""
+        with self._lock:
+            conn = self._connections.pop(threading.current_thread(), None)
+            self._holders.pop(threading.current_thread(), None)
+        if conn is not None:
+            self._close(conn)
+
+    def close_all(self):
+        """Close every pooled connection (checkpoints the WAL on last close)"""
+        with self._lock:
+            connections = list(self._connections.values())
+            self._connections.clear()
+            self._holders.clear()
+        for conn in connections:
+            self._close(conn)
+
+    @property
+    def size(self) -> int:
+        return len(self._connections)
+
+
+_pools: Dict[Tuple[str, Any], ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: str, row_factory: Any = None) -> ConnectionPool:
+    """Shared pool for a database file and row factory (one per absolute path and factory)"""
+    key = (os.path.abspath(db_path), row_factory)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = ConnectionPool(key[0], row_factory=row_factory)
+                _pools[key] = pool
+    return pool
+
+
+def close_all_pools():
+    """Close the connections of every pool"""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close_all()
+
+
+atexit.register(close_all_pools)
@@ -127,6 +127,8 @@ CREATE TABLE quotes (
     customer_email TEXT,
     status TEXT DEFAULT 'draft',
     total_price REAL DEFAULT 0.0,
+    user_initials TEXT, -- quoting user, for reports and the Open Quote list
+    created_date TEXT, -- YYYY-MM-DD of created_at, for daily report rollups
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
@@ -140,6 +142,8 @@ CREATE TABLE quote_items (
     quantity INTEGER DEFAULT 1,
     unit_price REAL NOT NULL,
     total_price REAL NOT NULL,
+    item_type TEXT, -- 'main' or 'spare'
+    payload TEXT, -- JSON of the full quote item, restored by load_quote
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (quote_id) REFERENCES quotes(id)
 );
@@ -218,6 +222,8 @@ CREATE INDEX idx_process_connections_type_size ON process_connections(type, size
 CREATE INDEX idx_voltages_model_voltage ON voltages(model_family, voltage);
 CREATE INDEX idx_length_pricing_material_model ON length_pricing(material_code, model_family);
 CREATE INDEX idx_quotes_number ON quotes(quote_number);
+CREATE INDEX idx_quotes_user_created ON quotes(user_initials, created_at);
+CREATE INDEX idx_quotes_created_date ON quotes(created_date);
 CREATE INDEX idx_quote_items_quote ON quote_items(quote_id);
 CREATE INDEX idx_spare_parts_part_number ON spare_parts(part_number);
 CREATE INDEX idx_spare_parts_category ON spare_parts(category);
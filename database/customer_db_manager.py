@@ -8,6 +8,9 @@ import os
 from typing import List, Dict, Optional
 import logging
 
+from database.connection_pool import get_pool
+from database.full_text import get_searcher, CUSTOMERS_INDEX
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,8 +47,12 @@ class CustomerDBManager:
             raise
     
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection."""
-        return sqlite3.connect(self.db_path)
+        """Get this thread's pooled database connection.
+        
+        Used as ``with self._get_connection() as conn`` which commits or
+        rolls back but leaves the connection open for reuse.
+        """
+        return get_pool(self.db_path).acquire()
     
     def add_customer(self, customer_name: str, contact_name: Optional[str] = None, 
                     email: Optional[str] = None, phone: Optional[str] = None) -> int:
@@ -86,9 +93,19 @@ class CustomerDBManager:
             columns = [description[0] for description in cursor.description]
             return [dict(zip(columns, row)) for row in cursor.fetchall()]
     
-    def search_customers(self, search_term: str) -> List[Dict]:
-        """Search customers by name or contact name."""
+    def search_customers(self, search_term: str, limit: Optional[int] = None) -> List[Dict]:
+        """Search customers by name or contact name, best matches first.
+        
+        Each word of the search term matches the start of a word in either
+        field; rows also carry a bm25 'rank' and a highlighted 'snippet'.
+        If no word matches, falls back to a substring search.
+        """
         with self._get_connection() as conn:
+            results = get_searcher(self.db_path).search(
+                conn, CUSTOMERS_INDEX, search_term, order_by="t.customer_name", limit=limit)
+            if results:
+                return results
+            
             cursor = conn.cursor()
             search_pattern = f"%{search_term}%"
             cursor.execute("""
@@ -98,7 +115,7 @@ class CustomerDBManager:
             """, (search_pattern, search_pattern))
             
             columns = [description[0] for description in cursor.description]
-            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()][:limit]
     
     def update_customer(self, customer_id: int, **kwargs) -> bool:
         """Update a customer's information."""
@@ -5,46 +5,124 @@ Handles all database connections and queries
 
 import sqlite3
 import os
-import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+
+from database.catalog import get_catalog_cache, CatalogSnapshot
+from database.connection_pool import get_pool
+from database.suggestion_index import SuggestionIndex
+from database.quote_numbers import get_allocator
+from database.reporting import (
+    ensure_migrated as ensure_reporting_migrated, initials_from_quote_number, query_rollup,
+    write_csv as write_report_csv
+)
+from database.quote_items import (
+    ITEM_INSERT, LEGACY_ITEM_INSERT, QuoteItems, item_rows, ensure_migrated as ensure_quote_items_migrated
+)
+from database.spare_part_models import ensure_migrated, parse_compatible_models, CompatibilityIndex, ALL_MODELS
+from database.full_text import (
+    get_searcher, QUOTES_INDEX, SPARE_PARTS_INDEX, PRODUCT_MODELS_INDEX, SearchIndex
+)
+from core.pricing_plan import (
+    PricingPlan, ModelPlan, MaterialPlan, LengthRule, length_cost, insulator_length_adder,
+    insulator_cost, od_option_cost, bent_probe_option, prorated_length_adder,
+    default_length_rules, compile_length_rules, OD_OPTION_CODE, OD_OPTION_ADDER_PER_FOOT
+)
+
+# Locations tried, in order, when no database path is given; the first is the default
+DEFAULT_DB_PATHS = (
+    "database/quotes.db",
+    "quotes.db",
+    "../quotes.db"
+)
 
 class DatabaseManager:
     def __init__(self, db_path: Optional[str] = None):
         """Initialize database manager"""
         if db_path is None:
             # Try to find the database in common locations
-            possible_paths = [
-                "database/quotes.db",
-                "quotes.db", 
-                "../quotes.db"
-            ]
-            
-            for path in possible_paths:
+            for path in DEFAULT_DB_PATHS:
                 if os.path.exists(path):
                     self.db_path = path
                     break
             else:
-                self.db_path = "database/quotes.db"  # Default location
+                self.db_path = DEFAULT_DB_PATHS[0]  # Default location
         else:
             self.db_path = db_path
             
-        self.connection = None
+        self._pool = get_pool(self.db_path, row_factory=sqlite3.Row)  # Enable column access by name
+        self._connected = False
+        self._catalog_cache = get_catalog_cache(self.db_path)
+    
+    def _catalog(self) -> Optional[CatalogSnapshot]:
+        """Current reference catalog snapshot, or None to fall back to SQL"""
+        return self._catalog_cache.get()
+    
+    @property
+    def catalog_version(self) -> int:
+        """Version of the reference catalog snapshot (0 if unavailable)"""
+        catalog = self._catalog()
+        return catalog.version if catalog else 0
+    
+    def _pricing_plan(self) -> Optional[PricingPlan]:
+        """Pricing plan compiled from the current catalog snapshot"""
+        catalog = self._catalog()
+        return catalog.derived('pricing_plan', PricingPlan) if catalog else None
+    
+    def get_model_plan(self, model_code: str) -> Optional[ModelPlan]:
+        """Compiled pricing entry (base length, threshold tables) for a model"""
+        plan = self._pricing_plan()
+        if plan:
+            return plan.model(model_code)
+        model_info = self.get_model_info(model_code)
+        return ModelPlan.from_row(model_info) if model_info else None
+    
+    def get_material_plan(self, material_code: str) -> Optional[MaterialPlan]:
+        """Compiled pricing entry for a probe material"""
+        plan = self._pricing_plan()
+        if plan:
+            return plan.material(material_code)
+        material_info = self.get_material_info(material_code)
+        return MaterialPlan.from_row(material_info) if material_info else None
+    
+    def get_length_rule(self, model_code: str, material_code: str) -> Optional[LengthRule]:
+        """Length pricing rule (length_pricing row) for a model family and material"""
+        plan = self._pricing_plan()
+        if plan:
+            return plan.length_rule(model_code, material_code)
+        rules = compile_length_rules(self.execute_query(
+            "SELECT * FROM length_pricing WHERE model_family = ? AND material_code = ?",
+            (model_code, material_code))) or default_length_rules()
+        return rules.get((model_code, material_code))
+    
+    def refresh_catalog(self):
+        """Reload the reference catalog after product/material/option edits"""
+        self._catalog_cache.invalidate()
+        return self._catalog()
+    
+    @property
+    def connection(self) -> Optional[sqlite3.Connection]:
+        """The calling thread's pooled connection while connected, else None"""
+        if not self._connected:
+            return None
+        return self._pool.acquire()
     
     def connect(self):
-        """Establish database connection"""
+        """Establish database connection (reuses this thread's pooled connection)"""
+        if self._connected:
+            return True
         try:
-            self.connection = sqlite3.connect(self.db_path)
-            self.connection.row_factory = sqlite3.Row  # Enable column access by name
+            self._pool.hold()
+            self._connected = True
             return True
         except sqlite3.Error as e:
             print(f"Database connection error: {e}")
             return False
     
     def disconnect(self):
-        """Close database connection"""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        """Release the pooled connection; uncommitted changes are rolled back once no other manager holds it"""
+        if self._connected:
+            self._pool.release(self._pool.acquire())
+            self._connected = False
     
     def execute_query(self, query: str, params: tuple = ()) -> List[Dict]:
         """Execute a SELECT query and return results"""
@@ -69,8 +147,23 @@ class DatabaseManager:
             print(f"Query execution error: {e}")
             return []
     
+    def full_text_search(self, index: SearchIndex, search_term: str, **kwargs) -> Optional[List[Dict]]:
+        """
+        Ranked FTS5 search of one table (see database.full_text.FullTextSearcher.search).
+        
+        Returns:
+            Matching rows, or None if the term is blank or full-text search is unavailable
+        """
+        if not self.connection and not self.connect():
+            return None
+        return get_searcher(self.db_path).search(self.connection, index, search_term, **kwargs)
+    
     def get_model_info(self, model_code: str) -> Optional[Dict]:
         """Get model information by model code"""
+        catalog = self._catalog()
+        if catalog:
+            return catalog.get_model_info(model_code)
+        
         query = """
         SELECT * FROM product_models 
         WHERE model_number = ? OR model_number LIKE ?
@@ -82,24 +175,40 @@ class DatabaseManager:
     
     def get_material_info(self, material_code: str) -> Optional[Dict]:
         """Get material information by code"""
+        catalog = self._catalog()
+        if catalog:
+            return catalog.get_material_info(material_code)
+        
         query = "SELECT * FROM materials WHERE code = ?"
         results = self.execute_query(query, (material_code,))
         return results[0] if results else None
     
     def get_insulator_info(self, insulator_code: str) -> Optional[Dict]:
         """Get insulator information by code"""
+        catalog = self._catalog()
+        if catalog:
+            return catalog.get_insulator_info(insulator_code)
+        
         query = "SELECT * FROM insulators WHERE code = ?"
         results = self.execute_query(query, (insulator_code,))
         return results[0] if results else None
     
     def get_option_info(self, option_code: str) -> Optional[Dict]:
         """Get option information by code"""
+        catalog = self._catalog()
+        if catalog:
+            return catalog.get_option_info(option_code)
+        
         query = "SELECT * FROM options WHERE code = ?"
         results = self.execute_query(query, (option_code,))
         return results[0] if results else None
     
     def get_voltage_options(self, model_family: Optional[str] = None) -> List[Dict]:
         """Get available voltage options, optionally filtered by model family"""
+        catalog = self._catalog()
+        if catalog:
+            return catalog.get_voltage_options(model_family)
+        
         if model_family:
             query = "SELECT * FROM voltages WHERE model_family = ? ORDER BY is_default DESC, voltage"
             params = (model_family,)
@@ -109,6 +218,16 @@ class DatabaseManager:
         
         return self.execute_query(query, params)
     
+    def get_voltage_info(self, model_family: str, voltage: str) -> Optional[Dict]:
+        """Get the voltage row for a model family/voltage combination"""
+        catalog = self._catalog()
+        if catalog:
+            return catalog.get_voltage_info(model_family, voltage)
+        
+        query = "SELECT * FROM voltages WHERE model_family = ? AND voltage = ?"
+        results = self.execute_query(query, (model_family, voltage))
+        return results[0] if results else None
+    
     def get_length_pricing(self, material_code: str, model_family: str) -> Optional[Dict]:
         """Get length pricing rules for material and model"""
         query = """
@@ -134,12 +253,9 @@ class DatabaseManager:
             base_price += material_info['base_price_adder']
         
         # Add voltage price adder (if any)
-        voltage_info = self.execute_query(
-            "SELECT * FROM voltages WHERE model_family = ? AND voltage = ?", 
-            (model_code, voltage)
-        )
+        voltage_info = self.get_voltage_info(model_code, voltage)
         if voltage_info:
-            base_price += voltage_info[0].get('price_adder', 0.0)
+            base_price += voltage_info.get('price_adder', 0.0)
         
         return base_price
     
@@ -150,184 +266,53 @@ class DatabaseManager:
         # Round up any non-whole number lengths for pricing
         probe_length = math.ceil(probe_length)
         
-        # Get model info for base length
-        model_info = self.get_model_info(model_family)
-        if not model_info:
+        model = self.get_model_plan(model_family)
+        if not model:
             return {'length_cost': 0.0, 'surcharge': 0.0}
         
-        model_base_length = model_info['base_length']
-        
-        # Get material info for pricing
-        material_info = self.get_material_info(material_code)
-        if not material_info:
+        material = self.get_material_plan(material_code)
+        if not material:
             return {'length_cost': 0.0, 'surcharge': 0.0}
         
-        # Calculate length cost based on material type
-        length_cost = 0.0
-        if material_info['length_adder_per_foot'] > 0:
-            # Per-foot materials use stepped calculation
-            length_cost = self._calculate_stepped_foot_pricing(
-                model_base_length, 
-                probe_length, 
-                material_info['length_adder_per_foot']
-            )
-        elif material_info['length_adder_per_inch'] > 0:
-            # Per-inch materials use continuous calculation from material base length
-            material_base_length = material_info.get('material_base_length', 4.0)  # Default to 4" if not specified
-            extra_length = max(0, probe_length - material_base_length)
-            if extra_length > 0:
-                length_cost = extra_length * material_info['length_adder_per_inch']
-        
-        # Calculate nonstandard length surcharge
-        surcharge = 0.0
-        
-        # Special rule for H (Halar) material: $300 adder for non-standard lengths
-        if material_code == 'H':
-            standard_lengths = [10, 12, 18, 24, 36, 48, 60, 72, 84, 96]
-            if probe_length not in standard_lengths:
-                surcharge = 300.0
-        
-        # Original nonstandard length surcharge for other materials
-        elif (material_info['nonstandard_length_surcharge'] > 0 and 
-              probe_length > 96.0):  # Standard threshold for most materials
-            surcharge = material_info['nonstandard_length_surcharge']
+        # Per-foot materials use the model's stepped thresholds, per-inch
+        # materials charge from the material base length
+        costs = length_cost(model, material, probe_length)
+        model_base_length = model.base_length
         
         return {
-            'length_cost': length_cost,
-            'surcharge': surcharge,
+            'length_cost': costs['length_cost'],
+            'surcharge': costs['surcharge'],
             'extra_length': probe_length - model_base_length if probe_length > model_base_length else 0,
             'base_length': model_base_length
         }
     
-    def _calculate_stepped_foot_pricing(self, model_base_length: float, probe_length: float, adder_per_foot: float) -> float:
-        """
-        Calculate stepped foot pricing based on foot thresholds.
-        For 10" base models: first adder at 11", then 24", 36", 48", etc.
-        For 6" base models: first adder at 7", then 18", 30", 42", etc. (every 12" from base)
-        """
-        if probe_length <= model_base_length:
-            return 0.0
-        
-        # Calculate foot thresholds based on model base length
-        if model_base_length == 10.0:
-            # For 10" base: thresholds at 11", 25", 37", 49", 61", 73", 85", 97", 109", 121"...
-            thresholds = [11.0]
-            next_threshold = 25.0
-            while next_threshold <= 121.0:  # Reasonable upper limit
-                thresholds.append(next_threshold)
-                next_threshold += 12.0
-        elif model_base_length == 6.0:
-            # For 6" base (FS10000): first adder at 7", then every 12" from base: 18", 30", 42", 54"...
-            thresholds = [7.0]  # First adder at base + 1"
-            next_threshold = model_base_length + 12.0  # Start at 18" (6" + 12")
-            while next_threshold <= 120.0:  # Reasonable upper limit
-                thresholds.append(next_threshold)
-                next_threshold += 12.0  # Continue every 12": 30", 42", 54", etc.
-        else:
-            # For other base lengths, use simple 12" increments from base + 1"
-            thresholds = [model_base_length + 1.0]
-            next_threshold = model_base_length + 12.0
-            while next_threshold <= model_base_length + 120.0:
-                thresholds.append(next_threshold)
-                next_threshold += 12.0
-        
-        # Count how many thresholds the probe length exceeds
-        num_adders = 0
-        for threshold in thresholds:
-            if probe_length >= threshold:
-                num_adders += 1
-            else:
-                break
-        
-        return num_adders * adder_per_foot
-    
-    def _calculate_od_option_foot_pricing(self, model_base_length: float, probe_length: float, adder_per_foot: float) -> float:
-        """
-        Calculate 3/4"OD option stepped foot pricing with strict 12" increments.
-        For 3/4"OD: 11" = first adder, 22" = second adder, 34" = third adder, etc.
-        Every 12" from model base length + 1".
-        """
-        if probe_length <= model_base_length:
-            return 0.0
-        
-        # Calculate thresholds: base + 1", base + 12", base + 24", base + 36", etc.
-        thresholds = []
-        for i in range(10):  # Generate up to 10 thresholds (reasonable limit)
-            if i == 0:
-                threshold = model_base_length + 1.0  # First threshold at base + 1"
-            else:
-                threshold = model_base_length + (12.0 * i)  # Subsequent thresholds every 12"
-            
-            if threshold > 120.0:  # Stop at reasonable upper limit
-                break
-            thresholds.append(threshold)
-        
-        # Count how many thresholds the probe length exceeds
-        num_adders = 0
-        for threshold in thresholds:
-            if probe_length >= threshold:
-                num_adders += 1
-            else:
-                break
-        
-        return num_adders * adder_per_foot
-    
     def calculate_option_cost(self, option_codes: List[str], probe_length: float = 10.0, model_code: Optional[str] = None) -> Dict[str, Any]:
         """Calculate total cost for options with special handling for 3/4"OD probe"""
         total_cost = 0.0
         option_details = []
         
         for code in option_codes:
-            # Check for bent probe degree format (e.g., 90DEG, 45DEG)
-            if code.endswith('DEG'):
-                # Extract degree and validate
-                try:
-                    degree = int(code[:-3])  # Remove 'DEG' suffix
-                    if 0 <= degree <= 180:
-                        option_details.append({
-                            'code': code,
-                            'name': f'Bent Probe ({degree}°)',
-                            'price': 50.0,  # Fixed price for all bent probe configurations
-                            'price_type': 'fixed'
-                        })
-                        total_cost += 50.0
-                    else:
-                        # Invalid degree range
-                        option_details.append({
-                            'code': code,
-                            'name': f'Invalid Bent Probe ({degree}°)',
-                            'price': 0.0,
-                            'price_type': 'fixed'
-                        })
-                except ValueError:
-                    # Invalid format
-                    option_details.append({
-                        'code': code,
-                        'name': f'Invalid Bent Probe Format',
-                        'price': 0.0,
-                        'price_type': 'fixed'
-                    })
-            elif code == '3/4"OD':
-                # Special handling for 3/4" OD probe: $175 base + $175 per foot in strict 12" increments
-                model_info = self.get_model_info(model_code) if model_code else None
-                model_base_length = model_info['base_length'] if model_info else 10.0  # Default to 10" if not found
-                
-                base_cost = 175.0
-                # Use OD-specific stepped foot pricing: 11"=1st adder, 22"=2nd adder, 34"=3rd adder, etc.
-                stepped_foot_cost = self._calculate_od_option_foot_pricing(model_base_length, probe_length, 175.0)
-                total_od_cost = base_cost + stepped_foot_cost
+            bent = bent_probe_option(code)
+            if bent:
+                option_details.append({k: v for k, v in bent.items() if k != 'valid'})
+                total_cost += bent['price']
+            elif code == OD_OPTION_CODE:
+                # 3/4" OD probe: base cost plus strict 12" foot steps (11", 22", 34" ...)
+                model = self.get_model_plan(model_code) if model_code else None
+                model_base_length = model.base_length if model else 10.0  # Default to 10" if not found
+                od = od_option_cost(model_base_length, probe_length)
                 
                 option_details.append({
                     'code': code,
                     'name': '3/4" Diameter Probe',
-                    'price': total_od_cost,
+                    'price': od['price'],
                     'price_type': 'base_plus_per_foot',
-                    'base_cost': base_cost,
-                    'per_foot_cost': stepped_foot_cost,
+                    'base_cost': od['base_cost'],
+                    'per_foot_cost': od['stepped_foot_cost'],
                     'probe_length_feet': probe_length / 12.0,
                     'model_base_length': model_base_length
                 })
-                total_cost += total_od_cost
+                total_cost += od['price']
             else:
                 # Regular option from database
                 option_info = self.get_option_info(code)
@@ -350,46 +335,13 @@ class DatabaseManager:
         insulator_info = self.get_insulator_info(insulator_code)
         if not insulator_info:
             return 0.0
-        cost = insulator_info['price_adder']
-        base_cost = cost
-        # Special rule: If probe material is 'h', teflon insulation adder is not applied
-        if (material_code and material_code.upper() == 'H' and insulator_code.upper() == 'TEF'):
-            base_cost = 0.0
-        # Special rule: If base insulator is Teflon, teflon insulation adder is not applied
-        elif (model_code and insulator_code.upper() == 'TEF'):
-            model_info = self.get_model_info(model_code)
-            if model_info and model_info.get('default_insulator', '').upper() == 'TEF':
-                base_cost = 0.0
-        # Always apply length adder if length > 4"
-        length_adder = 0.0
-        if insulator_length and insulator_length > 4.0:
-            length_adder = self._calculate_insulator_length_adder(insulator_length)
-        return base_cost + length_adder
+        model = self.get_model_plan(model_code) if model_code else None
+        return insulator_cost(insulator_code, insulator_info['price_adder'], material_code,
+                              model.default_insulator if model else None, insulator_length)['cost']
     
     def _calculate_insulator_length_adder(self, insulator_length: float) -> float:
-        """
-        Calculate insulator length adder based on the new pricing rule:
-        - 5-6": $150 adder
-        - 7-8": $200 adder  
-        - 9-10": $250 adder
-        - 11-12": $300 adder
-        - 13-14": $350 adder
-        - 15-16": $400 adder
-        - 17-18": $450 adder
-        - 19-20": $500 adder
-        """
-        if insulator_length <= 4.0:
-            return 0.0
-        
-        # Calculate which bracket the length falls into
-        # Each bracket is 2 inches wide, starting at 5"
-        bracket = int((insulator_length - 5.0) / 2.0) + 1
-        
-        # Calculate adder: $150 base + $50 per additional bracket
-        adder = 150.0 + (bracket - 1) * 50.0
-        
-        # Cap at $500 for 20" and above
-        return min(adder, 500.0)
+        """Insulator length adder (see core.pricing_plan.INSULATOR_LENGTH_BRACKETS)"""
+        return insulator_length_adder(insulator_length)
     
     def calculate_total_price(self, model_code: str, voltage: str, material_code: str, 
                             probe_length: float, option_codes: Optional[List[str]] = None, 
@@ -447,6 +399,10 @@ class DatabaseManager:
     # PROCESS CONNECTION METHODS
     def get_process_connection_info(self, conn_type: str, size: str, material: str = 'SS', rating: Optional[str] = None) -> Optional[Dict]:
         """Get process connection information by type, size, material, and rating"""
+        catalog = self._catalog()
+        if catalog:
+            return catalog.get_process_connection_info(conn_type, size, material, rating)
+        
         if rating:
             query = """
             SELECT * FROM process_connections 
@@ -559,6 +515,10 @@ class DatabaseManager:
 
     def get_material_codes(self) -> Dict[str, str]:
         """Get material code mappings"""
+        catalog = self._catalog()
+        if catalog:
+            return catalog.get_code_map('materials')
+        
         query = "SELECT code, name FROM materials"
         results = self.execute_query(query)
         
@@ -566,6 +526,10 @@ class DatabaseManager:
     
     def get_insulator_codes(self) -> Dict[str, str]:
         """Get insulator code mappings"""
+        catalog = self._catalog()
+        if catalog:
+            return catalog.get_code_map('insulators')
+        
         query = "SELECT code, name FROM insulators"
         results = self.execute_query(query)
         
@@ -573,13 +537,24 @@ class DatabaseManager:
     
     def get_option_codes(self) -> Dict[str, str]:
         """Get option code mappings"""
+        catalog = self._catalog()
+        if catalog:
+            return catalog.get_code_map('options')
+        
         query = "SELECT code, name FROM options"
         results = self.execute_query(query)
         
         return {row['code']: row['name'] for row in results}
     
-    def search_parts(self, search_term: str) -> List[Dict]:
-        """Search for parts in product catalog"""
+    def search_parts(self, search_term: str, limit: Optional[int] = None) -> List[Dict]:
+        """Search for parts in product catalog, best matches first (substring search if no word matches)"""
+        results = self.full_text_search(
+            PRODUCT_MODELS_INDEX, search_term,
+            select="t.model_number as part_number, t.description as name, t.base_price as price, 'product' as type",
+            order_by="t.model_number", limit=limit)
+        if results:
+            return results
+        
         query = """
         SELECT model_number as part_number, description as name, base_price as price, 'product' as type
         FROM product_models 
@@ -587,36 +562,54 @@ class DatabaseManager:
         """
         
         search_pattern = f"%{search_term}%"
-        return self.execute_query(query, (search_pattern, search_pattern))
+        return self.execute_query(query, (search_pattern, search_pattern))[:limit]
 
     # SPARE PARTS METHODS
     
+    def _spare_part_model_filter(self, model_code: str, table: str = 'spare_parts') -> Tuple[str, tuple]:
+        """
+        SQL condition (and its parameters) selecting parts compatible with a model.
+        
+        Uses the spare_part_models join table, migrating it on first use; parts
+        marked 'ALL' match every model. Falls back to a LIKE over the JSON
+        column if the table cannot be created.
+        """
+        if (self.connection or self.connect()) and ensure_migrated(self.db_path, self.connection):
+            return (f"{table}.id IN (SELECT spare_part_id FROM spare_part_models WHERE model_code IN (?, ?))",
+                    (model_code, ALL_MODELS))
+        return f"{table}.compatible_models LIKE ?", (f"%{model_code}%",)
+    
+    def _compatibility_index(self) -> Optional[CompatibilityIndex]:
+        """Parsed compatible_models for all spare parts, from the catalog snapshot"""
+        catalog = self._catalog()
+        return catalog.derived('spare_part_compatibility', CompatibilityIndex) if catalog else None
+    
     def get_spare_parts_by_model(self, model_code: str) -> List[Dict]:
-        """Get all spare parts compatible with a specific model"""
-        query = """
-        SELECT sp.*, 
-               CASE 
-                   WHEN sp.compatible_models LIKE ? THEN 1
-                   ELSE 0
-               END as direct_match
+        """Get all spare parts compatible with a specific model (model-specific parts before 'ALL' parts)"""
+        condition, params = self._spare_part_model_filter(model_code, 'sp')
+        if 'spare_part_models' in condition:
+            direct_match = "EXISTS (SELECT 1 FROM spare_part_models m WHERE m.spare_part_id = sp.id AND m.model_code = ?)"
+            params = (model_code, *params)
+        else:
+            direct_match = "1"
+        query = f"""
+        SELECT sp.*, {direct_match} as direct_match
         FROM spare_parts sp
-        WHERE sp.compatible_models LIKE ?
+        WHERE {condition}
         ORDER BY direct_match DESC, sp.category, sp.name
         """
-        
-        search_pattern = f"%{model_code}%"
-        return self.execute_query(query, (search_pattern, search_pattern))
+        return self.execute_query(query, params)
     
     def get_spare_parts_by_category(self, category: str, model_code: Optional[str] = None) -> List[Dict]:
         """Get spare parts by category, optionally filtered by model compatibility"""
         if model_code:
-            query = """
+            condition, model_params = self._spare_part_model_filter(model_code)
+            query = f"""
             SELECT * FROM spare_parts 
-            WHERE category = ? AND compatible_models LIKE ?
+            WHERE category = ? AND {condition}
             ORDER BY name
             """
-            search_pattern = f"%{model_code}%"
-            params = (category, search_pattern)
+            params = (category, *model_params)
         else:
             query = """
             SELECT * FROM spare_parts 
@@ -629,24 +622,41 @@ class DatabaseManager:
     
     def get_spare_part_by_part_number(self, part_number: str) -> Optional[Dict]:
         """Get specific spare part by part number"""
+        catalog = self._catalog()
+        if catalog:
+            return catalog.get_spare_part(part_number)
+        
         query = "SELECT * FROM spare_parts WHERE part_number = ?"
         results = self.execute_query(query, (part_number,))
         return results[0] if results else None
     
-    def search_spare_parts(self, search_term: str, model_code: Optional[str] = None) -> List[Dict]:
-        """Search spare parts by name, part number, or description"""
+    def search_spare_parts(self, search_term: str, model_code: Optional[str] = None,
+                           limit: Optional[int] = None) -> List[Dict]:
+        """
+        Search spare parts by name, part number, or description, best matches first.
+        
+        Falls back to a substring search when no word matches, since part
+        numbers are indexed as single words.
+        """
+        condition, model_params = self._spare_part_model_filter(model_code, 't') if model_code else ('', ())
+        results = self.full_text_search(
+            SPARE_PARTS_INDEX, search_term,
+            where=condition, params=model_params,
+            order_by="t.name", limit=limit)
+        if results:
+            return results
+        
         if model_code:
-            query = """
-            SELECT * FROM spare_parts 
+            query = f"""
+            SELECT * FROM spare_parts t
             WHERE (part_number LIKE ? OR name LIKE ? OR description LIKE ?)
-              AND compatible_models LIKE ?
+              AND {condition}
             ORDER BY 
                 CASE WHEN part_number LIKE ? THEN 1 ELSE 2 END,
                 name
             """
             search_pattern = f"%{search_term}%"
-            model_pattern = f"%{model_code}%"
-            params = (search_pattern, search_pattern, search_pattern, model_pattern, search_pattern)
+            params = (search_pattern, search_pattern, search_pattern, *model_params, search_pattern)
         else:
             query = """
             SELECT * FROM spare_parts 
@@ -658,20 +668,19 @@ class DatabaseManager:
             search_pattern = f"%{search_term}%"
             params = (search_pattern, search_pattern, search_pattern, search_pattern)
         
-        return self.execute_query(query, params)
+        return self.execute_query(query, params)[:limit]
     
     def get_spare_part_categories(self, model_code: Optional[str] = None) -> List[Dict]:
         """Get available spare part categories, optionally filtered by model"""
         if model_code:
-            query = """
+            condition, params = self._spare_part_model_filter(model_code)
+            query = f"""
             SELECT DISTINCT category, COUNT(*) as part_count
             FROM spare_parts 
-            WHERE category IS NOT NULL AND compatible_models LIKE ?
+            WHERE category IS NOT NULL AND {condition}
             GROUP BY category
             ORDER BY category
             """
-            search_pattern = f"%{model_code}%"
-            params = (search_pattern,)
         else:
             query = """
             SELECT DISTINCT category, COUNT(*) as part_count
@@ -706,11 +715,9 @@ class DatabaseManager:
         if spare_part['requires_length_spec'] and length and length > 10.0:
             # For probe assemblies with length specifications
             if '3/4' in spare_part['part_number'].upper() and 'PROBE' in spare_part['part_number'].upper():
-                # 3/4" diameter probes have $175/ft adder
-                extra_feet = (length - 10.0) / 12.0  # Convert inches to feet
-                if extra_feet > 0:
-                    length_adder = extra_feet * 175.0
-                    total_price = (base_price + length_adder) * quantity
+                # 3/4" diameter probes carry the 3/4"OD per-foot rate, prorated past 10"
+                length_adder = prorated_length_adder(length, 10.0, OD_OPTION_ADDER_PER_FOOT)
+                total_price = (base_price + length_adder) * quantity
         
         # Handle special requirements notes
         notes = []
@@ -755,7 +762,8 @@ class DatabaseManager:
         priority_categories = ['electronics', 'probe_assembly', 'housing', 'card', 'transmitter', 'receiver', 'fuse', 'cable']
         
         if model_code:
-            query = """
+            condition, model_params = self._spare_part_model_filter(model_code)
+            query = f"""
             SELECT *, 
                    CASE 
                        WHEN category = 'electronics' THEN 1
@@ -769,12 +777,11 @@ class DatabaseManager:
                        ELSE 9
                    END as priority
             FROM spare_parts 
-            WHERE compatible_models LIKE ?
+            WHERE {condition}
             ORDER BY priority, price DESC
             LIMIT ?
             """
-            search_pattern = f"%{model_code}%"
-            params = (search_pattern, limit)
+            params = (*model_params, limit)
         else:
             query = """
             SELECT *, 
@@ -799,42 +806,35 @@ class DatabaseManager:
     
     def validate_spare_part_compatibility(self, part_number: str, model_code: str) -> Dict[str, Any]:
         """Validate if a spare part is compatible with a specific model"""
-        spare_part = self.get_spare_part_by_part_number(part_number)
-        if not spare_part:
+        index = self._compatibility_index()
+        if index:
+            models = index.models_for(part_number)
+            compatible_models = list(models) if models is not None else None
+        else:
+            spare_part = self.get_spare_part_by_part_number(part_number)
+            compatible_models = parse_compatible_models(spare_part['compatible_models']) if spare_part else None
+        
+        if compatible_models is None:
             return {
                 'compatible': False,
                 'error': f"Spare part '{part_number}' not found"
             }
         
-        try:
-            # Parse the compatible_models JSON array
-            compatible_models = json.loads(spare_part['compatible_models'])
-            
-            # Check for exact match or wildcard compatibility
-            if model_code in compatible_models or 'ALL' in compatible_models:
-                return {
-                    'compatible': True,
-                    'part_number': part_number,
-                    'model_code': model_code,
-                    'compatible_models': compatible_models
-                }
-            else:
-                return {
-                    'compatible': False,
-                    'part_number': part_number,
-                    'model_code': model_code,
-                    'compatible_models': compatible_models,
-                    'error': f"Part '{part_number}' is not compatible with model '{model_code}'"
-                }
-        except (json.JSONDecodeError, KeyError):
-            # Fallback to string search if JSON parsing fails
-            if model_code in spare_part['compatible_models']:
-                return {'compatible': True}
-            else:
-                return {
-                    'compatible': False,
-                    'error': f"Compatibility data format error for part '{part_number}'"
-                }
+        # Check for exact match or wildcard compatibility
+        if model_code in compatible_models or ALL_MODELS in compatible_models:
+            return {
+                'compatible': True,
+                'part_number': part_number,
+                'model_code': model_code,
+                'compatible_models': compatible_models
+            }
+        return {
+            'compatible': False,
+            'part_number': part_number,
+            'model_code': model_code,
+            'compatible_models': compatible_models,
+            'error': f"Part '{part_number}' is not compatible with model '{model_code}'"
+        }
 
     def test_connection(self) -> bool:
         """Test database connection and return basic info"""
@@ -878,8 +878,13 @@ class DatabaseManager:
         Generate quote number in format: CustomerName UserInitialsMMDDYYLetter (e.g., ACME ZF071925A)
         
         The letter at the end is dependent on the company, user initials, and date.
-        Letters increment for the same company on the same day by the same user.
-        Letters reset to 'A' for a new company on the same day by the same user.
+        Letters increment for the same company on the same day by the same user
+        (A..Z, then AA, AB, ...). Letters reset to 'A' for a new company on the
+        same day by the same user.
+        
+        The number is allocated atomically from a counter table and stays
+        reserved until the quote is saved, the reservation is released with
+        release_quote_number, or it expires.
         
         Args:
             user_initials: User's initials (will be converted to uppercase)
@@ -888,71 +893,28 @@ class DatabaseManager:
         Returns:
             Generated quote number
         """
-        from datetime import datetime
-        
-        # Ensure uppercase initials
-        user_initials = user_initials.upper()
-        
-        # Get current date in MMDDYY format
-        today = datetime.now()
-        date_str = today.strftime("%m%d%y")
-        
-        # Base quote number pattern (without customer prefix for database lookup)
-        base_quote_number = f"{user_initials}{date_str}"
-        
-        # Find existing quotes for this user/date/company combination
-        if customer_name:
-            # Look for quotes with the same customer name, user initials, and date
-            query = """
-            SELECT quote_number FROM quotes 
-            WHERE customer_name = ? AND quote_number LIKE ? 
-            ORDER BY quote_number DESC
-            """
-            existing_quotes = self.execute_query(query, (customer_name, f"%{base_quote_number}%"))
-        else:
-            # Fallback to old behavior if no customer name provided
-            query = """
-            SELECT quote_number FROM quotes 
-            WHERE quote_number LIKE ? 
-            ORDER BY quote_number DESC
-            """
-            existing_quotes = self.execute_query(query, (f"%{base_quote_number}%",))
-        
-        # Determine next letter
-        if not existing_quotes:
-            # First quote of the day for this company/user combination
-            next_letter = 'A'
-        else:
-            # Get the last quote's letter and increment
-            last_quote = existing_quotes[0]['quote_number']
-            # Extract the letter from the end of the quote number
-            if len(last_quote) > len(base_quote_number):
-                # Find the base pattern in the quote number and get the letter after it
-                base_index = last_quote.find(base_quote_number)
-                if base_index != -1 and base_index + len(base_quote_number) < len(last_quote):
-                    last_letter = last_quote[base_index + len(base_quote_number)]
-                    next_letter = chr(ord(last_letter) + 1)
-                    
-                    # Handle wrap-around if we somehow get past Z
-                    if ord(next_letter) > ord('Z'):
-                        next_letter = 'A'  # Reset to A (or could be 'AA', 'AB', etc.)
-                else:
-                    next_letter = 'A'
-            else:
-                next_letter = 'A'
-        
-        # Return the full quote number with customer prefix if provided
-        if customer_name:
-            return f"{customer_name} {base_quote_number}{next_letter}"
-        else:
-            return f"{base_quote_number}{next_letter}"
+        return get_allocator(self.db_path).allocate(user_initials, customer_name)
+    
+    def release_quote_number(self, quote_number: str) -> bool:
+        """Give back a generated quote number that will not be saved, so it can be reissued"""
+        try:
+            return get_allocator(self.db_path).release(quote_number)
+        except sqlite3.Error as e:
+            print(f"Error releasing quote number: {e}")
+            return False
     
     def save_quote(self, quote_number: str, customer_name: str, customer_email: str, 
                    quote_items: List[Dict[str, Any]], total_price: float, 
-                   user_initials: str = "") -> bool:
+                   user_initials: str = "", overwrite: bool = False) -> bool:
         """
         Save a complete quote to the database
         
+        A quote number that is already saved is an error unless overwrite is
+        set (the caller opened that quote to re-quote it); then its header is
+        updated and its items replaced. Each item is stored with a JSON
+        payload so load_quote can restore it exactly; if quote_items cannot
+        gain the payload columns, items are saved without them.
+        
         Args:
             quote_number: Quote number
             customer_name: Customer name
@@ -960,9 +922,10 @@ class DatabaseManager:
             quote_items: List of quote items (main parts + spare parts)
             total_price: Total quote value
             user_initials: User initials for tracking
+            overwrite: Replace an existing quote with the same number
             
         Returns:
-            True if successful, False otherwise
+            True if successful, False otherwise (including an existing number without overwrite)
         """
         if not self.connection:
             if not self.connect():
@@ -972,41 +935,53 @@ class DatabaseManager:
             if not self.connection:
                 return False
                 
+            with_payload = ensure_quote_items_migrated(self.db_path, self.connection)
             cursor = self.connection.cursor()
             
-            # Insert quote record
-            quote_query = """
-            INSERT INTO quotes (quote_number, customer_name, customer_email, status, total_price, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, datetime('now'), datetime('now'))
-            """
-            
-            cursor.execute(quote_query, (quote_number, customer_name, customer_email, 'draft', total_price))
-            quote_id = cursor.lastrowid
+            # Insert (or, re-quoting, update) the quote record; reporting rollups follow through triggers
+            upsert = """
+            ON CONFLICT (quote_number) DO UPDATE SET
+                customer_name = excluded.customer_name,
+                customer_email = excluded.customer_email,
+                total_price = excluded.total_price,
+                updated_at = excluded.updated_at
+            """ if overwrite else ""
+            if ensure_reporting_migrated(self.db_path, self.connection):
+                quote_query = """
+                INSERT INTO quotes (quote_number, customer_name, customer_email, status, total_price,
+                                    user_initials, created_date, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, date('now'), datetime('now'), datetime('now'))
+                """ + upsert
+                initials = user_initials.upper() or initials_from_quote_number(quote_number)
+                params = (quote_number, customer_name, customer_email, 'draft', total_price, initials)
+            else:
+                quote_query = """
+                INSERT INTO quotes (quote_number, customer_name, customer_email, status, total_price, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, datetime('now'), datetime('now'))
+                """ + upsert
+                params = (quote_number, customer_name, customer_email, 'draft', total_price)
             
-            # Insert quote items
-            item_query = """
-            INSERT INTO quote_items (quote_id, part_number, description, quantity, unit_price, total_price, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, datetime('now'))
-            """
+            cursor.execute(quote_query, params)
+            cursor.execute("SELECT id FROM quotes WHERE quote_number = ?", (quote_number,))
+            quote_id = cursor.fetchone()[0]
             
-            for item in quote_items:
-                if item['type'] == 'main':
-                    part_number = item['part_number']
-                    description = f"{item['data'].get('model', 'N/A')} - {item['data'].get('voltage', 'N/A')}"
-                    unit_price = item['data'].get('total_price', 0.0)
-                else:  # spare part
-                    part_number = item['part_number']
-                    description = item['data'].get('description', 'Spare Part')
-                    unit_price = item['data'].get('pricing', {}).get('total_price', 0.0)
-                
-                quantity = item.get('quantity', 1)
-                total_item_price = unit_price * quantity
-                
-                cursor.execute(item_query, (quote_id, part_number, description, quantity, unit_price, total_item_price))
+            # Replace quote items in one batch (without payloads if quote_items could not be migrated)
+            cursor.execute("DELETE FROM quote_items WHERE quote_id = ?", (quote_id,))
+            cursor.executemany(ITEM_INSERT if with_payload else LEGACY_ITEM_INSERT,
+                               item_rows(quote_id, quote_items, with_payload))
             
             self.connection.commit()
+            try:
+                get_allocator(self.db_path).confirm(quote_number)
+            except sqlite3.Error as e:
+                print(f"Error clearing quote number reservation: {e}")
             return True
             
+        except sqlite3.IntegrityError as e:
+            print(f"Error saving quote: {quote_number} already exists ({e})")
+            if self.connection:
+                self.connection.rollback()
+            return False
         except sqlite3.Error as e:
             print(f"Error saving quote: {e}")
             if self.connection:
@@ -1017,6 +992,10 @@ class DatabaseManager:
         """
         Load a complete quote from the database
         
+        'items' holds the quote_items rows; 'quote_items' rebuilds the items
+        as the GUI builds them (type, part_number, quantity, data), decoding
+        each stored payload on first access instead of re-parsing.
+        
         Args:
             quote_number: Quote number to load
             
@@ -1041,7 +1020,7 @@ class DatabaseManager:
             
             # Get quote items
             items_query = """
-            SELECT * FROM quote_items WHERE quote_id = ? ORDER BY created_at
+            SELECT * FROM quote_items WHERE quote_id = ? ORDER BY id
             """
             
             quote_items = self.execute_query(items_query, (quote_data['id'],))
@@ -1054,7 +1033,8 @@ class DatabaseManager:
                 'total_price': quote_data['total_price'],
                 'created_at': quote_data['created_at'],
                 'updated_at': quote_data['updated_at'],
-                'items': quote_items
+                'items': quote_items,
+                'quote_items': QuoteItems(quote_items)
             }
             
         except sqlite3.Error as e:
@@ -1072,7 +1052,17 @@ class DatabaseManager:
         Returns:
             List of quote summaries
         """
-        if user_initials:
+        if user_initials and (self.connection or self.connect()) and \
+                ensure_reporting_migrated(self.db_path, self.connection):
+            query = """
+            SELECT quote_number, customer_name, customer_email, status, total_price, created_at
+            FROM quotes 
+            WHERE user_initials = ?
+            ORDER BY created_at DESC 
+            LIMIT ?
+            """
+            params = (user_initials.upper(), limit)
+        elif user_initials:
             query = """
             SELECT quote_number, customer_name, customer_email, status, total_price, created_at
             FROM quotes 
@@ -1094,6 +1084,41 @@ class DatabaseManager:
         
         return self.execute_query(query, params)
     
+    def get_quote_report(self, by: str = 'user', start_date: Optional[str] = None,
+                         end_date: Optional[str] = None, key: Optional[str] = None,
+                         per_day: bool = False) -> List[Dict[str, Any]]:
+        """
+        Quote counts and totals from the reporting rollups
+        
+        Args:
+            by: 'user', 'customer' or 'model'
+            start_date: First day included (YYYY-MM-DD)
+            end_date: Last day included (YYYY-MM-DD)
+            key: Only this user, customer or model
+            per_day: One row per day instead of one per user/customer/model
+            
+        Returns:
+            Report rows, largest total value first (empty if reporting is unavailable)
+        """
+        if not (self.connection or self.connect()) or not ensure_reporting_migrated(self.db_path, self.connection):
+            return []
+        try:
+            return query_rollup(self.connection, by, start_date, end_date, key, per_day)
+        except sqlite3.Error as e:
+            print(f"Error building quote report: {e}")
+            return []
+    
+    def export_quote_report_csv(self, destination: str, by: str = 'user', **filters) -> int:
+        """
+        Write a quote report (see get_quote_report) to a CSV file
+        
+        Returns:
+            Number of rows written
+        """
+        rows = self.get_quote_report(by, **filters)
+        write_report_csv(rows, destination)
+        return len(rows)
+    
     def update_quote_status(self, quote_number: str, status: str) -> bool:
         """
         Update quote status (draft, sent, accepted, rejected, etc.)
@@ -1130,16 +1155,29 @@ class DatabaseManager:
             print(f"Error updating quote status: {e}")
             return False
     
-    def search_quotes(self, search_term: str) -> List[Dict[str, Any]]:
+    def search_quotes(self, search_term: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Search quotes by quote number, customer name, or email
         
+        Each word of the search term matches the start of a word in those
+        fields; results are ranked (bm25) and carry a highlighted 'snippet'.
+        If no word matches, falls back to a substring search so that part of
+        a quote number (e.g. its date code) still finds it.
+        
         Args:
             search_term: Search term
+            limit: Maximum number of quotes
             
         Returns:
-            List of matching quotes
+            List of matching quotes, best match first
         """
+        results = self.full_text_search(
+            QUOTES_INDEX, search_term,
+            select="t.quote_number, t.customer_name, t.customer_email, t.status, t.total_price, t.created_at",
+            order_by="t.created_at DESC", limit=limit)
+        if results:
+            return results
+        
         query = """
         SELECT quote_number, customer_name, customer_email, status, total_price, created_at
         FROM quotes 
@@ -1150,7 +1188,7 @@ class DatabaseManager:
         """
         
         search_pattern = f"%{search_term}%"
-        return self.execute_query(query, (search_pattern, search_pattern, search_pattern))
+        return self.execute_query(query, (search_pattern, search_pattern, search_pattern))[:limit]
 
     def __enter__(self):
         """Context manager entry"""
@@ -1361,6 +1399,10 @@ class DatabaseManager:
     # Part Section Alias Methods
     def get_section_alias(self, section_type: str, alias: str) -> Optional[str]:
         """Get standard code for a section alias"""
+        catalog = self._catalog()
+        if catalog and catalog.has_table('part_section_aliases'):
+            return catalog.get_section_alias(section_type, alias)
+        
         query = "SELECT standard_code FROM part_section_aliases WHERE section_type = ? AND alias = ?"
         results = self.execute_query(query, (section_type, alias))
         return results[0]['standard_code'] if results else None
@@ -1388,6 +1430,7 @@ class DatabaseManager:
                 (section_type, alias, standard_code, description)
             )
             self.connection.commit()
+            self.refresh_catalog()
             return True
         except sqlite3.Error as e:
             print(f"Error adding section alias: {e}")
@@ -1406,13 +1449,23 @@ class DatabaseManager:
                 (section_type, alias)
             )
             self.connection.commit()
+            self.refresh_catalog()
             return cursor.rowcount > 0
         except sqlite3.Error as e:
             print(f"Error deleting section alias: {e}")
             return False
     
+    def get_suggestion_index(self) -> Optional[SuggestionIndex]:
+        """Autocomplete index built from the current catalog snapshot"""
+        catalog = self._catalog()
+        return catalog.derived('suggestion_index', SuggestionIndex) if catalog else None
+    
     def get_autocomplete_suggestions(self, section_type: str, partial_text: str, limit: int = 10) -> List[Dict]:
         """Get autocomplete suggestions for a section type"""
+        index = self.get_suggestion_index()
+        if index:
+            return index.suggest(section_type, partial_text, limit)
+        
         # Get standard codes for this section type
         suggestions = []
         
@@ -0,0 +1,185 @@
+"""
+Full-Text Search for Babbitt Quote Generator
+FTS5 shadow tables kept in sync by triggers, with ranked prefix search
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Any
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Markers placed around matched terms in the 'snippet' field
+HIGHLIGHT_OPEN = '['
+HIGHLIGHT_CLOSE = ']'
+SNIPPET_TOKENS = 12
+
+# Words in a search box; FTS5's unicode61 tokenizer splits on the same boundaries
+_WORD_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+class SearchIndex(NamedTuple):
+    """An FTS5 index over some text columns of a table"""
+    table: str
+    columns: Tuple[str, ...]
+    weights: Tuple[float, ...]  # bm25 column weights, same order as columns
+
+    @property
+    def fts_table(self) -> str:
+        return f"{self.table}_fts"
+
+
+QUOTES_INDEX = SearchIndex('quotes', ('quote_number', 'customer_name', 'customer_email'), (10.0, 5.0, 1.0))
+SPARE_PARTS_INDEX = SearchIndex('spare_parts', ('part_number', 'name', 'description'), (10.0, 5.0, 1.0))
+PRODUCT_MODELS_INDEX = SearchIndex('product_models', ('model_number', 'description'), (10.0, 1.0))
+CUSTOMERS_INDEX = SearchIndex('customers', ('customer_name', 'contact_name'), (5.0, 1.0))
+
+
+def _schema(index: SearchIndex) -> List[str]:
+    """DDL for the shadow table and the triggers that keep it in sync"""
+    fts, table = index.fts_table, index.table
+    columns = ', '.join(index.columns)
+    new_values = ', '.join(f"new.{c}" for c in index.columns)
+    old_values = ', '.join(f"old.{c}" for c in index.columns)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{columns}, content='{table}', content_rowid='id', "
+        f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {columns}) VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts}(rowid, {columns}) VALUES (new.id, {new_values}); END",
+    ]
+
+
+def ensure_search_index(conn: sqlite3.Connection, index: SearchIndex) -> bool:
+    """
+    Create the shadow table and triggers if missing, rebuilding the index
+    from the content table when it is new or its triggers were lost
+    (e.g. the table was dropped and recreated by a schema script).
+
+    Returns:
+        True if the index is usable, False if FTS5 or the table is unavailable
+    """
+    try:
+        existing = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE name IN (?, ?, ?, ?, ?)",
+            (index.table, index.fts_table, f"{index.fts_table}_ai",
+             f"{index.fts_table}_ad", f"{index.fts_table}_au"))}
+        if index.table not in existing:
+            return False
+        if len(existing) == 5:
+            return True
+
+        with conn:
+            for statement in _schema(index):
+                conn.execute(statement)
+            conn.execute(f"INSERT INTO {index.fts_table}({index.fts_table}) VALUES ('rebuild')")
+        logger.info("Built full-text index %s", index.fts_table)
+        return True
+    except sqlite3.Error as e:
+        logger.warning("Full-text index %s unavailable, using LIKE search: %s", index.fts_table, e)
+        return False
+
+
+def build_match_query(search_term: str) -> Optional[str]:
+    """
+    FTS5 query that requires every word, each as a prefix.
+    'acme zf01' -> '"acme"* "zf01"*'. Returns None if the term has no words.
+    """
+    words = _WORD_PATTERN.findall(search_term or '')
+    if not words:
+        return None
+    return ' '.join(f'"{word}"*' for word in words)
+
+
+class FullTextSearcher:
+    """
+    Ranked search over one database file's FTS5 indexes.
+
+    Each index is checked (and created if needed) the first time it is
+    searched. If FTS5 is missing the searcher reports it as unavailable and
+    callers keep their LIKE queries.
+    """
+
+    def __init__(self):
+        self._ready: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+
+    def available(self, conn: sqlite3.Connection, index: SearchIndex) -> bool:
+        """Ensure the index exists (once) and report whether it can be used"""
+        ready = self._ready.get(index.table)
+        if ready is None:
+            with self._lock:
+                ready = self._ready.get(index.table)
+                if ready is None:
+                    ready = ensure_search_index(conn, index)
+                    self._ready[index.table] = ready
+        return ready
+
+    def search(self, conn: sqlite3.Connection, index: SearchIndex, search_term: str,
+               select: str = 't.*', where: str = '', params: Sequence[Any] = (),
+               order_by: str = '', limit: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+        """
+        Rows of index.table matching search_term, best bm25 rank first.
+
+        Each row also carries 'rank' (lower is better) and 'snippet' (the
+        best-matching column with matched terms highlighted).
+
+        Args:
+            select: Columns of the content table (aliased t) to return
+            where: Extra SQL condition on t, ANDed with the match
+            params: Parameters for the where clause
+            order_by: Tie-breaker after rank
+            limit: Maximum number of rows
+
+        Returns:
+            Matching rows, or None when the term has no words or FTS5 is unavailable
+        """
+        match = build_match_query(search_term)
+        if match is None or not self.available(conn, index):
+            return None
+
+        fts = index.fts_table
+        weights = ', '.join(str(w) for w in index.weights)
+        snippet = f"snippet({fts}, -1, '{HIGHLIGHT_OPEN}', '{HIGHLIGHT_CLOSE}', '...', {SNIPPET_TOKENS})"
+        query = (
+            f"SELECT {select}, bm25({fts}, {weights}) AS rank, {snippet} AS snippet "
+            f"FROM {fts} JOIN {index.table} t ON t.id = {fts}.rowid "
+            f"WHERE {fts} MATCH ?"
+        )
+        if where:
+            query += f" AND ({where})"
+        query += " ORDER BY rank" + (f", {order_by}" if order_by else '')
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+
+        try:
+            cursor = conn.execute(query, (match, *params))
+        except sqlite3.Error as e:
+            logger.warning("Full-text search on %s failed: %s", fts, e)
+            return None
+        columns = [description[0] for description in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+_searchers: Dict[str, FullTextSearcher] = {}
+_searchers_lock = threading.Lock()
+
+
+def get_searcher(db_path: str) -> FullTextSearcher:
+    """Shared searcher for a database file"""
+    key = os.path.abspath(db_path)
+    with _searchers_lock:
+        searcher = _searchers.get(key)
+        if searcher is None:
+            searcher = FullTextSearcher()
+            _searchers[key] = searcher
+        return searcher
@@ -0,0 +1,168 @@
+"""
+Quote Item Persistence for Babbitt Quote Generator
+Serializes GUI quote items into quote_items rows and restores them on load
+
+Each row keeps the flattened part number, description and prices used by
+reports, plus a compact JSON payload of the full item (type, quantity and the
+parsed configuration). Loading a quote rebuilds the original items from the
+payload without parsing the part numbers again.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bumped if the payload layout changes; older payloads are still read
+PAYLOAD_VERSION = 1
+
+# Columns added to quote_items databases created before payloads existed
+ITEM_COLUMNS = (
+    ("item_type", "TEXT"),
+    ("payload", "TEXT"),
+)
+
+ITEM_INSERT = """
+INSERT INTO quote_items (quote_id, part_number, description, quantity, unit_price, total_price,
+                         item_type, payload, created_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
+"""
+
+# Used when the payload columns could not be added (e.g. a read-only legacy database)
+LEGACY_ITEM_INSERT = """
+INSERT INTO quote_items (quote_id, part_number, description, quantity, unit_price, total_price, created_at)
+VALUES (?, ?, ?, ?, ?, ?, datetime('now'))
+"""
+
+
+def item_summary(item: Dict[str, Any]) -> Tuple[str, float]:
+    """Description and unit price shown for a quote item (as in the quote tree)"""
+    data = item.get('data') or {}
+    if item.get('type') == 'main':
+        return f"{data.get('model', 'N/A')} - {data.get('voltage', 'N/A')}", data.get('total_price', 0.0)
+    return data.get('description', 'Spare Part'), data.get('pricing', {}).get('total_price', 0.0)
+
+
+def encode_item(item: Dict[str, Any]) -> str:
+    """Compact JSON payload for one quote item"""
+    payload = {'v': PAYLOAD_VERSION}
+    payload.update(item)
+    return json.dumps(payload, separators=(',', ':'), default=str)
+
+
+def item_rows(quote_id: int, quote_items: Sequence[Dict[str, Any]],
+              with_payload: bool = True) -> List[tuple]:
+    """Parameters of ITEM_INSERT (LEGACY_ITEM_INSERT if not with_payload) for every item, ready for executemany"""
+    rows = []
+    for item in quote_items:
+        description, unit_price = item_summary(item)
+        quantity = item.get('quantity', 1)
+        row = (quote_id, item['part_number'], description, quantity, unit_price, unit_price * quantity)
+        if with_payload:
+            row += (item.get('type', 'spare'), encode_item(item))
+        rows.append(row)
+    return rows
+
+
+def decode_item(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Quote item from a quote_items row. Rows saved before payloads existed
+    come back as spare-style items carrying the stored description and price.
+    """
+    payload = row.get('payload')
+    if payload:
+        try:
+            item = json.loads(payload)
+            item.pop('v', None)
+            return item
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.warning("Unreadable payload for quote item %s: %s", row.get('id'), e)
+    return {
+        'type': row.get('item_type') or 'spare',
+        'part_number': row['part_number'],
+        'quantity': row.get('quantity') or 1,
+        'data': {
+            'description': row.get('description') or 'Spare Part',
+            'pricing': {'total_price': row.get('unit_price') or 0.0},
+        },
+        'timestamp': row.get('created_at'),
+        'legacy': True,
+    }
+
+
+class QuoteItems(Sequence):
+    """
+    Quote items restored from quote_items rows.
+    Payloads are decoded the first time each item is read.
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self._rows = rows
+        self._items: List[Optional[Dict[str, Any]]] = [None] * len(rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        item = self._items[index]
+        if item is None:
+            item = self._items[index] = decode_item(self._rows[index])
+        return item
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(len(self)):
+            yield self[index]
+
+
+def migrate(conn: sqlite3.Connection) -> List[str]:
+    """
+    Add the item_type and payload columns to quote_items if missing.
+
+    Returns:
+        Names of the columns that were added
+    """
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(quote_items)")}
+    added = []
+    with conn:
+        for name, column_type in ITEM_COLUMNS:
+            if name not in existing:
+                conn.execute(f"ALTER TABLE quote_items ADD COLUMN {name} {column_type}")
+                added.append(name)
+    if added:
+        logger.info("Added quote_items columns: %s", ', '.join(added))
+    return added
+
+
+_ready: Dict[str, bool] = {}
+_ready_lock = threading.Lock()
+
+
+def ensure_migrated(db_path: str, conn: sqlite3.Connection) -> bool:
+    """
+    Migrate quote_items on first use (once per process and path).
+
+    Returns:
+        True if payloads can be stored
+    """
+    key = os.path.abspath(db_path)
+    ready = _ready.get(key)
+    if ready is not None:
+        return ready
+    with _ready_lock:
+        ready = _ready.get(key)
+        if ready is None:
+            try:
+                migrate(conn)
+                ready = True
+            except sqlite3.Error as e:
+                logger.warning("quote_items payload columns unavailable: %s", e)
+                ready = False
+            _ready[key] = ready
+    return ready
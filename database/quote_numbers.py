@@ -0,0 +1,224 @@
+"""
+Quote Number Allocator for Babbitt Quote Generator
+Hands out CustomerName UserInitialsMMDDYYLetter numbers from a counter table
+
+Each (initials, date, customer) key has a row in quote_number_sequences holding
+the next sequence number. Allocation reads and bumps that row inside a
+BEGIN IMMEDIATE transaction, so two workstations sharing the database never
+receive the same number. Sequence numbers map to letter suffixes A..Z, AA, AB...
+
+A number is reserved until the quote is saved. Reservations that are released
+(or left to expire) are handed out again before the counter moves on.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import date, datetime
+from typing import Dict, Optional, Tuple
+
+from utils.logger import get_logger
+
+try:
+    from config.settings import QUOTE_RESERVATION_TTL
+except ImportError:
+    QUOTE_RESERVATION_TTL = 8 * 3600.0
+
+logger = get_logger(__name__)
+
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS quote_number_sequences (
+        user_initials TEXT NOT NULL,
+        date_code TEXT NOT NULL,
+        customer_name TEXT NOT NULL,
+        next_seq INTEGER NOT NULL,
+        PRIMARY KEY (user_initials, date_code, customer_name)
+    ) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS quote_number_reservations (
+        quote_number TEXT PRIMARY KEY,
+        user_initials TEXT NOT NULL,
+        date_code TEXT NOT NULL,
+        customer_name TEXT NOT NULL,
+        seq INTEGER NOT NULL,
+        expires_at REAL NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_quote_number_reservations_key "
+    "ON quote_number_reservations(user_initials, date_code, customer_name, expires_at)",
+)
+
+_SUFFIX_PATTERN = re.compile(r'[A-Z]+')
+
+
+def seq_to_letters(seq: int) -> str:
+    """0 -> 'A', 25 -> 'Z', 26 -> 'AA', 27 -> 'AB', ..."""
+    if seq < 0:
+        raise ValueError(f"Sequence number must not be negative: {seq}")
+    letters = ''
+    seq += 1
+    while seq:
+        seq, remainder = divmod(seq - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+def letters_to_seq(letters: str) -> int:
+    """Inverse of seq_to_letters: 'A' -> 0, 'AA' -> 26"""
+    seq = 0
+    for letter in letters:
+        seq = seq * 26 + (ord(letter) - ord('A') + 1)
+    return seq - 1
+
+
+def format_quote_number(user_initials: str, date_code: str, customer_name: str, seq: int) -> str:
+    """'ACME', 'ZF', '071925', 0 -> 'ACME ZF071925A' (no prefix when there is no customer)"""
+    base = f"{user_initials}{date_code}{seq_to_letters(seq)}"
+    return f"{customer_name} {base}" if customer_name else base
+
+
+class QuoteNumberAllocator:
+    """
+    Atomic quote number allocation for one database file.
+
+    Every call opens its own short-lived connection so the allocator can be
+    used from any thread, and so its transactions never interleave with
+    whatever the caller's connection has in flight.
+    """
+
+    def __init__(self, db_path: str, ttl: float = QUOTE_RESERVATION_TTL, timeout: float = 30.0):
+        self.db_path = db_path
+        self.ttl = ttl
+        self.timeout = timeout
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, isolation_level=None)
+        if not self._schema_ready:
+            for statement in SCHEMA:
+                conn.execute(statement)
+            self._schema_ready = True
+        return conn
+
+    @staticmethod
+    def _saved(conn: sqlite3.Connection, quote_number: str) -> bool:
+        return conn.execute("SELECT 1 FROM quotes WHERE quote_number = ?", (quote_number,)).fetchone() is not None
+
+    @staticmethod
+    def _seed(conn: sqlite3.Connection, user_initials: str, date_code: str, customer_name: str) -> int:
+        """First free sequence number for a new key, from quotes saved before the counter existed"""
+        prefix = format_quote_number(user_initials, date_code, customer_name, 0)[:-1]
+        # Range scan on the quote_number index rather than LIKE '%...%'
+        rows = conn.execute("SELECT quote_number FROM quotes WHERE quote_number >= ? AND quote_number < ?",
+                            (prefix, prefix + '\uffff')).fetchall()
+        seqs = [letters_to_seq(row[0][len(prefix):]) for row in rows
+                if _SUFFIX_PATTERN.fullmatch(row[0][len(prefix):])]
+        return max(seqs) + 1 if seqs else 0
+
+    def allocate(self, user_initials: str, customer_name: str = "", today: Optional[date] = None) -> str:
+        """
+        Reserve the next quote number for a user, customer and day.
+
+        Args:
+            user_initials: User's initials (converted to uppercase)
+            customer_name: Customer name prefixed to the number
+            today: Date to number against (default: today)
+
+        Returns:
+            The reserved quote number
+        """
+        user_initials = user_initials.upper()
+        customer_name = customer_name.strip()
+        date_code = (today or datetime.now()).strftime("%m%d%y")
+        key = (user_initials, date_code, customer_name)
+        now = time.time()
+
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                quote_number = self._reuse_expired(conn, key, now)
+                if quote_number is None:
+                    quote_number = self._take_next(conn, key, now)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+        logger.debug("Allocated quote number %s", quote_number)
+        return quote_number
+
+    def _reuse_expired(self, conn: sqlite3.Connection, key: Tuple[str, str, str], now: float) -> Optional[str]:
+        """Lowest released or expired number for the key that was never saved"""
+        # Runs inside the allocation transaction: a reservation whose number
+        # has been saved since (without confirm()) is dropped, never reissued
+        conn.execute(
+            "DELETE FROM quote_number_reservations "
+            "WHERE user_initials = ? AND date_code = ? AND customer_name = ? "
+            "AND quote_number IN (SELECT quote_number FROM quotes)", key)
+        row = conn.execute(
+            "SELECT quote_number FROM quote_number_reservations "
+            "WHERE user_initials = ? AND date_code = ? AND customer_name = ? AND expires_at <= ? "
+            "ORDER BY seq LIMIT 1", (*key, now)).fetchone()
+        if row is None:
+            return None
+        conn.execute("UPDATE quote_number_reservations SET expires_at = ? WHERE quote_number = ?",
+                     (now + self.ttl, row[0]))
+        return row[0]
+
+    def _take_next(self, conn: sqlite3.Connection, key: Tuple[str, str, str], now: float) -> str:
+        row = conn.execute(
+            "SELECT next_seq FROM quote_number_sequences "
+            "WHERE user_initials = ? AND date_code = ? AND customer_name = ?", key).fetchone()
+        seq = row[0] if row else self._seed(conn, *key)
+        quote_number = format_quote_number(*key, seq)
+        # A number saved by hand (or by an older build) is skipped, never reissued
+        while self._saved(conn, quote_number):
+            seq += 1
+            quote_number = format_quote_number(*key, seq)
+        conn.execute(
+            "INSERT INTO quote_number_sequences (user_initials, date_code, customer_name, next_seq) "
+            "VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (user_initials, date_code, customer_name) DO UPDATE SET next_seq = excluded.next_seq",
+            (*key, seq + 1))
+        conn.execute(
+            "INSERT OR REPLACE INTO quote_number_reservations "
+            "(quote_number, user_initials, date_code, customer_name, seq, expires_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (quote_number, *key, seq, now + self.ttl))
+        return quote_number
+
+    def release(self, quote_number: str) -> bool:
+        """Give back a reserved number that will not be saved; it is reissued next"""
+        conn = self._connect()
+        try:
+            cursor = conn.execute("UPDATE quote_number_reservations SET expires_at = 0 WHERE quote_number = ?",
+                                  (quote_number,))
+            return cursor.rowcount > 0
+        finally:
+            conn.close()
+
+    def confirm(self, quote_number: str) -> bool:
+        """Drop the reservation of a number whose quote has been saved"""
+        conn = self._connect()
+        try:
+            cursor = conn.execute("DELETE FROM quote_number_reservations WHERE quote_number = ?",
+                                  (quote_number,))
+            return cursor.rowcount > 0
+        finally:
+            conn.close()
+
+
+_allocators: Dict[str, QuoteNumberAllocator] = {}
+_allocators_lock = threading.Lock()
+
+
+def get_allocator(db_path: str) -> QuoteNumberAllocator:
+    """Shared allocator for a database file"""
+    key = os.path.abspath(db_path)
+    with _allocators_lock:
+        allocator = _allocators.get(key)
+        if allocator is None:
+            allocator = QuoteNumberAllocator(db_path)
+            _allocators[key] = allocator
+        return allocator
@@ -0,0 +1,303 @@
+"""
+Quote Reporting for Babbitt Quote Generator
+Indexed quote history columns, trigger-maintained daily rollups and CSV export
+
+quotes gains user_initials and created_date columns (backfilled from the
+quote number and created_at). Three rollup tables hold per-day counts and
+totals by user, customer and model; triggers on quotes and quote_items keep
+them current as quotes are saved, so reports never scan the quote history.
+
+Run directly to migrate a database and print the per-user rollup:
+    python -m database.reporting [path/to/quotes.db]
+"""
+
+import csv
+import io
+import os
+import re
+import sqlite3
+import sys
+import threading
+from typing import Any, Dict, IO, List, Optional, Sequence, Tuple, Union
+
+from database.quote_items import migrate as migrate_quote_items
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Rollup name -> (table, key column, measure columns)
+ROLLUPS: Dict[str, Tuple[str, str, Tuple[str, ...]]] = {
+    'user': ('quote_rollup_user_day', 'user_initials', ('quote_count', 'total_value')),
+    'customer': ('quote_rollup_customer_day', 'customer_name', ('quote_count', 'total_value')),
+    'model': ('quote_rollup_model_day', 'model', ('line_count', 'unit_count', 'total_value')),
+}
+
+QUOTE_COLUMNS = (
+    ("user_initials", "TEXT"),
+    ("created_date", "TEXT"),
+)
+
+# Initials are the letters before the MMDDYY date in the last word of a quote number
+_QUOTE_NUMBER_PATTERN = re.compile(r'([A-Za-z]+)(\d{6})[A-Za-z]+$')
+
+# Model of a quote item: the parsed model for main parts, else the part number's first segment
+_ITEM_MODEL = (
+    "COALESCE(CASE WHEN json_valid({row}.payload) THEN json_extract({row}.payload, '$.data.model') END, "
+    "substr({row}.part_number, 1, instr({row}.part_number || '-', '-') - 1))"
+)
+
+
+def _rollup_table(name: str) -> str:
+    key = ROLLUPS[name][1]
+    measures = ROLLUPS[name][2]
+    measure_sql = ',\n        '.join(
+        f"{measure} {'REAL' if measure == 'total_value' else 'INTEGER'} NOT NULL DEFAULT 0" for measure in measures)
+    return f"""CREATE TABLE IF NOT EXISTS {ROLLUPS[name][0]} (
+        {key} TEXT NOT NULL,
+        created_date TEXT NOT NULL,
+        {measure_sql},
+        PRIMARY KEY ({key}, created_date)
+    ) WITHOUT ROWID"""
+
+
+def _quote_upsert(name: str, row: str, sign: str) -> str:
+    table, key, _ = ROLLUPS[name]
+    source = 'user_initials' if name == 'user' else 'customer_name'
+    return (
+        f"INSERT INTO {table} ({key}, created_date, quote_count, total_value) "
+        f"SELECT COALESCE({row}.{source}, ''), {row}.created_date, {sign}1, {sign}COALESCE({row}.total_price, 0) "
+        f"WHERE {row}.created_date IS NOT NULL "
+        f"ON CONFLICT ({key}, created_date) DO UPDATE SET "
+        f"quote_count = quote_count + excluded.quote_count, total_value = total_value + excluded.total_value;"
+    )
+
+
+def _item_upsert(row: str, sign: str) -> str:
+    table, key, _ = ROLLUPS['model']
+    model = _ITEM_MODEL.format(row=row)
+    return (
+        f"INSERT INTO {table} ({key}, created_date, line_count, unit_count, total_value) "
+        f"SELECT {model}, q.created_date, {sign}1, {sign}COALESCE({row}.quantity, 1), "
+        f"{sign}COALESCE({row}.total_price, 0) "
+        f"FROM quotes q WHERE q.id = {row}.quote_id AND q.created_date IS NOT NULL "
+        f"ON CONFLICT ({key}, created_date) DO UPDATE SET "
+        f"line_count = line_count + excluded.line_count, unit_count = unit_count + excluded.unit_count, "
+        f"total_value = total_value + excluded.total_value;"
+    )
+
+
+SCHEMA = tuple(_rollup_table(name) for name in ROLLUPS) + (
+    "CREATE INDEX IF NOT EXISTS idx_quotes_user_created ON quotes(user_initials, created_at)",
+    "CREATE INDEX IF NOT EXISTS idx_quotes_created_date ON quotes(created_date)",
+)
+
+TRIGGERS = (
+    f"""CREATE TRIGGER IF NOT EXISTS quote_rollups_ai AFTER INSERT ON quotes BEGIN
+        {_quote_upsert('user', 'new', '+')}
+        {_quote_upsert('customer', 'new', '+')}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS quote_rollups_au
+        AFTER UPDATE OF user_initials, customer_name, total_price, created_date ON quotes BEGIN
+        {_quote_upsert('user', 'old', '-')}
+        {_quote_upsert('customer', 'old', '-')}
+        {_quote_upsert('user', 'new', '+')}
+        {_quote_upsert('customer', 'new', '+')}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS quote_rollups_ad AFTER DELETE ON quotes BEGIN
+        {_quote_upsert('user', 'old', '-')}
+        {_quote_upsert('customer', 'old', '-')}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS quote_item_rollups_ai AFTER INSERT ON quote_items BEGIN
+        {_item_upsert('new', '+')}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS quote_item_rollups_ad AFTER DELETE ON quote_items BEGIN
+        {_item_upsert('old', '-')}
+    END""",
+)
+
+TRIGGER_NAMES = ('quote_rollups_ai', 'quote_rollups_au', 'quote_rollups_ad',
+                 'quote_item_rollups_ai', 'quote_item_rollups_ad')
+
+
+def initials_from_quote_number(quote_number: Optional[str]) -> Optional[str]:
+    """'ACME ZF071925A' -> 'ZF'; None if the number does not follow the format"""
+    match = _QUOTE_NUMBER_PATTERN.search((quote_number or '').strip())
+    return match.group(1).upper() if match else None
+
+
+def rebuild(conn: sqlite3.Connection):
+    """Recompute every rollup table from quotes and quote_items"""
+    for table, _, _ in ROLLUPS.values():
+        conn.execute(f"DELETE FROM {table}")
+    conn.execute(
+        "INSERT INTO quote_rollup_user_day (user_initials, created_date, quote_count, total_value) "
+        "SELECT COALESCE(user_initials, ''), created_date, COUNT(*), SUM(COALESCE(total_price, 0)) "
+        "FROM quotes WHERE created_date IS NOT NULL GROUP BY 1, 2")
+    conn.execute(
+        "INSERT INTO quote_rollup_customer_day (customer_name, created_date, quote_count, total_value) "
+        "SELECT COALESCE(customer_name, ''), created_date, COUNT(*), SUM(COALESCE(total_price, 0)) "
+        "FROM quotes WHERE created_date IS NOT NULL GROUP BY 1, 2")
+    conn.execute(
+        "INSERT INTO quote_rollup_model_day (model, created_date, line_count, unit_count, total_value) "
+        f"SELECT {_ITEM_MODEL.format(row='i')}, q.created_date, COUNT(*), SUM(COALESCE(i.quantity, 1)), "
+        "SUM(COALESCE(i.total_price, 0)) "
+        "FROM quote_items i JOIN quotes q ON q.id = i.quote_id WHERE q.created_date IS NOT NULL GROUP BY 1, 2")
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """
+    Add the reporting columns, indexes, rollup tables and triggers, backfill
+    user_initials/created_date for existing quotes and rebuild the rollups.
+    Safe to run repeatedly.
+
+    Returns:
+        Number of quotes whose reporting columns were backfilled
+    """
+    migrate_quote_items(conn)  # the model rollup reads quote_items.payload
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(quotes)")}
+    with conn:
+        for name, column_type in QUOTE_COLUMNS:
+            if name not in existing:
+                conn.execute(f"ALTER TABLE quotes ADD COLUMN {name} {column_type}")
+        for trigger in TRIGGER_NAMES:
+            conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")  # no double counting while backfilling
+        for statement in SCHEMA:
+            conn.execute(statement)
+
+        missing = conn.execute("SELECT id, quote_number, created_at FROM quotes "
+                               "WHERE user_initials IS NULL OR created_date IS NULL").fetchall()
+        conn.executemany(
+            "UPDATE quotes SET user_initials = COALESCE(user_initials, ?), "
+            "created_date = COALESCE(created_date, date(?)) WHERE id = ?",
+            [(initials_from_quote_number(quote_number), created_at, quote_id)
+             for quote_id, quote_number, created_at in missing])
+
+        rebuild(conn)
+        for statement in TRIGGERS:
+            conn.execute(statement)
+    logger.info("Reporting tables ready (%d quotes backfilled)", len(missing))
+    return len(missing)
+
+
+def is_migrated(conn: sqlite3.Connection) -> bool:
+    """True if the rollup tables and all of their triggers exist"""
+    names = [table for table, _, _ in ROLLUPS.values()] + list(TRIGGER_NAMES)
+    placeholders = ', '.join('?' * len(names))
+    found = conn.execute(f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({placeholders})", names).fetchone()[0]
+    return found == len(names)
+
+
+_ready: Dict[str, bool] = {}
+_ready_lock = threading.Lock()
+
+
+def ensure_migrated(db_path: str, conn: sqlite3.Connection) -> bool:
+    """
+    Migrate a database on first use (once per process and path).
+
+    Returns:
+        True if the reporting columns and rollups are available
+    """
+    key = os.path.abspath(db_path)
+    ready = _ready.get(key)
+    if ready is not None:
+        return ready
+    with _ready_lock:
+        ready = _ready.get(key)
+        if ready is None:
+            try:
+                if not is_migrated(conn):
+                    migrate(conn)
+                ready = True
+            except sqlite3.Error as e:
+                logger.warning("Quote reporting unavailable: %s", e)
+                ready = False
+            _ready[key] = ready
+    return ready
+
+
+def query_rollup(conn: sqlite3.Connection, by: str = 'user', start_date: Optional[str] = None,
+                 end_date: Optional[str] = None, key: Optional[str] = None,
+                 per_day: bool = False) -> List[Dict[str, Any]]:
+    """
+    Totals from one rollup table.
+
+    Args:
+        by: 'user', 'customer' or 'model'
+        start_date: First day included (YYYY-MM-DD)
+        end_date: Last day included (YYYY-MM-DD)
+        key: Only this user, customer or model
+        per_day: One row per key and day instead of one per key
+
+    Returns:
+        Rows with the key column, created_date (if per_day) and the summed measures
+    """
+    if by not in ROLLUPS:
+        raise ValueError(f"Unknown report '{by}'; expected one of {', '.join(ROLLUPS)}")
+    table, key_column, measures = ROLLUPS[by]
+
+    conditions = []
+    params: List[Any] = []
+    if start_date:
+        conditions.append("created_date >= ?")
+        params.append(start_date)
+    if end_date:
+        conditions.append("created_date <= ?")
+        params.append(end_date)
+    if key is not None:
+        conditions.append(f"{key_column} = ?")
+        params.append(key)
+
+    group = [key_column] + (['created_date'] if per_day else [])
+    sums = ', '.join(f"SUM({measure}) AS {measure}" for measure in measures)
+    query = f"SELECT {', '.join(group)}, {sums} FROM {table}"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += f" GROUP BY {', '.join(group)} HAVING SUM({measures[0]}) > 0"
+    query += f" ORDER BY {'created_date, ' if per_day else ''}total_value DESC, {key_column}"
+
+    cursor = conn.execute(query, params)
+    columns = [description[0] for description in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def write_csv(rows: Sequence[Dict[str, Any]], destination: Union[str, IO[str], None] = None) -> str:
+    """
+    Write report rows as CSV to a path or open file.
+
+    Returns:
+        The CSV text
+    """
+    buffer = io.StringIO()
+    if rows:
+        writer = csv.DictWriter(buffer, fieldnames=list(rows[0]), lineterminator='\n')
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({k: round(v, 2) if isinstance(v, float) else v for k, v in row.items()})
+    text = buffer.getvalue()
+    if isinstance(destination, str):
+        with open(destination, 'w', newline='', encoding='utf-8') as f:
+            f.write(text)
+    elif destination is not None:
+        destination.write(text)
+    return text
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Migrate the given database (default: database/quotes.db) and print the per-user rollup"""
+    argv = sys.argv[1:] if argv is None else argv
+    db_path = argv[0] if argv else os.path.join(os.path.dirname(os.path.abspath(__file__)), 'quotes.db')
+    if not os.path.exists(db_path):
+        print(f"Database not found: {db_path}")
+        return 1
+    conn = sqlite3.connect(db_path)
+    try:
+        migrate(conn)
+        write_csv(query_rollup(conn, 'user'), sys.stdout)
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
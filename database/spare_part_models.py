@@ -0,0 +1,170 @@
+"""
+Spare Part Compatibility Index for Babbitt Quote Generator
+Normalizes spare_parts.compatible_models (a JSON array) into an indexed join table
+
+Run directly to migrate a database:
+    python -m database.spare_part_models [path/to/quotes.db]
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Model code that makes a part compatible with every model
+ALL_MODELS = 'ALL'
+
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS spare_part_models (
+        spare_part_id INTEGER NOT NULL REFERENCES spare_parts(id) ON DELETE CASCADE,
+        model_code TEXT NOT NULL,
+        PRIMARY KEY (model_code, spare_part_id)
+    ) WITHOUT ROWID""",
+    "CREATE INDEX IF NOT EXISTS idx_spare_part_models_part ON spare_part_models(spare_part_id)",
+)
+
+# The column holds a JSON array, but a bare model code or 'ALL' is accepted too
+_MODELS_FROM_NEW = (
+    "SELECT new.id, trim(value) FROM json_each("
+    "CASE WHEN json_valid(new.compatible_models) AND json_type(new.compatible_models) = 'array' "
+    "THEN new.compatible_models ELSE json_array(new.compatible_models) END) "
+    "WHERE value IS NOT NULL AND trim(value) != ''"
+)
+
+TRIGGERS = (
+    f"""CREATE TRIGGER IF NOT EXISTS spare_part_models_ai AFTER INSERT ON spare_parts BEGIN
+        INSERT OR IGNORE INTO spare_part_models (spare_part_id, model_code) {_MODELS_FROM_NEW};
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS spare_part_models_au AFTER UPDATE OF id, compatible_models ON spare_parts BEGIN
+        DELETE FROM spare_part_models WHERE spare_part_id = old.id;
+        INSERT OR IGNORE INTO spare_part_models (spare_part_id, model_code) {_MODELS_FROM_NEW};
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS spare_part_models_ad AFTER DELETE ON spare_parts BEGIN
+        DELETE FROM spare_part_models WHERE spare_part_id = old.id;
+    END""",
+)
+
+
+def parse_compatible_models(value: Optional[str]) -> List[str]:
+    """
+    Model codes from a compatible_models value.
+    '["LS8000", "LS8000/2"]' -> ['LS8000', 'LS8000/2']; 'ALL' -> ['ALL']; None -> []
+    """
+    if not value:
+        return []
+    try:
+        models = json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        models = value
+    if not isinstance(models, list):
+        models = [models]
+    return [str(model).strip() for model in models if model is not None and str(model).strip()]
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """
+    Create spare_part_models and its triggers, then fill it from compatible_models.
+    Safe to run repeatedly; the table is rebuilt from the JSON column each time.
+
+    Returns:
+        Number of (part, model) rows written
+    """
+    rows = conn.execute("SELECT id, compatible_models FROM spare_parts").fetchall()
+    pairs = {(row[0], model) for row in rows for model in parse_compatible_models(row[1])}
+    with conn:
+        for statement in SCHEMA + TRIGGERS:
+            conn.execute(statement)
+        conn.execute("DELETE FROM spare_part_models")
+        conn.executemany("INSERT INTO spare_part_models (spare_part_id, model_code) VALUES (?, ?)", sorted(pairs))
+    logger.info("Indexed %d spare part compatibility entries", len(pairs))
+    return len(pairs)
+
+
+def is_migrated(conn: sqlite3.Connection) -> bool:
+    """True if the join table and all of its triggers exist"""
+    names = {row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE name IN "
+        "('spare_part_models', 'spare_part_models_ai', 'spare_part_models_au', 'spare_part_models_ad')")}
+    return len(names) == 4
+
+
+_ready: Dict[str, bool] = {}
+_ready_lock = threading.Lock()
+
+
+def ensure_migrated(db_path: str, conn: sqlite3.Connection) -> bool:
+    """
+    Migrate a database on first use (once per process and path).
+
+    Returns:
+        True if spare_part_models can be queried, False to fall back to LIKE filters
+    """
+    key = os.path.abspath(db_path)
+    ready = _ready.get(key)
+    if ready is not None:
+        return ready
+    with _ready_lock:
+        ready = _ready.get(key)
+        if ready is None:
+            try:
+                if not is_migrated(conn):
+                    migrate(conn)
+                ready = True
+            except sqlite3.Error as e:
+                logger.warning("Spare part compatibility index unavailable, using LIKE filters: %s", e)
+                ready = False
+            _ready[key] = ready
+    return ready
+
+
+class CompatibilityIndex:
+    """
+    Parsed compatible_models for every spare part, built once per catalog snapshot.
+    """
+
+    def __init__(self, catalog):
+        self._models: Dict[str, Tuple[str, ...]] = {}
+        self._parts: Dict[str, List[str]] = {}
+        for row in catalog.rows('spare_parts'):
+            models = tuple(parse_compatible_models(row['compatible_models']))
+            self._models.setdefault(row['part_number'], models)
+            for model in models:
+                self._parts.setdefault(model, []).append(row['part_number'])
+
+    def models_for(self, part_number: str) -> Optional[Tuple[str, ...]]:
+        """Compatible model codes of a part, or None if the part is unknown"""
+        return self._models.get(part_number)
+
+    def parts_for(self, model_code: str) -> List[str]:
+        """Part numbers listed for a model, including parts marked 'ALL'"""
+        return self._parts.get(model_code, []) + self._parts.get(ALL_MODELS, [])
+
+    def is_compatible(self, part_number: str, model_code: str) -> bool:
+        models = self._models.get(part_number, ())
+        return model_code in models or ALL_MODELS in models
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Migrate the given database (default: database/quotes.db)"""
+    argv = sys.argv[1:] if argv is None else argv
+    db_path = argv[0] if argv else os.path.join(os.path.dirname(os.path.abspath(__file__)), 'quotes.db')
+    if not os.path.exists(db_path):
+        print(f"Database not found: {db_path}")
+        return 1
+    conn = sqlite3.connect(db_path)
+    try:
+        count = migrate(conn)
+    finally:
+        conn.close()
+    print(f"spare_part_models: {count} rows in {db_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
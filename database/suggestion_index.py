@@ -0,0 +1,146 @@
+"""
+Autocomplete Suggestion Index for Babbitt Quote Generator
+Serves part-number section suggestions from the catalog snapshot instead of SQL
+"""
+
+from bisect import bisect_left
+from typing import Dict, List, Optional, Set, Tuple, Any
+
+from utils.cache import LRUCache
+
+try:
+    from config.settings import AUTOCOMPLETE_CACHE_SIZE
+except ImportError:
+    AUTOCOMPLETE_CACHE_SIZE = 1024
+
+# Section type -> (table, code column, name column, also match names)
+SECTION_SOURCES = {
+    'model': ('product_models', 'model_number', 'description', False),
+    'voltage': ('voltages', 'voltage', 'voltage', False),
+    'material': ('materials', 'code', 'name', True),
+    'option': ('options', 'code', 'name', True),
+    'insulator': ('insulators', 'code', 'name', True),
+}
+
+# Names are searched by substring; grams up to this length are indexed
+NGRAM_SIZE = 3
+
+
+class _Entry:
+    __slots__ = ('code', 'name', 'is_alias')
+
+    def __init__(self, code: str, name: Any, is_alias: bool = False):
+        self.code = code
+        self.name = name
+        self.is_alias = is_alias
+
+    def as_dict(self) -> Dict[str, Any]:
+        suggestion = {'code': self.code, 'name': self.name}
+        if self.is_alias:
+            suggestion['is_alias'] = True
+        return suggestion
+
+
+class _PrefixIndex:
+    """
+    Entries sorted by lower-cased code; a prefix is a contiguous run found by bisect.
+    Names can also be searched by substring through an n-gram map.
+    """
+
+    def __init__(self, entries: List[_Entry], match_names: bool = False):
+        pairs = sorted((str(entry.code).lower(), index) for index, entry in enumerate(entries))
+        self.entries = entries
+        self.keys = [key for key, _ in pairs]
+        self.order = [index for _, index in pairs]
+        self.names: Optional[List[str]] = None
+        self.grams: Dict[str, Set[int]] = {}
+        if match_names:
+            self.names = [str(entry.name or '').lower() for entry in entries]
+            for index, name in enumerate(self.names):
+                for size in range(1, NGRAM_SIZE + 1):
+                    for start in range(len(name) - size + 1):
+                        self.grams.setdefault(name[start:start + size], set()).add(index)
+
+    def prefix_matches(self, prefix: str) -> List[int]:
+        start = bisect_left(self.keys, prefix)
+        end = bisect_left(self.keys, prefix + '\uffff', start)
+        return self.order[start:end]
+
+    def name_matches(self, text: str) -> List[int]:
+        if self.names is None:
+            return []
+        candidates = self.grams.get(text[:NGRAM_SIZE], ())
+        return [index for index in candidates if text in self.names[index]]
+
+    def search(self, text: str, limit: int) -> List[_Entry]:
+        """Entries whose code starts with text (or whose name contains it), ordered by code"""
+        text = text.lower()
+        matches = set(self.prefix_matches(text))
+        if self.names is not None and text:
+            matches.update(self.name_matches(text))
+        # Same order as SQL "ORDER BY code": by the code as stored
+        return sorted((self.entries[index] for index in matches), key=lambda entry: str(entry.code))[:limit]
+
+
+class SuggestionIndex:
+    """
+    In-memory autocomplete index for every part-number section type.
+
+    Built once per catalog snapshot (see CatalogSnapshot.derived), so it is
+    rebuilt automatically when the reference data changes. Repeated lookups
+    are answered from a small LRU cache.
+    """
+
+    def __init__(self, catalog):
+        self.version = catalog.version
+        self._sections: Dict[str, _PrefixIndex] = {}
+        for section_type, (table, code_column, name_column, match_names) in SECTION_SOURCES.items():
+            if not catalog.has_table(table):
+                continue
+            entries = []
+            seen = set()
+            for row in catalog.rows(table):
+                code = row[code_column]
+                if code is None or code in seen:
+                    continue  # voltages repeat per model family; suggest each once
+                seen.add(code)
+                entries.append(_Entry(code, row[name_column]))
+            self._sections[section_type] = _PrefixIndex(entries, match_names)
+
+        aliases: Dict[str, List[_Entry]] = {}
+        if catalog.has_table('part_section_aliases'):
+            for row in catalog.rows('part_section_aliases'):
+                aliases.setdefault(row['section_type'], []).append(
+                    _Entry(row['alias'], f"{row['description']} (alias)", is_alias=True))
+        self._aliases = {section_type: _PrefixIndex(entries) for section_type, entries in aliases.items()}
+        self._cache = LRUCache(maxsize=AUTOCOMPLETE_CACHE_SIZE)
+
+    def suggest(self, section_type: str, partial_text: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Suggestions for the text typed in one section of a part number.
+
+        Standard codes come first, then aliases (flagged with is_alias),
+        matching DatabaseManager.get_autocomplete_suggestions.
+        """
+        key = (section_type, partial_text.lower(), limit)
+        entries: Optional[Tuple[_Entry, ...]] = self._cache.get(key)
+        if entries is None:
+            found: List[_Entry] = []
+            section = self._sections.get(section_type)
+            if section is not None:
+                found.extend(section.search(partial_text, limit))
+            aliases = self._aliases.get(section_type)
+            if aliases is not None:
+                found.extend(aliases.search(partial_text, limit))
+            entries = tuple(found[:limit])
+            self._cache.put(key, entries)
+        return [entry.as_dict() for entry in entries]
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry counts per section plus cache counters"""
+        return {
+            'version': self.version,
+            'sections': {name: len(index.entries) for name, index in self._sections.items()},
+            'aliases': {name: len(index.entries) for name, index in self._aliases.items()},
+            'cache': self._cache.stats(),
+        }
@@ -0,0 +1,272 @@
+"""
+Export Cache for Word Quote Generation
+
+Keeps rendered .docx files keyed by a hash of everything that goes into
+them: the generator and its version, the template files' contents and the
+normalized template variables (which include the quote date). Exporting
+the same quote again copies the cached file instead of rendering it.
+
+Entries live in the app data directory and are evicted least recently
+used first once the cache grows past its size cap. A file's modification
+time marks its last use, so processes sharing the directory share the LRU
+order.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+import logging
+
+try:
+    from config.settings import APP_VERSION, EXPORT_CACHE_DIR, EXPORT_CACHE_MAX_MB, EXPORT_CACHE_LINK
+except ImportError:
+    APP_VERSION = "1.0.0"
+    EXPORT_CACHE_DIR = Path.home() / ".cache" / "BabbittQuoteGenerator" / "export_cache"
+    EXPORT_CACHE_MAX_MB = 200
+    EXPORT_CACHE_LINK = False
+
+logger = logging.getLogger(__name__)
+
+# Bump when a generator's output changes for the same templates and variables
+EXPORT_CACHE_VERSION = 1
+
+ENTRY_SUFFIX = '.docx'
+
+# Content digests of template files, reused while the file is unchanged: path -> (mtime_ns, size, digest)
+_file_digests: Dict[str, Tuple[int, int, str]] = {}
+_file_digests_lock = threading.Lock()
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """SHA-256 of a file's contents ('missing' if it does not exist); only re-read after it changes"""
+    key = os.path.abspath(path)
+    try:
+        stat = os.stat(key)
+    except OSError:
+        return 'missing'
+    with _file_digests_lock:
+        entry = _file_digests.get(key)
+    if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+        return entry[2]
+    digest = hashlib.sha256()
+    with open(key, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    with _file_digests_lock:
+        _file_digests[key] = (stat.st_mtime_ns, stat.st_size, digest.hexdigest())
+    return digest.hexdigest()
+
+
+def export_key(generator: str, payload: Any, template_paths: Iterable[Union[str, Path]]) -> str:
+    """
+    Stable key for one export.
+
+    Args:
+        generator: Name of the export function
+        payload: Everything the document is rendered from, JSON-serializable
+            (other values are keyed by their str())
+        template_paths: Template and config files the export reads
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{generator}\0{EXPORT_CACHE_VERSION}\0{APP_VERSION}\0".encode('utf-8'))
+    for path in sorted({os.path.abspath(path) for path in template_paths}):
+        digest.update(f"{path}\0{file_digest(path)}\0".encode('utf-8'))
+    normalized = json.dumps(payload, sort_keys=True, default=str, separators=(',', ':'), ensure_ascii=False)
+    digest.update(normalized.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ExportCache:
+    """
+    Directory of rendered documents named by export key, capped in size.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int, link: bool = False):
+        """
+        Args:
+            cache_dir: Directory holding the cached documents
+            max_bytes: Size cap; least recently used entries are removed beyond it
+                (0 turns the cache off)
+            link: Hard-link hits into place instead of copying (falls back to a copy).
+                Only safe if exported files are never edited in place.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.link = link
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{ENTRY_SUFFIX}"
+
+    def fetch(self, key: str, output_path: str) -> bool:
+        """Put the cached document for key at output_path; False on a miss"""
+        entry = self._entry_path(key)
+        try:
+            self._place(entry, output_path)
+            os.utime(entry)  # mark as recently used
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return False
+        with self._lock:
+            self.hits += 1
+        logger.debug("Export cache hit %s -> %s", key[:12], output_path)
+        return True
+
+    def _place(self, entry: Path, output_path: str) -> None:
+        if self.link:
+            try:
+                if os.path.lexists(output_path):
+                    os.remove(output_path)
+                os.link(entry, output_path)
+                return
+            except FileNotFoundError:
+                raise
+            except OSError:
+                pass  # different volume or no link support; copy instead
+        shutil.copyfile(entry, output_path)
+
+    def store(self, key: str, output_path: str) -> None:
+        """Add a freshly rendered document, then trim the cache to its size cap"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = self._entry_path(key)
+        temp_path = self.cache_dir / f".{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            shutil.copyfile(output_path, temp_path)
+            os.replace(temp_path, entry)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+        with self._lock:
+            self.stores += 1
+        self.evict()
+
+    def _entries(self) -> list:
+        """(last used, size, path) of each cached document"""
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for item in it:
+                    if item.name.endswith(ENTRY_SUFFIX) and item.is_file():
+                        stat = item.stat()
+                        entries.append((stat.st_mtime, stat.st_size, item.path))
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the cache fits its cap; returns how many"""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        if removed:
+            with self._lock:
+                self.evictions += removed
+            logger.debug("Export cache evicted %d entries", removed)
+        return removed
+
+    def clear(self) -> None:
+        """Remove every cached document"""
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process and the cache's current size"""
+        entries = self._entries()
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _ in entries),
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'stores': self.stores,
+            'evictions': self.evictions,
+        }
+
+
+_export_cache: Optional[ExportCache] = None
+_export_cache_lock = threading.Lock()
+
+
+def get_export_cache() -> Optional[ExportCache]:
+    """Shared export cache, or None when EXPORT_CACHE_MAX_MB is 0 (and none was put in place)"""
+    global _export_cache
+    if _export_cache is None:
+        if EXPORT_CACHE_MAX_MB <= 0:
+            return None
+        with _export_cache_lock:
+            if _export_cache is None:
+                _export_cache = ExportCache(EXPORT_CACHE_DIR, EXPORT_CACHE_MAX_MB * 1024 * 1024, EXPORT_CACHE_LINK)
+    return _export_cache
+
+
+@contextmanager
+def use_export_cache(cache: ExportCache) -> Iterator[ExportCache]:
+    """
+    Send exports through another cache until the block ends, e.g.
+    ExportCache(path, max_bytes=0) to time rendering with caching off.
+    """
+    global _export_cache
+    previous = _export_cache
+    _export_cache = cache
+    try:
+        yield cache
+    finally:
+        _export_cache = previous
+
+
+def cached_export(generator: str, payload: Any, template_paths: Iterable[Union[str, Path]],
+                  output_path: str, render: Callable[[], bool]) -> bool:
+    """
+    Run render() to write output_path unless an identical export is cached.
+
+    Cache problems are logged and never fail the export.
+
+    Args:
+        generator: Name of the export function
+        payload: Everything the document is rendered from (see export_key)
+        template_paths: Template and config files the export reads
+        output_path: Where the document goes
+        render: Writes the document to output_path; returns success
+    """
+    cache = get_export_cache()
+    key = None
+    if cache is not None and cache.max_bytes > 0:
+        try:
+            key = export_key(generator, payload, template_paths)
+            if cache.fetch(key, output_path):
+                return True
+        except OSError as e:
+            logger.warning("Export cache lookup failed, rendering: %s", e)
+
+    success = render()
+
+    if success and key is not None:
+        try:
+            cache.store(key, output_path)
+        except OSError as e:
+            logger.warning("Could not add export to cache: %s", e)
+    return success
@@ -8,6 +8,7 @@ Uses a programmatically built template structure instead of model-specific templ
 
 import os
 import re
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Dict, Any, Optional, List, TYPE_CHECKING
 from datetime import datetime
@@ -26,6 +27,13 @@ try:
 except ImportError:
     DOCX_AVAILABLE = False
 
+from export.streaming_docx import StreamingDocxWriter
+
+try:
+    from config.settings import STREAMING_EXPORT_MIN_ITEMS
+except ImportError:
+    STREAMING_EXPORT_MIN_ITEMS = 50
+
 logger = logging.getLogger(__name__)
 
 def _extract_display_quote_number(quote_number: str) -> str:
@@ -252,13 +260,15 @@ class MasterQuoteGenerator:
             pricing_para.add_run(" | Total: ").bold = True
             pricing_para.add_run(f"${total_price:.2f}")
     
-    def _add_quote_summary(self, doc: Any, quote_items: List[Dict[str, Any]]) -> None:
+    def _add_quote_summary(self, doc: Any, quote_items: List[Dict[str, Any]],
+                           writer: Optional[StreamingDocxWriter] = None) -> None:
         """
         Add quote summary section with totals (only for multi-item quotes).
         
         Args:
             doc: Document object
             quote_items: List of all quote items
+            writer: Streaming writer whose body is doc; table rows are written as they are added
         """
         if len(quote_items) <= 1:
             return  # No summary needed for single items
@@ -287,10 +297,25 @@ class MasterQuoteGenerator:
                 for run in paragraph.runs:
                     run.bold = True
         
+        rows = writer.streamed_rows(table) if writer else nullcontext(table.add_row)
+        with rows as add_row:
+            self._add_summary_rows(add_row, quote_items)
+    
+    def _add_summary_rows(self, add_row, quote_items: List[Dict[str, Any]]) -> float:
+        """
+        Add the summary table's item rows and total row.
+        
+        Args:
+            add_row: Function adding a row to the summary table
+            quote_items: List of all quote items
+            
+        Returns:
+            Total quote value
+        """
         # Add data rows
         total_quote_value = 0.0
         for i, item in enumerate(quote_items, 1):
-            row_cells = table.add_row().cells
+            row_cells = add_row().cells
             
             # Item number
             row_cells[0].text = str(i)
@@ -317,7 +342,7 @@ class MasterQuoteGenerator:
             row_cells[4].text = f"${item_total:.2f}"
         
         # Add total row
-        total_row = table.add_row().cells
+        total_row = add_row().cells
         total_row[0].text = ""
         total_row[1].text = ""
         total_row[2].text = ""
@@ -329,6 +354,8 @@ class MasterQuoteGenerator:
             for paragraph in cell.paragraphs:
                 for run in paragraph.runs:
                     run.bold = True
+        
+        return total_quote_value
     
     def _add_footer_section(self, doc: Any, quote_data: Dict[str, Any]) -> None:
         """
@@ -446,6 +473,7 @@ class MasterQuoteGenerator:
         quote_number: str,
         output_path: str,
         employee_info: Optional[Dict[str, str]] = None,
+        streaming: Optional[bool] = None,
         **kwargs
     ) -> bool:
         """
@@ -458,6 +486,8 @@ class MasterQuoteGenerator:
             quote_number: Quote number
             output_path: Output file path
             employee_info: Employee information dict with 'name', 'phone', 'email'
+            streaming: Stream the document to disk item by item (default: for
+                quotes of STREAMING_EXPORT_MIN_ITEMS items or more); same output
             **kwargs: Additional template variables
             
         Returns:
@@ -468,9 +498,6 @@ class MasterQuoteGenerator:
             return False
         
         try:
-            # Create a new blank document
-            doc = Document()
-            
             # Prepare quote data
             quote_data = {
                 'date': datetime.now().strftime("%B %d, %Y"),
@@ -484,6 +511,16 @@ class MasterQuoteGenerator:
                 'quote_validity': kwargs.get('quote_validity', '30 days')
             }
             
+            if streaming is None:
+                streaming = len(quote_items) >= STREAMING_EXPORT_MIN_ITEMS
+            if streaming:
+                self._write_streaming(quote_items, quote_data, output_path)
+                logger.info(f"Master quote generated successfully: {output_path}")
+                return True
+            
+            # Create a new blank document
+            doc = Document()
+            
             # Build the document structure
             self._create_header_section(doc, quote_data)
             
@@ -508,6 +545,26 @@ class MasterQuoteGenerator:
             traceback.print_exc()
             return False
 
+    def _write_streaming(self, quote_items: List[Dict[str, Any]], quote_data: Dict[str, Any],
+                         output_path: str) -> None:
+        """
+        Build the same document as generate_master_quote, writing each item
+        to disk as soon as it is built instead of holding the whole quote.
+        
+        Args:
+            quote_items: List of quote items
+            quote_data: Quote information dictionary
+            output_path: Output file path
+        """
+        with StreamingDocxWriter(output_path) as writer:
+            doc = writer.body
+            self._create_header_section(doc, quote_data)
+            for i, item in enumerate(quote_items, 1):
+                self._add_item_section(doc, item, i)
+                writer.flush()
+            self._add_quote_summary(doc, quote_items, writer)
+            self._add_footer_section(doc, quote_data)
+
 # Convenience function for easy integration
 def generate_master_quote(
     quote_items: List[Dict[str, Any]],
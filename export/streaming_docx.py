@@ -0,0 +1,187 @@
+"""
+Streaming DOCX Writer for Large Quotes
+
+Writes word/document.xml straight into the output package while the quote
+is being built. Content is added through python-docx to a small scratch
+body, the same way it would be added to a Document, and is flushed to the
+zip stream after each item, so memory and per-paragraph cost stay flat no
+matter how many items the quote has. The other parts of the package are
+copied from the template as python-docx would save them.
+"""
+
+import copy
+import io
+import os
+import zipfile
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional
+import logging
+
+try:
+    from docx import Document
+    from docx.blkcntnr import BlockItemContainer
+    from docx.opc.oxml import serialize_part_xml
+    from lxml import etree
+    DOCX_AVAILABLE = True
+except ImportError:
+    DOCX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DOCUMENT_PART = 'word/document.xml'
+BODY_OPEN = b'<w:body>'
+BODY_CLOSE = b'</w:body>'
+TABLE_CLOSE = b'</w:tbl>'
+
+
+class StreamingBody(BlockItemContainer):
+    """
+    Scratch body with the Document API the quote generators use
+    (add_paragraph, add_table). Styles resolve against the template.
+    """
+
+    def __init__(self, element, document):
+        super().__init__(element, document._body)
+        self._block_width = document._block_width
+
+    def add_table(self, rows: int, cols: int, style=None):
+        """Add a table the way Document.add_table does"""
+        table = super().add_table(rows, cols, self._block_width)
+        table.style = style
+        return table
+
+
+class StreamingDocxWriter:
+    """
+    Writes a .docx whose body is streamed in pieces.
+
+    Usage:
+        with StreamingDocxWriter(output_path) as writer:
+            writer.body.add_paragraph("...")
+            writer.flush()
+
+    The document is equivalent to adding the same content to
+    Document(template) and saving it. If the block raises, the partial
+    file is removed.
+    """
+
+    def __init__(self, output_path: str, template: Optional[str] = None):
+        if not DOCX_AVAILABLE:
+            raise ImportError("python-docx is required. Install with: pip install python-docx")
+        self.output_path = output_path
+        self.bytes_written = 0
+
+        document = Document(template)
+        package = io.BytesIO()
+        document.save(package)
+        self._package = zipfile.ZipFile(package)
+
+        # Split the document part around the body content; the section
+        # properties close the body after everything streamed
+        template_body = document.element.body
+        sect_pr = template_body.sectPr
+        part_xml = serialize_part_xml(document.element)
+        if sect_pr is not None:
+            content_end = part_xml.index(b'<w:sectPr', part_xml.index(BODY_OPEN))
+        else:
+            content_end = part_xml.index(BODY_CLOSE)
+        self._head = part_xml[:part_xml.index(BODY_OPEN) + len(BODY_OPEN)]
+        self._tail = part_xml[content_end:]
+
+        # Scratch copy of the root element: serializing content inside it
+        # keeps the namespace declarations on the root, as in the saved part.
+        # Any content the template body already has is streamed first.
+        self._root = copy.deepcopy(document.element)
+        self._scratch = self._root.body
+        if sect_pr is not None:
+            self._scratch.remove(self._scratch.sectPr)
+        self.body = StreamingBody(self._scratch, document)
+
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._stream = None
+
+    def __enter__(self) -> 'StreamingDocxWriter':
+        self._zip = zipfile.ZipFile(self.output_path, 'w', zipfile.ZIP_DEFLATED)
+        entries = self._package.infolist()
+        document_index = [info.filename for info in entries].index(DOCUMENT_PART)
+        self._copy_entries(entries[:document_index])
+        self._rest = entries[document_index + 1:]
+        self._stream = self._zip.open(DOCUMENT_PART, 'w')
+        self._write(self._head)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            if exc_type is None:
+                self.flush()
+                self._write(self._tail)
+        finally:
+            self._stream.close()
+            if exc_type is None:
+                self._copy_entries(self._rest)
+            self._zip.close()
+            self._package.close()
+        if exc_type is not None and os.path.exists(self.output_path):
+            os.remove(self.output_path)
+        elif exc_type is None:
+            logger.debug("Streamed %d bytes of document XML to %s", self.bytes_written, self.output_path)
+
+    def _copy_entries(self, entries: List[zipfile.ZipInfo]) -> None:
+        """Copy template package parts, keeping python-docx's part order"""
+        for info in entries:
+            self._zip.writestr(info.filename, self._package.read(info), info.compress_type)
+
+    def _write(self, data: bytes) -> None:
+        self._stream.write(data)
+        self.bytes_written += len(data)
+
+    def _scratch_xml(self) -> bytes:
+        """Serialized content of the scratch body"""
+        xml = etree.tostring(self._root, encoding='UTF-8')
+        start = xml.find(BODY_OPEN)
+        if start < 0:
+            return b''  # empty body serializes as <w:body/>
+        return xml[start + len(BODY_OPEN):xml.rindex(BODY_CLOSE)]
+
+    def flush(self) -> None:
+        """Write everything added to the body so far and clear it"""
+        if len(self._scratch):
+            self._write(self._scratch_xml())
+            for child in list(self._scratch):
+                self._scratch.remove(child)
+
+    @contextmanager
+    def streamed_rows(self, table) -> Iterator[Callable[[], Any]]:
+        """
+        Stream the rows of a table that was just added to the body.
+
+        Yields an add_row() to use instead of table.add_row(); each row is
+        written once the next one is added, so only one row is in memory.
+        """
+        tbl = table._tbl
+        if len(self._scratch) == 0 or self._scratch[-1] is not tbl:
+            raise ValueError("streamed_rows() needs the table to be the last element of the body")
+
+        # Everything up to and including the rows added so far, without </w:tbl>
+        self._write(self._scratch_xml()[:-len(TABLE_CLOSE)])
+        for child in list(self._scratch)[:-1]:
+            self._scratch.remove(child)
+        for tr in tbl.tr_lst:
+            tbl.remove(tr)
+        rows_start = len(self._scratch_xml()) - len(TABLE_CLOSE)
+
+        def write_rows():
+            if tbl.tr_lst:
+                self._write(self._scratch_xml()[rows_start:-len(TABLE_CLOSE)])
+                for tr in tbl.tr_lst:
+                    tbl.remove(tr)
+
+        def add_row():
+            write_rows()
+            return table.add_row()
+
+        yield add_row
+        write_rows()
+        self._write(TABLE_CLOSE)
+        self._scratch.remove(tbl)
+
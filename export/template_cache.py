@@ -0,0 +1,246 @@
+"""
+Template Cache for Word Quote Generation
+
+Parses each .docx template once, records which paragraphs hold {{variable}}
+placeholders and conditional blocks, and hands out deep copies of the parsed
+document for every export. Entries are reloaded when the template file changes.
+"""
+
+import copy
+import io
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Any, Optional, List, NamedTuple, Tuple, Iterator, Union
+import logging
+
+try:
+    from docx import Document
+    from docx.text.paragraph import Paragraph
+    from docx.oxml.ns import qn
+    DOCX_AVAILABLE = True
+except ImportError:
+    DOCX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Regions a placeholder paragraph can live in
+BODY = 'body'
+TABLE = 'table'
+HEADER = 'header'
+FOOTER = 'footer'
+ALL_REGIONS = (BODY, TABLE, HEADER, FOOTER)
+
+
+def iter_template_paragraphs(doc, regions: Tuple[str, ...] = ALL_REGIONS) -> Iterator[Tuple[str, Any, Any]]:
+    """
+    Walk a document the way the template processors do: body paragraphs,
+    top-level table cells, then each section's header and footer.
+
+    Yields:
+        (region, container, paragraph) where container is 'body' for the
+        document story or (section_index, 'header'/'footer')
+    """
+    if BODY in regions:
+        for paragraph in doc.paragraphs:
+            yield BODY, BODY, paragraph
+
+    if TABLE in regions:
+        for table in doc.tables:
+            for row in table.rows:
+                for cell in row.cells:
+                    for paragraph in cell.paragraphs:
+                        yield TABLE, BODY, paragraph
+
+    for index, section in enumerate(doc.sections):
+        if HEADER in regions:
+            for paragraph in section.header.paragraphs:
+                yield HEADER, (index, HEADER), paragraph
+        if FOOTER in regions:
+            for paragraph in section.footer.paragraphs:
+                yield FOOTER, (index, FOOTER), paragraph
+
+
+class PlaceholderLocation(NamedTuple):
+    """A paragraph that contains template markup"""
+    region: str
+    container: Union[str, Tuple[int, str]]
+    index: int  # position among the container's w:p elements
+    has_conditionals: bool
+
+
+class CompiledTemplate:
+    """
+    A parsed template plus the locations of its placeholder paragraphs.
+
+    The parsed document is never modified; new_document() returns a deep
+    copy for each export.
+    """
+
+    def __init__(self, path: Path, mtime_ns: int, size: int):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.document = Document(str(path))
+        self.locations: List[PlaceholderLocation] = []
+        self._derived: Dict[str, Any] = {}
+        self._derived_lock = threading.Lock()
+
+        # Collect locations; this also creates any header/footer parts the
+        # processors would otherwise add on every export. Elements are keyed
+        # by the lxml proxies themselves: holding them keeps each proxy (and
+        # its identity) alive, where id() of a released proxy can be reused.
+        element_indexes = {}
+        seen = set()
+        for region, container, paragraph in iter_template_paragraphs(self.document):
+            text = paragraph.text
+            if '{{' not in text or paragraph._p in seen:
+                continue
+            seen.add(paragraph._p)
+            if container not in element_indexes:
+                root = self._container_element(self.document, container)
+                element_indexes[container] = {p: i for i, p in enumerate(root.iter(qn('w:p')))}
+            self.locations.append(PlaceholderLocation(
+                region=region,
+                container=container,
+                index=element_indexes[container][paragraph._p],
+                has_conditionals='{{if_' in text,
+            ))
+
+    @staticmethod
+    def _container_element(doc, container):
+        if container == BODY:
+            return doc.element.body
+        section_index, kind = container
+        return getattr(doc.sections[section_index], kind)._element
+
+    @staticmethod
+    def _container_parent(doc, container):
+        if container == BODY:
+            return doc._body
+        section_index, kind = container
+        return getattr(doc.sections[section_index], kind)
+
+    def derived(self, key: str, factory: Callable[['CompiledTemplate'], Any]) -> Any:
+        """
+        Build-once structure compiled from this template (e.g. its bullet lines).
+
+        Derived data lives and dies with the entry, so an edited template
+        file recompiles it on the next lookup.
+        """
+        value = self._derived.get(key)
+        if value is None:
+            with self._derived_lock:
+                value = self._derived.get(key)
+                if value is None:
+                    value = factory(self)
+                    self._derived[key] = value
+        return value
+
+    def new_document(self):
+        """Independent copy of the parsed template, ready to be filled in"""
+        # Copy the part rather than the Document proxy: lxml ignores the
+        # deepcopy memo, so the proxy's cached body would become a second,
+        # detached copy that doc.paragraphs reads while saves use the part's
+        return copy.deepcopy(self.document.part).document
+
+    def to_bytes(self) -> bytes:
+        """The parsed template serialized as .docx bytes"""
+        buffer = io.BytesIO()
+        self.document.save(buffer)
+        return buffer.getvalue()
+
+    def paragraphs(self, doc, regions: Tuple[str, ...] = ALL_REGIONS,
+                   conditionals_only: bool = False) -> List[Any]:
+        """
+        Paragraphs of a copy made by new_document() that contain template markup.
+
+        Args:
+            doc: Document returned by new_document()
+            regions: Regions to include (see ALL_REGIONS)
+            conditionals_only: Only paragraphs with {{if_...}} blocks
+        """
+        elements = {}
+        parents = {}
+        result = []
+        for location in self.locations:
+            if location.region not in regions or (conditionals_only and not location.has_conditionals):
+                continue
+            if location.container not in elements:
+                root = self._container_element(doc, location.container)
+                elements[location.container] = list(root.iter(qn('w:p')))
+                parents[location.container] = self._container_parent(doc, location.container)
+            result.append(Paragraph(elements[location.container][location.index], parents[location.container]))
+        return result
+
+
+class TemplateCache:
+    """
+    Cache of CompiledTemplate objects keyed by template path.
+
+    Each lookup stats the file, so an edited template is picked up on the next export.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, CompiledTemplate] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, template_path: Union[str, Path]) -> CompiledTemplate:
+        """
+        Compiled template for a path, loading it on first use or after it changes.
+
+        Raises:
+            OSError: If the template file cannot be read
+        """
+        path = Path(template_path)
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        if entry is not None:
+            logger.info("Template changed on disk, reloading: %s", path)
+        entry = CompiledTemplate(path, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    def load_document(self, template_path: Union[str, Path]):
+        """Fresh, modifiable Document for a template"""
+        return self.get(template_path).new_document()
+
+    def invalidate(self, template_path: Optional[Union[str, Path]] = None):
+        """Drop one template (or all of them) from the cache"""
+        with self._lock:
+            if template_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(template_path), None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and cached template count"""
+        return {
+            'templates': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+_template_cache: Optional[TemplateCache] = None
+_template_cache_lock = threading.Lock()
+
+
+def get_template_cache() -> TemplateCache:
+    """Process-wide template cache"""
+    global _template_cache
+    with _template_cache_lock:
+        if _template_cache is None:
+            _template_cache = TemplateCache()
+        return _template_cache
@@ -0,0 +1,186 @@
+"""
+Template Substitution Engine for Word Quote Generation
+
+Resolves {{variable}} placeholders and {{if_...}} conditional blocks in a
+single pass per paragraph. Each run keeps its own formatting.
+"""
+
+import re
+from bisect import bisect_right
+from typing import Callable, Dict, Optional, List, NamedTuple, Tuple, Iterator, Union
+
+# One pattern for every kind of template markup. Conditional forms are tried
+# before the plain variable form, so {{if_option:XSP:...}} is never treated
+# as a variable called "if_option:XSP:...".
+TOKEN_PATTERN = re.compile(
+    r'\{\{(?:'
+    r'if_option:(?P<option>[^:}]+):(?P<option_content>[^}]+)'
+    r'|if_multiple_items:(?P<multi_content>[^}]+)'
+    r'|if_single_item:(?P<single_content>[^}]+)'
+    r'|if_item_(?P<item>\d+):(?P<item_content>[^}]+)'
+    r'|(?P<var>[^}]+)'
+    r')\}\}'
+)
+
+
+class TemplateConditions(NamedTuple):
+    """Facts the {{if_...}} blocks are evaluated against"""
+    option_codes: Tuple[str, ...] = ()
+    has_multiple_items: bool = False
+    item_count: int = 1
+
+
+def missing_placeholder(name: str) -> str:
+    """Text left in the document for a variable with no value"""
+    return f"{{{{MISSING: {name}}}}}"
+
+
+def _iter_tokens(text: str, variables: Dict[str, str],
+                 conditions: Optional[TemplateConditions]) -> Iterator[Tuple[int, int, Optional[str]]]:
+    """
+    Split text into output pieces.
+
+    Yields:
+        (start, end, None) to copy text[start:end] unchanged, or
+        (position, position, value) to insert value at that source position
+    """
+    last = 0
+    for match in TOKEN_PATTERN.finditer(text):
+        if match.start() > last:
+            yield last, match.start(), None
+        last = match.end()
+
+        if conditions is None or match.group('var') is not None:
+            # Plain variable; with no conditions, conditional blocks are looked up as names too
+            name = match.group('var') if match.group('var') is not None else match.group(0)[2:-2]
+            value = variables[name] if name in variables else missing_placeholder(name)
+            # Credit the value to the first character of the name so it takes that run's formatting
+            position = match.start() + 2
+            yield position, position, str(value)
+            continue
+
+        if match.group('option') is not None:
+            keep, group = match.group('option') in conditions.option_codes, 'option_content'
+        elif match.group('multi_content') is not None:
+            keep, group = conditions.has_multiple_items, 'multi_content'
+        elif match.group('single_content') is not None:
+            keep, group = not conditions.has_multiple_items, 'single_content'
+        else:
+            keep, group = int(match.group('item')) <= conditions.item_count, 'item_content'
+
+        if keep:
+            yield match.start(group), match.end(group), None
+
+    if last < len(text):
+        yield last, len(text), None
+
+
+def render_text(text: str, variables: Dict[str, str], conditions: Optional[TemplateConditions] = None) -> str:
+    """
+    Resolve all template markup in a string.
+
+    Args:
+        text: Template text
+        variables: Variable name -> value
+        conditions: Facts for {{if_...}} blocks; None treats them as variable names
+    """
+    if '{{' not in text:
+        return text
+    return ''.join(text[start:end] if value is None else value
+                   for start, end, value in _iter_tokens(text, variables, conditions))
+
+
+class CompiledText:
+    """
+    Template text split once into literal pieces and variable names, so it
+    can be filled many times without re-scanning. Conditional blocks are
+    treated as variable names, as render_text() does without conditions.
+    """
+
+    __slots__ = ('text', 'pieces', 'names')
+
+    def __init__(self, text: str):
+        self.text = text
+        pieces: List[Union[str, Tuple[str]]] = []
+        last = 0
+        for match in TOKEN_PATTERN.finditer(text):
+            if match.start() > last:
+                pieces.append(text[last:match.start()])
+            pieces.append((match.group(0)[2:-2],))
+            last = match.end()
+        if last < len(text):
+            pieces.append(text[last:])
+        self.pieces = tuple(pieces)
+        self.names = frozenset(piece[0] for piece in pieces if isinstance(piece, tuple))
+
+    @property
+    def is_static(self) -> bool:
+        """True if the text has no markup"""
+        return not self.names
+
+    def literal_text(self) -> str:
+        """The text with all markup removed"""
+        return ''.join(piece for piece in self.pieces if isinstance(piece, str))
+
+    def render(self, variables: Dict[str, str], missing: Callable[[str], str] = missing_placeholder) -> str:
+        """Fill in the variables; missing(name) supplies the text for names not in variables"""
+        return ''.join(piece if isinstance(piece, str)
+                       else (str(variables[piece[0]]) if piece[0] in variables else missing(piece[0]))
+                       for piece in self.pieces)
+
+
+def render_paragraph(paragraph, variables: Dict[str, str], conditions: Optional[TemplateConditions] = None) -> bool:
+    """
+    Resolve all template markup in a paragraph, writing each changed run once.
+
+    Text that stays keeps its run; a variable's value goes into the run that
+    holds the start of its name. Paragraphs whose text does not come only from
+    plain runs (hyperlinks, fields) are rewritten as a single run.
+
+    Returns:
+        True if the paragraph changed
+    """
+    runs = paragraph.runs
+    run_texts = [run.text for run in runs]
+    text = ''.join(run_texts)
+    full_text = paragraph.text
+
+    if '{{' not in full_text:
+        return False
+
+    if text != full_text:
+        new_text = render_text(full_text, variables, conditions)
+        if new_text == full_text:
+            return False
+        paragraph.clear()
+        paragraph.add_run(new_text)
+        return True
+
+    run_starts = []
+    offset = 0
+    for run_text in run_texts:
+        run_starts.append(offset)
+        offset += len(run_text)
+
+    output: List[List[str]] = [[] for _ in runs]
+    for start, end, value in _iter_tokens(text, variables, conditions):
+        index = max(bisect_right(run_starts, start) - 1, 0)
+        if value is not None:
+            output[index].append(value)
+            continue
+        # Copy the literal span, splitting it at run boundaries
+        while start < end:
+            while index + 1 < len(runs) and run_starts[index + 1] <= start:
+                index += 1
+            run_end = run_starts[index + 1] if index + 1 < len(runs) else len(text)
+            piece_end = min(end, run_end)
+            output[index].append(text[start:piece_end])
+            start = piece_end
+
+    changed = False
+    for run, old_text, pieces in zip(runs, run_texts, output):
+        new_text = ''.join(pieces)
+        if new_text != old_text:
+            run.text = new_text
+            changed = True
+    return changed
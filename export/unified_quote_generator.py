@@ -7,7 +7,6 @@ approach with dynamic content generation.
 """
 
 import os
-import re
 from pathlib import Path
 from typing import Dict, Any, Optional, List, TYPE_CHECKING
 from datetime import datetime
@@ -25,6 +24,9 @@ try:
 except ImportError:
     DOCX_AVAILABLE = False
 
+from export.template_cache import get_template_cache
+from export.template_engine import render_paragraph
+
 logger = logging.getLogger(__name__)
 
 class UnifiedQuoteGenerator:
@@ -128,26 +130,7 @@ class UnifiedQuoteGenerator:
             paragraph: docx paragraph object
             variables: Dictionary of variable name -> value mappings
         """
-        full_text = paragraph.text
-        
-        # Find all template variables in the format {{variable_name}}
-        variable_pattern = r'\{\{([^}]+)\}\}'
-        matches = re.findall(variable_pattern, full_text)
-        
-        if not matches:
-            return
-        
-        # Replace variables in the full text
-        new_text = full_text
-        for var_name in matches:
-            placeholder = f"{{{{{var_name}}}}}"
-            value = variables.get(var_name, f"{{{{MISSING: {var_name}}}}}")
-            new_text = new_text.replace(placeholder, str(value))
-        
-        # Only update if text changed
-        if new_text != full_text:
-            paragraph.clear()
-            paragraph.add_run(new_text)
+        render_paragraph(paragraph, variables)
     
     def _add_multi_item_section(self, doc: Any, quote_items: List[Dict[str, Any]], 
                                start_index: int = 1) -> None:
@@ -461,8 +444,8 @@ class UnifiedQuoteGenerator:
                 logger.error(f"No template found for primary model: {primary_model}")
                 return False
             
-            # Load the template document
-            doc = Document(str(template_path))
+            # Load the template document (a copy of the cached parse)
+            doc = get_template_cache().load_document(template_path)
             
             # Get employee information
             employee_name = ""
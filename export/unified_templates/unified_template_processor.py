@@ -7,20 +7,156 @@ instead of creating documents from scratch.
 
 import os
 import json
-import re
+import threading
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import logging
 
+# Templates load through get_template_cache(); docx is only imported to check it is installed
 try:
-    from docx import Document
-    DOCX_AVAILABLE = True
+    import docx
 except ImportError:
-    DOCX_AVAILABLE = False
+    docx = None
+DOCX_AVAILABLE = docx is not None
+
+from export.export_cache import cached_export
+from export.template_cache import get_template_cache
+from export.template_engine import CompiledText, TemplateConditions, render_paragraph
+from utils.logger import trace, lazy
 
 logger = logging.getLogger(__name__)
 
+# Lines of a model template that become multi-item bullet points: those that
+# start with a bullet marker, and "Label: value" lines naming a spec
+BULLET_MARKERS = ('•', '-', '*')
+SPEC_KEYWORDS = ('voltage', 'output', 'connection', 'insulator', 'probe', 'housing', 'warranty')
+
+
+def _is_spec_line(*texts: str) -> bool:
+    """True if the texts contain a ':' and a spec keyword"""
+    return (any(':' in text for text in texts)
+            and any(keyword in text.lower() for text in texts for keyword in SPEC_KEYWORDS))
+
+
+class BulletTemplate:
+    """
+    The candidate bullet lines of a model template (body paragraphs, then
+    table cells), compiled once per template file.
+
+    Lines without markup that can never be bullets are dropped at compile
+    time, and most lines are classified then too; only lines whose
+    classification depends on a variable value are checked after filling.
+    """
+
+    BULLET = 'bullet'
+    SPEC = 'spec'
+    CHECK = 'check'
+
+    def __init__(self, template):
+        document = template.document
+        texts = [paragraph.text for paragraph in document.paragraphs]
+        texts.extend(paragraph.text
+                     for table in document.tables
+                     for row in table.rows
+                     for cell in row.cells
+                     for paragraph in cell.paragraphs)
+
+        self.lines: List[tuple] = []
+        for text in texts:
+            text = text.strip()
+            if not text:
+                continue
+            line = CompiledText(text)
+            literals = [piece for piece in line.pieces if isinstance(piece, str)]
+            if text.startswith(BULLET_MARKERS):
+                kind = self.BULLET
+            elif line.is_static:
+                if not _is_spec_line(text):
+                    continue
+                kind = self.SPEC
+            elif not text.startswith('{{') and _is_spec_line(*literals):
+                kind = self.SPEC
+            else:
+                kind = self.CHECK
+            self.lines.append((kind, line))
+
+    def render(self, variables: Dict[str, str]) -> List[str]:
+        """Bullet point texts for one item"""
+        bullet_points = []
+        for kind, line in self.lines:
+            text = line.render(variables).strip()
+            if not text:
+                continue
+            if kind == self.CHECK:
+                if text.startswith(BULLET_MARKERS):
+                    kind = self.BULLET
+                elif _is_spec_line(text):
+                    kind = self.SPEC
+                else:
+                    continue
+            if kind == self.BULLET:
+                text = text[1:].strip()
+                if text:
+                    bullet_points.append(text)
+            else:
+                bullet_points.append(text)
+        return bullet_points
+
+
+def _blank(name: str) -> str:
+    """Spec values drop placeholders that have no value"""
+    return ''
+
+
+class ModelConfig:
+    """
+    A model's configs/*_config.json with its technical specification values
+    compiled once, so each item is a single pass over the spec text.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.specs = tuple((spec.get('label', ''), CompiledText(spec.get('value', '')))
+                           for spec in data.get('technical_specifications', []))
+
+    def spec_lines(self, variables: Dict[str, Any]) -> List[str]:
+        """'Label: value' for each spec whose value is not empty once filled in"""
+        filled = {name: value for name, value in variables.items() if value}
+        lines = []
+        for label, value_text in self.specs:
+            value = value_text.render(filled, missing=_blank).strip()
+            if value:
+                lines.append(f"{label}: {value}")
+        return lines
+
+
+# Model configs shared by every processor, keyed by path; (mtime_ns, size, config)
+_model_configs: Dict[str, Tuple[int, int, ModelConfig]] = {}
+_model_configs_lock = threading.Lock()
+
+
+def load_model_config_file(config_path: Path) -> ModelConfig:
+    """
+    Compiled model config, read from disk on first use or after the file changes.
+
+    Raises:
+        OSError: If the config file cannot be read
+        ValueError: If it is not valid JSON
+    """
+    key = os.path.abspath(config_path)
+    stat = os.stat(key)
+    with _model_configs_lock:
+        entry = _model_configs.get(key)
+    if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+        return entry[2]
+    with open(key, 'r') as f:
+        config = ModelConfig(json.load(f))
+    with _model_configs_lock:
+        _model_configs[key] = (stat.st_mtime_ns, stat.st_size, config)
+    return config
+
+
 class UnifiedTemplateProcessor:
     """
     CORRECTED processor that loads master_template.docx and replaces variables.
@@ -46,13 +182,16 @@ class UnifiedTemplateProcessor:
     
     def _load_model_config(self, model: str) -> Dict[str, Any]:
         """Load configuration for a specific model."""
+        return self._get_model_config(model).data
+    
+    def _get_model_config(self, model: str) -> ModelConfig:
+        """Compiled configuration for a model; the file is only read again when it changes."""
         config_path = self.configs_dir / f'{model}_config.json'
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            return load_model_config_file(config_path)
         except Exception as e:
             logger.warning(f"Could not load config for model {model}: {e}")
-            return self._get_default_config(model)
+            return ModelConfig(self._get_default_config(model))
     
     def _get_default_config(self, model: str) -> Dict[str, Any]:
         """Get default configuration when model config is not found."""
@@ -91,6 +230,15 @@ class UnifiedTemplateProcessor:
         
         return None
     
+    def template_files(self, quote_items: List[Dict[str, Any]]) -> List[Path]:
+        """Template and config files a quote for these items can read, whether or not they exist."""
+        paths = [self.master_template_path]
+        for item in quote_items:
+            model = self._extract_model_from_part_number(item.get('part_number', ''))
+            paths.append(self.model_templates_dir / f'{model}_template.docx')
+            paths.append(self.configs_dir / f'{model}_config.json')
+        return paths
+    
     def _build_items_section(self, quote_items: List[Dict[str, Any]], base_variables: Dict[str, str]) -> str:
         """Build items section content matching original template format."""
         if not quote_items:
@@ -108,7 +256,7 @@ class UnifiedTemplateProcessor:
         
         # Get model and config
         model = self._extract_model_from_part_number(part_number)
-        config = self._load_model_config(model)
+        config = self._get_model_config(model)
         
         # Merge item data with base variables
         item_variables = base_variables.copy()
@@ -138,23 +286,8 @@ class UnifiedTemplateProcessor:
         section = f"{quantity} QTY {part_number}             {price_str}    EACH"
         
         # Add technical specifications as bullet points
-        specs = config.get('technical_specifications', [])
-        for spec in specs:
-            label = spec.get('label', '')
-            value_template = spec.get('value', '')
-            
-            # Replace variables in the value
-            value = value_template
-            for var_name, var_value in item_variables.items():
-                placeholder = f"{{{{{var_name}}}}}"
-                if var_value:
-                    value = value.replace(placeholder, str(var_value))
-            
-            # Clean up any remaining placeholders
-            value = re.sub(r'\{\{[^}]+\}\}', '', value).strip()
-            
-            if value:
-                section += f"\n• {label}: {value}"
+        for spec_line in config.spec_lines(item_variables):
+            section += f"\n• {spec_line}"
         
         return section
     
@@ -286,15 +419,18 @@ class UnifiedTemplateProcessor:
                 model = self._extract_model_from_part_number(quote_items[0].get('part_number', ''))
                 template_path = self._get_template_path(model)
                 if template_path and template_path.exists():
-                    logger.info(f"Loading model-specific template: {template_path}")
-                    doc = Document(str(template_path))
+                    logger.debug("Loading model-specific template: %s", template_path)
                 else:
                     logger.warning(f"Model-specific template not found for {model}, using master template")
-                    doc = Document(str(self.master_template_path))
+                    template_path = self.master_template_path
             else:
                 # Multi-item: Use master template
-                logger.info(f"Loading master template: {self.master_template_path}")
-                doc = Document(str(self.master_template_path))
+                logger.debug("Loading master template: %s", self.master_template_path)
+                template_path = self.master_template_path
+            
+            # Copy the cached, pre-scanned template instead of reading it from disk
+            template = get_template_cache().get(template_path)
+            doc = template.new_document()
             
             # Prepare all variable replacements
             str_variables = {k: str(v) if v is not None else "" for k, v in variables.items()}
@@ -365,28 +501,13 @@ class UnifiedTemplateProcessor:
             str_variables['quote_summary_table'] = self._build_quote_summary_table(quote_items)
             str_variables['optional_notes_section'] = self._build_optional_notes_section(quote_items)
             
-            # Process conditional content first
-            self._process_conditional_content(doc, str_variables)
+            # Resolve conditional content and variables in one pass over the
+            # paragraphs, tables, headers and footers that hold them
+            conditions = TemplateConditions(has_multiple_items=is_multi_item, item_count=len(quote_items))
+            for paragraph in template.paragraphs(doc):
+                self._replace_variables_in_paragraph(paragraph, str_variables, conditions)
             
-            # Replace all variables in paragraphs
-            for paragraph in doc.paragraphs:
-                self._replace_variables_in_paragraph(paragraph, str_variables)
-            
-            # Replace variables in tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        for paragraph in cell.paragraphs:
-                            self._replace_variables_in_paragraph(paragraph, str_variables)
-            
-            # Process headers and footers
-            for section in doc.sections:
-                for paragraph in section.header.paragraphs:
-                    self._replace_variables_in_paragraph(paragraph, str_variables)
-                for paragraph in section.footer.paragraphs:
-                    self._replace_variables_in_paragraph(paragraph, str_variables)
-            
-            logger.info("Template processing completed successfully")
+            logger.debug("Template processing completed successfully")
             return doc
             
         except Exception as e:
@@ -395,65 +516,10 @@ class UnifiedTemplateProcessor:
             logger.error(f"Traceback: {traceback.format_exc()}")
             return None
     
-    def _replace_variables_in_paragraph(self, paragraph, variables: Dict[str, str]) -> None:
-        """Replace variables in a paragraph, handling multi-line content."""
-        full_text = paragraph.text
-        
-        # Find variables that need replacement
-        variable_pattern = r'\{\{([^}]+)\}\}'
-        matches = re.findall(variable_pattern, full_text)
-        
-        if not matches:
-            return
-        
-        new_text = full_text
-        for var_name in matches:
-            placeholder = f"{{{{{var_name}}}}}"
-            value = variables.get(var_name, f"{{{{MISSING: {var_name}}}}}")
-            new_text = new_text.replace(placeholder, str(value))
-        
-        # Replace paragraph text
-        paragraph.clear()
-        
-        # Handle multi-line content
-        lines = new_text.split('\n')
-        for i, line in enumerate(lines):
-            if i > 0:
-                paragraph.add_run('\n')
-            paragraph.add_run(line)
-    
-    def _process_conditional_content(self, doc, variables: Dict[str, str]) -> None:
-        """Process conditional content markers."""
-        is_multi_item = variables.get('has_multiple_items', 'false').lower() == 'true'
-        
-        for paragraph in doc.paragraphs:
-            self._process_conditional_paragraph(paragraph, is_multi_item)
-        
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    for paragraph in cell.paragraphs:
-                        self._process_conditional_paragraph(paragraph, is_multi_item)
-    
-    def _process_conditional_paragraph(self, paragraph, is_multi_item: bool) -> None:
-        """Process conditional content in a paragraph."""
-        full_text = paragraph.text
-        
-        # Process single item conditionals
-        single_pattern = r'\{\{if_single_item:([^}]+)\}\}'
-        multi_pattern = r'\{\{if_multiple_items:([^}]+)\}\}'
-        
-        # Handle single item conditionals
-        if not is_multi_item:
-            full_text = re.sub(single_pattern, r'\1', full_text)
-            full_text = re.sub(multi_pattern, '', full_text)
-        else:
-            full_text = re.sub(single_pattern, '', full_text)
-            full_text = re.sub(multi_pattern, r'\1', full_text)
-        
-        if full_text != paragraph.text:
-            paragraph.clear()
-            paragraph.add_run(full_text)
+    def _replace_variables_in_paragraph(self, paragraph, variables: Dict[str, str],
+                                        conditions: Optional[TemplateConditions] = None) -> None:
+        """Replace variables (and conditional blocks) in a paragraph, keeping run formatting and line breaks."""
+        render_paragraph(paragraph, variables, conditions)
     
     def save_document(self, doc: Any, output_path: str) -> bool:
         """Save the processed document."""
@@ -563,6 +629,7 @@ class UnifiedTemplateProcessor:
         """
         Extract bullet points from a model-specific template by processing it with the item's variables.
         This simulates what the single-item template would show for this specific item.
+        The template's candidate lines are compiled once (see BulletTemplate).
         """
         try:
             # Get the model-specific template path
@@ -587,54 +654,10 @@ class UnifiedTemplateProcessor:
             if 'pc_rate' not in processed_variables:
                 processed_variables['pc_rate'] = ""
             
-            # Load the template
-            doc = Document(str(template_path))
-            
-            # Process the template with the item's variables
-            processed_lines = []
-            
-            # Debug: Print what variables we're using
-            logger.debug(f"Processing template for {model} with variables: {list(processed_variables.keys())}")
-            
-            # Process paragraphs
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    original_text = paragraph.text.strip()
-                    processed_text = self._replace_variables_in_text(original_text, processed_variables)
-                    if processed_text.strip():
-                        processed_lines.append(processed_text.strip())
-                        # Debug: Show what was processed
-                        if 'probe' in original_text.lower():
-                            logger.debug(f"Probe line - Original: '{original_text}' -> Processed: '{processed_text}'")
-            
-            # Process tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        for paragraph in cell.paragraphs:
-                            if paragraph.text.strip():
-                                original_text = paragraph.text.strip()
-                                processed_text = self._replace_variables_in_text(original_text, processed_variables)
-                                if processed_text.strip():
-                                    processed_lines.append(processed_text.strip())
-                                    # Debug: Show what was processed
-                                    if 'probe' in original_text.lower():
-                                        logger.debug(f"Probe line (table) - Original: '{original_text}' -> Processed: '{processed_text}'")
-            
-            # Extract bullet points (lines starting with • or -)
-            bullet_points = []
-            for line in processed_lines:
-                line = line.strip()
-                if line.startswith('•') or line.startswith('-') or line.startswith('*'):
-                    # Remove the bullet and clean up
-                    bullet_text = line[1:].strip()
-                    if bullet_text:
-                        bullet_points.append(bullet_text)
-                elif ':' in line and any(keyword in line.lower() for keyword in ['voltage', 'output', 'connection', 'insulator', 'probe', 'housing', 'warranty']):
-                    # This looks like a technical specification line
-                    bullet_points.append(line)
-            
-            return bullet_points
+            # Bullet lines are compiled once per template file; each item only fills them in
+            bullet_template = get_template_cache().get(template_path).derived('bullet_lines', BulletTemplate)
+            trace(logger, "Filling bullet lines for %s with variables: %s", model, lazy(lambda: sorted(processed_variables)))
+            return bullet_template.render(processed_variables)
             
         except Exception as e:
             logger.error(f"Error extracting bullet points from template for {model}: {e}")
@@ -642,41 +665,7 @@ class UnifiedTemplateProcessor:
     
     def _get_bullet_points_from_config(self, model: str, item_variables: Dict[str, str]) -> List[str]:
         """Fallback method to get bullet points from config when template extraction fails."""
-        config = self._load_model_config(model)
-        specs = config.get('technical_specifications', [])
-        
-        bullet_points = []
-        for spec in specs:
-            label = spec.get('label', '')
-            value_template = spec.get('value', '')
-            
-            value = value_template
-            for var_name, var_value in item_variables.items():
-                placeholder = f"{{{{{var_name}}}}}"
-                if var_value:
-                    value = value.replace(placeholder, str(var_value))
-            
-            value = re.sub(r'\{\{[^}]+\}\}', '', value).strip()
-            
-            if value:
-                bullet_points.append(f"{label}: {value}")
-        
-        return bullet_points
-    
-    def _replace_variables_in_text(self, text: str, variables: Dict[str, str]) -> str:
-        """Replace variables in text without modifying paragraph objects."""
-        new_text = text
-        
-        # Find variables that need replacement
-        variable_pattern = r'\{\{([^}]+)\}\}'
-        matches = re.findall(variable_pattern, text)
-        
-        for var_name in matches:
-            placeholder = f"{{{{{var_name}}}}}"
-            value = variables.get(var_name, f"{{{{MISSING: {var_name}}}}}")
-            new_text = new_text.replace(placeholder, str(value))
-        
-        return new_text
+        return self._get_model_config(model).spec_lines(item_variables)
 
 
 # Convenience function matching the original API
@@ -721,14 +710,20 @@ def generate_unified_quote(
         
         variables.update(kwargs)
         
-        # Process the template
-        doc = processor.process_unified_template(quote_items, variables)
-        if not doc:
-            logger.error("Failed to process unified template")
-            return False
+        def render() -> bool:
+            # Process the template
+            doc = processor.process_unified_template(quote_items, variables)
+            if not doc:
+                logger.error("Failed to process unified template")
+                return False
+            
+            # Save the document
+            return processor.save_document(doc, output_path)
         
-        # Save the document
-        return processor.save_document(doc, output_path)
+        # Identical items, variables and templates give an identical document
+        payload = {'quote_items': quote_items, 'variables': variables}
+        return cached_export('generate_unified_quote', payload, processor.template_files(quote_items),
+                             output_path, render)
         
     except Exception as e:
         logger.error(f"Error generating unified quote: {e}")
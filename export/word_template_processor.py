@@ -6,7 +6,10 @@ and maintains the original professional formatting and layout.
 """
 
 import os
+import pickle
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Dict, Any, Optional, TYPE_CHECKING, List
 from datetime import datetime
@@ -18,10 +21,24 @@ if TYPE_CHECKING:
 try:
     from docx import Document
     from docx.shared import Inches
+    from docx.blkcntnr import BlockItemContainer
+    from docx.oxml import OxmlElement, parse_xml
+    from lxml import etree
     DOCX_AVAILABLE = True
 except ImportError:
     DOCX_AVAILABLE = False
 
+try:
+    from config.settings import COMPOSED_SECTION_WORKERS, COMPOSED_PARALLEL_MIN_ITEMS
+except ImportError:
+    COMPOSED_SECTION_WORKERS = 0
+    COMPOSED_PARALLEL_MIN_ITEMS = 16
+
+from export.export_cache import cached_export
+from export.template_cache import get_template_cache
+from export.template_engine import TemplateConditions, render_paragraph
+from utils.logger import trace, lazy
+
 logger = logging.getLogger(__name__)
 
 class WordTemplateProcessor:
@@ -63,53 +80,30 @@ class WordTemplateProcessor:
         logger.warning(f"Template not found: {template_path}")
         return None
     
-    def replace_variables_in_paragraph(self, paragraph, variables: Dict[str, str]) -> None:
+    def replace_variables_in_paragraph(self, paragraph, variables: Dict[str, str],
+                                       conditions: Optional[TemplateConditions] = None) -> None:
         """
-        Replace template variables in a paragraph while preserving formatting.
+        Replace template variables (and, given conditions, conditional blocks)
+        in a paragraph while preserving run formatting.
         
         Args:
             paragraph: docx paragraph object
             variables: Dictionary of variable name -> value mappings
+            conditions: Option codes and item counts for {{if_...}} blocks
         """
-        # Get the full text of the paragraph
-        full_text = paragraph.text
-        
-        # Find all template variables in the format {{variable_name}}
-        variable_pattern = r'\{\{([^}]+)\}\}'
-        matches = re.findall(variable_pattern, full_text)
-        
-        if not matches:
-            return
-        
-        # Replace variables in the full text
-        new_text = full_text
-        for var_name in matches:
-            placeholder = f"{{{{{var_name}}}}}"
-            value = variables.get(var_name, f"{{{{MISSING: {var_name}}}}}")
-            new_text = new_text.replace(placeholder, str(value))
-        
-        # Clear the paragraph and add the new text
-        # This preserves the paragraph's formatting but not individual run formatting
-        paragraph.clear()
-        paragraph.add_run(new_text)
+        render_paragraph(paragraph, variables, conditions)
 
-    def _process_conditional_content_document(self, doc, variables: Dict[str, str], model: Optional[str] = None) -> None:
+    def _get_template_conditions(self, variables: Dict[str, str]) -> TemplateConditions:
         """
-        Process conditional content at the document level to avoid breaking formatting.
-        Handles {{if_option:option_code:content}} and {{if_multiple_items:content}} patterns.
+        Work out the facts {{if_option:option_code:content}}, {{if_multiple_items:content}}
+        and {{if_item_N:content}} blocks are evaluated against.
         Args:
-            doc: Document object
             variables: Dictionary of variables including option information
-            model: The template/model name (e.g., 'FS10000'), or None
         """
-        import re
         try:
             # Process option codes
             option_codes = variables.get('option_codes', [])
-            print(f"DEBUG: Raw option_codes from variables: {option_codes}")
-            logger.info(f"Raw option_codes from variables: {option_codes}")
-            print(f"DEBUG: Type of option_codes: {type(option_codes)}")
-            logger.info(f"Type of option_codes: {type(option_codes)}")
+            trace(logger, "Raw option_codes from variables: %r", option_codes)
             
             if isinstance(option_codes, str):
                 # Handle string representation of a list (like "['XSP']")
@@ -118,170 +112,29 @@ class WordTemplateProcessor:
                     try:
                         import ast
                         option_codes = ast.literal_eval(option_codes)
-                        print(f"DEBUG: Parsed string list to: {option_codes}")
-                        logger.info(f"Parsed string list to: {option_codes}")
                     except:
                         # Fallback: split by comma
                         option_codes = [opt.strip() for opt in option_codes.split(',') if opt.strip()]
-                        print(f"DEBUG: Fallback split by comma: {option_codes}")
-                        logger.info(f"Fallback split by comma: {option_codes}")
                 else:
                     # Regular comma-separated string
                     option_codes = [opt.strip() for opt in option_codes.split(',') if opt.strip()]
-                    print(f"DEBUG: Converted string option_codes to list: {option_codes}")
-                    logger.info(f"Converted string option_codes to list: {option_codes}")
-            elif isinstance(option_codes, list):
-                print(f"DEBUG: Option_codes is already a list: {option_codes}")
-                logger.info(f"Option_codes is already a list: {option_codes}")
-            else:
-                print(f"DEBUG: Unexpected option_codes type: {type(option_codes)}, value: {option_codes}")
-                logger.warning(f"Unexpected option_codes type: {type(option_codes)}, value: {option_codes}")
+            elif not isinstance(option_codes, list):
+                logger.warning("Unexpected option_codes type: %s, value: %r", type(option_codes), option_codes)
                 option_codes = []
             
-            print(f"DEBUG: Final option_codes for processing: {option_codes}")
-            logger.info(f"Final option_codes for processing: {option_codes}")
-            
             # Get multi-item information
             has_multiple_items = variables.get('has_multiple_items', 'false').lower() == 'true'
             item_count = int(variables.get('item_count', '1'))
             
-            print(f"DEBUG: Multi-item info - has_multiple_items: {has_multiple_items}, item_count: {item_count}")
-            logger.info(f"Multi-item info - has_multiple_items: {has_multiple_items}, item_count: {item_count}")
-            
-            # Process paragraphs for conditional content
-            for paragraph in doc.paragraphs:
-                try:
-                    self._process_conditional_content_paragraph(paragraph, option_codes, model, has_multiple_items, item_count)
-                except Exception as e:
-                    logger.warning(f"Error processing conditional content in paragraph: {e}")
-                    # Continue processing other paragraphs
+            logger.debug("Conditional content: option_codes=%s, has_multiple_items=%s, item_count=%s",
+                         option_codes, has_multiple_items, item_count)
             
-            # Process tables for conditional content
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        for paragraph in cell.paragraphs:
-                            try:
-                                self._process_conditional_content_paragraph(paragraph, option_codes, model, has_multiple_items, item_count)
-                            except Exception as e:
-                                logger.warning(f"Error processing conditional content in table paragraph: {e}")
-                                # Continue processing other paragraphs
-            
-            # Process headers and footers for conditional content
-            for section in doc.sections:
-                header = section.header
-                for paragraph in header.paragraphs:
-                    try:
-                        self._process_conditional_content_paragraph(paragraph, option_codes, model, has_multiple_items, item_count)
-                    except Exception as e:
-                        logger.warning(f"Error processing conditional content in header: {e}")
-                        # Continue processing other paragraphs
-                
-                footer = section.footer
-                for paragraph in footer.paragraphs:
-                    try:
-                        self._process_conditional_content_paragraph(paragraph, option_codes, model, has_multiple_items, item_count)
-                    except Exception as e:
-                        logger.warning(f"Error processing conditional content in footer: {e}")
-                        # Continue processing other paragraphs
+            return TemplateConditions(tuple(option_codes), has_multiple_items, item_count)
                         
         except Exception as e:
             logger.error(f"Error in conditional content processing: {e}")
             # Don't let this break the entire template processing
-            # Just log the error and continue
-
-    def _process_conditional_content_paragraph(self, paragraph, option_codes: List[str], model: Optional[str] = None, 
-                                             has_multiple_items: bool = False, item_count: int = 1) -> None:
-        """
-        Process conditional content in a single paragraph.
-        Args:
-            paragraph: Paragraph object
-            option_codes: List of option codes present in the part number
-            model: The template/model name (e.g., 'FS10000'), or None
-            has_multiple_items: Whether this is a multi-item quote
-            item_count: Number of items in the quote
-        """
-        import re
-        try:
-            full_text = paragraph.text
-            
-            # Process option-based conditionals: {{if_option:option_code:content}}
-            option_pattern = r'\{\{if_option:([^:]+):([^}]+)\}\}'
-            option_matches = list(re.finditer(option_pattern, full_text))
-            
-            # Process multi-item conditionals: {{if_multiple_items:content}}
-            multi_item_pattern = r'\{\{if_multiple_items:([^}]+)\}\}'
-            multi_item_matches = list(re.finditer(multi_item_pattern, full_text))
-            
-            # Process item-specific conditionals: {{if_item_2:content}}, {{if_item_3:content}}, etc.
-            item_pattern = r'\{\{if_item_(\d+):([^}]+)\}\}'
-            item_matches = list(re.finditer(item_pattern, full_text))
-            
-            # Combine all matches and sort by position (reverse order for processing)
-            all_matches = []
-            for match in option_matches:
-                all_matches.append(('option', match))
-            for match in multi_item_matches:
-                all_matches.append(('multi_item', match))
-            for match in item_matches:
-                all_matches.append(('item', match))
-            
-            # Sort by position in reverse order to process from end to beginning
-            all_matches.sort(key=lambda x: x[1].start(), reverse=True)
-            
-            if not all_matches:
-                return
-            
-            # Process all conditional content blocks
-            for match_type, match in all_matches:
-                start_pos = match.start()
-                end_pos = match.end()
-                
-                if match_type == 'option':
-                    # Handle option-based conditionals
-                    option_code = match.group(1)
-                    content = match.group(2)
-                    
-                    if option_code in option_codes:
-                        # Option is present, keep the content
-                        replacement = content
-                    else:
-                        # Option is not present, remove the conditional block
-                        replacement = ""
-                
-                elif match_type == 'multi_item':
-                    # Handle multi-item conditionals
-                    content = match.group(1)
-                    
-                    if has_multiple_items:
-                        # Multiple items exist, keep the content
-                        replacement = content
-                    else:
-                        # Single item, remove the conditional block
-                        replacement = ""
-                
-                elif match_type == 'item':
-                    # Handle item-specific conditionals
-                    item_number = int(match.group(1))
-                    content = match.group(2)
-                    
-                    if item_number <= item_count:
-                        # Item exists, keep the content
-                        replacement = content
-                    else:
-                        # Item doesn't exist, remove the conditional block
-                        replacement = ""
-                
-                # Replace the conditional block with the appropriate content
-                paragraph.clear()
-                new_text = full_text[:start_pos] + replacement + full_text[end_pos:]
-                paragraph.add_run(new_text)
-                full_text = new_text
-                
-        except Exception as e:
-            logger.error(f"Error processing conditional content in paragraph: {e}")
-            # Don't let this break the paragraph processing
-            # Just log the error and continue
+            return TemplateConditions()
     
     def replace_variables_in_table(self, table, variables: Dict[str, str]) -> None:
         """
@@ -313,52 +166,25 @@ class WordTemplateProcessor:
             return None
         
         try:
-            logger.info(f"Processing template: {template_path}")
-            logger.info(f"Template variables: {list(variables.keys())}")
+            logger.debug("Processing template: %s", template_path)
+            trace(logger, "Template variables: %s", lazy(lambda: sorted(variables)))
             
-            # Load the template document
-            doc = Document(str(template_path))
-            logger.info(f"Template loaded successfully, {len(doc.paragraphs)} paragraphs")
+            # Copy the cached, pre-scanned template instead of reading it from disk
+            template = get_template_cache().get(template_path)
+            doc = template.new_document()
             
             # Convert all values to strings
             str_variables = {k: str(v) if v is not None else "" for k, v in variables.items()}
             
-            # Process conditional content first (before regular variable replacement)
-            print("DEBUG: Processing conditional content...")
-            logger.info("Processing conditional content...")
-            print(f"DEBUG: Template variables keys: {list(str_variables.keys())}")
-            logger.info(f"Template variables keys: {list(str_variables.keys())}")
-            if 'option_codes' in str_variables:
-                print(f"DEBUG: Option codes found in variables: {str_variables['option_codes']}")
-                logger.info(f"Option codes found in variables: {str_variables['option_codes']}")
-            else:
-                print("DEBUG: No option_codes found in variables!")
-                logger.warning("No option_codes found in variables!")
-            
-            self._process_conditional_content_document(doc, str_variables, model)
-            print("DEBUG: Conditional content processing completed")
-            logger.info("Conditional content processing completed")
+            # Work out conditional content (resolved together with regular variables)
+            conditions = self._get_template_conditions(str_variables)
             
-            # Process all paragraphs
-            logger.info("Processing regular template variables...")
-            for paragraph in doc.paragraphs:
-                self.replace_variables_in_paragraph(paragraph, str_variables)
+            # Resolve conditionals and variables in one pass over the paragraphs that hold them
+            paragraphs = template.paragraphs(doc)
+            for paragraph in paragraphs:
+                self.replace_variables_in_paragraph(paragraph, str_variables, conditions)
             
-            # Process all tables
-            for table in doc.tables:
-                self.replace_variables_in_table(table, str_variables)
-            
-            # Process headers and footers
-            for section in doc.sections:
-                header = section.header
-                for paragraph in header.paragraphs:
-                    self.replace_variables_in_paragraph(paragraph, str_variables)
-                
-                footer = section.footer
-                for paragraph in footer.paragraphs:
-                    self.replace_variables_in_paragraph(paragraph, str_variables)
-            
-            logger.info("Template processing completed successfully")
+            logger.debug("Template processing completed: %d placeholder paragraphs", len(paragraphs))
             return doc
             
         except Exception as e:
@@ -655,14 +481,20 @@ def generate_word_quote(
         # Add any additional variables from kwargs
         variables.update(kwargs)
         
-        # Process the template
-        doc = processor.process_template(model, variables)
-        if not doc:
-            logger.error(f"Failed to process template for model: {model}")
-            return False
+        def render() -> bool:
+            # Process the template
+            doc = processor.process_template(model, variables)
+            if not doc:
+                logger.error(f"Failed to process template for model: {model}")
+                return False
+            
+            # Save the document
+            return processor.save_document(doc, output_path)
         
-        # Save the document
-        success = processor.save_document(doc, output_path)
+        # Identical variables and template give an identical document
+        template_path = processor.templates_dir / f"{model}_template.docx"
+        success = cached_export('generate_word_quote', {'model': model, 'variables': variables},
+                                [template_path], output_path, render)
         if success:
             logger.info(f"Quote generated successfully: {output_path}")
         
@@ -925,6 +757,7 @@ def generate_composed_multi_item_quote(
     quote_number: str,
     output_path: str,
     employee_info: Optional[Dict[str, str]] = None,
+    section_workers: Optional[int] = None,
     **kwargs
 ) -> bool:
     """
@@ -932,6 +765,9 @@ def generate_composed_multi_item_quote(
     This approach maintains the professional formatting and model-specific content
     for each item while combining them into one cohesive document.
     
+    Main item sections are rendered first, in worker processes for large
+    quotes, and spliced into the document in item order.
+    
     Args:
         quote_items: List of quote items with 'type', 'part_number', 'quantity', 'data'
         customer_name: Customer company name
@@ -939,6 +775,7 @@ def generate_composed_multi_item_quote(
         quote_number: Quote number
         output_path: Output file path
         employee_info: Employee information dict with 'name', 'phone', 'email'
+        section_workers: Worker processes for item sections (default: COMPOSED_SECTION_WORKERS; 1 = no pool)
         **kwargs: Additional template variables
         
     Returns:
@@ -1016,6 +853,11 @@ def generate_composed_multi_item_quote(
         
         composed_doc.add_paragraph("=" * 80)
         
+        # Render the main item sections up front; they only depend on their own item
+        main_items = [item for item in quote_items if item.get('type', 'main') == 'main']
+        fragments = iter(_render_main_item_fragments(main_items, processor, employee_name, employee_phone,
+                                                     employee_email, section_workers))
+        
         # Process each item and add its content
         for i, item in enumerate(quote_items, 1):
             item_type = item.get('type', 'main')
@@ -1034,10 +876,11 @@ def generate_composed_multi_item_quote(
             item_info.add_run(str(quantity))
             
             if item_type == 'main':
-                # Process main item using its specific model template
-                success = _add_main_item_section(composed_doc, item, i, processor, 
-                                               employee_name, employee_phone, employee_email)
-                if not success:
+                # Add the section rendered from its specific model template
+                fragment = next(fragments)
+                if fragment is not None:
+                    _splice_fragment(composed_doc, fragment)
+                else:
                     logger.warning(f"Failed to process main item {i}: {part_number}")
                     # Add basic info as fallback
                     _add_fallback_item_info(composed_doc, item, i)
@@ -1122,22 +965,21 @@ def generate_composed_multi_item_quote(
         return False
 
 
-def _add_main_item_section(doc, item: Dict[str, Any], item_number: int, processor: WordTemplateProcessor,
-                          employee_name: str, employee_phone: str, employee_email: str) -> bool:
+def _render_main_item_fragment(item: Dict[str, Any], processor: WordTemplateProcessor,
+                               employee_name: str, employee_phone: str, employee_email: str) -> Optional[bytes]:
     """
-    Add a main item section to the document using its specific model template.
+    Render a main item section from its specific model template into a
+    standalone <w:body> fragment, ready to be spliced into a document.
     
     Args:
-        doc: Document to add content to
         item: Quote item data
-        item_number: Item number (1, 2, 3, etc.)
         processor: Template processor
         employee_name: Employee name
         employee_phone: Employee phone
         employee_email: Employee email
         
     Returns:
-        True if successful, False otherwise
+        The section's paragraphs as serialized XML, or None if it could not be rendered
     """
     try:
         part_number = item.get('part_number', '')
@@ -1151,7 +993,7 @@ def _add_main_item_section(doc, item: Dict[str, Any], item_number: int, processo
         template_path = processor.get_template_path(model)
         if not template_path:
             logger.warning(f"No template found for model: {model}")
-            return False
+            return None
         
         # Prepare variables for this specific item
         insulator_vars = _parse_insulator_for_template(item_data)
@@ -1230,10 +1072,11 @@ def _add_main_item_section(doc, item: Dict[str, Any], item_number: int, processo
         item_doc = processor.process_template(model, variables)
         if not item_doc:
             logger.error(f"Failed to process template for model: {model}")
-            return False
+            return None
         
         # Extract content from the processed template (skip header sections)
         # We'll add the technical specifications and product details
+        section = BlockItemContainer(OxmlElement('w:body'), None)
         content_added = False
         
         for paragraph in item_doc.paragraphs:
@@ -1250,7 +1093,7 @@ def _add_main_item_section(doc, item: Dict[str, Any], item_number: int, processo
             # Add technical specifications and product details
             if any(keyword in text.lower() for keyword in ['specification', 'technical', 'model', 'voltage', 'probe', 'insulator', 'temperature', 'pressure', 'connection', 'output']):
                 # Copy the paragraph to our document
-                new_para = doc.add_paragraph()
+                new_para = section.add_paragraph()
                 for run in paragraph.runs:
                     new_run = new_para.add_run(run.text)
                     new_run.bold = run.bold
@@ -1259,13 +1102,107 @@ def _add_main_item_section(doc, item: Dict[str, Any], item_number: int, processo
         
         # If no content was extracted, add basic specifications
         if not content_added:
-            _add_basic_specifications(doc, item_data)
+            _add_basic_specifications(section, item_data)
         
-        return True
+        return etree.tostring(section._element)
         
     except Exception as e:
         logger.error(f"Error adding main item section: {e}")
+        return None
+
+
+# Per-process template processor for parallel section rendering
+_worker_processor = None
+
+
+def _init_section_worker() -> None:
+    """Process pool initializer: one template processor (and template cache) per worker"""
+    global _worker_processor
+    _worker_processor = WordTemplateProcessor()
+
+
+def _render_section_job(job: tuple) -> Optional[bytes]:
+    item, employee_name, employee_phone, employee_email = job
+    if _worker_processor is None:
+        _init_section_worker()
+    return _render_main_item_fragment(item, _worker_processor, employee_name, employee_phone, employee_email)
+
+
+def _can_send(jobs: List[tuple]) -> bool:
+    """True if the jobs can be pickled for worker processes (item data may hold objects that cannot)"""
+    try:
+        pickle.dumps(jobs, pickle.HIGHEST_PROTOCOL)
+        return True
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        logger.warning("Quote items cannot be sent to worker processes, rendering in process: %s", e)
+        return False
+
+
+def _render_main_item_fragments(items: List[Dict[str, Any]], processor: WordTemplateProcessor,
+                                employee_name: str, employee_phone: str, employee_email: str,
+                                workers: Optional[int] = None) -> List[Optional[bytes]]:
+    """
+    Render main item sections, in item order. Quotes with at least
+    COMPOSED_PARALLEL_MIN_ITEMS main items use a process pool; smaller ones
+    would spend more on starting workers than on rendering.
+    
+    Args:
+        items: Main quote items
+        processor: Template processor for rendering in this process
+        employee_name: Employee name
+        employee_phone: Employee phone
+        employee_email: Employee email
+        workers: Worker processes (default: COMPOSED_SECTION_WORKERS, 0 = CPU count; 1 = no pool)
+        
+    Returns:
+        One fragment (or None on failure) per item
+    """
+    jobs = [(item, employee_name, employee_phone, employee_email) for item in items]
+    if workers is None:
+        workers = COMPOSED_SECTION_WORKERS or os.cpu_count() or 1
+    workers = min(workers, len(jobs))
+    
+    if workers > 1 and len(jobs) >= COMPOSED_PARALLEL_MIN_ITEMS and _can_send(jobs):
+        try:
+            chunksize = max(1, len(jobs) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_section_worker) as pool:
+                return list(pool.map(_render_section_job, jobs, chunksize=chunksize))
+        except (OSError, BrokenProcessPool) as e:
+            logger.warning("Parallel section rendering unavailable, rendering in process: %s", e)
+    
+    return [_render_main_item_fragment(item, processor, employee_name, employee_phone, employee_email)
+            for item in items]
+
+
+def _splice_fragment(doc, fragment: bytes) -> None:
+    """Append the paragraphs of a rendered section fragment to the end of a document body"""
+    body = doc.element.body
+    for element in parse_xml(fragment):
+        body._insert_p(element)
+
+
+def _add_main_item_section(doc, item: Dict[str, Any], item_number: int, processor: WordTemplateProcessor,
+                          employee_name: str, employee_phone: str, employee_email: str) -> bool:
+    """
+    Add a main item section to the document using its specific model template.
+    
+    Args:
+        doc: Document to add content to
+        item: Quote item data
+        item_number: Item number (1, 2, 3, etc.)
+        processor: Template processor
+        employee_name: Employee name
+        employee_phone: Employee phone
+        employee_email: Employee email
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    fragment = _render_main_item_fragment(item, processor, employee_name, employee_phone, employee_email)
+    if fragment is None:
         return False
+    _splice_fragment(doc, fragment)
+    return True
 
 
 def _add_spare_part_section(doc, item: Dict[str, Any], item_number: int) -> None:
@@ -3,11 +3,17 @@ Auto-complete functionality for part number input
 Provides suggestions as user types based on database content and aliases
 """
 
+import threading
 import tkinter as tk
 from tkinter import ttk
 from typing import List, Dict, Optional, Callable
 from database.db_manager import DatabaseManager
 
+try:
+    from config.settings import AUTOCOMPLETE_DEBOUNCE_MS
+except ImportError:
+    AUTOCOMPLETE_DEBOUNCE_MS = 120
+
 class AutocompleteEntry(ttk.Entry):
     """Enhanced Entry widget with auto-complete functionality"""
     
@@ -18,17 +24,22 @@ class AutocompleteEntry(ttk.Entry):
         self.suggestion_window = None
         self.suggestion_listbox = None
         self.current_section = 0  # Track which section of part number we're in
+        self._pending_lookup = None  # after() id of the debounced suggestion refresh
+        self._hide_pending = None
         
         # Bind events
         self.bind('<KeyRelease>', self.on_key_release)
         self.bind('<KeyPress>', self.on_key_press)
-        self.bind('<FocusOut>', self.hide_suggestions)
+        self.bind('<FocusOut>', self.on_focus_out)
         self.bind('<Return>', self.on_return)
         self.bind('<Tab>', self.on_tab)
         self.bind('<Escape>', self.hide_suggestions)
         
         # Callback for when a suggestion is selected
         self.on_suggestion_selected = None
+        
+        # Build the suggestion index off the UI thread so the first keystroke is fast
+        threading.Thread(target=self.db_manager.get_suggestion_index, daemon=True).start()
     
     def set_suggestion_callback(self, callback: Callable[[str], None]):
         """Set callback function to be called when a suggestion is selected"""
@@ -46,13 +57,32 @@ class AutocompleteEntry(ttk.Entry):
         # Determine which section we're in
         self.current_section = self._get_section_at_cursor(text, cursor_pos)
         
-        # Get suggestions for current section
+        # Refresh suggestions once typing pauses rather than on every keystroke
+        if self._pending_lookup:
+            self.after_cancel(self._pending_lookup)
         current_word = self._get_current_word(text, cursor_pos)
         if len(current_word) >= 1:  # Show suggestions after 1 character
+            self._pending_lookup = self.after(AUTOCOMPLETE_DEBOUNCE_MS, self._refresh_suggestions)
+        else:
+            self._pending_lookup = None
+            self.hide_suggestions()
+    
+    def _refresh_suggestions(self):
+        """Debounced lookup for the word at the cursor"""
+        self._pending_lookup = None
+        text = self.get()
+        cursor_pos = self.index(tk.INSERT)
+        self.current_section = self._get_section_at_cursor(text, cursor_pos)
+        current_word = self._get_current_word(text, cursor_pos)
+        if current_word:
             self.show_suggestions(current_word)
         else:
             self.hide_suggestions()
     
+    def on_focus_out(self, event):
+        """Hide suggestions shortly after focus leaves, so a click on the list still lands"""
+        self._hide_pending = self.after(150, self.hide_suggestions)
+    
     def on_key_press(self, event):
         """Handle key press events for navigation"""
         if not self.suggestion_window or not self.suggestion_listbox:
@@ -106,14 +136,14 @@ class AutocompleteEntry(ttk.Entry):
     
     def _get_section_type(self, section: int) -> str:
         """Get the type of section based on position"""
-        section_types = ['model', 'voltage', 'material', 'length', 'options']
+        section_types = ['model', 'voltage', 'material', 'length', 'option']
         if section < len(section_types):
             return section_types[section]
-        return 'options'  # Default to options for additional sections
+        return 'option'  # Default to options for additional sections
     
     def show_suggestions(self, partial_text: str):
         """Show suggestion window"""
-        # Get suggestions from database
+        # Get suggestions from the in-memory index (SQL only if the catalog is unavailable)
         section_type = self._get_section_type(self.current_section)
         suggestions = self.db_manager.get_autocomplete_suggestions(section_type, partial_text, 10)
         
@@ -121,6 +151,10 @@ class AutocompleteEntry(ttk.Entry):
             self.hide_suggestions()
             return
         
+        # Same list already showing - leave the window and selection alone
+        if self.suggestion_window and suggestions == self.suggestions:
+            return
+        
         self.suggestions = suggestions
         
         # Create suggestion window if it doesn't exist
@@ -143,15 +177,14 @@ class AutocompleteEntry(ttk.Entry):
             # Bind listbox events
             self.suggestion_listbox.bind('<Button-1>', self._on_listbox_click)
             self.suggestion_listbox.bind('<Return>', self._on_listbox_return)
+            
+            # Position the suggestion window
+            self._position_suggestion_window()
         
         # Clear and populate listbox
         self.suggestion_listbox.delete(0, tk.END)
-        for suggestion in suggestions:
-            display_text = f"{suggestion['code']} - {suggestion['name']}"
-            self.suggestion_listbox.insert(tk.END, display_text)
-        
-        # Position the suggestion window
-        self._position_suggestion_window()
+        self.suggestion_listbox.insert(tk.END, *[f"{s['code']} - {s['name']}" for s in suggestions])
+        self.suggestion_listbox.configure(height=min(len(suggestions), 8))
         
         # Select first item
         if self.suggestion_listbox.size() > 0:
@@ -159,6 +192,8 @@ class AutocompleteEntry(ttk.Entry):
     
     def hide_suggestions(self, event=None):
         """Hide suggestion window"""
+        self._hide_pending = None
+        self.suggestions = []
         if self.suggestion_window:
             self.suggestion_window.destroy()
             self.suggestion_window = None
@@ -176,9 +211,8 @@ class AutocompleteEntry(ttk.Entry):
         # Position window
         self.suggestion_window.geometry(f"+{x}+{y}")
         
-        # Make sure window is on top
+        # Make sure window is on top; keyboard focus stays in the entry for typing and arrow keys
         self.suggestion_window.lift()
-        self.suggestion_window.focus_force()
     
     def _select_previous(self):
         """Select previous suggestion"""
@@ -228,6 +262,10 @@ class AutocompleteEntry(ttk.Entry):
         if not self.suggestion_listbox:
             return
         
+        if self._hide_pending:
+            self.after_cancel(self._hide_pending)
+            self._hide_pending = None
+        
         # Get clicked index
         index = self.suggestion_listbox.nearest(event.y)
         if index >= 0 and index < len(self.suggestions):
@@ -22,6 +22,7 @@ class CustomerSelectionDialog:
         self.customer_db = CustomerDBManager()
         self.on_customer_selected = on_customer_selected
         self.selected_customer = None
+        self._pending_search = None  # after() id of the debounced search
         
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
@@ -117,15 +118,18 @@ class CustomerSelectionDialog:
         self.dialog.bind('<Return>', lambda e: self.select_customer())
         self.dialog.bind('<Escape>', lambda e: self.dialog.destroy())
         
-    def load_customers(self):
-        """Load customers from database"""
+    def load_customers(self, search_term: str = ""):
+        """Load customers from database, or only those matching search_term"""
         try:
             # Clear existing items
             for item in self.customer_tree.get_children():
                 self.customer_tree.delete(item)
             
-            # Get customers from database
-            customers = self.customer_db.get_all_customers()
+            # Get customers from database (ranked full-text matches when searching)
+            if search_term:
+                customers = self.customer_db.search_customers(search_term)
+            else:
+                customers = self.customer_db.get_all_customers()
             
             for customer in customers:
                 self.customer_tree.insert('', 'end', 
@@ -139,19 +143,16 @@ class CustomerSelectionDialog:
             messagebox.showerror("Error", f"Failed to load customers: {str(e)}")
     
     def filter_customers(self, *args):
-        """Filter customers based on search term"""
-        search_term = self.search_var.get().lower()
-        
-        # Show/hide items based on search
-        for item in self.customer_tree.get_children():
-            values = self.customer_tree.item(item)['values']
-            customer_name = values[0].lower()
-            contact_name = values[1].lower()
-            
-            if search_term in customer_name or search_term in contact_name:
-                self.customer_tree.reattach(item, '', len(self.customer_tree.get_children()))
-            else:
-                self.customer_tree.detach(item)
+        """Filter customers based on search term once typing pauses"""
+        if self._pending_search:
+            self.dialog.after_cancel(self._pending_search)
+        self._pending_search = self.dialog.after(
+            200, lambda: self._run_search(self.search_var.get().strip()))
+    
+    def _run_search(self, search_term: str):
+        """Reload the list with customers matching the search term"""
+        self._pending_search = None
+        self.load_customers(search_term)
     
     def on_customer_select(self, event):
         """Handle customer selection"""
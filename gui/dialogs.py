@@ -862,4 +862,70 @@ class ErrorDialog:
         
         # Key bindings
         self.dialog.bind('<Return>', lambda e: self.dialog.destroy())
-        self.dialog.bind('<Escape>', lambda e: self.dialog.destroy()) 
\ No newline at end of file
+        self.dialog.bind('<Escape>', lambda e: self.dialog.destroy()) 
+
+class JobStatusDialog:
+    """Non-modal window listing background jobs with their progress"""
+    
+    def __init__(self, parent, job_runner):
+        self.parent = parent
+        self.job_runner = job_runner
+        self.dialog = tk.Toplevel(parent)
+        self.setup_dialog()
+        self.create_content()
+        self.refresh()
+        self.job_runner.add_listener(self.on_job_changed)
+    
+    def setup_dialog(self):
+        """Setup dialog properties"""
+        self.dialog.title("Background Jobs")
+        self.dialog.geometry("560x260")
+        self.dialog.transient(self.parent)
+        self.dialog.protocol("WM_DELETE_WINDOW", self.close)
+    
+    def create_content(self):
+        """Create dialog content"""
+        main_frame = ttk.Frame(self.dialog, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        columns = ("Job", "Status", "Progress", "Message")
+        self.tree = ttk.Treeview(main_frame, columns=columns, show="headings", height=8)
+        for column, width in zip(columns, (160, 80, 70, 220)):
+            self.tree.heading(column, text=column)
+            self.tree.column(column, width=width)
+        self.tree.pack(fill=tk.BOTH, expand=True)
+        
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=(10, 0))
+        ttk.Button(button_frame, text="Cancel Selected", command=self.cancel_selected).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Close", command=self.close).pack(side=tk.RIGHT)
+        
+        self.dialog.bind('<Escape>', lambda e: self.close())
+    
+    def refresh(self):
+        """Rebuild the job list"""
+        selected = self.tree.selection()
+        self.tree.delete(*self.tree.get_children())
+        for job in reversed(self.job_runner.jobs()):
+            self.tree.insert("", tk.END, iid=str(job.id), values=(
+                job.name, job.status.title(), f"{job.progress:.0%}", job.message
+            ))
+        existing = [iid for iid in selected if self.tree.exists(iid)]
+        if existing:
+            self.tree.selection_set(existing)
+    
+    def on_job_changed(self, job):
+        """Job runner listener; runs on the UI thread"""
+        if self.dialog.winfo_exists():
+            self.refresh()
+    
+    def cancel_selected(self):
+        """Request cancellation of the selected jobs"""
+        for iid in self.tree.selection():
+            self.job_runner.cancel(int(iid))
+        self.refresh()
+    
+    def close(self):
+        """Stop listening and close the window"""
+        self.job_runner.remove_listener(self.on_job_changed)
+        self.dialog.destroy()
@@ -8,7 +8,11 @@ from tkinter import ttk, messagebox, filedialog, simpledialog
 from typing import Optional, Dict, Any, Union
 import sys
 import os
+import copy
 import datetime
+import json
+import threading
+import time
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -16,44 +20,57 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.settings import (
     WINDOW_TITLE, WINDOW_WIDTH, WINDOW_HEIGHT, 
     WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT, SAMPLE_PART_NUMBERS,
-    ERROR_MESSAGES, SUCCESS_MESSAGES
+    ERROR_MESSAGES, SUCCESS_MESSAGES, STARTUP_PROBE_ENV
 )
-from core.part_parser import PartNumberParser
-from core.quote_generator import QuoteGenerator
-from core.spare_parts_manager import SparePartsManager
+from utils.logger import get_logger, trace
+from utils.job_runner import JobRunner
 
-from .dialogs import ExportDialog, ShortcutManagerDialog
+from .dialogs import ExportDialog, ShortcutManagerDialog, JobStatusDialog
 from .autocomplete import AutocompleteEntry
 
+logger = get_logger(__name__)
+
 class MainWindow:
     """Main application window"""
     
-    def __init__(self):
-        """Initialize the main window"""
+    def __init__(self, started_at: Optional[float] = None):
+        """
+        Initialize the main window
+        
+        Args:
+            started_at: time.perf_counter() at process start, for the startup time metric
+        """
+        self._started_at = started_at if started_at is not None else time.perf_counter()
+        self.startup_seconds = None
+        
         self.root = tk.Tk()
         self.root.title("Babbitt Quote Generator")
         self.root.geometry("1200x800")
         
-        # Initialize components
-        self.parser = PartNumberParser()
-        self.quote_generator = QuoteGenerator()
-        self.spare_parts_manager = SparePartsManager()
+        # Parser, quote generator and spare parts manager are built on first use
+        self._parser = None
+        self._quote_generator = None
+        self._spare_parts_manager = None
+        self._components_lock = threading.Lock()
         
         # Initialize spare parts manager
         self.spare_parts_list = []  # List to store added spare parts
         self.quote_items = []  # List to store all quote items (main parts + spare parts)
         self.current_quote_number = None  # Track current quote number
+        self.saved_quote_number = None  # Number opened from or saved to the database; saving it again overwrites
         self.current_quote_data = None  # Track current parsed quote data
         self.selected_employee_info = None  # Store selected employee for template use
         self.selected_customer = None  # Store selected customer for quote generation
         
-        # Track pending quote numbers for this session (not yet saved to database)
-        self.pending_quote_numbers = set()
-        
         # Import database manager for quote functionality
         from database.db_manager import DatabaseManager
         self.db_manager = DatabaseManager()
         
+        # Parse and export jobs run in the background; results come back via root.after polling
+        self.job_runner = JobRunner()
+        self.job_runner.attach(self.root)
+        self._parse_job = None
+        
         self.setup_window()
         self.create_menu()
         self.create_widgets()
@@ -63,6 +80,36 @@ class MainWindow:
         # Highlight key buttons on startup to draw attention
         self.root.after(1000, self.highlight_key_buttons)
     
+    @property
+    def parser(self):
+        """Part number parser (created on first parse, possibly on a worker thread)"""
+        if self._parser is None:
+            with self._components_lock:
+                if self._parser is None:
+                    from core.part_parser import PartNumberParser
+                    self._parser = PartNumberParser()
+        return self._parser
+    
+    @property
+    def quote_generator(self):
+        """Plain Word quote generator (imports python-docx on first use)"""
+        if self._quote_generator is None:
+            with self._components_lock:
+                if self._quote_generator is None:
+                    from core.quote_generator import QuoteGenerator
+                    self._quote_generator = QuoteGenerator()
+        return self._quote_generator
+    
+    @property
+    def spare_parts_manager(self):
+        """Spare parts manager sharing the window's database manager"""
+        if self._spare_parts_manager is None:
+            with self._components_lock:
+                if self._spare_parts_manager is None:
+                    from core.spare_parts_manager import SparePartsManager
+                    self._spare_parts_manager = SparePartsManager(self.db_manager)
+        return self._spare_parts_manager
+    
     def setup_window(self):
         """Configure main window properties"""
         self.root.title(WINDOW_TITLE)
@@ -113,6 +160,9 @@ class MainWindow:
         tools_menu.add_separator()
         tools_menu.add_command(label="Validate Database", command=self.validate_database)
         tools_menu.add_command(label="Sample Part Numbers", command=self.show_samples)
+        tools_menu.add_command(label="Export Quote Report...", command=self.export_quote_report)
+        tools_menu.add_separator()
+        tools_menu.add_command(label="Background Jobs", command=self.show_job_status)
         
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -473,73 +523,115 @@ class MainWindow:
             self.parse_part_number()
     
     def parse_part_number(self):
-        """Parse the entered part number and display results"""
+        """Parse the entered part number in the background and display results"""
         part_number = self.part_number_var.get().strip()
         
         if not part_number:
             messagebox.showwarning("Input Required", "Please enter a part number to parse.")
             return
         
-        try:
-            self.status_var.set("Parsing part number...")
-            self.root.update()
-            
-            # Parse the part number (shortcut processing is handled in handle_part_number_enter)
-            parsed_result = self.parser.parse_part_number(part_number)
-            
-            if parsed_result.get('error'):
-                self.status_var.set("Parse failed")
-                messagebox.showerror("Parse Error", f"Failed to parse part number:\n{parsed_result['error']}")
-                # Clear quote data on parse failure
-                self.current_quote_data = None
+        # Only the most recent request matters; an older one still running is dropped
+        name = f"Parse {part_number}"
+        previous = self._parse_job
+        if previous is not None and previous.active:
+            if previous.name == name:
                 return
-            
-            # Generate quote data
-            self.current_quote_data = self.parser.get_quote_data(parsed_result)
-            
-            # Update status with hint about second Enter
-            total_price = self.current_quote_data.get('total_price', 0)
-            self.status_var.set(f"Part parsed successfully - Total: ${total_price:.2f} (Press Enter again to add to quote)")
-            
-        except Exception as e:
-            self.status_var.set("Error occurred")
-            messagebox.showerror("Error", f"An error occurred while parsing:\n{str(e)}")
-            # Clear quote data on error
+            previous.cancel()
+        
+        self.status_var.set("Parsing part number...")
+        job = self.job_runner.submit(
+            name,
+            lambda job: self._run_parse_job(job, part_number),
+            on_done=lambda result: self._on_parse_done(job, result),
+            on_error=lambda error: self._on_parse_error(job, error),
+        )
+        self._parse_job = job
+    
+    def _run_parse_job(self, job, part_number: str) -> Dict[str, Any]:
+        """Parse and price a part number; runs on a worker thread"""
+        # Parse the part number (shortcut processing is handled in handle_part_number_enter)
+        job.report(0.1, "Parsing")
+        parsed_result = self.parser.parse_part_number(part_number)
+        if parsed_result.get('error'):
+            return {'error': parsed_result['error']}
+        
+        job.check_cancelled()
+        job.report(0.5, "Pricing")
+        return {'quote_data': self.parser.get_quote_data(parsed_result)}
+    
+    def _on_parse_done(self, job, result: Dict[str, Any]):
+        """Show a finished parse job, unless a newer one has replaced it"""
+        if job is not self._parse_job:
+            return
+        
+        if result.get('error'):
+            self.status_var.set("Parse failed")
+            messagebox.showerror("Parse Error", f"Failed to parse part number:\n{result['error']}")
+            # Clear quote data on parse failure
             self.current_quote_data = None
+            return
+        
+        # Generate quote data
+        self.current_quote_data = result['quote_data']
+        
+        # Update status with hint about second Enter
+        total_price = self.current_quote_data.get('total_price', 0)
+        self.status_var.set(f"Part parsed successfully - Total: ${total_price:.2f} (Press Enter again to add to quote)")
+    
+    def _on_parse_error(self, job, error: BaseException):
+        """A parse job raised an unexpected error"""
+        if job is not self._parse_job:
+            return
+        self.status_var.set("Error occurred")
+        messagebox.showerror("Error", f"An error occurred while parsing:\n{str(error)}")
+        # Clear quote data on error
+        self.current_quote_data = None
     
-    def export_quote(self):
-        """Export current quote to Word document using unified quote generator"""
-        print("=== EXPORT_QUOTE FUNCTION CALLED ===")
-        print(f"Quote items: {self.quote_items}")
+    def export_quote(self, title: str = "Export Quote", on_complete=None):
+        """
+        Export current quote to Word document using unified quote generator.
+        
+        The file dialog runs here; document generation and the database save
+        run as a background job so the window stays responsive.
+        
+        Args:
+            title: File dialog title
+            on_complete: Called on the UI thread after a successful export
+        """
+        logger.debug("export_quote called with %d items", len(self.quote_items))
+        trace(logger, "Quote items: %s", self.quote_items)
+        
+        # A second click while an export is running must not start another one
+        if self.job_runner.active_job('export'):
+            logger.debug("Export already in progress - ignoring request")
+            self.status_var.set("Export already in progress...")
+            return
         
         if not self.quote_items:
-            print("No quote items - showing warning")
+            logger.debug("No quote items - showing warning")
             messagebox.showwarning("No Quote", "Please add items to the quote first.")
             return
         
-        print("✓ Quote items validation passed")
         
         # Validate user is selected
         user_initials = self.get_user_initials()
-        print(f"User initials retrieved: '{user_initials}'")
+        logger.debug("User initials retrieved: '%s'", user_initials)
         
         if not user_initials:
-            print("❌ No user selected - showing error")
+            logger.debug("No user selected - showing error")
             messagebox.showerror("User Required", 
                 "You must select a user before exporting a quote.\n\n"
                 "This is required for quote number generation and tracking.")
             return
         
-        print(f"✓ Initials validation passed: '{user_initials}'")
         
         # Generate quote number if not already generated
         if not self.current_quote_number:
-            print("Generating new quote number...")
+            logger.debug("Generating new quote number...")
             if not self.generate_new_quote_number():
-                print("❌ Quote number generation failed")
+                logger.warning("Quote number generation failed")
                 return  # Failed to generate quote number
         
-        print(f"✓ Quote number available: {self.current_quote_number}")
         
         try:
             # Use quote number as default filename
@@ -548,192 +640,282 @@ class MainWindow:
             filename = filedialog.asksaveasfilename(
                 defaultextension=".docx",
                 filetypes=[("Word documents", "*.docx"), ("All files", "*.*")],
-                title="Export Quote",
+                title=title,
                 initialfile=default_filename
             )
             
-            if filename:
-                print(f"Export filename selected: {filename}")
-                
-                # Try to use unified quote generator for both single and multi-item export
-                success = False
-                main_items = [item for item in self.quote_items if item.get('type') == 'main']
-                
-                if main_items:
-                    # Get customer information
-                    customer_name = self.company_var.get() or "Customer Name"
-                    contact_name = self.contact_person_var.get() or "Contact Person"
+            if not filename:
+                return
+            logger.debug("Export filename selected: %s", filename)
+            
+            if not any(item.get('type') == 'main' for item in self.quote_items):
+                logger.error("No main items found in quote")
+                messagebox.showerror("Export Error", "No main items found in quote.")
+                return
+            
+            request = self._collect_export_request(filename, user_initials)
+            job = self.job_runner.submit(
+                f"Export {request['quote_number']}",
+                lambda job: self._run_export_job(job, request),
+                key='export',
+                on_done=lambda result: self._on_export_done(request, result, on_complete),
+                on_error=self._on_export_error,
+                on_cancel=self._on_export_cancelled,
+                on_progress=self._show_job_progress,
+            )
+            if job:
+                self.export_button.config(state=tk.DISABLED)
+                self.status_var.set(f"Exporting quote {request['quote_number']}...")
+                    
+        except Exception as e:
+            logger.exception("Exception in export_quote: %s", e)
+            self.status_var.set("Export failed")
+            messagebox.showerror("Export Error", f"Failed to export quote:\n{str(e)}")
+    
+    def _collect_export_request(self, filename: str, user_initials: str) -> Dict[str, Any]:
+        """Snapshot everything an export needs so the worker never touches Tk variables"""
+        # Get employee information for template
+        employee_name = ""
+        employee_phone = ""
+        employee_email = ""
+        if hasattr(self, 'selected_employee_info') and self.selected_employee_info:
+            emp = self.selected_employee_info
+            employee_name = f"{emp['first_name']} {emp['last_name']}"
+            employee_phone = emp.get('work_phone', '')
+            employee_email = emp.get('work_email', '')
+            logger.debug("Using employee: %s (%s, %s)", employee_name, employee_phone, employee_email)
+        else:
+            logger.debug("No employee selected, using default contact info")
+        
+        # Use the generated quote number (guaranteed to exist at this point)
+        assert self.current_quote_number is not None
+        
+        return {
+            'filename': filename,
+            'quote_items': copy.deepcopy(self.quote_items),
+            'customer_name': self.company_var.get() or "Customer Name",
+            'contact_name': self.contact_person_var.get() or "Contact Person",
+            'customer_email': self.contact_person_var.get().strip(),
+            'quote_number': self.current_quote_number,
+            'overwrite': self.current_quote_number == self.saved_quote_number,
+            'user_initials': user_initials,
+            'lead_time': self.lead_time_var.get(),
+            'employee_info': {
+                'name': employee_name,
+                'phone': employee_phone,
+                'email': employee_email
+            },
+        }
+    
+    @staticmethod
+    def _run_export_job(job, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate the document and save the quote; runs on a worker thread"""
+        quote_items = request['quote_items']
+        filename = request['filename']
+        main_items = [item for item in quote_items if item.get('type') == 'main']
+        employee_info = request['employee_info']
+        
+        job.check_cancelled()
+        job.report(0.1, "Generating document")
+        
+        # Use unified template system for completely unified formatting
+        logger.debug("Unified template export with %s items", len(quote_items))
+        success = False
+        try:
+            from export.unified_templates.unified_template_processor import generate_unified_quote
+            
+            success = generate_unified_quote(
+                quote_items=quote_items,
+                customer_name=request['customer_name'],
+                attention_name=request['contact_name'],
+                quote_number=request['quote_number'],
+                output_path=filename,
+                employee_info=employee_info,
+                lead_time=request['lead_time']
+            )
+            logger.debug("Unified template export success: %s", success)
+            
+        except Exception as e:
+            logger.exception("Unified template export failed: %s", e)
+            job.check_cancelled()
+            
+            # Fallback to old system if unified fails
+            if len(quote_items) > 1:
+                logger.info("Falling back to composed multi-item export...")
+                job.report(0.4, "Retrying with multi-item template")
+                try:
+                    from export.word_template_processor import generate_composed_multi_item_quote
                     
-                    # Get employee information for template
-                    employee_name = ""
-                    employee_phone = ""
-                    employee_email = ""
-                    if hasattr(self, 'selected_employee_info') and self.selected_employee_info:
-                        emp = self.selected_employee_info
-                        employee_name = f"{emp['first_name']} {emp['last_name']}"
-                        employee_phone = emp.get('work_phone', '')
-                        employee_email = emp.get('work_email', '')
-                        print(f"🔧 Using employee: {employee_name} ({employee_phone}, {employee_email})")
-                    else:
-                        print("⚠ No employee selected, using default contact info")
+                    success = generate_composed_multi_item_quote(
+                        quote_items=quote_items,
+                        customer_name=request['customer_name'],
+                        attention_name=request['contact_name'],
+                        quote_number=request['quote_number'],
+                        output_path=filename,
+                        employee_info=employee_info,
+                        lead_time=request['lead_time']
+                    )
+                    logger.debug("Fallback multi-item export success: %s", success)
                     
-                    # Use the generated quote number (guaranteed to exist at this point)
-                    assert self.current_quote_number is not None
-                    quote_number = self.current_quote_number
+                except Exception as fallback_e:
+                    logger.error("Fallback multi-item export also failed: %s", fallback_e)
+                    success = False
+            else:
+                # For single items, try the old single-item export as fallback
+                logger.info("Falling back to single-item export...")
+                job.report(0.4, "Retrying with single-item template")
+                try:
+                    from export.word_template_processor import generate_word_quote
                     
-                    # Use unified template system for completely unified formatting
-                    print(f"🚀 Unified template export with {len(self.quote_items)} items")
+                    main_item = main_items[0]
+                    part_number = main_item.get('part_number', '')
+                    quote_data = main_item.get('data', {})
                     
-                    try:
-                        from export.unified_templates.unified_template_processor import generate_unified_quote
-                        
-                        # Prepare employee info
-                        employee_info = {
-                            'name': employee_name,
-                            'phone': employee_phone,
-                            'email': employee_email
-                        }
-                        
-                        success = generate_unified_quote(
-                            quote_items=self.quote_items,
-                            customer_name=customer_name,
-                            attention_name=contact_name,
-                            quote_number=quote_number,
-                            output_path=filename,
-                            employee_info=employee_info,
-                            lead_time=self.lead_time_var.get()
-                        )
-                        print(f"✅ Unified template export success: {success}")
-                        
-                    except Exception as e:
-                        print(f"❌ Unified template export failed: {e}")
-                        import traceback
-                        traceback.print_exc()
-                        
-                        # Fallback to old system if unified fails
-                        is_multi_item = len(self.quote_items) > 1
-                        if is_multi_item:
-                            print("🔄 Falling back to composed multi-item export...")
-                            try:
-                                from export.word_template_processor import generate_composed_multi_item_quote
-                                
-                                employee_info = {
-                                    'name': employee_name,
-                                    'phone': employee_phone,
-                                    'email': employee_email
-                                }
-                                
-                                success = generate_composed_multi_item_quote(
-                                    quote_items=self.quote_items,
-                                    customer_name=customer_name,
-                                    attention_name=contact_name,
-                                    quote_number=quote_number,
-                                    output_path=filename,
-                                    employee_info=employee_info,
-                                    lead_time=self.lead_time_var.get()
-                                )
-                                print(f"✅ Fallback multi-item export success: {success}")
-                                
-                            except Exception as fallback_e:
-                                print(f"❌ Fallback multi-item export also failed: {fallback_e}")
-                                success = False
-                        else:
-                            # For single items, try the old single-item export as fallback
-                            print("🔄 Falling back to single-item export...")
-                            try:
-                                from export.word_template_processor import generate_word_quote
-                                
-                                main_item = main_items[0]
-                                part_number = main_item.get('part_number', '')
-                                quote_data = main_item.get('data', {})
-                                
-                                model = part_number.split('-')[0] if '-' in part_number else part_number[:6]
-                                unit_price = quote_data.get('total_price', 0)
-                                unit_price_str = f"{unit_price:.2f}" if unit_price > 0 else "Please Contact"
-                                
-                                success = generate_word_quote(
-                                    model=model,
-                                    customer_name=customer_name,
-                                    attention_name=contact_name,
-                                    quote_number=quote_number,
-                                    part_number=part_number,
-                                    unit_price=unit_price_str,
-                                    supply_voltage=quote_data.get('voltage', '115VAC'),
-                                    probe_length=str(quote_data.get('probe_length', 12)),
-                                    output_path=filename,
-                                    employee_name=employee_name,
-                                    employee_phone=employee_phone,
-                                    employee_email=employee_email,
-                                    lead_time=self.lead_time_var.get(),
-                                    **quote_data
-                                )
-                                print(f"✅ Fallback single-item export success: {success}")
-                                
-                            except Exception as fallback_e:
-                                print(f"❌ Fallback single-item export also failed: {fallback_e}")
-                                success = False
+                    model = part_number.split('-')[0] if '-' in part_number else part_number[:6]
+                    unit_price = quote_data.get('total_price', 0)
+                    unit_price_str = f"{unit_price:.2f}" if unit_price > 0 else "Please Contact"
                     
-                    if success:
-                        # Save quote to database after successful export
-                        try:
-                            # Calculate total for database save
-                            customer_name = self.company_var.get().strip() or "Customer Name"
-                            if self.current_quote_number:
-                                if self.db_manager.connect():
-                                    # At this point current_quote_number is guaranteed to be set
-                                    assert self.current_quote_number is not None
-                                    
-                                    # Calculate total correctly based on item type
-                                    total_quote_value = 0.0
-                                    for item in self.quote_items:
-                                        if item.get('type') == 'main':
-                                            unit_price = item.get('data', {}).get('total_price', 0)
-                                        else:  # spare part
-                                            unit_price = item.get('data', {}).get('pricing', {}).get('total_price', 0)
-                                        quantity = item.get('quantity', 1)
-                                        total_quote_value += unit_price * quantity
-                                    
-                                    # Save the quote to database
-                                    self.db_manager.save_quote(
-                                        quote_number=self.current_quote_number,
-                                        customer_name=customer_name,
-                                        customer_email=self.contact_person_var.get().strip(),
-                                        quote_items=self.quote_items,
-                                        total_price=total_quote_value,
-                                        user_initials=self.get_user_initials()
-                                    )
-                                    print(f"✅ Quote saved to database: {self.current_quote_number}")
-                                    self.db_manager.disconnect()
-                            
-                        except Exception as db_e:
-                            print(f"⚠ Database save failed (export still successful): {db_e}")
-                            # Don't fail the export if database save fails
-                        
-                        print("✅ Export completed successfully")
-                        self.status_var.set(f"Quote exported successfully: {filename}")
-                        messagebox.showinfo("Export Complete", f"Quote exported successfully to:\n{filename}")
-                        
-                        # Clear the quote after successful export and save
-                        self.quote_items.clear()
-                        self._refresh_quote_tree()
-                        self.current_quote_number = None  # Reset for next quote
-                        self.status_var.set("Quote exported and cleared - ready for new quote")
-                        
-                    else:
-                        print("❌ Export failed - all methods unsuccessful")
-                        self.status_var.set("Export failed")
-                        messagebox.showerror("Export Error", "Failed to export quote using all available methods.")
+                    success = generate_word_quote(
+                        model=model,
+                        customer_name=request['customer_name'],
+                        attention_name=request['contact_name'],
+                        quote_number=request['quote_number'],
+                        part_number=part_number,
+                        unit_price=unit_price_str,
+                        supply_voltage=quote_data.get('voltage', '115VAC'),
+                        probe_length=str(quote_data.get('probe_length', 12)),
+                        output_path=filename,
+                        employee_name=employee_info['name'],
+                        employee_phone=employee_info['phone'],
+                        employee_email=employee_info['email'],
+                        lead_time=request['lead_time'],
+                        **quote_data
+                    )
+                    logger.debug("Fallback single-item export success: %s", success)
                     
+                except Exception as fallback_e:
+                    logger.error("Fallback single-item export also failed: %s", fallback_e)
+                    success = False
+        
+        if not success:
+            return {'success': False, 'saved': False}
+        
+        # Cancelled while the document was being written: don't leave a file behind
+        if job.cancelled:
+            if os.path.exists(filename):
+                os.remove(filename)
+            job.check_cancelled()
+        
+        # Save quote to database after successful export
+        job.report(0.8, "Saving to database")
+        saved = False
+        try:
+            # Calculate total correctly based on item type
+            total_quote_value = 0.0
+            for item in quote_items:
+                if item.get('type') == 'main':
+                    unit_price = item.get('data', {}).get('total_price', 0)
+                else:  # spare part
+                    unit_price = item.get('data', {}).get('pricing', {}).get('total_price', 0)
+                quantity = item.get('quantity', 1)
+                total_quote_value += unit_price * quantity
+            
+            # Own manager so this thread gets its own pooled connection
+            from database.db_manager import DatabaseManager
+            db_manager = DatabaseManager()
+            if db_manager.connect():
+                saved = db_manager.save_quote(
+                    quote_number=request['quote_number'],
+                    customer_name=request['customer_name'].strip(),
+                    customer_email=request['customer_email'],
+                    quote_items=quote_items,
+                    total_price=total_quote_value,
+                    user_initials=request['user_initials'],
+                    overwrite=request['overwrite']
+                )
+                if saved:
+                    logger.info("Quote saved to database: %s", request['quote_number'])
                 else:
-                    print("❌ No main items found in quote")
-                    messagebox.showerror("Export Error", "No main items found in quote.")
-                    
-        except Exception as e:
-            print(f"❌ Exception in export_quote: {e}")
-            import traceback
-            traceback.print_exc()
+                    logger.warning("Quote %s was not saved to the database", request['quote_number'])
+                db_manager.disconnect()
+                
+        except Exception as db_e:
+            logger.warning("Database save failed (export still successful): %s", db_e)
+            # Don't fail the export if database save fails
+        
+        job.report(1.0, "Done")
+        return {'success': True, 'saved': bool(saved)}
+    
+    def _on_export_done(self, request: Dict[str, Any], result: Dict[str, Any], on_complete=None):
+        """Report the outcome of an export job on the UI thread"""
+        self.export_button.config(state=tk.NORMAL)
+        filename = request['filename']
+        
+        if not result['success']:
+            logger.error("Export failed - all methods unsuccessful")
             self.status_var.set("Export failed")
-            messagebox.showerror("Export Error", f"Failed to export quote:\n{str(e)}")
+            messagebox.showerror("Export Error", "Failed to export quote using all available methods.")
+            return
+        
+        logger.info("Export completed successfully")
+        self.status_var.set(f"Quote exported successfully: {filename}")
+        messagebox.showinfo("Export Complete", f"Quote exported successfully to:\n{filename}")
+        
+        # Clear the quote after successful export and save
+        self.quote_items.clear()
+        self._refresh_quote_tree()
+        self.current_quote_number = None  # Reset for next quote
+        self.saved_quote_number = None
+        self.status_var.set("Quote exported and cleared - ready for new quote")
+        if on_complete:
+            on_complete()
+    
+    def _on_export_error(self, error: BaseException):
+        """Export job raised an unexpected error"""
+        self.export_button.config(state=tk.NORMAL)
+        self.status_var.set("Export failed")
+        messagebox.showerror("Export Error", f"Failed to export quote:\n{str(error)}")
+    
+    def _on_export_cancelled(self):
+        """Export job was cancelled before it finished"""
+        self.export_button.config(state=tk.NORMAL)
+        self.status_var.set("Export cancelled")
+    
+    def _show_job_progress(self, job):
+        """Mirror a job's progress in the status bar"""
+        self.status_var.set(f"{job.name}: {job.message} ({job.progress:.0%})")
+    
+    def show_job_status(self):
+        """Show the background job status window"""
+        JobStatusDialog(self.root, self.job_runner)
+    
+    def export_quote_report(self):
+        """Export quote counts and totals per user, customer or model per day to CSV"""
+        by = simpledialog.askstring("Quote Report", "Report by (user, customer or model):",
+                                    initialvalue="user", parent=self.root)
+        if not by:
+            return
+        by = by.strip().lower()
+        if by not in ('user', 'customer', 'model'):
+            messagebox.showerror("Quote Report", f"Unknown report '{by}'. Use user, customer or model.")
+            return
+        
+        filename = filedialog.asksaveasfilename(
+            title="Export Quote Report",
+            defaultextension=".csv",
+            initialfile=f"quote_report_by_{by}.csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+        
+        try:
+            count = self.db_manager.export_quote_report_csv(filename, by=by, per_day=True)
+            self.status_var.set(f"Quote report exported: {count} row(s) to {filename}")
+        except Exception as e:
+            messagebox.showerror("Quote Report", f"Failed to export report: {str(e)}")
+        finally:
+            self.db_manager.disconnect()
 
     @staticmethod
     def _extract_insulator_material_name(quote_data: dict) -> str:
@@ -763,148 +945,18 @@ class MainWindow:
         }
         return material_codes.get(material_code, 'UHMWPE')
 
-    def _try_rtf_template_export(self, export_path: str) -> bool:
-        """Try exporting using the unified template system with master template"""
-        try:
-            # Check if we have quote data
-            if not self.current_quote_data:
-                print("No quote data available")
-                return False
-                
-            # Import the unified template system
-            import sys
-            import os
-            sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-            
-            # Try unified template system (primary method)
-            try:
-                from export.unified_templates.unified_template_processor import generate_unified_quote
-                print("✓ Unified template processor imported successfully")
-                print("Attempting unified template export...")
-                success = self._try_word_template_export(export_path)
-                print(f"Unified template export returned: {success}")
-                if success:
-                    print("✓ Unified template export successful - returning True")
-                    return True
-                print("⚠ Unified template export failed")
-            except ImportError as e:
-                print(f"❌ Unified template system import failed: {e}")
-            except Exception as e:
-                print(f"❌ Unified template system error: {e}")
-                import traceback
-                traceback.print_exc()
-            
-            # If unified system fails, show error but don't fall back to old systems
-            print("❌ Unified template system failed - no fallback available")
-            return False
-            
-        except Exception as e:
-            print(f"Unified template export failed: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
-    
-    def _try_word_template_export(self, export_path: str) -> bool:
-        """Try exporting using the unified template system with master template"""
-        try:
-            print("🔧 Starting unified template export...")
-            from export.unified_templates.unified_template_processor import generate_unified_quote
-            print("✓ generate_unified_quote imported successfully")
-            
-            # Ensure we have quote data
-            if not self.current_quote_data:
-                print("❌ No quote data available")
-                return False
-            print("✓ Quote data available")
-            
-            # Get customer information
-            customer_name = self.company_var.get() or "Customer Name"
-            contact_name = self.contact_person_var.get() or "Contact Person"
-            
-            # Employee info for template
-            employee_name = ""
-            employee_phone = ""
-            employee_email = ""
-            if hasattr(self, 'selected_employee_info') and self.selected_employee_info:
-                emp = self.selected_employee_info
-                employee_name = f"{emp['first_name']} {emp['last_name']}"
-                employee_phone = emp.get('work_phone', '')
-                employee_email = emp.get('work_email', '')
-            
-            # Use the current quote number (should be set by now)
-            quote_number = self.current_quote_number or f"Q-{datetime.datetime.now().strftime('%Y%m%d-%H%M')}"
-            
-            # Prepare quote items for unified system
-            quote_items = []
-            
-            # Add main item
-            main_item = {
-                'part_number': self.current_quote_data.get('original_part_number', ''),
-                'quantity': int(self.main_qty_var.get() or 1),
-                'type': 'main',
-                'data': self.current_quote_data
-            }
-            quote_items.append(main_item)
-            
-            # Add any spare parts from quote tree
-            for item in self.quote_items:
-                if item.get('type') != 'main':  # Skip main item as it's already added
-                    quote_items.append(item)
-            
-            # Debug output
-            print(f"Unified Template Export Debug:")
-            print(f"  Quote Items Count: {len(quote_items)}")
-            print(f"  Customer: {customer_name}")
-            print(f"  Export Path: {export_path}")
-            print(f"  Employee Name: {employee_name}")
-            print(f"  Employee Phone: {employee_phone}")
-            
-            # Generate the quote using unified template system
-            print("🚀 Calling generate_unified_quote with parameters:")
-            print(f"   Quote Items: {len(quote_items)} items")
-            print(f"   Customer: {customer_name}")
-            print(f"   Quote Number: {quote_number}")
-            print(f"   Output Path: {export_path}")
-            
-            success = generate_unified_quote(
-                quote_items=quote_items,
-                customer_name=customer_name,
-                attention_name=contact_name,
-                quote_number=quote_number,
-                output_path=export_path,
-                employee_info={
-                    'name': employee_name,
-                    'phone': employee_phone,
-                    'email': employee_email
-                },
-                # Additional variables that might be needed
-                lead_time=self.lead_time_var.get() if hasattr(self, 'lead_time_var') else 'In Stock'
-            )
-            
-            print(f"Unified template export success: {success}")
-            if success and os.path.exists(export_path):
-                print(f"File created successfully: {os.path.getsize(export_path)} bytes")
-            else:
-                print(f"File not found after export: {export_path}")
-            
-            return success
-        except Exception as e:
-            print(f"Unified template export failed: {e}")
-            import traceback
-            traceback.print_exc()
-            return False
-    
     def new_quote(self):
         """Start a new quote"""
-        # If there's a current quote number that hasn't been saved, remove it from pending
-        if self.current_quote_number and self.current_quote_number in self.pending_quote_numbers:
-            self.pending_quote_numbers.remove(self.current_quote_number)
+        # Hand back a quote number that was never saved so it can be reissued
+        if self.current_quote_number:
+            self.db_manager.release_quote_number(self.current_quote_number)
         
         self.part_number_var.set("")
         self.clear_customer_info()  # Clear customer information
         self.main_qty_var.set("1")
         self.current_quote_data = None
         self.current_quote_number = None
+        self.saved_quote_number = None
         
         # Clear quote items
         self.quote_items = []
@@ -960,6 +1012,15 @@ class MainWindow:
         
         ttk.Label(main_frame, text="Select a quote to open:", font=("Arial", 12, "bold")).pack(anchor=tk.W, pady=(0, 10))
         
+        # Search box - empty shows the recent quotes, otherwise ranked full-text matches
+        search_frame = ttk.Frame(main_frame)
+        search_frame.pack(fill=tk.X, pady=(0, 10))
+        ttk.Label(search_frame, text="Search:").pack(side=tk.LEFT, padx=(0, 10))
+        search_var = tk.StringVar()
+        search_entry = ttk.Entry(search_frame, textvariable=search_var)
+        search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        search_entry.focus()
+        
         # Create listbox with quotes
         listbox_frame = ttk.Frame(main_frame)
         listbox_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
@@ -971,11 +1032,39 @@ class MainWindow:
         quote_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
+        shown_quotes = list(recent_quotes)
+        
+        def populate(quotes):
+            shown_quotes[:] = quotes
+            quote_listbox.delete(0, tk.END)
+            for quote in quotes:
+                date_str = quote['created_at'][:10] if quote['created_at'] else 'Unknown'
+                display_text = f"{quote['quote_number']} - {quote['customer_name']} - ${quote['total_price']:.2f} - {date_str}"
+                quote_listbox.insert(tk.END, display_text)
+        
+        pending_search = []
+        
+        def run_search():
+            pending_search.clear()
+            term = search_var.get().strip()
+            if not term:
+                populate(recent_quotes)
+                return
+            try:
+                populate(self.db_manager.search_quotes(term, limit=50))
+            finally:
+                self.db_manager.disconnect()
+        
+        def on_search_changed(*args):
+            # Wait for a pause in typing before querying
+            if pending_search:
+                selection_window.after_cancel(pending_search.pop())
+            pending_search.append(selection_window.after(200, run_search))
+        
+        search_var.trace_add('write', on_search_changed)
+        
         # Populate listbox
-        for quote in recent_quotes:
-            date_str = quote['created_at'][:10] if quote['created_at'] else 'Unknown'
-            display_text = f"{quote['quote_number']} - {quote['customer_name']} - ${quote['total_price']:.2f} - {date_str}"
-            quote_listbox.insert(tk.END, display_text)
+        populate(recent_quotes)
         
         # Button frame
         button_frame = ttk.Frame(main_frame)
@@ -987,7 +1076,7 @@ class MainWindow:
                 messagebox.showwarning("No Selection", "Please select a quote to open.")
                 return
             
-            selected_quote = recent_quotes[selection[0]]
+            selected_quote = shown_quotes[selection[0]]
             quote_number = selected_quote['quote_number']
             
             # Load the complete quote data
@@ -1010,11 +1099,19 @@ class MainWindow:
                 
                 # Set quote number
                 self.current_quote_number = quote_data['quote_number']
+                self.saved_quote_number = quote_data['quote_number']  # re-quote: saving updates it
                 self.update_quote_number_display()
                 
-                # Note: Loading quote items would require more complex logic
-                # to rebuild the original quote items structure
-                messagebox.showinfo("Quote Loaded", f"Quote {quote_number} basic information loaded.\nNote: Individual quote items would need additional implementation to fully restore.")
+                # Restore the saved items as they were added (no re-parsing)
+                self.quote_items = list(quote_data['quote_items'])
+                self._refresh_quote_tree()
+                
+                legacy_count = sum(1 for item in self.quote_items if item.get('legacy'))
+                message = f"Quote {quote_number} loaded with {len(self.quote_items)} item(s)."
+                if legacy_count:
+                    message += f"\n{legacy_count} item(s) were saved by an older version and only keep their description and price."
+                messagebox.showinfo("Quote Loaded", message)
+                self.status_var.set(f"Opened quote {quote_number}")
                 
                 selection_window.destroy()
                 
@@ -1070,14 +1167,12 @@ class MainWindow:
                 customer_email=self.email_var.get().strip(),
                 quote_items=self.quote_items,
                 total_price=total_value,
-                user_initials=user_initials
+                user_initials=user_initials,
+                overwrite=self.current_quote_number == self.saved_quote_number
             )
             
             if success:
-                # Remove from pending numbers since it's now saved
-                if self.current_quote_number in self.pending_quote_numbers:
-                    self.pending_quote_numbers.remove(self.current_quote_number)
-                
+                self.saved_quote_number = self.current_quote_number
                 messagebox.showinfo("Quote Saved", f"Quote {self.current_quote_number} saved successfully!")
                 self.status_var.set(f"Quote {self.current_quote_number} saved to database")
             else:
@@ -1745,218 +1840,8 @@ Length pricing is automatically calculated for probe assemblies.
                 quote_window.destroy()
         
         def export_full_quote():
-            print("=== EXPORT_FULL_QUOTE FUNCTION CALLED ===")
-            
-            if not self.quote_items:
-                messagebox.showwarning("Empty Quote", "No items to export.")
-                return
-            
-            # Validate user is selected (same logic as main export)
-            user_initials = self.get_user_initials()
-            if not user_initials:
-                messagebox.showerror("User Required", 
-                    "You must select a user before exporting a quote.\n\n"
-                    "This is required for quote number generation and tracking.")
-                return
-            
-            # Generate quote number if not already generated
-            if not self.current_quote_number:
-                if not self.generate_new_quote_number():
-                    return  # Failed to generate quote number
-            
-            try:
-                # Use quote number as default filename
-                default_filename = f"{self.current_quote_number}.docx"
-                
-                filename = filedialog.asksaveasfilename(
-                    defaultextension=".docx",
-                    filetypes=[("Word documents", "*.docx"), ("All files", "*.*")],
-                    title="Export Complete Quote",
-                    initialfile=default_filename
-                )
-                
-                if filename:
-                    print(f"Export filename selected: {filename}")
-                    
-                    # Get customer information
-                    customer_name = self.company_var.get() or "Customer Name"
-                    contact_name = self.contact_person_var.get() or "Contact Person"
-                    
-                    # Get employee information for template
-                    employee_name = ""
-                    employee_phone = ""
-                    employee_email = ""
-                    if hasattr(self, 'selected_employee_info') and self.selected_employee_info:
-                        emp = self.selected_employee_info
-                        employee_name = f"{emp['first_name']} {emp['last_name']}"
-                        employee_phone = emp.get('work_phone', '')
-                        employee_email = emp.get('work_email', '')
-                        print(f"🔧 Using employee: {employee_name} ({employee_phone}, {employee_email})")
-                    else:
-                        print("⚠ No employee selected, using default contact info")
-                    
-                    # Use the generated quote number (guaranteed to exist at this point)
-                    assert self.current_quote_number is not None
-                    quote_number = self.current_quote_number
-                    
-                    # Determine if this is a multi-item quote
-                    is_multi_item = len(self.quote_items) > 1
-                    main_items = [item for item in self.quote_items if item.get('type') == 'main']
-                    
-                    # Try to use unified template system for both single and multi-item quotes
-                    print(f"🚀 Unified template export with {len(self.quote_items)} items")
-                    
-                    success = False
-                    
-                    try:
-                        from export.unified_templates.unified_template_processor import generate_unified_quote
-                        
-                        # Prepare employee info
-                        employee_info = {
-                            'name': employee_name,
-                            'phone': employee_phone,
-                            'email': employee_email
-                        }
-                        
-                        success = generate_unified_quote(
-                            quote_items=self.quote_items,
-                            customer_name=customer_name,
-                            attention_name=contact_name,
-                            quote_number=quote_number,
-                            output_path=filename,
-                            employee_info=employee_info,
-                            lead_time=self.lead_time_var.get()
-                        )
-                        print(f"✅ Unified template export success: {success}")
-                        
-                    except Exception as e:
-                        print(f"❌ Unified template export failed: {e}")
-                        import traceback
-                        traceback.print_exc()
-                        
-                        # Fallback to old system if unified fails
-                        if is_multi_item:
-                            print("🔄 Falling back to composed multi-item export...")
-                            try:
-                                from export.word_template_processor import generate_composed_multi_item_quote
-                                
-                                employee_info = {
-                                    'name': employee_name,
-                                    'phone': employee_phone,
-                                    'email': employee_email
-                                }
-                                
-                                success = generate_composed_multi_item_quote(
-                                    quote_items=self.quote_items,
-                                    customer_name=customer_name,
-                                    attention_name=contact_name,
-                                    quote_number=quote_number,
-                                    output_path=filename,
-                                    employee_info=employee_info
-                                )
-                                print(f"✅ Fallback multi-item export success: {success}")
-                                
-                            except Exception as fallback_e:
-                                print(f"❌ Fallback multi-item export also failed: {fallback_e}")
-                                success = False
-                            else:
-                                print("🔄 Falling back to single-item export...")
-                                try:
-                                    from export.word_template_processor import generate_word_quote
-                                    
-                                    main_item = main_items[0]
-                                    part_number = main_item.get('part_number', '')
-                                    quote_data = main_item.get('data', {})
-                                    
-                                    model = part_number.split('-')[0] if '-' in part_number else part_number[:6]
-                                    unit_price = quote_data.get('total_price') or quote_data.get('base_price') or 0.0
-                                    unit_price_str = f"{unit_price:.2f}" if unit_price > 0 else "Please Contact"
-                                    
-                                    success = generate_word_quote(
-                                        model=model,
-                                        customer_name=customer_name,
-                                        attention_name=contact_name,
-                                        quote_number=quote_number,
-                                        part_number=part_number,
-                                        unit_price=unit_price_str,
-                                        supply_voltage=quote_data.get('voltage', '115VAC'),
-                                        probe_length=str(quote_data.get('probe_length', 12)),
-                                        output_path=filename,
-                                        employee_name=employee_name,
-                                        employee_phone=employee_phone,
-                                        employee_email=employee_email,
-                                        lead_time=self.lead_time_var.get(),
-                                        **quote_data
-                                    )
-                                    print(f"✅ Fallback single-item export success: {success}")
-                                    
-                                except Exception as fallback_e:
-                                    print(f"❌ Fallback single-item export also failed: {fallback_e}")
-                                    success = False
-                        
-                        # If unified system fails, try RTF fallback
-                        if not success:
-                            print("📄 Trying RTF template fallback...")
-                            success = self._try_rtf_template_export(filename)
-                    
-                    if not success:
-                        print("❌ Template export failed, using old quote generator...")
-                        # Create combined data for export
-                        combined_data = {
-                            'type': 'multi_item_quote',
-                            'items': self.quote_items,
-                            'total_items': len(self.quote_items),
-                            'total_price': total_quote_value,
-                            'export_timestamp': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        }
-                        
-                        # Export to Word using old system
-                        output_path = self.quote_generator.generate_quote(combined_data, output_path=filename)
-                        success = bool(output_path)
-                    
-                    if success:
-                        # Save quote to database after successful export
-                        try:
-                            # Calculate total for database save
-                            customer_name = self.company_var.get().strip()
-                            if customer_name and self.current_quote_number:
-                                if self.db_manager.connect():
-                                    # At this point current_quote_number is guaranteed to be set
-                                    assert self.current_quote_number is not None
-                                    
-                                    db_save_success = self.db_manager.save_quote(
-                                        quote_number=self.current_quote_number,
-                                        customer_name=customer_name,
-                                        customer_email=self.email_var.get().strip(),
-                                        quote_items=self.quote_items,
-                                        total_price=total_quote_value,
-                                        user_initials=user_initials
-                                    )
-                                    
-                                    if db_save_success:
-                                        # Remove from pending numbers since it's now saved
-                                        if self.current_quote_number in self.pending_quote_numbers:
-                                            self.pending_quote_numbers.remove(self.current_quote_number)
-                                        
-                                        self.status_var.set(f"Quote {self.current_quote_number} exported and saved to database")
-                                    else:
-                                        self.status_var.set(f"Quote {self.current_quote_number} exported (database save failed)")
-                                    
-                                    self.db_manager.disconnect()
-                        except Exception as db_error:
-                            print(f"Database save error: {db_error}")
-                            # Don't show error to user since export was successful
-                        
-                        messagebox.showinfo("Export Success", f"Complete quote exported to:\n{filename}\n\nQuote Number: {self.current_quote_number}")
-                        quote_window.destroy()
-                    else:
-                        messagebox.showerror("Export Error", "Failed to export quote using all available methods.")
-                    
-            except Exception as e:
-                print(f"Export error: {e}")
-                import traceback
-                traceback.print_exc()
-                messagebox.showerror("Export Error", f"Failed to export quote:\n{str(e)}")
+            # Same background pipeline as the main Export button
+            self.export_quote(title="Export Complete Quote", on_complete=quote_window.destroy)
         
         ttk.Button(button_frame, text="Remove Selected", command=remove_selected_item).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(button_frame, text="Clear Quote", command=clear_quote).pack(side=tk.LEFT, padx=(0, 10))
@@ -1965,12 +1850,31 @@ Length pricing is automatically calculated for probe assemblies.
     
     def on_closing(self):
         """Handle window closing"""
-        if messagebox.askokcancel("Quit", "Do you want to quit?"):
+        if self.job_runner.active_job('export'):
+            prompt = "An export is still running and will be cancelled. Quit anyway?"
+        else:
+            prompt = "Do you want to quit?"
+        if messagebox.askokcancel("Quit", prompt):
+            self.job_runner.shutdown()
             self.root.destroy()
     
     def run(self):
         """Start the application main loop"""
+        self.root.after_idle(self._record_startup_time)
         self.root.mainloop()
+    
+    def _record_startup_time(self):
+        """Log start-to-interactive time once the first idle event shows the window is ready"""
+        self.startup_seconds = time.perf_counter() - self._started_at
+        logger.info("Startup: window interactive after %.0f ms", self.startup_seconds * 1000)
+        
+        # Launch benchmark: report the time and close without prompting
+        probe_path = os.environ.get(STARTUP_PROBE_ENV)
+        if probe_path:
+            with open(probe_path, 'w') as f:
+                json.dump({'startup_ms': self.startup_seconds * 1000}, f)
+            self.job_runner.shutdown()
+            self.root.destroy()
 
     # def parse_spare_part(self):
     #     """Parse spare part number and show information (HIDDEN - will be implemented later)"""
@@ -2138,129 +2042,17 @@ Length pricing is automatically calculated for probe assemblies.
             return False
         
         try:
-            # Connect to database and generate quote number
-            if not self.db_manager.connect():
-                messagebox.showerror("Database Error", "Could not connect to database to generate quote number.")
-                return False
-            
-            # Generate quote number considering both database and pending numbers
-            self.current_quote_number = self._generate_quote_number_with_pending(user_initials)
+            # Reserved atomically in the database, so other workstations never get the same number
+            customer_name = self.company_var.get().strip() or "CUSTOMER"
+            self.current_quote_number = self.db_manager.generate_quote_number(user_initials, customer_name)
+            logger.debug("Generated quote number: %s", self.current_quote_number)
             self.update_quote_number_display()
             self.status_var.set(f"Generated quote number: {self.current_quote_number}")
-            
-            # Add to pending numbers (will be removed when saved)
-            self.pending_quote_numbers.add(self.current_quote_number)
-            
             return True
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to generate quote number: {str(e)}")
             return False
-        finally:
-            self.db_manager.disconnect()
-    
-    def _generate_quote_number_with_pending(self, user_initials: str) -> str:
-        """
-        Generate quote number considering both database and pending numbers.
-        This ensures proper incrementing even within the same session.
-        Format: CustomerName UserInitialsMMDDYYLetter (e.g., ACME ZF071925A)
-        """
-        from datetime import datetime
-        
-        # Get customer name from GUI
-        customer_name = self.company_var.get().strip() or "CUSTOMER"
-        
-        # Ensure uppercase initials
-        user_initials = user_initials.upper()
-        
-        # Get current date in MMDDYY format
-        today = datetime.now()
-        date_str = today.strftime("%m%d%y")
-        
-        # Base quote number pattern (without customer prefix for database lookup)
-        base_quote_number = f"{user_initials}{date_str}"
-        
-        print(f"DEBUG: Generating quote number for user {user_initials}, date {date_str}")
-        print(f"DEBUG: Customer name from GUI: '{customer_name}'")
-        print(f"DEBUG: Base quote number pattern: {base_quote_number}")
-        
-        # Find existing quotes for this user/date combination in database
-        # Look for any quote numbers that contain the base pattern (user initials + date)
-        # This ensures we find all quotes for this user/date regardless of customer name
-        query = """
-        SELECT quote_number FROM quotes 
-        WHERE quote_number LIKE ? 
-        ORDER BY quote_number DESC
-        """
-        
-        existing_quotes = self.db_manager.execute_query(query, (f"%{base_quote_number}%",))
-        print(f"DEBUG: Found {len(existing_quotes)} existing quotes in database")
-        for quote in existing_quotes:
-            print(f"DEBUG: Database quote: {quote['quote_number']}")
-        
-        # Combine database quotes with pending quotes for this base pattern
-        all_quotes = []
-        
-        # Add database quotes
-        for quote in existing_quotes:
-            all_quotes.append(quote['quote_number'])
-        
-        # Add pending quotes that match this base pattern
-        print(f"DEBUG: Pending quotes: {list(self.pending_quote_numbers)}")
-        for pending_quote in self.pending_quote_numbers:
-            if base_quote_number in pending_quote:
-                all_quotes.append(pending_quote)
-                print(f"DEBUG: Added pending quote: {pending_quote}")
-        
-        # Sort all quotes to find the highest letter
-        all_quotes.sort(reverse=True)
-        print(f"DEBUG: All quotes after sorting: {all_quotes}")
-        
-        # Determine next letter
-        if not all_quotes:
-            # First quote of the day
-            next_letter = 'A'
-            print(f"DEBUG: No existing quotes, using letter: {next_letter}")
-        else:
-            # Extract letters from all quotes and find the highest one
-            all_letters = []
-            for quote in all_quotes:
-                print(f"DEBUG: Processing quote: {quote}")
-                # Handle both old format (ZF071925A) and new format (Customer ZF071925A)
-                if base_quote_number in quote:
-                    base_index = quote.find(base_quote_number)
-                    if base_index != -1 and base_index + len(base_quote_number) < len(quote):
-                        letter = quote[base_index + len(base_quote_number)]
-                        if letter.isalpha():
-                            all_letters.append(letter)
-                            print(f"DEBUG: Extracted letter '{letter}' from '{quote}'")
-                        else:
-                            print(f"DEBUG: Non-alphabetic character '{letter}' found in '{quote}', skipping")
-                    else:
-                        print(f"DEBUG: Could not extract letter from '{quote}'")
-                else:
-                    print(f"DEBUG: Quote '{quote}' does not contain base pattern '{base_quote_number}'")
-            
-            print(f"DEBUG: All extracted letters: {all_letters}")
-            
-            if not all_letters:
-                next_letter = 'A'
-                print(f"DEBUG: No valid letters found, using: {next_letter}")
-            else:
-                # Find the highest letter
-                highest_letter = max(all_letters)
-                print(f"DEBUG: Highest letter found: {highest_letter}")
-                next_letter = chr(ord(highest_letter) + 1)
-                print(f"DEBUG: Next letter: {next_letter}")
-                
-                # Handle wrap-around if we somehow get past Z
-                if ord(next_letter) > ord('Z'):
-                    next_letter = 'A'  # Reset to A (or could be 'AA', 'AB', etc.)
-                    print(f"DEBUG: Wrapped around to: {next_letter}")
-        
-        result = f"{customer_name} {base_quote_number}{next_letter}"
-        print(f"DEBUG: Final quote number: {result}")
-        return result
     
     def add_to_quote_tree(self, item_type, part_number, description, quantity, unit_price, total_price):
         """Add an item to the quote tree display"""
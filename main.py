@@ -4,6 +4,11 @@ Babbitt Quote Generator - Main Application
 Professional quote generator for Babbitt International products
 """
 
+import time
+
+_STARTED_AT = time.perf_counter()  # start of the start-to-interactive metric
+
+import multiprocessing
 import sys
 import os
 
@@ -24,7 +29,7 @@ def main():
     
     try:
         print("Using advanced professional GUI interface...")
-        app = MainWindow()
+        app = MainWindow(started_at=_STARTED_AT)
         app.run()
     except KeyboardInterrupt:
         print("\nApplication closed by user")
@@ -34,4 +39,6 @@ def main():
         traceback.print_exc()
 
 if __name__ == "__main__":
+    # Export worker processes start from this file in the packaged app
+    multiprocessing.freeze_support()
     main() 
\ No newline at end of file
@@ -0,0 +1,59 @@
+"""
+Shared test setup
+Exports made by tests use a fresh export cache under the test's temp dir, never the user's app data cache,
+and the default database is a temp copy, never the checked-in database/quotes.db
+"""
+
+import os
+import shutil
+
+import pytest
+
+import database.db_manager as db_manager
+import export.export_cache as export_cache
+from database.db_manager import DatabaseManager
+from export.export_cache import ExportCache
+
+SHIPPED_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'database', 'quotes.db')
+
+
+@pytest.fixture(scope='session', autouse=True)
+def default_db_copy(tmp_path_factory):
+    """
+    Point DatabaseManager() (and so every parser and engine built without a
+    path) at one copy of the shipped database for the whole session. Opening
+    a pooled connection switches the file to WAL, which would otherwise
+    rewrite the tracked database/quotes.db.
+    """
+    db_path = str(tmp_path_factory.mktemp('default_db') / 'quotes.db')
+    shutil.copy(SHIPPED_DB_PATH, db_path)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(db_manager, 'DEFAULT_DB_PATHS', (db_path,))
+        yield db_path
+
+
+@pytest.fixture(autouse=True)
+def isolated_export_cache(tmp_path, monkeypatch):
+    """Point the shared export cache at an empty directory for each test"""
+    cache = ExportCache(tmp_path / 'export_cache', max_bytes=export_cache.EXPORT_CACHE_MAX_MB * 1024 * 1024)
+    monkeypatch.setattr(export_cache, '_export_cache', cache)
+    return cache
+
+
+@pytest.fixture
+def db_copy(request, tmp_path):
+    """
+    DatabaseManager on a copy of the shipped quotes database.
+
+    On unittest-style classes (@pytest.mark.usefixtures('db_copy')) it is also
+    set as self.db, with self.db_path and self.temp_dir, before setUp runs.
+    """
+    db_path = str(tmp_path / 'quotes.db')
+    shutil.copy(SHIPPED_DB_PATH, db_path)
+    db = DatabaseManager(db_path)
+    if request.instance is not None:
+        request.instance.temp_dir = str(tmp_path)
+        request.instance.db_path = db_path
+        request.instance.db = db
+    yield db
+    db.disconnect()
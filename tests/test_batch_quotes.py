@@ -0,0 +1,107 @@
+"""
+Test headless batch quoting
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from core import batch_quotes
+
+
+class TestBatchQuotes(unittest.TestCase):
+    """Test cases for core.batch_quotes"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.temp_dir, "requests.csv")
+        with open(self.csv_path, "w", encoding="utf-8") as f:
+            f.write('customer,contact,part_number,quantity,quote_number\n')
+            f.write('ACME,Jane Doe,"LS2000-115VAC-S-10""",2,ACME ZF010125A\n')
+            f.write('ACME,Jane Doe,"LS7000-115VAC-H-24""",1,ACME ZF010125A\n')
+            f.write('Globex,Hank,"LS2000-115VAC-S-10""-XSP",1,Globex ZF010125A\n')
+            f.write('Initech,Bill,BOGUS-PART,1,Initech ZF010125A\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_read_groups_rows_into_quotes(self):
+        """CSV rows are grouped per quote in first-seen order"""
+        quotes = batch_quotes.read_quote_requests(self.csv_path)
+        self.assertEqual([q['customer'] for q in quotes], ['ACME', 'Globex', 'Initech'])
+        self.assertEqual([i['quantity'] for i in quotes[0]['items']], [2, 1])
+
+    def test_read_jsonl(self):
+        """JSONL accepts whole quotes and flat rows"""
+        path = os.path.join(self.temp_dir, "requests.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({'customer': 'ACME', 'items': [{'part_number': 'LS2000-115VAC-S-10"'}]}) + "\n")
+            f.write(json.dumps({'customer': 'Globex', 'part_number': 'LS2000-115VAC-S-10"', 'quantity': 3}) + "\n")
+        quotes = batch_quotes.read_quote_requests(path)
+        self.assertEqual(len(quotes), 2)
+        self.assertEqual(quotes[1]['items'], [{'part_number': 'LS2000-115VAC-S-10"', 'quantity': 3}])
+
+    def test_assign_quote_numbers_unique_within_run(self):
+        """Two quotes for one customer get different letters"""
+        class FakeDB:
+            def generate_quote_number(self, initials, customer):
+                return f"{customer} {initials}010125A"
+
+        quotes = [batch_quotes._normalize_quote({'customer': 'ACME'}) for _ in range(3)]
+        batch_quotes.assign_quote_numbers(quotes, 'ZF', FakeDB())
+        self.assertEqual([q['quote_number'] for q in quotes],
+                         ['ACME ZF010125A', 'ACME ZF010125B', 'ACME ZF010125C'])
+
+    def test_bump_letter_matches_allocator(self):
+        """Letters run past Z the way the quote number allocator numbers them"""
+        self.assertEqual(batch_quotes._bump_letter('ACME ZF010125Z'), 'ACME ZF010125AA')
+        self.assertEqual(batch_quotes._bump_letter('ACME ZF010125AZ'), 'ACME ZF010125BA')
+        self.assertEqual(batch_quotes._bump_letter('ZF010125'), 'ZF010125A')
+
+    def test_reserved_numbers_released(self):
+        """Numbers reserved for a run are handed back whether or not it saved anything"""
+        class FakeDB:
+            released = []
+
+            def generate_quote_number(self, initials, customer):
+                return f"{customer} {initials}010125A"
+
+            def release_quote_number(self, quote_number):
+                self.released.append(quote_number)
+
+        db = FakeDB()
+        quotes = [batch_quotes._normalize_quote({'customer': name}) for name in ('ACME', 'Globex')]
+        quotes.append(batch_quotes._normalize_quote({'customer': 'Initech', 'quote_number': 'Initech ZF010125C'}))
+        reserved = batch_quotes.assign_quote_numbers(quotes, 'ZF', db)
+        self.assertEqual(reserved, ['ACME ZF010125A', 'Globex ZF010125A'])
+        batch_quotes.release_quote_numbers(reserved, db)
+        self.assertEqual(db.released, reserved)
+
+    def test_run_batch_writes_documents_and_manifest(self):
+        """Valid quotes are exported, bad ones reported, results identical across worker counts"""
+        quotes = batch_quotes.read_quote_requests(self.csv_path)
+        totals = None
+        for workers in (1, 2):
+            output_dir = os.path.join(self.temp_dir, f"out{workers}")
+            manifest = batch_quotes.run_batch(quotes, output_dir, workers=workers)
+
+            self.assertEqual(manifest['succeeded'], 2)
+            self.assertEqual(manifest['failed'], 1)
+            for entry in manifest['results']:
+                self.assertIn('total_ms', entry['timings'])
+                if entry['success']:
+                    self.assertTrue(os.path.exists(entry['output_path']))
+            self.assertTrue(manifest['results'][2]['errors'])
+            json.dumps(manifest)
+
+            run_totals = [entry['total_price'] for entry in manifest['results']]
+            if totals is not None:
+                self.assertEqual(run_totals, totals)
+            totals = run_totals
+        self.assertEqual(totals[0], 455.0 * 2 + manifest['results'][0]['items'][1]['unit_price'])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
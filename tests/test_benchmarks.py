@@ -0,0 +1,69 @@
+"""
+Test the pricing benchmark suite
+Fixtures must load, results must be JSON-ready and comparisons must gate regressions
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+import pytest
+
+from benchmarks.pricing_benchmarks import (
+    DEFAULT_FIXTURES, autocomplete_probes, compare, load_fixtures, main, run_suite
+)
+
+
+class TestPricingBenchmarks(unittest.TestCase):
+    """Test cases for benchmarks.pricing_benchmarks"""
+
+    def test_load_fixtures(self):
+        """Comment and blank lines are skipped; prices are parsed"""
+        fixtures = load_fixtures(DEFAULT_FIXTURES)
+        self.assertEqual(len(fixtures), 100)
+        self.assertEqual(fixtures[0], ('LS2000-115VAC-S-10"', 455.0))
+
+    def test_autocomplete_probes(self):
+        """Each section is probed with up to three typed characters"""
+        probes = autocomplete_probes(['LS2000-115VAC-S-10"-XSP'])
+        self.assertEqual(probes, [('model', 'L'), ('model', 'LS'), ('model', 'LS2'),
+                                  ('voltage', '1'), ('voltage', '11'), ('voltage', '115'),
+                                  ('material', 'S'),
+                                  ('option', 'X'), ('option', 'XS'), ('option', 'XSP')])
+
+    @pytest.mark.usefixtures('db_copy')
+    def test_run_suite(self):
+        """A short run produces JSON-serializable timings for the chosen stages"""
+        results = run_suite(['parse_cold', 'pricing', 'autocomplete'], rounds=1, warmup=0, db_path=self.db_path)
+        self.assertEqual(list(results['stages']), ['parse_cold', 'pricing', 'autocomplete'])
+        for stage in results['stages'].values():
+            self.assertGreater(stage['ops'], 0)
+            self.assertGreater(stage['median_s'], 0)
+        json.dumps(results)
+
+        with self.assertRaises(ValueError):
+            run_suite(['nope'])
+
+    def test_compare_gates_regressions(self):
+        """Only stages slower than the threshold fail, and the CLI exits non-zero for them"""
+        baseline = {'stages': {'pricing': {'median_s': 1.0}, 'parse_cold': {'median_s': 1.0}}}
+        current = {'stages': {'pricing': {'median_s': 1.1}, 'parse_cold': {'median_s': 1.3},
+                              'autocomplete': {'median_s': 5.0}}}
+        rows = {row['stage']: row for row in compare(baseline, current, threshold=0.15)}
+        self.assertEqual(set(rows), {'pricing', 'parse_cold'})
+        self.assertFalse(rows['pricing']['regressed'])
+        self.assertTrue(rows['parse_cold']['regressed'])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            paths = []
+            for name, data in (('baseline.json', baseline), ('current.json', current)):
+                paths.append(os.path.join(temp_dir, name))
+                with open(paths[-1], 'w') as f:
+                    json.dump(data, f)
+            self.assertEqual(main(['compare', *paths]), 1)
+            self.assertEqual(main(['compare', *paths, '--threshold', '0.5']), 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,85 @@
+"""
+Test compiled bullet-point extraction for multi-item quotes
+Filling a compiled BulletTemplate must give the same bullets as scanning the template document
+"""
+
+import glob
+import os
+import unittest
+
+from docx import Document
+
+from export.template_cache import TemplateCache
+from export.template_engine import CompiledText, render_text
+from export.unified_templates.unified_template_processor import BulletTemplate, UnifiedTemplateProcessor
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), '..', 'export', 'templates')
+
+ITEM_VARIABLES = {
+    'model': 'LS2000', 'supply_voltage': '115VAC', 'probe_material': '316 Stainless Steel',
+    'probe_size': '1/2', 'probe_length': '24', 'pc_size': '3/4"', 'pc_type': 'NPT', 'pc_matt': 'SS',
+    'pc_rate': '', 'ins_long': '4" UHMWPE', 'ins_material': 'UHMWPE', 'ins_length': '4', 'ins_temp': '180',
+    'max_pressure': '300 PSI', 'max_temperature': '180°F', 'quantity': '2', 'unit_price': '$545.00',
+    'part_number': 'LS2000-115VAC-S-24"', 'customer_name': 'ACME', 'attention_name': 'Pat',
+    'date': 'January 1, 2026', 'quote_number': 'ZF010126A', 'employee_name': 'Jo', 'lead_time': 'In Stock',
+}
+
+
+def scan_bullets(path, variables):
+    """Bullets found by walking every paragraph and table cell of the document"""
+    doc = Document(path)
+    texts = [p.text for p in doc.paragraphs]
+    texts += [p.text for t in doc.tables for r in t.rows for c in r.cells for p in c.paragraphs]
+    bullets = []
+    for text in texts:
+        line = render_text(text.strip(), variables).strip() if text.strip() else ''
+        if not line:
+            continue
+        if line[0] in '•-*':
+            if line[1:].strip():
+                bullets.append(line[1:].strip())
+        elif ':' in line and any(k in line.lower() for k in
+                                 ['voltage', 'output', 'connection', 'insulator', 'probe', 'housing', 'warranty']):
+            bullets.append(line)
+    return bullets
+
+
+class TestBulletTemplate(unittest.TestCase):
+    """Test cases for BulletTemplate and its use by UnifiedTemplateProcessor"""
+
+    def test_compiled_text(self):
+        """Pieces split once and fill with a chosen missing-value policy"""
+        text = CompiledText('Probe: {{probe_size}}" x {{probe_length}}"')
+        self.assertEqual(text.names, {'probe_size', 'probe_length'})
+        self.assertEqual(text.render({'probe_size': '1/2', 'probe_length': 10}), 'Probe: 1/2" x 10"')
+        self.assertEqual(text.render({}, missing=lambda name: ''), 'Probe: " x "')
+        self.assertEqual(text.render({}), render_text(text.text, {}))
+        self.assertTrue(CompiledText('plain').is_static)
+
+    def test_matches_document_scan(self):
+        """Every model template yields the same bullets as the full scan"""
+        cache = TemplateCache()
+        paths = sorted(glob.glob(os.path.join(TEMPLATES_DIR, '*_template.docx')))
+        self.assertTrue(paths)
+        for path in paths:
+            for variables in (ITEM_VARIABLES, {}):
+                bullets = cache.get(path).derived('bullet_lines', BulletTemplate).render(variables)
+                self.assertEqual(bullets, scan_bullets(path, variables), os.path.basename(path))
+
+    def test_compiled_once_per_template(self):
+        """Items of the same model reuse one compiled template"""
+        cache = TemplateCache()
+        path = os.path.join(TEMPLATES_DIR, 'LS2000_template.docx')
+        compiled = cache.get(path).derived('bullet_lines', BulletTemplate)
+        self.assertIs(cache.get(path).derived('bullet_lines', BulletTemplate), compiled)
+
+        processor = UnifiedTemplateProcessor()
+        first = processor._extract_bullet_points_from_template('LS2000', ITEM_VARIABLES)
+        second = processor._extract_bullet_points_from_template('LS2000', dict(ITEM_VARIABLES, probe_length='36'))
+        self.assertTrue(first)
+        self.assertNotEqual(first, second)
+        self.assertTrue(any('36' in bullet for bullet in second))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,73 @@
+"""
+Test the in-memory reference catalog snapshot
+Lookups must match the direct SQL queries and pick up reference table edits
+"""
+
+import sqlite3
+import unittest
+
+import pytest
+
+
+@pytest.mark.usefixtures('db_copy')
+class TestCatalogSnapshot(unittest.TestCase):
+    """Test cases for catalog-backed DatabaseManager lookups"""
+
+    def _sql_one(self, query, params=()):
+        results = self.db.execute_query(query, params)
+        return results[0] if results else None
+
+    def test_lookups_match_sql(self):
+        """Every code lookup returns the same row as the table query"""
+        for row in self.db.execute_query("SELECT code FROM materials"):
+            self.assertEqual(self.db.get_material_info(row['code']),
+                             self._sql_one("SELECT * FROM materials WHERE code = ?", (row['code'],)))
+        for row in self.db.execute_query("SELECT code FROM options"):
+            self.assertEqual(self.db.get_option_info(row['code']),
+                             self._sql_one("SELECT * FROM options WHERE code = ?", (row['code'],)))
+        for row in self.db.execute_query("SELECT code FROM insulators"):
+            self.assertEqual(self.db.get_insulator_info(row['code']),
+                             self._sql_one("SELECT * FROM insulators WHERE code = ?", (row['code'],)))
+        for row in self.db.execute_query("SELECT part_number FROM spare_parts"):
+            self.assertEqual(self.db.get_spare_part_by_part_number(row['part_number']),
+                             self._sql_one("SELECT * FROM spare_parts WHERE part_number = ?",
+                                           (row['part_number'],)))
+        for row in self.db.execute_query("SELECT model_number FROM product_models"):
+            self.assertEqual(self.db.get_model_info(row['model_number'])['model_number'],
+                             row['model_number'])
+
+        self.assertEqual(self.db.get_voltage_options(),
+                         self.db.execute_query("SELECT * FROM voltages ORDER BY model_family, is_default DESC, voltage"))
+        self.assertEqual(self.db.get_process_connection_info('NPT', '3/4"', 'SS'),
+                         self._sql_one("SELECT * FROM process_connections WHERE type = 'NPT' "
+                                       "AND size = '3/4\"' AND material = 'SS' "
+                                       "AND (rating IS NULL OR rating = '')"))
+
+    def test_prefix_model_lookup(self):
+        """Partial model codes still resolve like the LIKE query did"""
+        self.assertEqual(self.db.get_model_info('ls2000')['model_number'], 'LS2000')
+        self.assertIsNone(self.db.get_model_info('NOPE'))
+
+    def test_results_are_copies(self):
+        """Mutating a returned row must not leak into the snapshot"""
+        info = self.db.get_material_info('S')
+        info['base_price_adder'] = 9999
+        self.assertNotEqual(self.db.get_material_info('S')['base_price_adder'], 9999)
+
+    def test_refresh_after_table_change(self):
+        """A reference table edit produces a new snapshot version"""
+        version = self.db.catalog_version
+        self.assertGreater(version, 0)
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("UPDATE materials SET base_price_adder = 123.0 WHERE code = 'S'")
+        conn.commit()
+        conn.close()
+
+        self.db.refresh_catalog()
+        self.assertGreater(self.db.catalog_version, version)
+        self.assertEqual(self.db.get_material_info('S')['base_price_adder'], 123.0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,97 @@
+"""
+Test composed multi-item quotes with item sections rendered in worker processes
+The parallel path must give the same document body as rendering every item in process
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from docx import Document
+from lxml import etree
+
+import export.word_template_processor as word_template_processor
+from export.word_template_processor import (
+    WordTemplateProcessor, _add_main_item_section, _render_main_item_fragments,
+    generate_composed_multi_item_quote
+)
+
+
+def main_item(model, voltage, length, price):
+    return {
+        'type': 'main', 'part_number': f'{model}-{voltage}-S-{length}"', 'quantity': 2,
+        'data': {'model': model, 'voltage': voltage, 'probe_length': length, 'total_price': price,
+                 'probe_material_name': '316 Stainless Steel', 'probe_diameter': '1/2"',
+                 'insulator': {'material': 'U', 'length': 4}, 'options': []},
+    }
+
+
+QUOTE_ITEMS = [
+    main_item('LS2000', '115VAC', 10, 455.0),
+    main_item('LS2100', '24VDC', 24, 612.5),
+    {'type': 'spare', 'part_number': 'LS2000-ELECTRONICS', 'quantity': 1,
+     'data': {'description': 'Replacement electronics', 'pricing': {'total_price': 265.0}}},
+    main_item('LS6000', '115VAC', 36, 845.0),
+    main_item('NOPE9000', '115VAC', 12, 100.0),
+]
+
+
+def body_xml(path):
+    return etree.tostring(Document(path).element.body)
+
+
+class TestComposedSections(unittest.TestCase):
+    """Test cases for rendering composed quote item sections"""
+
+    def generate(self, temp_dir, name, workers):
+        path = os.path.join(temp_dir, name)
+        self.assertTrue(generate_composed_multi_item_quote(
+            QUOTE_ITEMS, 'ACME', 'Pat', 'ZF010126A', path, section_workers=workers))
+        return path
+
+    def test_parallel_matches_serial(self):
+        """Sections from a process pool are spliced in item order, same as in-process"""
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch.object(word_template_processor, 'COMPOSED_PARALLEL_MIN_ITEMS', 2):
+            serial = body_xml(self.generate(temp_dir, 'serial.docx', 1))
+            parallel = body_xml(self.generate(temp_dir, 'parallel.docx', 2))
+        self.assertEqual(parallel, serial)
+        for part_number in ('LS2000-115VAC-S-10"', 'LS2100-24VDC-S-24"', 'LS6000-115VAC-S-36"'):
+            self.assertIn(part_number.encode(), serial)
+
+    def test_fragments_in_item_order(self):
+        """One fragment per main item; items without a template get None"""
+        processor = WordTemplateProcessor()
+        items = [item for item in QUOTE_ITEMS if item['type'] == 'main']
+        fragments = _render_main_item_fragments(items, processor, 'Jo', '555', 'jo@example.com', workers=1)
+        self.assertEqual(len(fragments), 4)
+        self.assertIsNone(fragments[3])
+        self.assertIn(b'x 10"', fragments[0])
+        self.assertIn(b'x 24"', fragments[1])
+        self.assertNotIn(b'{{', b''.join(fragments[:3]))
+
+    def test_unpicklable_items_render_in_process(self):
+        """Item data that cannot be sent to workers falls back to rendering in process"""
+        processor = WordTemplateProcessor()
+        items = [item for item in QUOTE_ITEMS if item['type'] == 'main'][:3]
+        unpicklable = [dict(item, data=dict(item['data'], on_change=lambda: None)) for item in items]
+        with patch.object(word_template_processor, 'COMPOSED_PARALLEL_MIN_ITEMS', 2), \
+                patch.object(word_template_processor, 'ProcessPoolExecutor') as pool:
+            fragments = _render_main_item_fragments(unpicklable, processor, 'Jo', '555', 'jo@example.com', workers=2)
+        pool.assert_not_called()
+        self.assertEqual(fragments, _render_main_item_fragments(items, processor, 'Jo', '555', 'jo@example.com',
+                                                                workers=1))
+
+    def test_add_main_item_section(self):
+        """The single-item helper splices the fragment into the document body"""
+        doc = Document()
+        processor = WordTemplateProcessor()
+        self.assertTrue(_add_main_item_section(doc, QUOTE_ITEMS[0], 1, processor, 'Jo', '555', 'jo@example.com'))
+        self.assertTrue(any('x 10"' in paragraph.text for paragraph in doc.paragraphs))
+        self.assertEqual(doc.element.body[-1].tag.rsplit('}', 1)[1], 'sectPr')
+        self.assertFalse(_add_main_item_section(doc, QUOTE_ITEMS[4], 2, processor, 'Jo', '555', 'jo@example.com'))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
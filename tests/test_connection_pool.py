@@ -0,0 +1,113 @@
+"""
+Test the shared SQLite connection pool
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from database import connection_pool
+from database.connection_pool import ConnectionPool, get_pool, is_network_path
+from database.db_manager import DatabaseManager
+
+
+class TestConnectionPool(unittest.TestCase):
+    """Test cases for thread-affine pooled connections"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "pool.db")
+        self.pool = ConnectionPool(self.db_path, row_factory=sqlite3.Row)
+
+    def tearDown(self):
+        self.pool.close_all()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_same_thread_reuses_connection(self):
+        """Repeated acquires on one thread return the same handle"""
+        self.assertIs(self.pool.acquire(), self.pool.acquire())
+        self.assertEqual(self.pool.size, 1)
+
+    def test_threads_get_own_connection(self):
+        """Each thread gets a separate connection"""
+        main_conn = self.pool.acquire()
+        other = []
+        thread = threading.Thread(target=lambda: other.append(self.pool.acquire()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(main_conn, other[0])
+
+    def test_pragmas_applied(self):
+        """WAL and tuned pragmas are set on new connections"""
+        conn = self.pool.acquire()
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0].lower(), "wal")
+        self.assertEqual(conn.execute("PRAGMA temp_store").fetchone()[0], 2)  # MEMORY
+
+    def test_network_share_keeps_rollback_journal(self):
+        """Databases on a network share get DELETE journaling and no mmap"""
+        self.assertTrue(is_network_path(r'\\server\share\quotes.db'))
+        self.assertTrue(is_network_path('//server/share/quotes.db'))
+
+        with mock.patch.object(connection_pool, 'is_network_path', return_value=True):
+            pool = ConnectionPool(self.db_path)
+        try:
+            conn = pool.acquire()
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0].lower(), "delete")
+            self.assertEqual(conn.execute("PRAGMA mmap_size").fetchone()[0], 0)
+        finally:
+            pool.close_all()
+
+    def test_release_rolls_back(self):
+        """Uncommitted work does not survive a release"""
+        conn = self.pool.acquire()
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.commit()
+        conn.execute("INSERT INTO t VALUES (1)")
+        self.pool.release(conn)
+        self.assertEqual(self.pool.acquire().execute("SELECT COUNT(*) FROM t").fetchone()[0], 0)
+
+    def test_database_manager_reconnect_is_pooled(self):
+        """DatabaseManager.connect()/disconnect() no longer reopen the file"""
+        db = DatabaseManager(self.db_path)
+        db.connect()
+        first = db.connection
+        db.disconnect()
+        self.assertIsNone(db.connection)
+        db.connect()
+        self.assertIs(db.connection, first)
+        db.disconnect()
+
+    def test_sibling_disconnect_keeps_open_transaction(self):
+        """Only the last manager to disconnect rolls back the shared connection"""
+        first = DatabaseManager(self.db_path)
+        first.connect()
+        first.connection.execute("CREATE TABLE t (x INTEGER)")
+        first.connection.commit()
+        first.connection.execute("INSERT INTO t VALUES (1)")
+
+        second = DatabaseManager(self.db_path)
+        second.connect()
+        second.disconnect()
+        self.assertTrue(first.connection.in_transaction)
+        first.connection.commit()
+        first.disconnect()
+        self.assertEqual(self.pool.acquire().execute("SELECT COUNT(*) FROM t").fetchone()[0], 1)
+
+    def test_pools_keyed_by_row_factory(self):
+        """Callers asking for different row factories get their own pools"""
+        rows = get_pool(self.db_path, row_factory=sqlite3.Row)
+        plain = get_pool(self.db_path)
+        self.assertIsNot(rows, plain)
+        self.assertIs(get_pool(self.db_path, row_factory=sqlite3.Row), rows)
+        self.assertIs(rows.acquire().row_factory, sqlite3.Row)
+        self.assertIsNone(plain.acquire().row_factory)
+        rows.close_all()
+        plain.close_all()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,124 @@
+"""
+Test the content-addressed export cache
+Identical quotes are copied from the cache instead of re-rendered; the cache stays under its size cap
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import export.export_cache as export_cache
+from export.export_cache import ExportCache, cached_export, export_key, get_export_cache, use_export_cache
+from export.word_template_processor import WordTemplateProcessor, generate_word_quote
+
+
+class TestExportCache(unittest.TestCase):
+    """Test cases for ExportCache and export_key"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.cache = ExportCache(self.root / 'cache', max_bytes=1024)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, name, data):
+        path = self.root / name
+        path.write_bytes(data)
+        return str(path)
+
+    def test_key_is_stable(self):
+        """Key ignores dict order but follows payload, generator and template contents"""
+        template = self.root / 'LS2000_template.docx'
+        template.write_bytes(b'first')
+        key = export_key('quote', {'a': 1, 'b': [1, 2]}, [template])
+        self.assertEqual(export_key('quote', {'b': [1, 2], 'a': 1}, [template, template]), key)
+        self.assertNotEqual(export_key('quote', {'a': 2, 'b': [1, 2]}, [template]), key)
+        self.assertNotEqual(export_key('other', {'a': 1, 'b': [1, 2]}, [template]), key)
+
+        template.write_bytes(b'second')
+        os.utime(template, ns=(0, os.stat(template).st_mtime_ns + 1_000_000))
+        self.assertNotEqual(export_key('quote', {'a': 1, 'b': [1, 2]}, [template]), key)
+
+    def test_fetch_and_store(self):
+        """A stored document is copied to later outputs and counted as a hit"""
+        output = self.write('out.docx', b'rendered')
+        self.assertFalse(self.cache.fetch('k1', output))
+        self.cache.store('k1', output)
+
+        copy = str(self.root / 'copy.docx')
+        self.assertTrue(self.cache.fetch('k1', copy))
+        self.assertEqual(Path(copy).read_bytes(), b'rendered')
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['entries']), (1, 1, 1))
+        self.assertEqual(stats['hit_rate'], 0.5)
+
+    def test_least_recently_used_evicted(self):
+        """Past the size cap the entry used longest ago goes first"""
+        for index, key in enumerate(('old', 'used', 'new')):
+            self.cache.store(key, self.write(f'{key}.docx', b'x' * 400))
+            entry = self.cache._entry_path(key)
+            os.utime(entry, (index, index))
+            if key == 'used':
+                self.assertTrue(self.cache.fetch('old', str(self.root / 'again.docx')))
+        self.assertFalse(self.cache._entry_path('used').exists())
+        self.assertTrue(self.cache._entry_path('old').exists())
+        self.assertTrue(self.cache._entry_path('new').exists())
+        self.assertEqual(self.cache.stats()['evictions'], 1)
+
+    def test_hard_link(self):
+        """Link mode puts the cached file itself at the output path"""
+        cache = ExportCache(self.root / 'linked', max_bytes=1024, link=True)
+        cache.store('k1', self.write('out.docx', b'rendered'))
+        output = self.write('existing.docx', b'stale')
+        self.assertTrue(cache.fetch('k1', output))
+        self.assertEqual(Path(output).read_bytes(), b'rendered')
+        self.assertTrue(os.path.samefile(output, cache._entry_path('k1')))
+
+    def test_failed_render_not_stored(self):
+        """Only successful exports are cached"""
+        with patch.object(export_cache, '_export_cache', self.cache):
+            output = str(self.root / 'out.docx')
+            self.assertFalse(cached_export('quote', {}, [], output, lambda: False))
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    def test_zero_cap_turns_cache_off(self):
+        """A cache capped at 0 bytes renders every export and stores nothing"""
+        previous = get_export_cache()
+        renders = []
+        output = str(self.root / 'out.docx')
+
+        def render():
+            renders.append(self.write('out.docx', b'rendered'))
+            return True
+
+        with use_export_cache(ExportCache(self.root / 'off', max_bytes=0)) as cache:
+            self.assertTrue(cached_export('quote', {}, [], output, render))
+            self.assertTrue(cached_export('quote', {}, [], output, render))
+        self.assertEqual(len(renders), 2)
+        self.assertEqual(cache.stats()['entries'], 0)
+        self.assertIs(get_export_cache(), previous)
+
+    def test_generate_word_quote_hit(self):
+        """Exporting the same quote twice renders it once"""
+        args = ('LS2000', 'ACME', 'Pat', 'ZF010126A', 'LS2000-115VAC-S-10"', '$455.00', '115VAC', '10')
+        cache = ExportCache(self.root / 'quotes', max_bytes=10 * 1024 * 1024)
+        with patch.object(export_cache, '_export_cache', cache), \
+                patch.object(WordTemplateProcessor, 'process_template',
+                             autospec=True, side_effect=WordTemplateProcessor.process_template) as process:
+            first = str(self.root / 'first.docx')
+            second = str(self.root / 'second.docx')
+            self.assertTrue(generate_word_quote(*args, first))
+            self.assertTrue(generate_word_quote(*args, second))
+            self.assertEqual(process.call_count, 1)
+            self.assertEqual(Path(first).read_bytes(), Path(second).read_bytes())
+
+            self.assertTrue(generate_word_quote(*args, second, quantity='3'))
+            self.assertEqual(process.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
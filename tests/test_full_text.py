@@ -0,0 +1,92 @@
+"""
+Test FTS5-backed search for quotes, spare parts and customers
+"""
+
+import os
+import shutil
+import sqlite3
+import unittest
+
+import pytest
+
+from database.customer_db_manager import CustomerDBManager
+from database.full_text import build_match_query
+
+
+@pytest.mark.usefixtures('db_copy')
+class TestFullTextSearch(unittest.TestCase):
+    """Test cases for the full-text search methods"""
+
+    def setUp(self):
+        """Work on a copy of the shipped customers database too"""
+        self.customers_path = os.path.join(self.temp_dir, "customers.db")
+        shutil.copy(os.path.join(os.path.dirname(__file__), '..', 'database', 'customers.db'), self.customers_path)
+
+    def test_match_query(self):
+        """Search words become quoted prefix terms; punctuation cannot inject syntax"""
+        self.assertEqual(build_match_query('acme zf01'), '"acme"* "zf01"*')
+        self.assertEqual(build_match_query('x" OR y'), '"x"* "OR"* "y"*')
+        self.assertIsNone(build_match_query(' -" '))
+
+    def test_quotes_follow_inserts_updates_and_deletes(self):
+        """Triggers keep the index in step with the quotes table"""
+        self.assertEqual(self.db.search_quotes('Zyxwidget'), [])
+
+        connection = sqlite3.connect(self.db_path)
+        connection.execute("INSERT INTO quotes (quote_number, customer_name, customer_email, total_price) "
+                           "VALUES ('ZYXWIDGET ZF010125A', 'Zyxwidget Corp', 'buyer@zyx.example', 100.0)")
+        connection.execute("INSERT INTO quotes (quote_number, customer_name, total_price) "
+                           "VALUES ('OTHER ZF010125A', 'Other Co Zyxwidget Division', 50.0)")
+        connection.commit()
+
+        results = self.db.search_quotes('zyxw')
+        self.assertEqual([r['quote_number'] for r in results], ['ZYXWIDGET ZF010125A', 'OTHER ZF010125A'])
+        self.assertEqual(results[0]['snippet'], '[ZYXWIDGET] ZF010125A')
+        self.assertEqual(len(self.db.search_quotes('zyxw', limit=1)), 1)
+
+        connection.execute("UPDATE quotes SET customer_name = 'Renamed' WHERE quote_number = 'OTHER ZF010125A'")
+        connection.execute("DELETE FROM quotes WHERE quote_number = 'ZYXWIDGET ZF010125A'")
+        connection.commit()
+        connection.close()
+        self.assertEqual(self.db.search_quotes('zyxw'), [])
+        self.assertEqual([r['quote_number'] for r in self.db.search_quotes('renamed')], ['OTHER ZF010125A'])
+
+    def test_mid_word_terms_fall_back_to_substring_search(self):
+        """A date code inside a quote number or part number still finds it"""
+        connection = sqlite3.connect(self.db_path)
+        connection.execute("INSERT INTO quotes (quote_number, customer_name, total_price) "
+                           "VALUES ('ZQ093187A', 'Date Code Co', 10.0)")
+        connection.commit()
+        connection.close()
+        self.assertEqual([r['quote_number'] for r in self.db.search_quotes('093187')], ['ZQ093187A'])
+
+        results = self.db.search_spare_parts('2000')
+        self.assertTrue(results)
+        self.assertTrue(all('2000' in r['part_number'] + (r['name'] or '') + (r['description'] or '')
+                            for r in results))
+
+    def test_blank_term_lists_everything(self):
+        """An empty search still returns every quote, as the LIKE query did"""
+        total = self.db.execute_query("SELECT COUNT(*) AS n FROM quotes")[0]['n']
+        self.assertEqual(len(self.db.search_quotes('')), total)
+
+    def test_spare_parts_ranked_and_filtered(self):
+        """Part number hits outrank description hits and the model filter applies"""
+        results = self.db.search_spare_parts('electronics', 'LS2000')
+        self.assertTrue(results)
+        self.assertTrue(all('LS2000' in (r['compatible_models'] or '') for r in results))
+        ranks = [r['rank'] for r in results]
+        self.assertEqual(ranks, sorted(ranks))
+
+    def test_customers(self):
+        """Customer search matches word prefixes in company or contact name"""
+        manager = CustomerDBManager(self.customers_path)
+        customer_id = manager.add_customer("Quxley Industries", "Pat Vantablack")
+        self.assertEqual([c['id'] for c in manager.search_customers('quxl')], [customer_id])
+        self.assertEqual([c['id'] for c in manager.search_customers('vanta')], [customer_id])
+        manager.delete_customer(customer_id)
+        self.assertEqual(manager.search_customers('quxl'), [])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,85 @@
+"""
+Test the background job runner
+"""
+
+import threading
+import time
+import unittest
+
+from utils.job_runner import JobRunner, CANCELLED, DONE, FAILED
+
+
+def wait_for(runner, job, timeout=5.0):
+    """Poll the runner like the Tk loop would until the job finishes"""
+    deadline = time.monotonic() + timeout
+    while job.active and time.monotonic() < deadline:
+        runner.poll()
+        time.sleep(0.01)
+    runner.poll()
+
+
+class TestJobRunner(unittest.TestCase):
+    """Test cases for JobRunner"""
+
+    def setUp(self):
+        self.runner = JobRunner(max_workers=2)
+
+    def tearDown(self):
+        self.runner.shutdown()
+
+    def test_callbacks_run_on_polling_thread(self):
+        """Results and progress are delivered on the thread that polls"""
+        seen = []
+
+        def work(job):
+            job.report(0.5, "halfway")
+            return threading.current_thread().name
+
+        job = self.runner.submit("work", work,
+                                 on_progress=lambda j: seen.append(('progress', j.message, threading.current_thread())),
+                                 on_done=lambda r: seen.append(('done', r, threading.current_thread())))
+        wait_for(self.runner, job)
+
+        self.assertEqual(job.status, DONE)
+        self.assertEqual([entry[0] for entry in seen], ['progress', 'done'])
+        self.assertTrue(seen[1][1].startswith('job'))
+        self.assertTrue(all(entry[2] is threading.current_thread() for entry in seen))
+
+    def test_duplicate_key_is_ignored(self):
+        """A second job with an active key is refused until the first finishes"""
+        release = threading.Event()
+        first = self.runner.submit("export", lambda job: release.wait(5), key='export')
+        self.assertIsNone(self.runner.submit("export", lambda job: None, key='export'))
+
+        release.set()
+        wait_for(self.runner, first)
+        self.assertIsNotNone(self.runner.submit("export", lambda job: None, key='export'))
+
+    def test_cancel_and_failure(self):
+        """Cancelled jobs report on_cancel; exceptions reach on_error"""
+        started = threading.Event()
+        outcomes = []
+
+        def cancellable(job):
+            started.set()
+            while True:
+                job.check_cancelled()
+                time.sleep(0.01)
+
+        job = self.runner.submit("loop", cancellable, on_cancel=lambda: outcomes.append('cancelled'))
+        started.wait(5)
+        self.assertTrue(self.runner.cancel(job.id))
+        wait_for(self.runner, job)
+
+        def broken(job):
+            raise ValueError("boom")
+
+        failing = self.runner.submit("broken", broken, on_error=lambda e: outcomes.append(str(e)))
+        wait_for(self.runner, failing)
+
+        self.assertEqual((job.status, failing.status), (CANCELLED, FAILED))
+        self.assertEqual(outcomes, ['cancelled', 'boom'])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
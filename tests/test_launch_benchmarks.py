@@ -0,0 +1,56 @@
+"""
+Test the launch benchmark and build size report
+A fake app stands in for the GUI: it writes the startup probe file the way MainWindow does
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+from benchmarks.launch_benchmarks import (
+    STARTUP_PROBE_ENV, bundle_size, format_results, launch_once, measure_launch
+)
+
+# Writes {"startup_ms": 12.5} to the probe path, like MainWindow._record_startup_time
+FAKE_APP = [sys.executable, '-c',
+            f"import json, os; json.dump({{'startup_ms': 12.5}}, open(os.environ['{STARTUP_PROBE_ENV}'], 'w'))"]
+
+
+class TestLaunchBenchmarks(unittest.TestCase):
+    """Test cases for benchmarks.launch_benchmarks"""
+
+    def test_measure_launch(self):
+        """Each run records wall time and the app-reported startup time"""
+        results = measure_launch(FAKE_APP, runs=2, warmup=0)
+        interactive = results['stages']['launch_interactive']
+        self.assertEqual(interactive['samples_s'], [0.0125, 0.0125])
+        wall = results['stages']['launch_wall']
+        self.assertEqual(wall['rounds'], 2)
+        self.assertGreater(wall['median_s'], 0)
+        json.dumps(results)
+        self.assertIn('launch_wall', format_results(results))
+
+    def test_launch_without_probe_fails(self):
+        """An app that never reports its startup time is an error, not a zero"""
+        with self.assertRaises(RuntimeError):
+            launch_once([sys.executable, '-c', 'pass'])
+
+    def test_bundle_size(self):
+        """Sizes are grouped by entry below the onedir contents directory"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.makedirs(os.path.join(temp_dir, '_internal', 'docx'))
+            for relative, size in (('App.exe', 100), (os.path.join('_internal', 'python312.dll'), 300),
+                                   (os.path.join('_internal', 'docx', 'a.pyc'), 50),
+                                   (os.path.join('_internal', 'docx', 'b.pyc'), 70)):
+                with open(os.path.join(temp_dir, relative), 'wb') as f:
+                    f.write(b'x' * size)
+            report = bundle_size(temp_dir)
+            self.assertEqual((report['bytes'], report['files']), (520, 4))
+            self.assertEqual(report['largest'][0], [os.path.join('_internal', 'python312.dll'), 300])
+            self.assertIn([os.path.join('_internal', 'docx'), 120], report['largest'])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
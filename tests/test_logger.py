@@ -0,0 +1,38 @@
+"""
+Test verbosity control and lazy tracing
+"""
+
+import logging
+import unittest
+
+from utils.logger import TRACE, set_verbosity, trace, is_tracing, lazy
+
+
+class TestTracing(unittest.TestCase):
+    """Test cases for trace() and set_verbosity()"""
+
+    def setUp(self):
+        self.logger = logging.getLogger('test_tracing.module')
+        self.addCleanup(self.logger.setLevel, logging.NOTSET)
+
+    def test_trace_is_lazy_when_off(self):
+        """Nothing is formatted or computed while tracing is off"""
+        calls = []
+        self.assertFalse(is_tracing(self.logger))
+        trace(self.logger, "value: %s", lazy(lambda: calls.append(1)))
+        self.assertEqual(calls, [])
+
+    def test_per_logger_verbosity(self):
+        """Tracing one logger leaves the others at the application level"""
+        set_verbosity(TRACE, ['test_tracing'])
+        self.assertTrue(is_tracing(self.logger))
+        self.assertFalse(is_tracing(logging.getLogger('other_module')))
+        with self.assertLogs('test_tracing.module', level=TRACE) as captured:
+            trace(self.logger, "value: %s", lazy(lambda: 42))
+        self.assertEqual(captured.records[0].getMessage(), "value: 42")
+        self.assertEqual(captured.records[0].levelname, "TRACE")
+        logging.getLogger('test_tracing').setLevel(logging.NOTSET)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,82 @@
+"""
+Test compiled model configs for unified quote item sections
+Spec values must fill in exactly as the per-variable replace loop did, and config files are read once
+"""
+
+import glob
+import json
+import os
+import re
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from export.unified_templates.unified_template_processor import (
+    ModelConfig, UnifiedTemplateProcessor, load_model_config_file
+)
+
+CONFIGS_DIR = os.path.join(os.path.dirname(__file__), '..', 'export', 'unified_templates', 'configs')
+
+ITEM_VARIABLES = {
+    'supply_voltage': '115VAC', 'probe_material': '316 Stainless Steel', 'probe_size': '1/2',
+    'probe_length': 24, 'pc_size': '3/4"', 'pc_type': 'NPT', 'pc_matt': 'SS', 'pc_rate': '',
+    'ins_material': 'UHMWPE', 'ins_length': '4', 'ins_temp': 0, 'max_pressure': '300 PSI',
+}
+
+
+def replace_loop(config, variables):
+    """Spec lines as built by substituting every variable into every spec value"""
+    lines = []
+    for spec in config.get('technical_specifications', []):
+        value = spec.get('value', '')
+        for var_name, var_value in variables.items():
+            if var_value:
+                value = value.replace(f"{{{{{var_name}}}}}", str(var_value))
+        value = re.sub(r'\{\{[^}]+\}\}', '', value).strip()
+        if value:
+            lines.append(f"{spec.get('label', '')}: {value}")
+    return lines
+
+
+class TestModelConfig(unittest.TestCase):
+    """Test cases for ModelConfig and load_model_config_file"""
+
+    def test_matches_replace_loop(self):
+        """Every shipped config gives the same spec lines as the replace loop"""
+        paths = sorted(glob.glob(os.path.join(CONFIGS_DIR, '*_config.json')))
+        self.assertTrue(paths)
+        for path in paths:
+            with open(path) as f:
+                data = json.load(f)
+            config = ModelConfig(data)
+            for variables in (ITEM_VARIABLES, {}, {'supply_voltage': '24VDC'}):
+                self.assertEqual(config.spec_lines(variables), replace_loop(data, variables), os.path.basename(path))
+
+    def test_config_read_once(self):
+        """The file is parsed once and again only after it changes"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / 'LS9999_config.json'
+            path.write_text(json.dumps({'technical_specifications': [{'label': 'Probe', 'value': '{{probe_size}}"'}]}))
+            first = load_model_config_file(path)
+            with patch('export.unified_templates.unified_template_processor.json.load') as load:
+                self.assertIs(load_model_config_file(path), first)
+                load.assert_not_called()
+
+            path.write_text(json.dumps({'technical_specifications': [{'label': 'Probe', 'value': '{{probe_size}} in'}]}))
+            os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+            self.assertEqual(load_model_config_file(path).spec_lines({'probe_size': '1/2'}), ['Probe: 1/2 in'])
+
+    def test_single_item_section(self):
+        """The single-item section lists the filled spec values"""
+        processor = UnifiedTemplateProcessor()
+        item = {'part_number': 'LS2000-115VAC-S-10"', 'quantity': 1, 'type': 'main',
+                'data': {'total_price': 455.0, 'supply_voltage': '115VAC', 'probe_length': 10}}
+        section = processor._build_single_item_section(item, {})
+        self.assertTrue(section.startswith('1 QTY LS2000-115VAC-S-10"'))
+        self.assertIn('• Supply Voltage: 115VAC', section)
+        self.assertNotIn('{{', section)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,56 @@
+"""
+Test part number parsing and the parse cache
+"""
+
+import sqlite3
+import unittest
+
+import pytest
+
+from core.part_parser import PartNumberParser
+
+
+class TestParseCache(unittest.TestCase):
+    """Test cases for the memoized parse_part_number"""
+
+    def setUp(self):
+        self.parser = PartNumberParser()
+        self.parser.clear_cache()
+
+    def test_repeat_parse_hits_cache(self):
+        """Same part number (any case/whitespace) is parsed once"""
+        first = self.parser.parse_part_number('LS2000-115VAC-S-10"')
+        second = self.parser.parse_part_number('  ls2000-115vac-s-10"  ')
+        self.assertEqual(first, second)
+        stats = self.parser.get_cache_stats()
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hits'], 1)
+
+    def test_cached_results_are_independent(self):
+        """Modifying a returned result does not affect later parses"""
+        result = self.parser.parse_part_number('LS2000-115VAC-S-10"-XSP')
+        result['pricing']['total_price'] = -1
+        result['options'].clear()
+        again = self.parser.parse_part_number('LS2000-115VAC-S-10"-XSP')
+        self.assertGreater(again['pricing']['total_price'], 0)
+        self.assertTrue(again['options'])
+
+    @pytest.mark.usefixtures('db_copy')
+    def test_price_change_invalidates(self):
+        """A catalog change produces a fresh parse with the new price"""
+        self.parser.db = self.db
+
+        before = self.parser.parse_part_number('LS2000-115VAC-S-10"')['pricing']['total_price']
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("UPDATE product_models SET base_price = base_price + 100 WHERE model_number = 'LS2000'")
+        conn.commit()
+        conn.close()
+        self.parser.db.refresh_catalog()
+
+        after = self.parser.parse_part_number('LS2000-115VAC-S-10"')['pricing']['total_price']
+        self.assertEqual(after, before + 100)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,62 @@
+"""
+Test batch pricing against single-configuration pricing
+"""
+
+import itertools
+import unittest
+
+import pytest
+
+from core.pricing_engine import PricingEngine
+
+
+@pytest.mark.usefixtures('db_copy')
+class TestPriceBatch(unittest.TestCase):
+    """Test cases for PricingEngine.price_batch"""
+
+    def setUp(self):
+        self.engine = PricingEngine(self.db)
+
+    def _rows(self):
+        rows = []
+        for model, material, length in itertools.product(
+                ['LS2000', 'LS7000/2', 'FS10000', 'NOPE'], ['S', 'H', 'U', 'TS'], [6, 10, 10.5, 25, 36, 97, 121]):
+            for options, insulator, insulator_length in [([], None, None),
+                                                         (['3/4"OD', 'XSP', '90DEG'], 'TEF', 6),
+                                                         (['VR'], 'U', 19.5)]:
+                rows.append({
+                    'model_code': model, 'voltage': '115VAC', 'material_code': material,
+                    'probe_length': length, 'option_codes': options,
+                    'insulator_code': insulator, 'insulator_length': insulator_length,
+                })
+        return rows
+
+    def test_batch_matches_single_pricing(self):
+        """Every price column equals calculate_complete_pricing for the same row"""
+        rows = self._rows()
+        result = self.engine.price_batch(rows)
+        for i, row in enumerate(rows):
+            single = self.engine.calculate_complete_pricing(
+                *[row.get(field) for field in PricingEngine.BATCH_INPUT_FIELDS])
+            for field in PricingEngine.BATCH_PRICE_FIELDS:
+                self.assertEqual(result[field][i], single[field], (row, field))
+
+    def test_columnar_input_and_breakdown(self):
+        """Columnar input works and breakdown text is only built on request"""
+        columns = {'model_code': ['LS2000', 'LS2000'], 'material_code': ['S', 'S'], 'probe_length': [25, 10]}
+        result = self.engine.price_batch(columns)
+        self.assertNotIn('breakdown', result)
+        self.assertEqual(result['length_cost'], [90.0, 0.0])
+
+        result = self.engine.price_batch(columns, include_breakdown=True)
+        self.assertEqual(result['breakdown'][0][-1], f"TOTAL: ${result['total_price'][0]:.2f}")
+
+    def test_invalid_length_flagged(self):
+        """A bad row is reported without failing the batch"""
+        result = self.engine.price_batch([{'model_code': 'LS2000', 'material_code': 'S', 'probe_length': None}])
+        self.assertEqual(result['success'], [False])
+        self.assertEqual(result['total_price'], [0.0])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
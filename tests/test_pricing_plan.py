@@ -0,0 +1,55 @@
+"""
+Test the compiled pricing plan threshold tables
+"""
+
+import unittest
+
+from core.pricing_plan import (
+    stepped_foot_thresholds, od_option_thresholds, foot_adder_count,
+    od_foot_adder_count, insulator_length_adder
+)
+from database.db_manager import DatabaseManager
+
+
+class TestPricingPlan(unittest.TestCase):
+    """Test cases for precomputed stepped pricing lookups"""
+
+    def test_stepped_foot_thresholds(self):
+        """10" and 6" base models keep their documented thresholds"""
+        self.assertEqual(stepped_foot_thresholds(10.0)[:4], (11.0, 25.0, 37.0, 49.0))
+        self.assertEqual(stepped_foot_thresholds(10.0)[-1], 121.0)
+        self.assertEqual(stepped_foot_thresholds(6.0)[:4], (7.0, 18.0, 30.0, 42.0))
+        self.assertEqual(stepped_foot_thresholds(12.0)[:3], (13.0, 24.0, 36.0))
+
+    def test_foot_adder_counts(self):
+        """Adders start at each threshold, inclusive"""
+        self.assertEqual(foot_adder_count(10.0, 10), 0)
+        self.assertEqual(foot_adder_count(10.0, 11), 1)
+        self.assertEqual(foot_adder_count(10.0, 24), 1)
+        self.assertEqual(foot_adder_count(10.0, 25), 2)
+        self.assertEqual(foot_adder_count(10.0, 200), 10)
+        self.assertEqual(foot_adder_count(6.0, 18), 2)
+
+    def test_od_thresholds(self):
+        """3/4"OD steps every 12" from base + 1" and never past 120\""""
+        self.assertEqual(od_option_thresholds(10.0)[:3], (11.0, 22.0, 34.0))
+        self.assertTrue(all(t <= 120.0 for t in od_option_thresholds(10.0)))
+        self.assertEqual(od_foot_adder_count(10.0, 22), 2)
+
+    def test_insulator_length_brackets(self):
+        """Insulator length adder brackets and $500 cap"""
+        expected = {4: 0.0, 4.5: 150.0, 6: 150.0, 7: 200.0, 10: 250.0, 18: 450.0, 19: 500.0, 30: 500.0}
+        for length, adder in expected.items():
+            self.assertEqual(insulator_length_adder(length), adder, length)
+
+    def test_plan_served_from_catalog(self):
+        """Model plans come from the snapshot and match the model rows"""
+        db = DatabaseManager()
+        plan = db.get_model_plan('FS10000')
+        self.assertEqual(plan.base_length, db.get_model_info('FS10000')['base_length'])
+        self.assertEqual(plan.foot_thresholds, stepped_foot_thresholds(plan.base_length))
+        self.assertEqual(db.calculate_length_cost('S', 'LS2000', 25)['length_cost'], 90.0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
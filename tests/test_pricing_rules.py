@@ -0,0 +1,73 @@
+"""
+Test the shared pricing rules
+DatabaseManager, PricingEngine and SparePartsParser must evaluate the same rule table
+"""
+
+import unittest
+
+import pytest
+
+from core.pricing_engine import PricingEngine
+from core.pricing_plan import (
+    bent_probe_option, default_length_rules, insulator_cost, od_option_cost, prorated_length_adder
+)
+from core.spare_parts_parser import SparePartsParser
+
+
+@pytest.mark.usefixtures('db_copy')
+class TestPricingRules(unittest.TestCase):
+    """Test cases for the rule evaluators in core.pricing_plan"""
+
+    def setUp(self):
+        self.engine = PricingEngine(self.db)
+
+    def test_length_rules_from_catalog_and_json(self):
+        """The length_pricing table and its exported JSON compile to the same rules"""
+        rule = self.db.get_length_rule('LS2000', 'H')
+        self.assertEqual((rule.base_length, rule.adder_per_foot, rule.nonstandard_surcharge), (10.0, 110.0, 300.0))
+        self.assertEqual(default_length_rules()[('LS2000', 'H')], rule)
+        self.assertIsNone(self.db.get_length_rule('LS2000', 'NOPE'))
+
+    def test_prorated_spare_probe_pricing(self):
+        """Spare probe assemblies are prorated per inch past the rule's base length"""
+        self.assertEqual(prorated_length_adder(10, 10.0, 45.0), 0.0)
+        self.assertEqual(prorated_length_adder(22, 10.0, 45.0), 45.0)
+        self.assertEqual(self.db.get_length_rule('LS2000', 'S').prorated_adder(34), 90.0)
+        self.assertEqual(self.db.get_length_rule('LS2000', 'H').prorated_adder(16), 55.0)
+        self.assertEqual(self.db.get_length_rule('LS2000', 'U').prorated_adder(10), 240.0)
+
+        parser = SparePartsParser(self.db)
+        result = parser.parse_spare_part_number('LS2000-H-10"')
+        self.assertEqual(result['pricing_info']['calculated_price'], result['pricing_info']['base_price'])
+        result['variables']['length'] = '22'
+        parser._calculate_spare_part_pricing(result)
+        self.assertEqual(result['pricing_info']['calculated_price'] - result['pricing_info']['base_price'], 110.0)
+
+    def test_option_rules(self):
+        """Bent probe and 3/4"OD options price the same in both call sites"""
+        self.assertEqual(bent_probe_option('90DEG')['price'], 50.0)
+        self.assertFalse(bent_probe_option('270DEG')['valid'])
+        self.assertFalse(bent_probe_option('XDEG')['valid'])
+        self.assertIsNone(bent_probe_option('XSP'))
+        self.assertEqual(od_option_cost(10.0, 22)['price'], 175.0 + 2 * 175.0)
+
+        for length in (10, 11, 22, 34, 60):
+            codes = ['3/4"OD', '90DEG', 'XSP']
+            db_cost = self.db.calculate_option_cost(codes, length, 'LS2000')['total_cost']
+            engine_cost = self.engine._calculate_option_pricing(codes, length, 'LS2000')['total_cost']
+            self.assertEqual(db_cost, engine_cost, length)
+
+    def test_insulator_rules(self):
+        """Teflon waivers and length adders agree across call sites"""
+        self.assertEqual(insulator_cost('TEF', 40.0, 'H')['waived'], 'material_h')
+        self.assertEqual(insulator_cost('TEF', 40.0, 'S', 'TEF')['cost'], 0.0)
+        self.assertEqual(insulator_cost('TEF', 40.0, 'S', 'DEL', 6)['cost'], 190.0)
+
+        for material, model, length in (('H', 'LS2000', None), ('S', 'LS2000', 8), ('S', 'LS7000', 4)):
+            db_cost = self.db.calculate_insulator_cost('TEF', material, model, length)
+            engine_cost = self.engine._calculate_insulator_pricing('TEF', material, model, length)['cost']
+            self.assertEqual(db_cost, engine_cost, (material, model, length))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
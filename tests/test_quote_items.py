@@ -0,0 +1,94 @@
+"""
+Test saving and reloading complete quotes
+Items must come back exactly as they were added, without re-parsing
+"""
+
+import sqlite3
+import unittest
+from unittest import mock
+
+import pytest
+
+from core.part_parser import PartNumberParser
+from database.quote_items import QuoteItems
+
+
+@pytest.mark.usefixtures('db_copy')
+class TestQuoteItems(unittest.TestCase):
+    """Test cases for DatabaseManager.save_quote and load_quote"""
+
+    def setUp(self):
+        main_data = PartNumberParser().parse_part_number('LS2000-115VAC-S-10"')
+        main_data['total_price'] = 450.0  # added by QuoteGenerator in the main window
+        self.items = [
+            {'type': 'main', 'part_number': 'LS2000-115VAC-S-10"', 'customer_name': 'ACME',
+             'quantity': 2, 'data': main_data, 'timestamp': '2025-07-19 10:00:00'},
+            {'type': 'spare', 'part_number': 'LS2000-ELECTRONICS', 'customer_name': 'ACME',
+             'quantity': 1, 'data': {'description': 'LS2000 Electronics', 'pricing': {'total_price': 125.0}},
+             'timestamp': '2025-07-19 10:01:00'},
+        ]
+
+    def test_round_trip(self):
+        """Every item, including the parsed configuration, survives save and load"""
+        self.assertTrue(self.db.save_quote('ACME ZF071925Q', 'ACME', 'buyer@acme.example', self.items, 500.0, 'ZF'))
+        quote = self.db.load_quote('ACME ZF071925Q')
+        self.assertIsInstance(quote['quote_items'], QuoteItems)
+        self.assertEqual(list(quote['quote_items']), self.items)
+
+        rows = quote['items']
+        self.assertEqual([row['item_type'] for row in rows], ['main', 'spare'])
+        self.assertEqual(rows[0]['quantity'], 2)
+        self.assertAlmostEqual(rows[0]['total_price'], 2 * self.items[0]['data']['total_price'])
+        self.assertEqual(rows[1]['description'], 'LS2000 Electronics')
+
+    def test_resave_replaces_items(self):
+        """Saving an opened quote again updates it instead of failing on the number"""
+        self.assertTrue(self.db.save_quote('ACME ZF071925Q', 'ACME', '', self.items, 500.0))
+        self.assertTrue(self.db.save_quote('ACME ZF071925Q', 'ACME Corp', '', self.items[1:], 125.0, overwrite=True))
+        quote = self.db.load_quote('ACME ZF071925Q')
+        self.assertEqual(quote['customer_name'], 'ACME Corp')
+        self.assertEqual(quote['total_price'], 125.0)
+        self.assertEqual(list(quote['quote_items']), self.items[1:])
+
+    def test_existing_number_not_overwritten(self):
+        """Saving a number that is already taken fails and leaves that quote as it was"""
+        self.assertTrue(self.db.save_quote('ACME ZF071925Q', 'ACME', '', self.items, 500.0))
+        self.assertFalse(self.db.save_quote('ACME ZF071925Q', 'Other Co', '', self.items[1:], 125.0))
+        quote = self.db.load_quote('ACME ZF071925Q')
+        self.assertEqual(quote['customer_name'], 'ACME')
+        self.assertEqual(quote['total_price'], 500.0)
+        self.assertEqual(list(quote['quote_items']), self.items)
+
+    def test_legacy_rows(self):
+        """Rows saved before payloads existed still load with their description and price"""
+        self.assertTrue(self.db.save_quote('ACME ZF071925Q', 'ACME', '', self.items, 500.0))
+        connection = sqlite3.connect(self.db_path)
+        connection.execute("UPDATE quote_items SET payload = NULL, item_type = NULL")
+        connection.commit()
+        connection.close()
+
+        items = list(self.db.load_quote('ACME ZF071925Q')['quote_items'])
+        self.assertTrue(all(item['legacy'] for item in items))
+        self.assertEqual([item['part_number'] for item in items], ['LS2000-115VAC-S-10"', 'LS2000-ELECTRONICS'])
+        self.assertEqual(items[1]['data']['pricing']['total_price'], 125.0)
+        self.assertEqual(items[1]['data']['description'], 'LS2000 Electronics')
+
+    def test_save_without_payload_columns(self):
+        """If quote_items cannot be migrated, quotes still save in the old layout"""
+        connection = sqlite3.connect(self.db_path)
+        columns = {row[1] for row in connection.execute("PRAGMA table_info(quote_items)")}
+        for column in ('item_type', 'payload'):
+            if column in columns:
+                connection.execute(f"ALTER TABLE quote_items DROP COLUMN {column}")
+        connection.commit()
+        connection.close()
+
+        with mock.patch('database.db_manager.ensure_quote_items_migrated', return_value=False):
+            self.assertTrue(self.db.save_quote('ACME ZF071925Q', 'ACME', '', self.items, 500.0))
+        items = list(self.db.load_quote('ACME ZF071925Q')['quote_items'])
+        self.assertTrue(all(item['legacy'] for item in items))
+        self.assertEqual([item['part_number'] for item in items], ['LS2000-115VAC-S-10"', 'LS2000-ELECTRONICS'])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
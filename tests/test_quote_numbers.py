@@ -0,0 +1,122 @@
+"""
+Test the quote number allocator
+Numbers must be sequential per user/customer/day, never collide and recycle released reservations
+"""
+
+import sqlite3
+import threading
+import unittest
+from datetime import date
+
+import pytest
+
+from database.db_manager import DatabaseManager
+from database.quote_numbers import QuoteNumberAllocator, letters_to_seq, seq_to_letters
+
+DAY = date(2025, 7, 19)
+
+
+@pytest.mark.usefixtures('db_copy')
+class TestQuoteNumbers(unittest.TestCase):
+    """Test cases for QuoteNumberAllocator"""
+
+    def setUp(self):
+        """Allocate from a copy of the shipped database"""
+        self.allocator = QuoteNumberAllocator(self.db_path)
+
+    def _save(self, quote_number):
+        connection = sqlite3.connect(self.db_path)
+        connection.execute("INSERT INTO quotes (quote_number, customer_name) VALUES (?, 'test')", (quote_number,))
+        connection.commit()
+        connection.close()
+
+    def test_letters(self):
+        """A..Z then AA, AB, ... and back"""
+        self.assertEqual([seq_to_letters(n) for n in (0, 1, 25, 26, 27, 51, 52, 701, 702)],
+                         ['A', 'B', 'Z', 'AA', 'AB', 'AZ', 'BA', 'ZZ', 'AAA'])
+        for n in range(800):
+            self.assertEqual(letters_to_seq(seq_to_letters(n)), n)
+
+    def test_sequence_per_customer(self):
+        """Letters count up per customer and start over for a new one"""
+        numbers = [self.allocator.allocate('zf', 'ACME', DAY) for _ in range(3)]
+        self.assertEqual(numbers, ['ACME ZF071925A', 'ACME ZF071925B', 'ACME ZF071925C'])
+        self.assertEqual(self.allocator.allocate('ZF', 'Other', DAY), 'Other ZF071925A')
+        # The shipped database already holds ZF071925A and ZF071925B
+        self.assertEqual(self.allocator.allocate('ZF', '', DAY), 'ZF071925C')
+
+    def test_overflow_past_z(self):
+        """The 27th quote of the day is AA instead of wrapping to A"""
+        numbers = [self.allocator.allocate('ZF', 'ACME', DAY) for _ in range(28)]
+        self.assertEqual(numbers[25:], ['ACME ZF071925Z', 'ACME ZF071925AA', 'ACME ZF071925AB'])
+        self.assertEqual(len(set(numbers)), 28)
+
+    def test_continues_after_existing_quotes(self):
+        """A new counter starts after quotes already saved, and skips numbers taken since"""
+        self._save('ACME ZF071925A')
+        self._save('ACME ZF071925B')
+        self._save('ACME ZF071925BX-OLD')
+        self.assertEqual(self.allocator.allocate('ZF', 'ACME', DAY), 'ACME ZF071925C')
+        self._save('ACME ZF071925D')
+        self.assertEqual(self.allocator.allocate('ZF', 'ACME', DAY), 'ACME ZF071925E')
+
+    def test_release_and_expiry(self):
+        """Released and expired reservations are reissued; saved ones are not"""
+        first = self.allocator.allocate('ZF', 'ACME', DAY)
+        second = self.allocator.allocate('ZF', 'ACME', DAY)
+        self.assertTrue(self.allocator.release(first))
+        self.assertEqual(self.allocator.allocate('ZF', 'ACME', DAY), first)
+
+        expiring = QuoteNumberAllocator(self.db_path, ttl=0)
+        third = expiring.allocate('ZF', 'ACME', DAY)
+        self.assertEqual(third, 'ACME ZF071925C')
+        self.assertEqual(self.allocator.allocate('ZF', 'ACME', DAY), third)
+
+        self.allocator.release(second)
+        self._save(second)
+        self.assertEqual(self.allocator.allocate('ZF', 'ACME', DAY), 'ACME ZF071925D')
+
+    def test_saved_reservation_not_reissued(self):
+        """A lapsed reservation whose number was saved without confirm() is dropped, not reissued"""
+        first = self.allocator.allocate('ZF', 'ACME', DAY)
+        second = self.allocator.allocate('ZF', 'ACME', DAY)
+        self.allocator.release(first)
+        self.allocator.release(second)
+        self._save(first)
+        self.assertEqual(self.allocator.allocate('ZF', 'ACME', DAY), second)
+        connection = sqlite3.connect(self.db_path)
+        reserved = connection.execute("SELECT quote_number FROM quote_number_reservations").fetchall()
+        connection.close()
+        self.assertEqual(reserved, [(second,)])
+
+    def test_save_quote_confirms_reservation(self):
+        """Saving through DatabaseManager clears the reservation so release is a no-op"""
+        db = DatabaseManager(self.db_path)
+        quote_number = db.generate_quote_number('zf', 'ACME')
+        self.assertTrue(db.save_quote(quote_number, 'ACME', '', [], 0.0, 'ZF'))
+        self.assertFalse(db.release_quote_number(quote_number))
+        self.assertNotEqual(db.generate_quote_number('ZF', 'ACME'), quote_number)
+        db.disconnect()
+
+    def test_concurrent_allocators(self):
+        """Separate allocators (as on separate workstations) never hand out the same number"""
+        results = []
+        lock = threading.Lock()
+
+        def worker():
+            allocator = QuoteNumberAllocator(self.db_path)
+            numbers = [allocator.allocate('ZF', 'ACME', DAY) for _ in range(10)]
+            with lock:
+                results.extend(numbers)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 40)
+        self.assertEqual(len(set(results)), 40)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,86 @@
+"""
+Test quote reporting columns, rollups and CSV export
+Rollups maintained by triggers must always equal a full scan of the quotes
+"""
+
+import io
+import os
+import sqlite3
+import unittest
+
+import pytest
+
+from database.reporting import initials_from_quote_number, query_rollup, rebuild, write_csv
+
+
+@pytest.mark.usefixtures('db_copy')
+class TestReporting(unittest.TestCase):
+    """Test cases for database.reporting and the DatabaseManager report methods"""
+
+    def _items(self, *prices):
+        return [{'type': 'main', 'part_number': 'LS2000-115VAC-S-10"', 'quantity': 1,
+                 'data': {'model': 'LS2000', 'voltage': '115VAC', 'total_price': price}} for price in prices]
+
+    def _rebuilt(self, by):
+        """The same report computed from scratch"""
+        connection = sqlite3.connect(self.db_path)
+        try:
+            with connection:
+                rebuild(connection)
+            return query_rollup(connection, by)
+        finally:
+            connection.close()
+
+    def test_initials(self):
+        """Initials come from the last word of the quote number"""
+        self.assertEqual(initials_from_quote_number('ACME Corp ZF071925A'), 'ZF')
+        self.assertEqual(initials_from_quote_number('JB071025AB'), 'JB')
+        self.assertIsNone(initials_from_quote_number('Quote 42'))
+
+    def test_backfill_and_recent_quotes(self):
+        """Existing quotes get their initials; the Open Quote list filters on the column"""
+        recent = self.db.get_recent_quotes(limit=50, user_initials='jb')
+        self.assertEqual([q['quote_number'] for q in recent], ['ASE JB080425A'])
+        users = {row['user_initials']: row['quote_count'] for row in self.db.get_quote_report('user')}
+        self.assertEqual(users['JB'], 1)
+        self.assertEqual(sum(users.values()),
+                         self.db.execute_query("SELECT COUNT(*) AS n FROM quotes")[0]['n'])
+
+    def test_rollups_follow_saves(self):
+        """New and re-saved quotes update every rollup incrementally"""
+        self.assertTrue(self.db.save_quote('Zed Co QX010125A', 'Zed Co', '', self._items(100.0, 50.0), 150.0, 'qx'))
+        self.assertTrue(self.db.save_quote('Zed Co QX010125B', 'Zed Co', '', self._items(25.0), 25.0, 'QX'))
+        report = self.db.get_quote_report('customer', key='Zed Co')
+        self.assertEqual(report[0]['quote_count'], 2)
+        self.assertAlmostEqual(report[0]['total_value'], 175.0)
+
+        # Re-saving replaces the quote's contribution instead of adding to it
+        self.assertTrue(self.db.save_quote('Zed Co QX010125B', 'Zed Co', '', self._items(30.0, 30.0), 60.0, 'QX',
+                                           overwrite=True))
+        report = self.db.get_quote_report('user', key='QX')
+        self.assertEqual(report[0]['quote_count'], 2)
+        self.assertAlmostEqual(report[0]['total_value'], 210.0)
+
+        for by in ('user', 'customer', 'model'):
+            self.assertEqual(self.db.get_quote_report(by), self._rebuilt(by), by)
+
+    def test_per_day_and_csv(self):
+        """Per-day rows can be filtered by date and written as CSV"""
+        rows = self.db.get_quote_report('user', start_date='2025-08-04', end_date='2025-08-04', per_day=True)
+        self.assertTrue(rows)
+        self.assertTrue(all(row['created_date'] == '2025-08-04' for row in rows))
+
+        text = write_csv(rows, io.StringIO())
+        self.assertTrue(text.startswith('user_initials,created_date,quote_count,total_value\n'))
+        self.assertEqual(len(text.splitlines()), len(rows) + 1)
+
+        path = os.path.join(self.temp_dir, 'report.csv')
+        self.assertEqual(self.db.export_quote_report_csv(path, by='model'), len(self.db.get_quote_report('model')))
+        self.assertTrue(os.path.getsize(path) > 0)
+
+        with self.assertRaises(ValueError):
+            query_rollup(self.db.connection, 'region')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
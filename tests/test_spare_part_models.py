@@ -0,0 +1,96 @@
+"""
+Test the spare_part_models compatibility index
+Model filters must match exact codes and follow edits to spare_parts
+"""
+
+import sqlite3
+import unittest
+
+import pytest
+
+from database.spare_part_models import is_migrated, migrate, parse_compatible_models
+
+
+@pytest.mark.usefixtures('db_copy')
+class TestSparePartModels(unittest.TestCase):
+    """Test cases for the normalized spare part compatibility table"""
+
+    def _part_numbers(self, parts):
+        return {part['part_number'] for part in parts}
+
+    def test_parse_compatible_models(self):
+        """JSON arrays, bare codes and empty values all parse"""
+        self.assertEqual(parse_compatible_models('["LS8000", " LS8000/2 "]'), ['LS8000', 'LS8000/2'])
+        self.assertEqual(parse_compatible_models('ALL'), ['ALL'])
+        self.assertEqual(parse_compatible_models(None), [])
+        self.assertEqual(parse_compatible_models('[]'), [])
+
+    def test_migration_populates_table(self):
+        """Every listed model of every part gets a row"""
+        self.db.get_spare_parts_by_model('LS2000')
+        connection = sqlite3.connect(self.db_path)
+        try:
+            self.assertTrue(is_migrated(connection))
+            expected = sum(len(set(parse_compatible_models(row[0])))
+                           for row in connection.execute("SELECT compatible_models FROM spare_parts"))
+            self.assertEqual(connection.execute("SELECT COUNT(*) FROM spare_part_models").fetchone()[0], expected)
+            self.assertEqual(migrate(connection), expected)
+        finally:
+            connection.close()
+
+    def test_exact_model_match(self):
+        """LS8000 no longer picks up parts listed only for LS8000/2"""
+        parts = self._part_numbers(self.db.get_spare_parts_by_model('LS8000'))
+        self.assertIn('LS8000-R-RECEIVER-CARD', parts)
+        self.assertIn('FUSE-1/2-AMP', parts)
+        self.assertNotIn('LS8000/2-R-RECEIVER-CARD', parts)
+
+        parts = self._part_numbers(self.db.get_spare_parts_by_model('LS8000/2'))
+        self.assertIn('LS8000/2-R-RECEIVER-CARD', parts)
+        self.assertNotIn('LS8000-R-RECEIVER-CARD', parts)
+
+        categories = {part['category'] for part in self.db.get_spare_parts_by_model('LS8000')}
+        self.assertEqual({row['category'] for row in self.db.get_spare_part_categories('LS8000')}, categories)
+
+    def test_all_is_wildcard_and_triggers_follow_edits(self):
+        """Parts marked ALL match any model; inserts, updates and deletes are tracked"""
+        connection = sqlite3.connect(self.db_path)
+        self.db.get_spare_parts_by_model('LS2000')  # migrate before editing
+        connection.execute("INSERT INTO spare_parts (part_number, name, price, category, compatible_models) "
+                           "VALUES ('ZQX-UNIVERSAL', 'Universal Widget', 5.0, 'other', 'ALL')")
+        connection.commit()
+
+        parts = self.db.get_spare_parts_by_model('LS2000')
+        self.assertIn('ZQX-UNIVERSAL', self._part_numbers(parts))
+        self.assertFalse([p for p in parts if p['part_number'] == 'ZQX-UNIVERSAL'][0]['direct_match'])
+        self.assertIn('ZQX-UNIVERSAL', self._part_numbers(self.db.get_spare_parts_by_category('other', 'LT9000')))
+
+        connection.execute("UPDATE spare_parts SET compatible_models = '[\"FS10000\"]' "
+                           "WHERE part_number = 'ZQX-UNIVERSAL'")
+        connection.commit()
+        self.assertNotIn('ZQX-UNIVERSAL', self._part_numbers(self.db.get_spare_parts_by_model('LS2000')))
+        self.assertIn('ZQX-UNIVERSAL', self._part_numbers(self.db.get_spare_parts_by_model('FS10000')))
+
+        connection.execute("DELETE FROM spare_parts WHERE part_number = 'ZQX-UNIVERSAL'")
+        connection.commit()
+        orphans = connection.execute("SELECT COUNT(*) FROM spare_part_models "
+                                     "WHERE spare_part_id NOT IN (SELECT id FROM spare_parts)").fetchone()[0]
+        connection.close()
+        self.assertEqual(orphans, 0)
+
+    def test_validate_compatibility(self):
+        """Validation uses exact codes and reports unknown parts"""
+        result = self.db.validate_spare_part_compatibility('LS8000/2-R-RECEIVER-CARD', 'LS8000')
+        self.assertFalse(result['compatible'])
+        self.assertEqual(result['compatible_models'], ['LS8000/2'])
+
+        result = self.db.validate_spare_part_compatibility('FUSE-1/2-AMP', 'LT9000')
+        self.assertTrue(result['compatible'])
+
+        result = self.db.validate_spare_part_compatibility('NO-SUCH-PART', 'LS2000')
+        self.assertFalse(result['compatible'])
+        self.assertIn('error', result)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
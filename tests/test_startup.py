@@ -0,0 +1,53 @@
+"""
+Test the lazy startup path
+The main window module must not pull in python-docx, exports or the parser at import time
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from core.part_parser import FALLBACK_MATERIAL_CODES, PartNumberParser
+from core.quote_generator import QuoteGenerator
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestStartup(unittest.TestCase):
+    """Test cases for deferred imports and lazy components"""
+
+    def test_main_window_import_is_light(self):
+        """Importing gui.main_window leaves docx, export and the core managers unloaded"""
+        code = ("import sys; import gui.main_window; "
+                "print(','.join(sorted(m for m in sys.modules if m.split('.')[0] in ('docx', 'export') "
+                "or m in ('core.part_parser', 'core.quote_generator', 'core.spare_parts_manager', "
+                "'core.pricing_engine'))))")
+        output = subprocess.run([sys.executable, '-c', code], cwd=PROJECT_ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        self.assertEqual(output, '')
+
+    def test_parser_loads_code_tables_on_first_use(self):
+        """Construction does not query the code tables; first access does"""
+        parser = PartNumberParser()
+        self.assertIsNone(parser._material_codes)
+        self.assertIn('S', parser.material_codes)
+        self.assertIs(parser.material_codes, parser._material_codes)
+
+        parser.db.get_material_codes = lambda: {}
+        parser._material_codes = None
+        self.assertEqual(parser.material_codes, FALLBACK_MATERIAL_CODES)
+
+    def test_quote_generator_imports_docx_on_demand(self):
+        """The plain quote generator still writes documents"""
+        data = {'original_part_number': 'LS2000-115VAC-S-10"', 'model': 'LS2000', 'options': [],
+                'warnings': [], 'errors': []}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'quote.docx')
+            self.assertTrue(QuoteGenerator().generate_quote(data, path))
+            self.assertTrue(os.path.getsize(path) > 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
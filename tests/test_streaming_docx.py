@@ -0,0 +1,87 @@
+"""
+Test the streaming DOCX writer and the streamed master quote export
+A streamed quote must hold exactly the parts and bytes python-docx would save
+"""
+
+import os
+import tempfile
+import unittest
+
+from docx import Document
+
+from benchmarks.export_benchmarks import format_results, run_suite, same_package
+from export.master_quote_generator import MasterQuoteGenerator
+from export.streaming_docx import StreamingDocxWriter
+
+
+def quote_items(count):
+    items = []
+    for i in range(count):
+        if i % 4 == 3:
+            items.append({'type': 'spare', 'part_number': 'LS2000-ELECTRONICS', 'quantity': 1,
+                          'data': {'description': 'Replacement electronics', 'category': 'electronics',
+                                   'pricing': {'total_price': 265.0}}})
+        else:
+            items.append({'type': 'main', 'part_number': f'LS2000-115VAC-S-{10 + i}"', 'quantity': 1 + i % 3,
+                          'data': {'model': 'LS2000', 'voltage': '115VAC', 'probe_length': 10 + i,
+                                   'probe_material_name': '316 Stainless Steel', 'total_price': 455.0 + i,
+                                   'options': ['XSP: Extra Static Protection'] if i % 2 else []}})
+    return items
+
+
+class TestStreamingDocx(unittest.TestCase):
+    """Test cases for StreamingDocxWriter"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def test_master_quote_identical(self):
+        """Streamed master quotes match the python-docx ones part for part"""
+        generator = MasterQuoteGenerator()
+        for count in (1, 2, 9):
+            for streaming in (False, True):
+                self.assertTrue(generator.generate_master_quote(
+                    quote_items(count), 'ACME', 'Pat', 'ACME ZF010126A', self.path(f'{streaming}.docx'),
+                    employee_info={'name': 'Jo', 'phone': '555', 'email': 'jo@example.com'},
+                    lead_time='2 - 3 Weeks', streaming=streaming))
+            self.assertTrue(same_package(self.path('False.docx'), self.path('True.docx')), count)
+
+        doc = Document(self.path('True.docx'))
+        self.assertEqual(len(doc.tables), 2)
+        self.assertEqual(len(doc.tables[1].rows), 11)
+        self.assertEqual(doc.tables[1].rows[-1].cells[3].text, 'TOTAL:')
+
+    def test_streamed_rows_needs_last_table(self):
+        """Rows can only be streamed for the table at the end of the body"""
+        with StreamingDocxWriter(self.path('table.docx')) as writer:
+            table = writer.body.add_table(rows=1, cols=2)
+            writer.body.add_paragraph('after')
+            with self.assertRaises(ValueError):
+                with writer.streamed_rows(table):
+                    pass
+        self.assertEqual(Document(self.path('table.docx')).paragraphs[-1].text, 'after')
+
+    def test_failed_export_leaves_no_file(self):
+        """An exception while streaming removes the partial document"""
+        with self.assertRaises(RuntimeError):
+            with StreamingDocxWriter(self.path('partial.docx')) as writer:
+                writer.body.add_paragraph('started')
+                writer.flush()
+                raise RuntimeError('boom')
+        self.assertFalse(os.path.exists(self.path('partial.docx')))
+
+    def test_export_benchmark(self):
+        """A short benchmark run records both backends and checks they agree"""
+        results = run_suite(sizes=(3,), rounds=1, warmup=0)
+        self.assertEqual(list(results['stages']), ['document_3', 'streaming_3'])
+        self.assertEqual(results['meta']['identical'], {'3': True})
+        self.assertGreater(results['stages']['streaming_3']['bytes'], 0)
+        self.assertIn('streaming_3', format_results(results))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,53 @@
+"""
+Test the in-memory autocomplete suggestion index
+Suggestions must match the SQL queries they replace and follow catalog edits
+"""
+
+import sqlite3
+import unittest
+
+import pytest
+
+
+@pytest.mark.usefixtures('db_copy')
+class TestSuggestionIndex(unittest.TestCase):
+    """Test cases for DatabaseManager.get_autocomplete_suggestions"""
+
+    def _sql_suggestions(self, section_type, partial_text, limit=10):
+        index = self.db.get_suggestion_index
+        self.db.get_suggestion_index = lambda: None
+        try:
+            return [dict(row) for row in self.db.get_autocomplete_suggestions(section_type, partial_text, limit)]
+        finally:
+            self.db.get_suggestion_index = index
+
+    def test_matches_sql(self):
+        """Index results equal the LIKE queries, including name matches and aliases"""
+        self.assertIsNotNone(self.db.get_suggestion_index())
+        for section_type in ('model', 'voltage', 'material', 'option', 'insulator'):
+            for partial_text in ('l', 'LS2', '1', 's', 'tef', 'x', 'xsp', 'c', 'zzz'):
+                self.assertEqual(self.db.get_autocomplete_suggestions(section_type, partial_text, 10),
+                                 self._sql_suggestions(section_type, partial_text, 10),
+                                 (section_type, partial_text))
+
+    def test_repeat_lookups_cached_and_refreshed(self):
+        """Repeated prefixes hit the cache; catalog edits rebuild the index"""
+        index = self.db.get_suggestion_index()
+        self.db.get_autocomplete_suggestions('option', 'x')
+        self.db.get_autocomplete_suggestions('option', 'X')
+        self.assertEqual(index.stats()['cache']['hits'], 1)
+
+        connection = sqlite3.connect(self.db_path)
+        connection.execute("INSERT INTO options (code, name, description, price, price_type, category) "
+                           "VALUES ('ZQX', 'Test Option', 'test', 1.0, 'fixed', 'Other')")
+        connection.commit()
+        connection.close()
+        self.db.refresh_catalog()
+
+        codes = [s['code'] for s in self.db.get_autocomplete_suggestions('option', 'zq')]
+        self.assertEqual(codes, ['ZQX'])
+        self.assertIsNot(self.db.get_suggestion_index(), index)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,70 @@
+"""
+Test the parsed DOCX template cache
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from docx import Document
+
+from export.template_cache import TemplateCache, iter_template_paragraphs
+
+TEMPLATE = os.path.join(os.path.dirname(__file__), '..', 'export', 'templates', 'LS2000_template.docx')
+
+
+class TestTemplateCache(unittest.TestCase):
+    """Test cases for TemplateCache"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'LS2000_template.docx')
+        shutil.copy(TEMPLATE, self.path)
+        self.cache = TemplateCache()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_locations_match_full_scan(self):
+        """Recorded paragraphs are exactly the ones a full scan finds with {{...}}"""
+        template = self.cache.get(self.path)
+        doc = template.new_document()
+        expected = [p.text for _, _, p in iter_template_paragraphs(doc) if '{{' in p.text]
+        self.assertEqual([p.text for p in template.paragraphs(doc)], expected)
+        self.assertTrue(expected)
+
+    def test_copies_are_independent(self):
+        """Editing one copy leaves the cached template and later copies untouched"""
+        template = self.cache.get(self.path)
+        first = template.new_document()
+        for paragraph in template.paragraphs(first):
+            paragraph.clear()
+        second = self.cache.load_document(self.path)
+        self.assertTrue(all('{{' in p.text for p in template.paragraphs(second)))
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    def test_copy_views_share_one_tree(self):
+        """Paragraphs read back from a filled copy show the text that gets saved"""
+        template = self.cache.get(self.path)
+        doc = template.new_document()
+        template.paragraphs(doc)[0].text = 'filled in'
+        self.assertIs(doc.element, doc.part.element)
+        self.assertIn('filled in', [p.text for p in doc.paragraphs])
+
+    def test_reload_on_file_change(self):
+        """A template saved again on disk is parsed again"""
+        first = self.cache.get(self.path)
+        doc = Document(self.path)
+        doc.add_paragraph('{{extra_placeholder}}')
+        doc.save(self.path)
+        os.utime(self.path, ns=(first.mtime_ns + 10**9, first.mtime_ns + 10**9))
+
+        second = self.cache.get(self.path)
+        self.assertIsNot(first, second)
+        self.assertEqual(len(second.locations), len(first.locations) + 1)
+        self.assertIs(self.cache.get(self.path), second)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
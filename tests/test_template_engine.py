@@ -0,0 +1,65 @@
+"""
+Test single-pass template substitution
+"""
+
+import unittest
+
+from docx import Document
+
+from export.template_engine import TemplateConditions, render_paragraph, render_text
+
+
+class TestRenderText(unittest.TestCase):
+    """Test cases for render_text"""
+
+    def test_variables_and_missing(self):
+        """Known variables are filled in, unknown ones are flagged"""
+        text = render_text("{{a}} and {{b}}", {'a': 'X'})
+        self.assertEqual(text, "X and {{MISSING: b}}")
+
+    def test_conditionals(self):
+        """Each kind of conditional block is kept or dropped"""
+        conditions = TemplateConditions(option_codes=('XSP',), has_multiple_items=True, item_count=2)
+        text = render_text("{{if_option:XSP:S}}{{if_option:VR:V}}|{{if_multiple_items:M}}"
+                           "{{if_single_item:1}}|{{if_item_2:two}}{{if_item_3:three}}", {}, conditions)
+        self.assertEqual(text, "S|M|two")
+
+    def test_conditionals_without_conditions_are_variables(self):
+        """Without conditions, conditional blocks are looked up as plain names"""
+        self.assertEqual(render_text("{{if_item_2:x}}", {}), "{{MISSING: if_item_2:x}}")
+
+
+class TestRenderParagraph(unittest.TestCase):
+    """Test cases for render_paragraph"""
+
+    def test_run_formatting_preserved(self):
+        """Labels keep their formatting and values take the placeholder name's run"""
+        paragraph = Document().add_paragraph()
+        paragraph.add_run("Quote #: ").bold = True
+        paragraph.add_run("{{")
+        paragraph.add_run("quote_number").italic = True
+        paragraph.add_run("}}{{if_option:XSP:, XSP}}")
+
+        changed = render_paragraph(paragraph, {'quote_number': 'ACME ZF1'}, TemplateConditions(('XSP',)))
+
+        self.assertTrue(changed)
+        self.assertEqual(paragraph.text, "Quote #: ACME ZF1, XSP")
+        runs = paragraph.runs
+        self.assertEqual(len(runs), 4)
+        self.assertTrue(runs[0].bold)
+        self.assertEqual((runs[2].text, runs[2].italic), ("ACME ZF1", True))
+
+    def test_untouched_paragraph(self):
+        """Paragraphs without markup are left alone"""
+        paragraph = Document().add_paragraph("Plain text")
+        self.assertFalse(render_paragraph(paragraph, {}))
+
+    def test_multiline_value(self):
+        """Newlines in values become line breaks"""
+        paragraph = Document().add_paragraph("{{items_section}}")
+        render_paragraph(paragraph, {'items_section': "Item 1\nItem 2"})
+        self.assertEqual(paragraph.text, "Item 1\nItem 2")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -7,7 +7,9 @@ from .helpers import (
     format_currency, validate_email, validate_phone, 
     clean_part_number, extract_numeric_value, safe_float_convert
 )
-from .logger import get_logger, setup_logging
+from .logger import get_logger, setup_logging, set_verbosity, trace, is_tracing, lazy, TRACE
+from .cache import LRUCache
+from .job_runner import JobRunner, Job, JobCancelled
 from .exceptions import (
     QuoteGeneratorError, ParseError, ValidationError, 
     DatabaseError, ExportError
@@ -22,6 +24,15 @@ __all__ = [
     'safe_float_convert',
     'get_logger',
     'setup_logging',
+    'set_verbosity',
+    'trace',
+    'is_tracing',
+    'lazy',
+    'TRACE',
+    'LRUCache',
+    'JobRunner',
+    'Job',
+    'JobCancelled',
     'QuoteGeneratorError',
     'ParseError',
     'ValidationError',
@@ -0,0 +1,254 @@
+"""
+Background Job Runner for Babbitt Quote Generator
+Runs parse, price and export work off the Tk main thread and delivers results back to it
+"""
+
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Job states
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+ACTIVE_STATES = (PENDING, RUNNING)
+
+POLL_INTERVAL_MS = 100
+
+
+class JobCancelled(Exception):
+    """Raised inside a job function when the job has been cancelled"""
+    pass
+
+
+class Job:
+    """
+    One unit of background work.
+
+    The job function receives the Job and may call report() and
+    check_cancelled() while it runs; callbacks always run on the thread
+    that calls JobRunner.poll().
+    """
+
+    def __init__(self, job_id: int, name: str, func: Callable[['Job'], Any], key: Optional[str] = None,
+                 on_done: Optional[Callable[[Any], None]] = None,
+                 on_error: Optional[Callable[[BaseException], None]] = None,
+                 on_progress: Optional[Callable[['Job'], None]] = None,
+                 on_cancel: Optional[Callable[[], None]] = None):
+        self.id = job_id
+        self.name = name
+        self.key = key
+        self.func = func
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.on_cancel = on_cancel
+        self.status = PENDING
+        self.progress = 0.0
+        self.message = ''
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self._cancel_event = threading.Event()
+        self._events: Optional[queue.Queue] = None
+
+    @property
+    def active(self) -> bool:
+        return self.status in ACTIVE_STATES
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        """Ask the job to stop; it stops at its next check_cancelled() call"""
+        self._cancel_event.set()
+
+    def check_cancelled(self):
+        """Raise JobCancelled if cancel() has been called"""
+        if self._cancel_event.is_set():
+            raise JobCancelled(self.name)
+
+    def report(self, progress: float, message: str = ''):
+        """Record progress (0.0 - 1.0) from the worker thread"""
+        self.progress = max(0.0, min(1.0, progress))
+        self.message = message
+        if self._events is not None:
+            self._events.put((self, 'progress', None))
+
+
+class JobRunner:
+    """
+    Thread pool plus an event queue drained on the UI thread.
+
+    Jobs with the same key never run twice at once: submitting while one
+    is active returns None, which is how a second click on Export is ignored.
+    """
+
+    def __init__(self, max_workers: int = 2, history: int = 50):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self._events: queue.Queue = queue.Queue()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._jobs: List[Job] = []
+        self._history = history
+        self._listeners: List[Callable[[Job], None]] = []
+        self._root = None
+        self._after_id = None
+
+    def submit(self, name: str, func: Callable[[Job], Any], key: Optional[str] = None, **callbacks) -> Optional[Job]:
+        """
+        Queue func(job) on a worker thread.
+
+        Args:
+            name: Label shown in the job-status panel
+            func: Work to run; receives the Job
+            key: Jobs sharing a key are not run concurrently
+            **callbacks: on_done(result), on_error(exc), on_progress(job), on_cancel()
+
+        Returns:
+            The new Job, or None if a job with the same key is still active
+        """
+        with self._lock:
+            if key is not None and self.active_job(key) is not None:
+                logger.info("Job '%s' already running, ignoring duplicate request", key)
+                return None
+            job = Job(next(self._ids), name, func, key=key, **callbacks)
+            job._events = self._events
+            self._jobs.append(job)
+            finished = [j for j in self._jobs if not j.active]
+            for old in finished[:max(0, len(finished) - self._history)]:
+                self._jobs.remove(old)
+
+        self._events.put((job, 'submitted', None))
+        self._executor.submit(self._run, job)
+        return job
+
+    def _run(self, job: Job):
+        if job.cancelled:
+            self._events.put((job, CANCELLED, None))
+            return
+        job.status = RUNNING
+        self._events.put((job, 'started', None))
+        started = time.perf_counter()
+        try:
+            result = job.func(job)
+        except JobCancelled:
+            self._events.put((job, CANCELLED, None))
+        except Exception as e:
+            logger.exception("Job '%s' failed: %s", job.name, e)
+            self._events.put((job, FAILED, e))
+        else:
+            self._events.put((job, DONE, result))
+        finally:
+            logger.debug("Job '%s' finished in %.1f ms", job.name, (time.perf_counter() - started) * 1000)
+
+    def active_job(self, key: str) -> Optional[Job]:
+        """The pending or running job with this key, if any"""
+        for job in self._jobs:
+            if job.key == key and job.active:
+                return job
+        return None
+
+    def jobs(self) -> List[Job]:
+        """Recent jobs, oldest first"""
+        with self._lock:
+            return list(self._jobs)
+
+    def cancel(self, job_id: int) -> bool:
+        """Request cancellation of a job by id"""
+        for job in self.jobs():
+            if job.id == job_id and job.active:
+                job.cancel()
+                return True
+        return False
+
+    def add_listener(self, listener: Callable[[Job], None]):
+        """Call listener(job) on the UI thread whenever a job changes"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Job], None]):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def poll(self) -> int:
+        """
+        Deliver queued job events and run their callbacks on the calling thread.
+
+        Returns:
+            Number of events handled
+        """
+        handled = 0
+        while True:
+            try:
+                job, event, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+            handled += 1
+            callback, args = None, ()
+            if event == 'progress':
+                callback, args = job.on_progress, (job,)
+            elif event == DONE:
+                job.status, job.result, job.progress = DONE, payload, 1.0
+                callback, args = job.on_done, (payload,)
+            elif event == FAILED:
+                job.status, job.error = FAILED, payload
+                callback, args = job.on_error, (payload,)
+            elif event == CANCELLED:
+                job.status = CANCELLED
+                callback = job.on_cancel
+            if event in (DONE, FAILED, CANCELLED):
+                job.finished_at = time.time()
+
+            if callback is not None:
+                try:
+                    callback(*args)
+                except Exception as e:
+                    logger.exception("Callback for job '%s' failed: %s", job.name, e)
+            for listener in list(self._listeners):
+                try:
+                    listener(job)
+                except Exception as e:
+                    logger.exception("Job listener failed: %s", e)
+        return handled
+
+    def attach(self, root, interval_ms: int = POLL_INTERVAL_MS):
+        """Poll from a Tk root's event loop every interval_ms"""
+        self._root = root
+
+        def tick():
+            self.poll()
+            self._after_id = root.after(interval_ms, tick)
+
+        self._after_id = root.after(interval_ms, tick)
+
+    def shutdown(self, cancel: bool = True):
+        """Stop polling, optionally cancel active jobs, and release the worker threads"""
+        if self._root is not None and self._after_id is not None:
+            try:
+                self._root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        if cancel:
+            for job in self.jobs():
+                if job.active:
+                    job.cancel()
+        self._executor.shutdown(wait=False)
+
+    def stats(self) -> Dict[str, int]:
+        """Job counts by status"""
+        counts: Dict[str, int] = {}
+        for job in self.jobs():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return counts
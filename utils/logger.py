@@ -1,20 +1,20 @@
 """
 Logging Configuration for Babbitt Quote Generator
-Provides centralized logging setup and utilities
+Provides centralized logging setup, verbosity control and lazy tracing
 """
 
 import logging
 import logging.handlers
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union, Iterable, Callable, Any
 from datetime import datetime
 
 # Import settings with fallback
 try:
     from config.settings import (
         LOG_LEVEL, LOG_FORMAT, LOG_DATE_FORMAT, 
-        LOGS_DIR, BASE_DIR
+        LOGS_DIR, BASE_DIR, LOG_LEVEL_ENV, LOG_TRACE_ENV
     )
 except ImportError:
     # Fallback values if settings not available
@@ -23,6 +23,20 @@ except ImportError:
     LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
     BASE_DIR = Path(__file__).parent.parent
     LOGS_DIR = BASE_DIR / "logs"
+    LOG_LEVEL_ENV = "BABBITT_LOG_LEVEL"
+    LOG_TRACE_ENV = "BABBITT_TRACE"
+
+# Finer than DEBUG: variable dumps and per-item detail from hot paths
+TRACE = 5
+logging.addLevelName(TRACE, "TRACE")
+
+
+def _level_number(level: Union[str, int]) -> int:
+    """Convert a level name (including TRACE) or number to a number"""
+    if isinstance(level, int):
+        return level
+    number = logging.getLevelName(str(level).upper())
+    return number if isinstance(number, int) else logging.INFO
 
 def setup_logging(
     level: str = LOG_LEVEL,
@@ -45,8 +59,9 @@ def setup_logging(
     # Clear any existing handlers
     logging.getLogger().handlers.clear()
     
-    # Set logging level
-    numeric_level = getattr(logging, level.upper(), logging.INFO)
+    # Set logging level (the environment can raise or lower it without a code change)
+    level = os.environ.get(LOG_LEVEL_ENV) or level
+    numeric_level = _level_number(level)
     logging.getLogger().setLevel(numeric_level)
     
     # Create formatter
@@ -74,6 +89,67 @@ def setup_logging(
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
         logging.getLogger().addHandler(file_handler)
+    
+    # Per-module tracing, e.g. BABBITT_TRACE=export,core.pricing_engine
+    trace_names = [name.strip() for name in os.environ.get(LOG_TRACE_ENV, "").split(",") if name.strip()]
+    if trace_names:
+        set_verbosity(TRACE, trace_names)
+
+def set_verbosity(level: Union[str, int], names: Optional[Iterable[str]] = None) -> None:
+    """
+    Change how much is logged while the application is running
+    
+    Args:
+        level: Level name or number (TRACE, DEBUG, INFO, WARNING, ...)
+        names: Logger names to change (e.g. ["export"]); default is every logger
+    """
+    numeric_level = _level_number(level)
+    root = logging.getLogger()
+    
+    if names:
+        for name in names:
+            logging.getLogger(name).setLevel(numeric_level)
+        # Let the more detailed records through the handlers; other loggers
+        # are still filtered by the root level
+        for handler in root.handlers:
+            if handler.level > numeric_level:
+                handler.setLevel(numeric_level)
+    else:
+        root.setLevel(numeric_level)
+        for handler in root.handlers:
+            handler.setLevel(numeric_level)
+
+def is_tracing(logger: logging.Logger) -> bool:
+    """True if TRACE records from this logger would be emitted"""
+    return logger.isEnabledFor(TRACE)
+
+def trace(logger: logging.Logger, message: str, *args: Any) -> None:
+    """
+    Log at TRACE level with %-style arguments
+    
+    Nothing is formatted unless tracing is on for this logger, so this is
+    safe to call per item or per price.
+    """
+    if logger.isEnabledFor(TRACE):
+        logger.log(TRACE, message, *args)
+
+class lazy:
+    """
+    Log argument computed only when the record is actually formatted
+    
+    Example:
+        logger.debug("Template variables: %s", lazy(lambda: sorted(variables)))
+    """
+    
+    __slots__ = ('func',)
+    
+    def __init__(self, func: Callable[[], Any]):
+        self.func = func
+    
+    def __str__(self) -> str:
+        return str(self.func())
+    
+    __repr__ = __str__
 
 def get_logger(name: str) -> logging.Logger:
     """